@@ -0,0 +1,78 @@
+"""Link near-duplicate product images to a canonical image
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Duplicates point at the image whose features they share. No foreign key:
+    # a duplicate keeps its copied features when the canonical job is deleted.
+    op.execute(
+        """
+        ALTER TABLE product_images
+        ADD COLUMN IF NOT EXISTS canonical_img_id VARCHAR(255);
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_product_images_canonical
+        ON product_images(canonical_img_id)
+        WHERE canonical_img_id IS NOT NULL;
+        """
+    )
+
+    # Recent canonical hashes are loaded into the finder's lookup index
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_product_images_phash_recent
+        ON product_images(created_at)
+        WHERE phash IS NOT NULL AND canonical_img_id IS NULL;
+        """
+    )
+
+    # Features written for a canonical image are copied to its duplicates, so
+    # the segmentation, embedding and keypoint services stay unaware of them
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION propagate_product_image_features()
+        RETURNS trigger AS $$
+        BEGIN
+            UPDATE product_images
+            SET masked_local_path = NEW.masked_local_path,
+                kp_blob_path = NEW.kp_blob_path,
+                emb_rgb = NEW.emb_rgb,
+                emb_gray = NEW.emb_gray
+            WHERE canonical_img_id = NEW.img_id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS trg_product_images_propagate_features ON product_images;")
+    op.execute(
+        """
+        CREATE TRIGGER trg_product_images_propagate_features
+        AFTER UPDATE OF masked_local_path, kp_blob_path, emb_rgb, emb_gray ON product_images
+        FOR EACH ROW
+        WHEN (NEW.canonical_img_id IS NULL)
+        EXECUTE FUNCTION propagate_product_image_features();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_product_images_propagate_features ON product_images;")
+    op.execute("DROP FUNCTION IF EXISTS propagate_product_image_features();")
+    op.execute("DROP INDEX IF EXISTS idx_product_images_phash_recent;")
+    op.execute("DROP INDEX IF EXISTS idx_product_images_canonical;")
+    op.execute("ALTER TABLE product_images DROP COLUMN IF EXISTS canonical_img_id;")
@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 from ..database import DatabaseManager
 from ..models import ProductImage
 from ..logging_config import configure_logging
@@ -11,18 +11,8 @@ class ProductImageCRUD:
 
     def _convert_row_to_image(self, row: Dict[str, Any]) -> ProductImage:
         """Convert database row to ProductImage, handling vector types"""
-        # Convert asyncpg.Record to dict to make it mutable
+        # Embeddings arrive as float32 arrays via the binary vector codec
         row_dict = dict(row)
-
-        # Convert vector strings back to lists if they exist
-        if row_dict.get('emb_rgb') is not None:
-            if isinstance(row_dict['emb_rgb'], str):
-                # Parse string representation like "[0.1,0.2,0.3]"
-                row_dict['emb_rgb'] = [float(x) for x in row_dict['emb_rgb'].strip('[]').split(',') if x]
-        if row_dict.get('emb_gray') is not None:
-            if isinstance(row_dict['emb_gray'], str):
-                # Parse string representation like "[0.1,0.2,0.3]"
-                row_dict['emb_gray'] = [float(x) for x in row_dict['emb_gray'].strip('[]').split(',') if x]
         return ProductImage(**row_dict)
 
     async def create_product_image(self, image: ProductImage) -> str:
@@ -55,17 +45,14 @@ class ProductImageCRUD:
             return image.img_id
         return inserted_id
 
-    async def update_embeddings(self, img_id: str, emb_rgb: List[float], emb_gray: List[float]):
+    async def update_embeddings(self, img_id: str, emb_rgb: Sequence[float], emb_gray: Sequence[float]):
         """Update embeddings for a product image"""
-        # Convert lists to strings for pgvector compatibility
-        emb_rgb_str = str(emb_rgb)
-        emb_gray_str = str(emb_gray)
         query = """
         UPDATE product_images
         SET emb_rgb = $2::vector, emb_gray = $3::vector
         WHERE img_id = $1
         """
-        await self.db.execute(query, img_id, emb_rgb_str, emb_gray_str)
+        await self.db.execute(query, img_id, emb_rgb, emb_gray)
 
     async def get_product_image(self, img_id: str) -> Optional[ProductImage]:
         """Get a product image by ID"""
@@ -272,4 +259,71 @@ class ProductImageCRUD:
                 product_id=image.product_id
             )
             return image.img_id
-        return inserted_id
\ No newline at end of file
+        return inserted_id
+
+    async def create_product_images_with_conn(self, images: Sequence[ProductImage], conn) -> List[str]:
+        """
+        Create several product images with one statement on an existing asyncpg connection.
+        Idempotent via ON CONFLICT (img_id) DO NOTHING. Images linked to a canonical
+        image through canonical_img_id copy its masked path, keypoints and embeddings.
+
+        Args:
+            images: ProductImage models to insert
+            conn: Existing asyncpg connection to execute against
+
+        Returns:
+            The IDs of the images that were inserted; images that already existed are skipped.
+        """
+        if not images:
+            return []
+
+        # Duplicates start out with the features their canonical image already has
+        query = """
+        INSERT INTO product_images (
+            img_id, product_id, local_path, kp_blob_path, phash, canonical_img_id,
+            masked_local_path, emb_rgb, emb_gray
+        )
+        SELECT
+            u.img_id, u.product_id, u.local_path, COALESCE(u.kp_blob_path, c.kp_blob_path),
+            u.phash, u.canonical_img_id, c.masked_local_path, c.emb_rgb, c.emb_gray
+        FROM unnest($1::text[], $2::text[], $3::text[], $4::text[], $5::bigint[], $6::text[])
+            AS u(img_id, product_id, local_path, kp_blob_path, phash, canonical_img_id)
+        LEFT JOIN product_images c ON c.img_id = u.canonical_img_id
+        ON CONFLICT (img_id) DO NOTHING
+        RETURNING img_id
+        """
+        rows = await conn.fetch(
+            query,
+            [image.img_id for image in images],
+            [image.product_id for image in images],
+            [image.local_path for image in images],
+            [image.kp_blob_path for image in images],
+            [image.phash for image in images],
+            [image.canonical_img_id for image in images],
+        )
+        inserted_ids = [row["img_id"] for row in rows]
+        if len(inserted_ids) < len(images):
+            logger.debug(
+                "Images already existed - idempotent insert skipped",
+                skipped=len(images) - len(inserted_ids),
+                product_id=images[0].product_id
+            )
+        return inserted_ids
+
+    async def lock_product_images_with_conn(self, img_ids: Sequence[str], conn) -> List[str]:
+        """
+        Share-lock existing product images until the caller's transaction ends.
+
+        Holding the lock while linking duplicates keeps a concurrent feature update
+        of the canonical image from missing rows that are not committed yet.
+
+        Returns:
+            The IDs of the images that exist.
+        """
+        if not img_ids:
+            return []
+        rows = await conn.fetch(
+            "SELECT img_id FROM product_images WHERE img_id = ANY($1::text[]) FOR SHARE",
+            list(img_ids),
+        )
+        return [row["img_id"] for row in rows]
\ No newline at end of file
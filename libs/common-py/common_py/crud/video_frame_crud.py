@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 from ..database import DatabaseManager
 from ..models import VideoFrame
 
@@ -8,18 +8,8 @@ class VideoFrameCRUD:
 
     def _convert_row_to_frame(self, row: Dict[str, Any]) -> VideoFrame:
         """Convert database row to VideoFrame, handling vector types"""
-        # Convert asyncpg.Record to dict to make it mutable
+        # Embeddings arrive as float32 arrays via the binary vector codec
         row_dict = dict(row)
-
-        # Convert vector strings back to lists if they exist
-        if row_dict.get('emb_rgb') is not None:
-            if isinstance(row_dict['emb_rgb'], str):
-                # Parse string representation like "[0.1,0.2,0.3]"
-                row_dict['emb_rgb'] = [float(x) for x in row_dict['emb_rgb'].strip('[]').split(',') if x]
-        if row_dict.get('emb_gray') is not None:
-            if isinstance(row_dict['emb_gray'], str):
-                # Parse string representation like "[0.1,0.2,0.3]"
-                row_dict['emb_gray'] = [float(x) for x in row_dict['emb_gray'].strip('[]').split(',') if x]
         return VideoFrame(**row_dict)
 
     async def create_video_frame(self, frame: VideoFrame) -> str:
@@ -41,17 +31,14 @@ class VideoFrameCRUD:
         # When ON CONFLICT DO NOTHING triggers, RETURNING returns no row; safely return the requested id
         return inserted_id if inserted_id else frame.frame_id
 
-    async def update_embeddings(self, frame_id: str, emb_rgb: List[float], emb_gray: List[float]):
+    async def update_embeddings(self, frame_id: str, emb_rgb: Sequence[float], emb_gray: Sequence[float]):
         """Update embeddings for a video frame"""
-        # Convert lists to strings for pgvector compatibility
-        emb_rgb_str = str(emb_rgb)
-        emb_gray_str = str(emb_gray)
         query = """
         UPDATE video_frames
         SET emb_rgb = $2::vector, emb_gray = $3::vector
         WHERE frame_id = $1
         """
-        await self.db.execute(query, frame_id, emb_rgb_str, emb_gray_str)
+        await self.db.execute(query, frame_id, emb_rgb, emb_gray)
 
     async def get_video_frame(self, frame_id: str) -> Optional[VideoFrame]:
         """Get a video frame by ID"""
@@ -3,6 +3,7 @@ import asyncpg
 import os
 from typing import Optional, List, Dict, Any, Tuple
 from .logging_config import configure_logging
+from .vector_codec import register_vector_codec
 
 logger = configure_logging("common-py:database")
 
@@ -18,12 +19,17 @@ class DatabaseManager:
         # Get timezone from environment variable
         timezone = os.getenv("TZ", "UTC")
 
+        async def init_connection(conn: asyncpg.Connection) -> None:
+            await conn.execute(f"SET TIME ZONE '{timezone}'")
+            # Exchange pgvector embeddings as float32 arrays, not text
+            await register_vector_codec(conn)
+
         self.pool = await asyncio.wait_for(
             asyncpg.create_pool(
                 self.dsn,
                 min_size=1,
                 max_size=10,
-                init=lambda conn: conn.execute(f"SET TIME ZONE '{timezone}'"),
+                init=init_connection,
                 command_timeout=60.0,
                 server_settings={"application_name": "product_video_matching"}
             ),
@@ -0,0 +1,180 @@
+"""Versioned on-disk format for keypoint blobs.
+
+A version 2 blob is a single uncompressed ``.npy`` file named
+``<entity_id>.kpv2.npy``. Each record holds one keypoint as float32
+``x, y, size, angle, response, octave`` followed by its descriptor row
+(``uint8`` for AKAZE, ``float32`` for SIFT). Because the file is a plain
+``.npy`` array it can be opened with ``np.load(..., mmap_mode="r")`` and
+never needs pickle.
+
+Version 1 blobs are the ``.npz`` archives with a pickled list of keypoint
+dictionaries written before this format existed. They are still readable
+through :func:`read_keypoint_blob` and can be rewritten with
+:func:`migrate_keypoint_blob`.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple, Union
+
+import numpy as np
+
+BLOB_VERSION = 2
+BLOB_SUFFIX = f".kpv{BLOB_VERSION}.npy"
+LEGACY_SUFFIX = ".npz"
+
+KEYPOINT_FIELDS = ("x", "y", "size", "angle", "response", "octave")
+KEYPOINT_DTYPE = np.dtype([(name, "<f4") for name in KEYPOINT_FIELDS])
+
+_VERSIONED_SUFFIX = re.compile(r"\.kpv(\d+)\.npy$")
+
+PathLike = Union[str, Path]
+
+
+class KeypointBlob(NamedTuple):
+    """Keypoints as a ``KEYPOINT_DTYPE`` array plus their descriptors."""
+
+    keypoints: np.ndarray
+    descriptors: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.keypoints.shape[0])
+
+    @property
+    def points(self) -> np.ndarray:
+        """Return the ``(n, 2)`` float32 keypoint coordinates."""
+
+        return np.stack((self.keypoints["x"], self.keypoints["y"]), axis=1)
+
+
+def blob_path(directory: PathLike, entity_id: str) -> Path:
+    """Return the path of the current-version blob for ``entity_id``."""
+
+    return Path(directory) / f"{entity_id}{BLOB_SUFFIX}"
+
+
+def blob_version(path: PathLike) -> int:
+    """Return the format version implied by a blob's file name."""
+
+    name = str(path)
+    if name.endswith(LEGACY_SUFFIX):
+        return 1
+
+    match = _VERSIONED_SUFFIX.search(name)
+    if match is None:
+        raise ValueError(f"Unrecognised keypoint blob name: {name}")
+    return int(match.group(1))
+
+
+def keypoints_to_array(keypoints: Iterable[Any]) -> np.ndarray:
+    """Convert ``cv2.KeyPoint``-like objects to a ``KEYPOINT_DTYPE`` array."""
+
+    return np.array(
+        [
+            (kp.pt[0], kp.pt[1], kp.size, kp.angle, kp.response, kp.octave)
+            for kp in keypoints
+        ],
+        dtype=KEYPOINT_DTYPE,
+    )
+
+
+def write_keypoint_blob(
+    path: PathLike,
+    keypoints: np.ndarray,
+    descriptors: np.ndarray,
+) -> str:
+    """Write a version 2 blob and return its path.
+
+    ``keypoints`` must be a ``KEYPOINT_DTYPE`` array with one row per
+    descriptor row.
+    """
+
+    path = Path(path)
+    if not str(path).endswith(BLOB_SUFFIX):
+        raise ValueError(f"Keypoint blob path must end with {BLOB_SUFFIX}: {path}")
+
+    descriptors = np.asarray(descriptors)
+    if descriptors.dtype != np.uint8:
+        descriptors = descriptors.astype("<f4")
+    if descriptors.ndim != 2 or descriptors.shape[0] != keypoints.shape[0]:
+        raise ValueError(
+            f"Descriptors shape {descriptors.shape} does not match "
+            f"{keypoints.shape[0]} keypoints"
+        )
+
+    record_dtype = np.dtype(
+        KEYPOINT_DTYPE.descr
+        + [("descriptor", descriptors.dtype.str, (descriptors.shape[1],))]
+    )
+    records = np.empty(keypoints.shape[0], dtype=record_dtype)
+    for name in KEYPOINT_FIELDS:
+        records[name] = keypoints[name]
+    records["descriptor"] = descriptors
+
+    # ``np.save`` would append ``.npy`` to a path without that suffix
+    with open(path, "wb") as handle:
+        np.save(handle, records, allow_pickle=False)
+    return str(path)
+
+
+def read_keypoint_blob(path: PathLike, mmap: bool = True) -> KeypointBlob:
+    """Read a keypoint blob of any supported version.
+
+    Version 2 blobs are memory-mapped when ``mmap`` is true; the returned
+    arrays are read-only views into the file.
+    """
+
+    version = blob_version(path)
+    if version == 1:
+        return _read_legacy_blob(path)
+    if version != BLOB_VERSION:
+        raise ValueError(f"Unsupported keypoint blob version {version}: {path}")
+
+    records = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+    return KeypointBlob(
+        keypoints=records[list(KEYPOINT_FIELDS)],
+        descriptors=records["descriptor"],
+    )
+
+
+def _read_legacy_blob(path: PathLike) -> KeypointBlob:
+    # Version 1 stores keypoints as a pickled object array of dictionaries
+    with np.load(path, allow_pickle=True) as data:
+        kp_data = data["keypoints"]
+        descriptors = data["descriptors"]
+
+    keypoints = np.array(
+        [
+            (
+                kp["pt"][0],
+                kp["pt"][1],
+                kp["size"],
+                kp["angle"],
+                kp["response"],
+                kp["octave"],
+            )
+            for kp in kp_data
+        ],
+        dtype=KEYPOINT_DTYPE,
+    )
+
+    if descriptors.ndim != 2:
+        descriptors = np.empty((0, 0), dtype=np.uint8)
+    count = min(len(keypoints), len(descriptors))
+    return KeypointBlob(keypoints[:count], descriptors[:count])
+
+
+def migrate_keypoint_blob(path: PathLike) -> str:
+    """Rewrite a legacy ``.npz`` blob next to itself in the current format.
+
+    Returns the path of the current-version blob; blobs that are already
+    current are returned unchanged.
+    """
+
+    if blob_version(path) == BLOB_VERSION:
+        return str(path)
+
+    blob = read_keypoint_blob(path)
+    legacy = Path(path)
+    target = legacy.with_name(legacy.name[: -len(LEGACY_SUFFIX)] + BLOB_SUFFIX)
+    return write_keypoint_blob(target, blob.keypoints, blob.descriptors)
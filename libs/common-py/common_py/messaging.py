@@ -1,25 +1,82 @@
 import asyncio
 import json
+import time
 import uuid
-from typing import Dict, Any, Callable, Optional
+from collections import deque
+from typing import Dict, Any, Callable, List, Optional
 from datetime import datetime, timezone
 import aio_pika
 from aio_pika import Message, DeliveryMode
 from .logging_config import configure_logging
-from .messaging_handler import MessageHandler # New import
+from .messaging_handler import (
+    MessageHandler,
+    RETRY_DELAYS_SECONDS,
+    retry_queue_arguments,
+    retry_queue_name,
+)
+from .metrics import metrics
 
 logger = configure_logging("common-py:messaging")
 
 
+class ConsumerStats:
+    """In-flight count and handler latency for one subscribed queue"""
+
+    def __init__(self, queue_name: str, prefetch_count: int, max_workers: Optional[int]):
+        self.queue_name = queue_name
+        self.prefetch_count = prefetch_count
+        self.max_workers = max_workers
+        self.in_flight = 0
+        self.processed = 0
+        self.latencies = deque(maxlen=1000)  # Keep last 1000 handler durations
+        self._tags = {"queue": queue_name}
+
+    def started(self) -> float:
+        self.in_flight += 1
+        metrics.set_gauge("broker.consumer.in_flight", self.in_flight, self._tags)
+        return time.perf_counter()
+
+    def finished(self, started_at: float) -> None:
+        duration = time.perf_counter() - started_at
+        self.in_flight -= 1
+        self.processed += 1
+        self.latencies.append(duration)
+        metrics.set_gauge("broker.consumer.in_flight", self.in_flight, self._tags)
+        metrics.increment_counter("broker.consumer.processed", tags=self._tags)
+        metrics.record_histogram("broker.consumer.latency_seconds", duration, self._tags)
+
+    def snapshot(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+        return {
+            "queue": self.queue_name,
+            "prefetch_count": self.prefetch_count,
+            "max_workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "processed": self.processed,
+            "latency_avg_seconds": sum(latencies) / len(latencies) if latencies else 0.0,
+            "latency_p95_seconds": latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0,
+        }
+
+
 class MessageBroker:
-    """RabbitMQ message broker wrapper"""
+    """RabbitMQ message broker wrapper
     
-    def __init__(self, broker_url: str):
+    Publishing and queue inspection share one channel. Every subscription
+    consumes on a channel of its own, so its prefetch limit applies to that
+    queue only. Failed messages are retried through per-topic TTL retry
+    queues unless local_retries is set (see MessageHandler).
+    """
+    
+    def __init__(self, broker_url: str, local_retries: bool = False):
         self.broker_url = broker_url
+        self.local_retries = local_retries
         self.connection = None
         self.channel = None
         self.exchange = None
         self.message_handler_instance = None # New instance
+        self.consumer_channels: Dict[str, Any] = {}
+        self.consumer_stats: Dict[str, ConsumerStats] = {}
+        self._worker_tasks: List[asyncio.Task] = []
     
     async def connect(self, timeout: float = 30.0):
         """Establish connection to RabbitMQ"""
@@ -45,6 +102,13 @@ class MessageBroker:
     
     async def disconnect(self):
         """Close connection to RabbitMQ"""
+        for task in self._worker_tasks:
+            task.cancel()
+        if self._worker_tasks:
+            await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self.consumer_channels = {}
+
         if self.connection:
             await self.connection.close()
             logger.info("Disconnected from RabbitMQ")
@@ -85,7 +149,14 @@ class MessageBroker:
             correlation_id=enriched_event["_metadata"]["correlation_id"]
         )
     
-    async def subscribe_to_topic(self, topic: str, handler: Callable, queue_name: Optional[str] = None, prefetch_count: int = 10):
+    async def subscribe_to_topic(
+        self,
+        topic: str,
+        handler: Callable,
+        queue_name: Optional[str] = None,
+        prefetch_count: int = 10,
+        max_workers: Optional[int] = None,
+    ):
         """
         Subscribe to a topic and handle messages
         
@@ -94,37 +165,89 @@ class MessageBroker:
             handler: Async function to handle messages
             queue_name: Optional queue name (defaults to topic-based name)
             prefetch_count: Maximum number of unacknowledged messages consumed at once (default: 10)
+            max_workers: Optional number of worker tasks running the handler. Deliveries
+                are queued to the workers, so at most max_workers handlers run at once
+                while up to prefetch_count messages are buffered. Defaults to one
+                handler per delivery, bounded by prefetch_count.
         """
         if not self.exchange:
             raise RuntimeError("Not connected to RabbitMQ")
         
-        # Set QoS (prefetch) to limit concurrent message processing
-        await self.channel.set_qos(prefetch_count=prefetch_count)
+        # Each consumer gets its own channel so its QoS (prefetch) is not
+        # overwritten by later subscriptions
+        channel = await self.connection.channel()
+        await channel.set_qos(prefetch_count=prefetch_count)
         
         # Create queue
         queue_name = queue_name or f"queue.{topic}"
-        queue = await self.channel.declare_queue(queue_name, durable=True)
+        queue = await channel.declare_queue(queue_name, durable=True)
         
         # Bind queue to topic
         await queue.bind(self.exchange, routing_key=topic)
         
         # Set up DLQ
         dlq_name = f"{queue_name}.dlq"
-        dlq = await self.channel.declare_queue(dlq_name, durable=True)
+        dlq = await channel.declare_queue(dlq_name, durable=True)
+        
+        # Set up retry queues, one per delay tier, that dead-letter back to the topic
+        if not self.local_retries:
+            for delay in RETRY_DELAYS_SECONDS:
+                retry_name = retry_queue_name(topic, delay)
+                retry_queue = await channel.declare_queue(
+                    retry_name,
+                    durable=True,
+                    arguments=retry_queue_arguments(self.exchange.name, topic, delay)
+                )
+                await retry_queue.bind(self.exchange, routing_key=retry_name)
         
         # Create a dedicated MessageHandler for this subscription to ensure correct DLQ routing
-        message_handler = MessageHandler(self.exchange, dlq_name)
+        message_handler = MessageHandler(self.exchange, dlq_name, local_retries=self.local_retries)
+        stats = ConsumerStats(queue_name, prefetch_count, max_workers)
+
+        async def process(message):
+            started_at = stats.started()
+            try:
+                await message_handler.handle_message(message, handler, topic)
+            finally:
+                stats.finished(started_at)
 
-        # Start consuming with a handler bound to this subscription's DLQ
-        await queue.consume(lambda message: message_handler.handle_message(message, handler, topic))
+        if max_workers:
+            # Deliveries are only queued here, so the consumer callback returns at once
+            pending: asyncio.Queue = asyncio.Queue()
+            for _ in range(max_workers):
+                self._worker_tasks.append(asyncio.create_task(self._run_worker(pending, process, queue_name)))
+            await queue.consume(pending.put)
+        else:
+            # Start consuming with a handler bound to this subscription's DLQ
+            await queue.consume(process)
+
+        self.consumer_channels[queue_name] = channel
+        self.consumer_stats[queue_name] = stats
         
         logger.info(
             "Subscribed to topic",
             topic=topic,
             queue=queue_name,
-            prefetch_count=prefetch_count
+            prefetch_count=prefetch_count,
+            max_workers=max_workers
         )
 
+    async def _run_worker(self, pending: asyncio.Queue, process: Callable, queue_name: str):
+        """Run queued deliveries of one subscription until cancelled"""
+        while True:
+            message = await pending.get()
+            try:
+                await process(message)
+            except Exception as e:
+                # Keep the worker alive; the message handler already logged the failure
+                logger.error("Consumer worker error", queue=queue_name, error=str(e))
+            finally:
+                pending.task_done()
+
+    def get_consumer_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-queue in-flight count, processed count and handler latency"""
+        return {name: stats.snapshot() for name, stats in self.consumer_stats.items()}
+
     async def get_queue_message_count(self, queue_name: str) -> int:
         """
         Get the number of messages in a queue
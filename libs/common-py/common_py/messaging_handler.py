@@ -10,10 +10,40 @@ from .error_codes import ErrorCode, create_error, RetryableError
 
 logger = configure_logging("common-py:messaging_handler")
 
+# Delay before each retry attempt; a message is sent to the DLQ once it has used them all
+RETRY_DELAYS_SECONDS = (1, 2, 4)
+
+
+def retry_queue_name(topic: str, delay_seconds: int) -> str:
+    """Name (and routing key) of the retry queue holding messages for one delay tier"""
+    return f"retry.{topic}.{delay_seconds}s"
+
+
+def retry_queue_arguments(exchange_name: str, topic: str, delay_seconds: int) -> Dict[str, Any]:
+    """Queue arguments that hold a message for the delay, then dead-letter it back to the topic"""
+    return {
+        "x-message-ttl": int(delay_seconds * 1000),
+        "x-dead-letter-exchange": exchange_name,
+        "x-dead-letter-routing-key": topic,
+    }
+
+
 class MessageHandler:
-    def __init__(self, broker_exchange: aio_pika.Exchange, dlq_name: str):
+    """Runs a handler for one delivery and routes failures to retry or the DLQ
+    
+    Retries are delayed by the broker: the message is published to the retry
+    queue for its attempt (see retry_queue_name) and acknowledged at once, so
+    a failing message never holds a prefetch slot while it waits. With
+    local_retries=True the delay is instead kept by an in-process task that
+    republishes to the topic, a stand-in for tests and brokers without the
+    retry queues declared.
+    """
+
+    def __init__(self, broker_exchange: aio_pika.Exchange, dlq_name: str, local_retries: bool = False):
         self.exchange = broker_exchange
         self.dlq_name = dlq_name
+        self.local_retries = local_retries
+        self._pending_retries = set()
 
     async def handle_message(self, message: aio_pika.IncomingMessage, handler: Callable, topic: str):
         correlation_id = message.correlation_id
@@ -82,11 +112,9 @@ class MessageHandler:
             # Check retry count
             retry_count = message.headers.get("x-retry-count", 0) if message.headers else 0
             
-            if is_retryable and retry_count < 3:
-                # Retry with exponential backoff
-                delay = min(2 ** retry_count, 60)  # Max 60 seconds
-                
-                await asyncio.sleep(delay)
+            if is_retryable and retry_count < len(RETRY_DELAYS_SECONDS):
+                # Retry with exponential backoff, delayed outside the consumer
+                delay = RETRY_DELAYS_SECONDS[retry_count]
                 
                 # Republish with incremented retry count
                 retry_message = Message(
@@ -99,7 +127,12 @@ class MessageHandler:
                     correlation_id=correlation_id
                 )
                 
-                await self.exchange.publish(retry_message, routing_key=topic)
+                if self.local_retries:
+                    task = asyncio.create_task(self._publish_later(retry_message, topic, delay))
+                    self._pending_retries.add(task)
+                    task.add_done_callback(self._pending_retries.discard)
+                else:
+                    await self.exchange.publish(retry_message, routing_key=retry_queue_name(topic, delay))
                 await message.ack()
                 
                 logger.info(
@@ -136,6 +169,19 @@ class MessageHandler:
                     reason="max_retries" if is_retryable else "fatal_error"
                 )
     
+    async def _publish_later(self, message: Message, topic: str, delay: float):
+        """Local stand-in for a retry queue: republish to the topic after the delay"""
+        await asyncio.sleep(delay)
+        try:
+            await self.exchange.publish(message, routing_key=topic)
+        except Exception as e:
+            logger.error("Failed to republish retry", topic=topic, correlation_id=message.correlation_id, error=str(e))
+
+    async def wait_for_retries(self):
+        """Wait until every locally scheduled retry has been republished"""
+        if self._pending_retries:
+            await asyncio.gather(*list(self._pending_retries), return_exceptions=True)
+
     def _is_retryable_error(self, error: Exception) -> bool:
         """Determine if an error is retryable"""
         if isinstance(error, RetryableError):
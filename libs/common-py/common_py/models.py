@@ -24,6 +24,7 @@ class ProductImage(BaseModel):
     emb_gray: Optional[List[float]] = None
     kp_blob_path: Optional[str] = None
     phash: Optional[int] = None
+    canonical_img_id: Optional[str] = None
     created_at: Optional[datetime] = None
 
 
@@ -0,0 +1,69 @@
+"""Binary asyncpg codec for the pgvector ``vector`` type.
+
+pgvector's binary wire format is a big-endian ``uint16`` dimension, a
+``uint16`` reserved field and ``dim`` big-endian ``float32`` values. With
+the codec registered, embeddings are exchanged with Postgres as
+``np.ndarray`` (float32) buffers instead of ``"[0.1,0.2,...]"`` strings.
+"""
+
+import struct
+from typing import Any
+
+import asyncpg
+import numpy as np
+
+from .logging_config import configure_logging
+
+logger = configure_logging("common-py:vector_codec")
+
+_HEADER = struct.Struct(">HH")
+_WIRE_DTYPE = np.dtype(">f4")
+
+
+def encode_vector(value: Any) -> bytes:
+    """Encode an array-like embedding into pgvector's binary format."""
+
+    if isinstance(value, str):
+        # Legacy callers may still send the text representation
+        value = np.array(value.strip().strip("[]").split(","), dtype=np.float32)
+
+    array = np.asarray(value, dtype=_WIRE_DTYPE)
+    if array.ndim != 1:
+        raise ValueError(f"vector must be one-dimensional, got shape {array.shape}")
+
+    return _HEADER.pack(array.shape[0], 0) + array.tobytes()
+
+
+def decode_vector(data: bytes) -> np.ndarray:
+    """Decode pgvector's binary format into a float32 ``np.ndarray``."""
+
+    dim, _ = _HEADER.unpack_from(data)
+    return np.frombuffer(
+        data,
+        dtype=_WIRE_DTYPE,
+        count=dim,
+        offset=_HEADER.size,
+    ).astype(np.float32)
+
+
+async def register_vector_codec(conn: asyncpg.Connection) -> bool:
+    """Register the binary ``vector`` codec on a connection.
+
+    Returns ``False`` when the pgvector extension is not installed in the
+    connected database, in which case the connection is left unchanged.
+    """
+
+    try:
+        await conn.set_type_codec(
+            "vector",
+            schema="public",
+            encoder=encode_vector,
+            decoder=decode_vector,
+            format="binary",
+        )
+    except ValueError as exc:
+        # asyncpg raises ValueError for unknown types
+        logger.debug("pgvector type not available, codec not registered", error=str(exc))
+        return False
+
+    return True
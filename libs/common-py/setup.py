@@ -6,6 +6,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "asyncpg>=0.29.0",
+        "numpy>=1.26.0",
         "aio-pika>=9.3.1",
         "pydantic>=2.5.0",
         "structlog>=23.2.0",
@@ -1,2 +1,4 @@
 # Vision processing utilities
 from ._job_progress_manager import JobProgressManager
+from .inference_executor import InferenceExecutor
+from .micro_batcher import MicroBatcher
@@ -0,0 +1,120 @@
+"""Executor layer that keeps CPU-heavy vision work off the event loop."""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from common_py.logging_config import configure_logging
+from common_py.metrics import metrics
+
+logger = configure_logging("vision-common:inference_executor")
+
+EXECUTOR_KINDS = ("thread", "process")
+
+T = TypeVar("T")
+
+
+class InferenceExecutor:
+    """Run blocking calls on a sized thread or process pool.
+
+    ``thread`` pools suit torch, whose kernels release the GIL; ``process``
+    pools suit OpenCV feature extraction, where detector objects are not
+    shareable between threads. ``max_workers=0`` runs calls inline on the
+    event loop, which is what unit tests use. Queue depth and busy workers
+    are published as ``inference_executor.queue_depth`` and
+    ``inference_executor.busy_workers`` gauges tagged with the executor name.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: Optional[int] = None,
+        kind: str = "thread",
+    ) -> None:
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(
+                f"Unsupported executor kind: {kind}. Expected one of {EXECUTOR_KINDS}"
+            )
+
+        self.name = name
+        self.kind = kind
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max(0, max_workers)
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+        self._tags = {"executor": name}
+
+    @property
+    def inline(self) -> bool:
+        return self.max_workers == 0
+
+    @property
+    def busy_workers(self) -> int:
+        return min(self._in_flight, self.max_workers)
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self._in_flight - self.max_workers)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "busy_workers": self.busy_workers,
+            "queue_depth": self.queue_depth,
+        }
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                # Spawned workers do not inherit the event loop or its threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.name,
+                )
+            logger.info(
+                "Started inference executor",
+                executor=self.name,
+                kind=self.kind,
+                max_workers=self.max_workers,
+            )
+        return self._executor
+
+    def _publish_gauges(self) -> None:
+        metrics.set_gauge("inference_executor.queue_depth", self.queue_depth, self._tags)
+        metrics.set_gauge("inference_executor.busy_workers", self.busy_workers, self._tags)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run ``func(*args)`` on the pool and return its result.
+
+        For ``process`` executors ``func`` and its arguments must be
+        picklable, i.e. ``func`` has to be a module-level function.
+        """
+
+        if self.inline:
+            return func(*args)
+
+        self._in_flight += 1
+        self._publish_gauges()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._in_flight -= 1
+            self._publish_gauges()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,152 @@
+"""Dynamic micro-batching of concurrent per-item requests."""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Generic, List, Optional, Sequence, Set, Tuple, TypeVar
+
+from common_py.logging_config import configure_logging
+
+logger = configure_logging("vision-common:micro_batcher")
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+BatchFn = Callable[[Sequence[ItemT]], Awaitable[Sequence[ResultT]]]
+
+
+class MicroBatcher(Generic[ItemT, ResultT]):
+    """Coalesce concurrent :meth:`submit` calls into batched calls.
+
+    A background task waits for the first pending item, then keeps
+    collecting until ``max_batch_size`` items are queued or ``max_wait_ms``
+    milliseconds have passed, and hands the batch to ``batch_fn``.
+    ``batch_fn`` must return one result per item, in order; each caller
+    receives its own result, or the exception raised by ``batch_fn``.
+    Up to ``max_concurrent_batches`` batches run at once, so a pooled
+    ``batch_fn`` can keep several workers busy.
+    """
+
+    def __init__(
+        self,
+        batch_fn: BatchFn,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 20.0,
+        name: str = "micro_batcher",
+        max_concurrent_batches: int = 1,
+    ) -> None:
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.name = name
+        self._queue: "asyncio.Queue[Tuple[ItemT, asyncio.Future]]" = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+        self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+        self._in_flight: Set[asyncio.Task] = set()
+        self.batches_processed = 0
+        self.items_processed = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of items waiting to be batched."""
+
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the background batching task (idempotent)."""
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        """Stop the batching task and fail any requests still queued."""
+
+        tasks = [task for task in (self._worker, *self._in_flight) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker = None
+
+        while not self._queue.empty():
+            self._fail([self._queue.get_nowait()], RuntimeError(f"{self.name} stopped"))
+
+    async def submit(self, item: ItemT) -> ResultT:
+        """Queue ``item`` and wait for its result."""
+
+        self.start()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    @staticmethod
+    def _fail(batch: List[Tuple[ItemT, asyncio.Future]], exc: BaseException) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _collect(self, batch: List[Tuple[ItemT, asyncio.Future]]) -> None:
+        batch.append(await self._queue.get())
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # Still drain whatever is already queued
+                while len(batch) < self.max_batch_size and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+    async def _run(self) -> None:
+        while True:
+            await self._slots.acquire()
+            batch: List[Tuple[ItemT, asyncio.Future]] = []
+            try:
+                await self._collect(batch)
+            except asyncio.CancelledError:
+                self._slots.release()
+                self._fail(batch, RuntimeError(f"{self.name} stopped"))
+                raise
+
+            task = asyncio.create_task(self._process(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _process(self, batch: List[Tuple[ItemT, asyncio.Future]]) -> None:
+        try:
+            items = [item for item, _ in batch]
+            results = await self.batch_fn(items)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"{self.name} batch function returned {len(results)} "
+                    f"results for {len(items)} items"
+                )
+        except asyncio.CancelledError:
+            self._fail(batch, RuntimeError(f"{self.name} stopped"))
+            raise
+        except Exception as exc:
+            logger.error(
+                "Batch processing failed",
+                batcher=self.name,
+                batch_size=len(batch),
+                error=str(exc),
+            )
+            self._fail(batch, exc)
+            return
+        finally:
+            self._slots.release()
+
+        self.batches_processed += 1
+        self.items_processed += len(items)
+        logger.debug(
+            "Processed batch",
+            batcher=self.name,
+            batch_size=len(items),
+            pending=self.pending,
+        )
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
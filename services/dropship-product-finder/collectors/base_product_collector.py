@@ -1,8 +1,9 @@
+import asyncio
 from abc import abstractmethod
 from typing import List, Dict, Any, Optional
 from pathlib import Path
+from urllib.parse import urlsplit
 import httpx
-from io import BytesIO
 
 try:  # Pillow is optional in unit test environments
     from PIL import Image
@@ -10,6 +11,7 @@ except ImportError:  # pragma: no cover - exercised only when Pillow missing
     Image = None
 from common_py.logging_config import configure_logging
 from .interface import IProductCollector
+from .image_pipeline import normalize_image_async
 from config_loader import config
 
 logger = configure_logging("dropship-product-finder:base_product_collector")
@@ -23,11 +25,17 @@ class BaseProductCollector(IProductCollector):
         self.products_dir = self.data_root / "products"
         self.products_dir.mkdir(parents=True, exist_ok=True)
 
-        # HTTP client for downloading images (timeout is configurable)
+        # Pooled HTTP client for downloading images (timeout is configurable)
         self.client = httpx.AsyncClient(
             timeout=config.IMAGE_DOWNLOAD_TIMEOUT_SECS,
-            follow_redirects=True
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=config.IMAGE_DOWNLOAD_CONCURRENCY,
+                max_keepalive_connections=config.IMAGE_DOWNLOAD_CONCURRENCY,
+            ),
         )
+        # Keeps concurrent products from hammering a single image CDN
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
 
     @abstractmethod
     async def collect_products(self, query: str, top_k: int) -> List[Dict[str, Any]]:
@@ -49,7 +57,8 @@ class BaseProductCollector(IProductCollector):
             product_dir.mkdir(parents=True, exist_ok=True)
 
             # Download image
-            response = await self.client.get(image_url)
+            async with self._host_limit(image_url):
+                response = await self.client.get(image_url)
             response.raise_for_status()
 
             # Save original image
@@ -63,18 +72,12 @@ class BaseProductCollector(IProductCollector):
                     path=str(image_path),
                 )
             else:
-                # Process and normalize image
-                image = Image.open(BytesIO(response.content))
-
-                # Convert to RGB if needed
-                if image.mode != "RGB":
-                    image = image.convert("RGB")
-
-                # Resize to standard size (keeping aspect ratio)
-                image.thumbnail((400, 400), Image.Resampling.LANCZOS)
-
-                # Save processed image
-                image.save(image_path, "JPEG", quality=90)
+                # Normalize (RGB, 400px thumbnail, JPEG) off the event loop
+                await normalize_image_async(
+                    response.content,
+                    str(image_path),
+                    max_workers=config.IMAGE_PROCESS_WORKERS,
+                )
 
             logger.info(
                 "Downloaded and processed image",
@@ -93,6 +96,12 @@ class BaseProductCollector(IProductCollector):
             )
             return None
 
+    def _host_limit(self, image_url: str) -> asyncio.Semaphore:
+        host = urlsplit(image_url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(config.IMAGE_PER_HOST_CONCURRENCY)
+        return self._host_limits[host]
+
     async def close(self):
         """Close HTTP client"""
         await self.client.aclose()
@@ -0,0 +1,116 @@
+"""Image normalization off the event loop.
+
+Decoding, converting, thumbnailing and re-encoding product images is CPU
+bound, so collectors hand the downloaded bytes to a process pool instead of
+running Pillow on the event loop. JPEGs are decoded with Pillow's draft mode,
+which lets libjpeg downscale by a power of two while decoding instead of
+materializing the full-resolution image first. The same workers compute the
+perceptual hashes used to spot repeated listing photos.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Optional, Tuple
+
+THUMBNAIL_SIZE: Tuple[int, int] = (400, 400)
+JPEG_QUALITY = 90
+# dHash compares a 9x8 grayscale thumbnail column by column: 64 bits
+DHASH_SIZE = 8
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def normalize_image(
+    data: bytes, image_path: str, size: Tuple[int, int] = THUMBNAIL_SIZE
+) -> str:
+    """Decode ``data``, fit it into ``size`` as RGB and save it as JPEG at ``image_path``.
+
+    Runs in worker processes, so it only takes picklable arguments and
+    imports Pillow itself.
+    """
+    from PIL import Image
+
+    with Image.open(BytesIO(data)) as image:
+        if image.format == "JPEG":
+            # Let the decoder downscale; thumbnail() finishes the exact resize
+            image.draft("RGB", size)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        image.thumbnail(size, Image.Resampling.LANCZOS)
+        image.save(image_path, "JPEG", quality=JPEG_QUALITY)
+    return image_path
+
+
+def image_hash(image_path: str) -> Optional[int]:
+    """Return the 64-bit difference hash (dHash) of an image file as a signed BIGINT.
+
+    Returns None when the file cannot be decoded.
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(image_path) as image:
+            image.draft("L", (DHASH_SIZE + 1, DHASH_SIZE))
+            pixels = list(
+                image.convert("L")
+                .resize((DHASH_SIZE + 1, DHASH_SIZE), Image.Resampling.BILINEAR)
+                .getdata()
+            )
+    except (OSError, ValueError):
+        return None
+
+    value = 0
+    for row in range(DHASH_SIZE):
+        for col in range(DHASH_SIZE):
+            left = pixels[row * (DHASH_SIZE + 1) + col]
+            right = pixels[row * (DHASH_SIZE + 1) + col + 1]
+            value = (value << 1) | (left > right)
+    # product_images.phash is a signed BIGINT
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _get_executor(max_workers: Optional[int]) -> Optional[ProcessPoolExecutor]:
+    global _executor
+    if max_workers == 0:
+        return None
+    if _executor is None:
+        # Spawned workers avoid inheriting the event loop and its threads
+        _executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+async def normalize_image_async(
+    data: bytes, image_path: str, max_workers: Optional[int] = None
+) -> str:
+    """Run :func:`normalize_image` in the shared process pool.
+
+    ``max_workers=0`` uses the loop's default thread pool instead, which is
+    what unit tests use.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(max_workers), normalize_image, data, image_path
+    )
+
+
+async def image_hash_async(
+    image_path: str, max_workers: Optional[int] = None
+) -> Optional[int]:
+    """Run :func:`image_hash` in the shared process pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(max_workers), image_hash, image_path
+    )
+
+
+def shutdown() -> None:
+    """Stop the worker processes; the pool is recreated on next use."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
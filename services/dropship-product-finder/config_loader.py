@@ -73,6 +73,16 @@ class DropshipProductFinderConfig:
     BROWSE_CONCURRENCY: int = int(os.getenv("BROWSE_CONCURRENCY", "4"))
     ITEM_CONCURRENCY: int = int(os.getenv("ITEM_CONCURRENCY", "4"))
     IMAGE_DOWNLOAD_TIMEOUT_SECS: float = float(os.getenv("IMAGE_DOWNLOAD_TIMEOUT_SECS", 30.0))
+    # Image pipeline: pooled connections, per-host limit and normalization workers
+    IMAGE_DOWNLOAD_CONCURRENCY: int = int(os.getenv("IMAGE_DOWNLOAD_CONCURRENCY", "32"))
+    IMAGE_PER_HOST_CONCURRENCY: int = int(os.getenv("IMAGE_PER_HOST_CONCURRENCY", "8"))
+    IMAGE_PROCESS_WORKERS: int = int(os.getenv("IMAGE_PROCESS_WORKERS", str(os.cpu_count() or 1)))
+
+    # Near-duplicate product images (dHash Hamming distance out of 64 bits)
+    PHASH_DEDUP_ENABLED: bool = os.getenv("PHASH_DEDUP_ENABLED", "true").lower() == "true"
+    PHASH_MAX_DISTANCE: int = int(os.getenv("PHASH_MAX_DISTANCE", "4"))
+    PHASH_LOOKBACK_DAYS: int = int(os.getenv("PHASH_LOOKBACK_DAYS", "7"))
+    PHASH_INDEX_REFRESH_SECS: float = float(os.getenv("PHASH_INDEX_REFRESH_SECS", "300"))
 
     @property
     def EBAY_CLIENT_ID(self) -> str:
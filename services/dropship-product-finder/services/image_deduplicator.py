@@ -0,0 +1,176 @@
+import time
+from typing import Dict, List, Optional, Tuple
+
+from common_py.database import DatabaseManager
+from common_py.logging_config import configure_logging
+from collectors import image_pipeline
+from config_loader import config
+
+logger = configure_logging("dropship-product-finder:image_deduplicator")
+
+_HASH_MASK = (1 << 64) - 1
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two 64-bit hashes (signed or unsigned)."""
+    return bin((a ^ b) & _HASH_MASK).count("1")
+
+
+class BKTree:
+    """Burkhard-Keller tree over 64-bit perceptual hashes.
+
+    Children are keyed by their Hamming distance to the parent, so a radius
+    search only descends into children whose key lies within ``radius`` of
+    the query's distance to the node (triangle inequality).
+    """
+
+    def __init__(self):
+        self._root: Optional[Tuple[int, str, Dict[int, tuple]]] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, phash: int, img_id: str) -> None:
+        if self._root is None:
+            self._root = (phash, img_id, {})
+            self._size = 1
+            return
+
+        node = self._root
+        while True:
+            distance = hamming_distance(phash, node[0])
+            if distance == 0:
+                # Same hash already indexed; the first image stays canonical
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = (phash, img_id, {})
+                self._size += 1
+                return
+            node = child
+
+    def nearest(self, phash: int, radius: int) -> Optional[Tuple[int, str]]:
+        """Closest ``(distance, img_id)`` within ``radius`` of ``phash``, or None."""
+        if self._root is None:
+            return None
+
+        best: Optional[Tuple[int, str]] = None
+        stack = [self._root]
+        while stack:
+            node_hash, node_id, children = stack.pop()
+            distance = hamming_distance(phash, node_hash)
+            if distance <= radius and (best is None or distance < best[0]):
+                best = (distance, node_id)
+                if distance == 0:
+                    break
+            limit = radius if best is None else min(radius, best[0])
+            for key, child in children.items():
+                if distance - limit <= key <= distance + limit:
+                    stack.append(child)
+        return best
+
+
+class ImageDeduplicator:
+    """Finds earlier copies of a product photo by perceptual hash.
+
+    Canonical images of the running job are indexed as their products are
+    committed. Canonical images of recent jobs are loaded from the database
+    once their features are complete, so a duplicate can copy them at insert
+    time; that index is reloaded every ``PHASH_INDEX_REFRESH_SECS``.
+    """
+
+    def __init__(
+        self,
+        db: DatabaseManager,
+        max_distance: Optional[int] = None,
+        lookback_days: Optional[int] = None,
+        refresh_secs: Optional[float] = None,
+    ):
+        self.db = db
+        self.max_distance = config.PHASH_MAX_DISTANCE if max_distance is None else max_distance
+        self.lookback_days = config.PHASH_LOOKBACK_DAYS if lookback_days is None else lookback_days
+        self.refresh_secs = config.PHASH_INDEX_REFRESH_SECS if refresh_secs is None else refresh_secs
+        self._job_trees: Dict[str, BKTree] = {}
+        self._recent = BKTree()
+        self._recent_loaded_at: Optional[float] = None
+
+    async def hash_image(self, local_path: str) -> Optional[int]:
+        """dHash of a downloaded image, computed in the image process pool."""
+        try:
+            return await image_pipeline.image_hash_async(
+                local_path, max_workers=config.IMAGE_PROCESS_WORKERS
+            )
+        except Exception as e:
+            logger.warning("Failed to hash image", local_path=local_path, error=str(e))
+            return None
+
+    async def resolve(
+        self, job_id: str, images: List[Tuple[str, Optional[int]]]
+    ) -> Dict[str, str]:
+        """Map each duplicate among one product's images to its canonical image ID.
+
+        ``images`` are ``(img_id, phash)`` pairs in listing order. A photo is
+        matched against earlier photos of the same product, then against the
+        job's committed images, then against recent jobs. Images without a
+        hash, or without a match, are left out of the result.
+        """
+        product_tree = BKTree()
+        links: Dict[str, str] = {}
+        for img_id, phash in images:
+            if phash is None:
+                continue
+            match = product_tree.nearest(phash, self.max_distance)
+            if match is None and job_id in self._job_trees:
+                match = self._job_trees[job_id].nearest(phash, self.max_distance)
+            if match is None and self.lookback_days > 0:
+                await self._refresh_recent()
+                match = self._recent.nearest(phash, self.max_distance)
+
+            if match:
+                links[img_id] = match[1]
+            else:
+                product_tree.add(phash, img_id)
+        return links
+
+    def register(self, job_id: str, img_id: str, phash: Optional[int]) -> None:
+        """Index a committed canonical image for the rest of ``job_id``."""
+        if phash is not None:
+            self._job_trees.setdefault(job_id, BKTree()).add(phash, img_id)
+
+    def release_job(self, job_id: str) -> None:
+        self._job_trees.pop(job_id, None)
+
+    async def _refresh_recent(self) -> None:
+        now = time.monotonic()
+        if self._recent_loaded_at is not None and now - self._recent_loaded_at < self.refresh_secs:
+            return
+        self._recent_loaded_at = now
+
+        try:
+            rows = await self.db.fetch_all(
+                """
+                SELECT img_id, phash
+                FROM product_images
+                WHERE phash IS NOT NULL
+                  AND canonical_img_id IS NULL
+                  AND emb_rgb IS NOT NULL
+                  AND kp_blob_path IS NOT NULL
+                  AND created_at >= NOW() - make_interval(days => $1)
+                ORDER BY created_at
+                """,
+                self.lookback_days,
+            )
+        except Exception as e:
+            logger.warning("Failed to load recent image hashes", error=str(e))
+            return
+
+        recent = BKTree()
+        for row in rows:
+            recent.add(row["phash"], row["img_id"])
+        self._recent = recent
+        logger.info(
+            "Loaded recent image hashes",
+            images=len(recent),
+            lookback_days=self.lookback_days,
+        )
@@ -1,7 +1,7 @@
 import uuid
 import asyncio
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import asyncpg
 from common_py.database import DatabaseManager
 from common_py.messaging import MessageBroker
@@ -9,6 +9,7 @@ from common_py.crud import ProductCRUD, ProductImageCRUD
 from common_py.models import Product, ProductImage
 from common_py.logging_config import configure_logging
 from collectors.base_product_collector import BaseProductCollector
+from .image_deduplicator import ImageDeduplicator
 
 logger = configure_logging("dropship-product-finder:image_storage_manager")
 
@@ -19,19 +20,23 @@ class ImageStorageManager:
         db: DatabaseManager,
         broker: MessageBroker,
         collectors: Dict[str, BaseProductCollector],
+        deduplicator: Optional[ImageDeduplicator] = None,
     ):
         self.db = db
         self.broker = broker
         self.product_crud = ProductCRUD(db)
         self.image_crud = ProductImageCRUD(db)
         self.collectors = collectors
+        self.deduplicator = deduplicator
 
     async def store_product(
         self, product_data: Dict[str, Any], job_id: str, source: str, correlation_id: str
     ):
         """Store a single product and its images within a single transaction on one DB connection.
 
-        Ensures product insert and subsequent image inserts are atomic to avoid FK violations.
+        Images are downloaded concurrently before the transaction starts, so the
+        connection is not held across network I/O. Ensures product insert and the
+        bulk image insert are atomic to avoid FK violations.
         Defers publishing image.ready events until after COMMIT to avoid race conditions.
         """
         start_time = time.perf_counter()
@@ -53,6 +58,10 @@ class ImageStorageManager:
         if not self.db.pool:
             raise RuntimeError("Database not connected")
 
+        product_images = await self._download_product_images(product, images, source)
+        if self.deduplicator:
+            await self._link_duplicate_images(product_images, job_id)
+
         async with self.db.pool.acquire() as conn:
             try:
                 # Explicit transaction to guarantee single-connection ordering
@@ -91,8 +100,8 @@ class ImageStorageManager:
 
                 # Insert images using same connection with FK-violation-aware retry
                 events_to_publish: List[Dict[str, Any]] = []
-                await self._download_and_store_product_images(
-                    product, images, source, job_id, correlation_id, conn, events_to_publish
+                await self._store_product_images(
+                    product, product_images, job_id, correlation_id, conn, events_to_publish
                 )
 
                 # Commit transaction
@@ -106,6 +115,12 @@ class ImageStorageManager:
                     elapsed_ms=elapsed_ms,
                 )
 
+                # Later products of the job can now link to these images
+                if self.deduplicator:
+                    for image in product_images:
+                        if not image.canonical_img_id:
+                            self.deduplicator.register(job_id, image.img_id, image.phash)
+
                 # Publish buffered events after commit
                 for evt in events_to_publish:
                     await self.broker.publish_event(
@@ -134,42 +149,45 @@ class ImageStorageManager:
                 )
                 raise
 
-    async def _download_and_store_product_images(
-        self,
-        product: Product,
-        image_urls: List[str],
-        source: str,
-        job_id: str,
-        correlation_id: str,
-        conn: asyncpg.Connection,
-        events_buffer: List[Dict[str, Any]],
-    ):
-        """
-        Download images and store them using the provided DB connection.
-        Resilient to FK violations via bounded retry that polls for product existence.
+    async def _download_product_images(
+        self, product: Product, image_urls: List[str], source: str
+    ) -> List[ProductImage]:
+        """Download all images of a product concurrently.
+
+        The collector bounds connections per host, so concurrent products share
+        the image CDNs fairly. Failed downloads are logged and skipped.
         """
-        # Retry/backoff settings
-        base_delay = 0.2
-        backoff_factor = 2.0
-        max_delay = 2.0
-        deadline_s = 20.0
+        async def _download(image_url: str, image_id: str):
+            local_path = await self.collectors[source].download_image(
+                image_url, product.product_id, image_id
+            )
+            phash = None
+            if local_path and self.deduplicator:
+                phash = await self.deduplicator.hash_image(local_path)
+            return local_path, phash
 
-        for i, image_url in enumerate(image_urls):
-            image_id = f"{product.product_id}_img_{i}"
-            try:
-                local_path = await self.collectors[source].download_image(
-                    image_url, product.product_id, image_id
-                )
-            except Exception as dl_err:
+        image_ids = [f"{product.product_id}_img_{i}" for i in range(len(image_urls))]
+        results = await asyncio.gather(
+            *(
+                _download(image_url, image_id)
+                for image_url, image_id in zip(image_urls, image_ids)
+            ),
+            return_exceptions=True,
+        )
+
+        product_images: List[ProductImage] = []
+        for image_url, image_id, result in zip(image_urls, image_ids, results):
+            if isinstance(result, BaseException):
                 logger.error(
                     "Failed to download image",
                     product_id=product.product_id,
                     image_id=image_id,
                     image_url=image_url,
-                    error=str(dl_err),
+                    error=str(result),
                 )
                 continue
 
+            local_path, phash = result
             if not local_path:
                 logger.error(
                     "Collector returned empty local_path for image",
@@ -179,76 +197,141 @@ class ImageStorageManager:
                 )
                 continue
 
-            image = ProductImage(
-                img_id=image_id,
-                product_id=product.product_id,
-                local_path=local_path,
+            product_images.append(
+                ProductImage(
+                    img_id=image_id,
+                    product_id=product.product_id,
+                    local_path=local_path,
+                    phash=phash,
+                )
             )
+        return product_images
 
-            # Try idempotent insert; on FK violation, poll for product existence with backoff
-            start_time = time.perf_counter()
-            delay = base_delay
-            while True:
-                try:
-                    # Use connection-scoped insert for atomicity
-                    await self.image_crud.create_product_image_with_conn(image, conn)
+    async def _link_duplicate_images(self, images: List[ProductImage], job_id: str):
+        """Point near-duplicate images at the canonical image whose features they reuse.
+
+        Linked images are stored but not announced, so segmentation, embedding
+        and keypoint extraction run once per distinct photo.
+        """
+        links = await self.deduplicator.resolve(
+            job_id, [(image.img_id, image.phash) for image in images]
+        )
+        for image in images:
+            image.canonical_img_id = links.get(image.img_id)
+        if links:
+            logger.info(
+                "Linked duplicate product images",
+                job_id=job_id,
+                product_id=images[0].product_id,
+                duplicates=len(links),
+                images_count=len(images),
+            )
 
-                    # Buffer event for post-commit publishing
+    async def _store_product_images(
+        self,
+        product: Product,
+        images: List[ProductImage],
+        job_id: str,
+        correlation_id: str,
+        conn: asyncpg.Connection,
+        events_buffer: List[Dict[str, Any]],
+    ):
+        """
+        Insert a product's images with one statement using the provided DB connection.
+        Resilient to FK violations via bounded retry that polls for product existence.
+        """
+        if not images:
+            return
+
+        # Retry/backoff settings
+        base_delay = 0.2
+        backoff_factor = 2.0
+        max_delay = 2.0
+        deadline_s = 20.0
+
+        # Canonical images from earlier products stay locked until COMMIT, so a
+        # concurrent feature update cannot miss the duplicates linked to them
+        own_ids = {image.img_id for image in images}
+        external_ids = {
+            image.canonical_img_id
+            for image in images
+            if image.canonical_img_id and image.canonical_img_id not in own_ids
+        }
+        if external_ids:
+            existing = set(
+                await self.image_crud.lock_product_images_with_conn(sorted(external_ids), conn)
+            )
+            for image in images:
+                if image.canonical_img_id in external_ids - existing:
+                    # Canonical was deleted since it was indexed; process this copy
+                    image.canonical_img_id = None
+
+        # Try idempotent insert; on FK violation, poll for product existence with backoff
+        start_time = time.perf_counter()
+        delay = base_delay
+        while True:
+            try:
+                # Use connection-scoped insert for atomicity
+                await self.image_crud.create_product_images_with_conn(images, conn)
+
+                # Buffer events for post-commit publishing; duplicates reuse canonical features
+                for image in images:
+                    if image.canonical_img_id:
+                        continue
                     events_buffer.append(
                         {
                             "topic": "products.image.ready",
                             "payload": {
                                 "product_id": product.product_id,
-                                "image_id": image_id,
-                                "local_path": local_path,
+                                "image_id": image.img_id,
+                                "local_path": image.local_path,
                                 "job_id": job_id,
                             },
                             "correlation_id": correlation_id,
                         }
                     )
-                    break
-                except Exception as e:
-                    # Detect FK violation by SQLSTATE or message text
-                    msg = str(e).lower()
-                    is_fk_violation = (
-                        "foreign key" in msg
-                        or "23503" in msg  # SQLSTATE for FK violation
-                        or isinstance(e, asyncpg.ForeignKeyViolationError)
+                return
+            except Exception as e:
+                # Detect FK violation by SQLSTATE or message text
+                msg = str(e).lower()
+                is_fk_violation = (
+                    "foreign key" in msg
+                    or "23503" in msg  # SQLSTATE for FK violation
+                    or isinstance(e, asyncpg.ForeignKeyViolationError)
+                )
+                elapsed = time.perf_counter() - start_time
+                if not is_fk_violation or elapsed >= deadline_s:
+                    logger.error(
+                        "Image insert failed (not retriable or deadline exceeded)",
+                        job_id=job_id,
+                        product_id=product.product_id,
+                        images_count=len(images),
+                        error=str(e),
+                        elapsed_s=round(elapsed, 3),
                     )
-                    elapsed = time.perf_counter() - start_time
-                    if not is_fk_violation or elapsed >= deadline_s:
-                        logger.error(
-                            "Image insert failed (not retriable or deadline exceeded)",
-                            job_id=job_id,
-                            product_id=product.product_id,
-                            image_id=image_id,
-                            image_url=image_url,
-                            error=str(e),
-                            elapsed_s=round(elapsed, 3),
-                        )
-                        # Skip or abort per existing policy: skip this image
-                        break
-
-                    # Poll for product existence before retrying
-                    try:
-                        exists = await conn.fetchval(
-                            "SELECT 1 FROM products WHERE product_id = $1",
-                            product.product_id,
-                        )
-                    except Exception as poll_err:
-                        exists = None
-                        logger.error(
-                            "Product existence poll failed",
-                            job_id=job_id,
-                            product_id=product.product_id,
-                            error=str(poll_err),
-                        )
-
-                    if exists:
-                        # Exponential backoff before retrying insert
-                        await asyncio.sleep(delay)
-                        delay = min(delay * backoff_factor, max_delay)
-                    else:
-                        # If product still not visible, wait then continue polling
-                        await asyncio.sleep(delay)
-                        delay = min(delay * backoff_factor, max_delay)
+                    # Skip or abort per existing policy: skip these images
+                    return
+
+                # Poll for product existence before retrying
+                try:
+                    exists = await conn.fetchval(
+                        "SELECT 1 FROM products WHERE product_id = $1",
+                        product.product_id,
+                    )
+                except Exception as poll_err:
+                    exists = None
+                    logger.error(
+                        "Product existence poll failed",
+                        job_id=job_id,
+                        product_id=product.product_id,
+                        error=str(poll_err),
+                    )
+
+                if exists:
+                    # Exponential backoff before retrying insert
+                    await asyncio.sleep(delay)
+                    delay = min(delay * backoff_factor, max_delay)
+                else:
+                    # If product still not visible, wait then continue polling
+                    await asyncio.sleep(delay)
+                    delay = min(delay * backoff_factor, max_delay)
@@ -4,12 +4,14 @@ from typing import Dict, Any, Optional, Set
 from common_py.database import DatabaseManager
 from common_py.messaging import MessageBroker
 from common_py.logging_config import configure_logging
+from collectors import image_pipeline
 from collectors.base_product_collector import BaseProductCollector
 from collectors.amazon_product_collector import AmazonProductCollector
 from collectors.ebay.ebay_product_collector import EbayProductCollector
 from config_loader import config
 from .product_collection_manager import ProductCollectionManager
 from .image_storage_manager import ImageStorageManager
+from .image_deduplicator import ImageDeduplicator
 from collectors.mock_ebay_collector import MockEbayCollector
 
 logger = configure_logging("dropship-product-finder:service")
@@ -46,7 +48,10 @@ class DropshipProductFinderService:
                 ),
             }
 
-        self.image_storage_manager = ImageStorageManager(db, broker, self.collectors)
+        self.image_deduplicator = ImageDeduplicator(db) if config.PHASH_DEDUP_ENABLED else None
+        self.image_storage_manager = ImageStorageManager(
+            db, broker, self.collectors, deduplicator=self.image_deduplicator
+        )
         self.product_collection_manager = ProductCollectionManager(
             self.collectors, self.image_storage_manager
         )
@@ -75,20 +80,25 @@ class DropshipProductFinderService:
                 query_count=len(queries),
             )
 
-            (
-                amazon_count,
-                ebay_count,
-            ) = await self.product_collection_manager.collect_and_store_products(
-                job_id, queries, top_amz, top_ebay, correlation_id
-            )
+            try:
+                (
+                    amazon_count,
+                    ebay_count,
+                ) = await self.product_collection_manager.collect_and_store_products(
+                    job_id, queries, top_amz, top_ebay, correlation_id
+                )
+            finally:
+                if self.image_deduplicator:
+                    self.image_deduplicator.release_job(job_id)
 
+            # Duplicates linked to a canonical image are not sent downstream
             total_images = (
                 await self.db.fetch_val(
                     """
                     SELECT COUNT(*)
                     FROM product_images pi
                     JOIN products p ON pi.product_id = p.product_id
-                    WHERE p.job_id = $1
+                    WHERE p.job_id = $1 AND pi.canonical_img_id IS NULL
                     """,
                     job_id,
                 )
@@ -195,6 +205,7 @@ class DropshipProductFinderService:
         )
 
     async def close(self):
-        """Close all collectors"""
+        """Close all collectors and the image normalization pool"""
         for collector in self.collectors.values():
             await collector.close()
+        image_pipeline.shutdown()
@@ -1,3 +1,5 @@
+import asyncio
+from io import BytesIO
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -72,3 +74,72 @@ async def test_download_image_handles_download_error(monkeypatch, tmp_path):
     assert error_args[0] == "Failed to download image"
     assert error_kwargs["image_url"] == "https://example.com/404.jpg"
     assert error_kwargs["image_id"] == "image-2"
+
+
+@pytest.mark.asyncio
+async def test_download_image_limits_requests_per_host(monkeypatch, tmp_path):
+    monkeypatch.setattr("collectors.base_product_collector.Image", None)
+    monkeypatch.setattr("collectors.base_product_collector.config.IMAGE_PER_HOST_CONCURRENCY", 1)
+
+    collector = DummyCollector(str(tmp_path))
+    await collector.client.aclose()
+
+    in_flight = {"a.example.com": 0, "b.example.com": 0}
+    peak = {"a.example.com": 0, "b.example.com": 0}
+
+    async def fake_get(url):
+        host = url.split("/")[2]
+        in_flight[host] += 1
+        peak[host] = max(peak[host], in_flight[host])
+        await asyncio.sleep(0)
+        in_flight[host] -= 1
+        response = SimpleNamespace(content=b"image-bytes")
+        response.raise_for_status = lambda: None
+        return response
+
+    collector.client = AsyncMock()
+    collector.client.get.side_effect = fake_get
+
+    paths = await asyncio.gather(
+        *(
+            collector.download_image(f"https://{host}/{i}.jpg", "product-3", f"{host}-{i}")
+            for host in ("a.example.com", "b.example.com")
+            for i in range(3)
+        )
+    )
+
+    assert all(paths)
+    assert peak == {"a.example.com": 1, "b.example.com": 1}
+
+
+def test_normalize_image_fits_jpeg_into_thumbnail(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    from collectors.image_pipeline import normalize_image
+
+    source = BytesIO()
+    Image.new("L", (1600, 1200), color=128).save(source, "JPEG")
+    image_path = tmp_path / "image.jpg"
+
+    assert normalize_image(source.getvalue(), str(image_path)) == str(image_path)
+
+    with Image.open(image_path) as normalized:
+        assert normalized.mode == "RGB"
+        assert normalized.size == (400, 300)
+
+
+def test_image_hash_matches_resized_copy_and_differs_for_other_photo(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    from collectors.image_pipeline import image_hash
+    from services.image_deduplicator import hamming_distance
+
+    # Brightens left to right, so every dHash column comparison is stable
+    gradient = Image.linear_gradient("L").rotate(90).resize((640, 480))
+    gradient.save(tmp_path / "original.jpg", "JPEG")
+    gradient.resize((320, 240)).save(tmp_path / "resized.jpg", "JPEG")
+    gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT).save(tmp_path / "other.jpg", "JPEG")
+
+    original = image_hash(str(tmp_path / "original.jpg"))
+
+    assert hamming_distance(original, image_hash(str(tmp_path / "resized.jpg"))) <= 4
+    assert hamming_distance(original, image_hash(str(tmp_path / "other.jpg"))) > 4
+    assert image_hash(str(tmp_path / "missing.jpg")) is None
@@ -0,0 +1,104 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.image_deduplicator import BKTree, ImageDeduplicator, hamming_distance
+
+pytestmark = pytest.mark.unit
+
+JOB_ID = "job-123"
+BASE_HASH = 0x0F0F_0F0F_0F0F_0F0F
+
+
+def _flip(phash: int, bits: int) -> int:
+    """Return ``phash`` with its lowest ``bits`` bits inverted."""
+    return phash ^ ((1 << bits) - 1)
+
+
+@pytest.fixture
+def db():
+    return MagicMock(fetch_all=AsyncMock(return_value=[]))
+
+
+@pytest.fixture
+def deduplicator(db):
+    return ImageDeduplicator(db, max_distance=4, lookback_days=7, refresh_secs=300)
+
+
+def test_hamming_distance_handles_signed_hashes():
+    assert hamming_distance(-1, 0) == 64
+    assert hamming_distance(BASE_HASH, _flip(BASE_HASH, 3)) == 3
+
+
+def test_bk_tree_returns_closest_match_within_radius():
+    tree = BKTree()
+    tree.add(BASE_HASH, "root")
+    tree.add(_flip(BASE_HASH, 20), "other")
+    tree.add(_flip(BASE_HASH, 2), "near")
+
+    assert tree.nearest(_flip(BASE_HASH, 1), radius=4) == (1, "root")
+    assert tree.nearest(_flip(BASE_HASH, 3), radius=4) == (1, "near")
+    assert tree.nearest(_flip(BASE_HASH, 12), radius=4) is None
+    assert len(tree) == 3
+
+
+def test_bk_tree_keeps_first_image_for_identical_hashes():
+    tree = BKTree()
+    tree.add(BASE_HASH, "first")
+    tree.add(BASE_HASH, "second")
+
+    assert tree.nearest(BASE_HASH, radius=0) == (0, "first")
+    assert len(tree) == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_links_repeated_photos_within_product(deduplicator):
+    links = await deduplicator.resolve(
+        JOB_ID,
+        [
+            ("img_0", BASE_HASH),
+            ("img_1", _flip(BASE_HASH, 30)),
+            ("img_2", _flip(BASE_HASH, 2)),
+            ("img_3", None),
+        ],
+    )
+
+    assert links == {"img_2": "img_0"}
+
+
+@pytest.mark.asyncio
+async def test_resolve_links_to_registered_images_of_the_same_job(deduplicator):
+    deduplicator.register(JOB_ID, "earlier_img", BASE_HASH)
+
+    assert await deduplicator.resolve(JOB_ID, [("img_0", _flip(BASE_HASH, 1))]) == {"img_0": "earlier_img"}
+    assert await deduplicator.resolve("other-job", [("img_0", _flip(BASE_HASH, 1))]) == {}
+
+    deduplicator.release_job(JOB_ID)
+    assert await deduplicator.resolve(JOB_ID, [("img_0", _flip(BASE_HASH, 1))]) == {}
+
+
+@pytest.mark.asyncio
+async def test_resolve_links_to_processed_images_of_recent_jobs(deduplicator, db):
+    db.fetch_all.return_value = [{"img_id": "recent_img", "phash": BASE_HASH}]
+
+    assert await deduplicator.resolve(JOB_ID, [("img_0", BASE_HASH)]) == {"img_0": "recent_img"}
+    await deduplicator.resolve(JOB_ID, [("img_1", BASE_HASH)])
+
+    # The recent-jobs index is reused until it is due for a refresh
+    db.fetch_all.assert_called_once()
+    assert db.fetch_all.call_args[0][1] == 7
+
+
+@pytest.mark.asyncio
+async def test_resolve_without_lookback_skips_database(db):
+    deduplicator = ImageDeduplicator(db, max_distance=4, lookback_days=0, refresh_secs=300)
+
+    assert await deduplicator.resolve(JOB_ID, [("img_0", BASE_HASH)]) == {}
+    db.fetch_all.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_recent_index_load_failure_is_not_fatal(deduplicator, db):
+    db.fetch_all.side_effect = Exception("db down")
+
+    assert await deduplicator.resolve(JOB_ID, [("img_0", BASE_HASH)]) == {}
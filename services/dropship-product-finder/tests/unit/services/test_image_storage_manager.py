@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from services.image_storage_manager import ImageStorageManager
 import pytest
@@ -34,7 +35,7 @@ def mock_dependencies():
     conn_mock = MagicMock(execute=AsyncMock(), __aenter__=AsyncMock(return_value=conn_execute_mock), __aexit__=AsyncMock())
     db_mock.pool.acquire = MagicMock(return_value=conn_mock)
     broker_mock = MagicMock(publish_event=AsyncMock())
-    image_crud_mock = MagicMock(create_product_image=AsyncMock(), create_product_image_with_conn=AsyncMock())
+    image_crud_mock = MagicMock(create_product_image=AsyncMock(), create_product_images_with_conn=AsyncMock())
 
     # Mock collector for download_image
     collector_mock = MagicMock()
@@ -65,8 +66,11 @@ async def test_store_product_success(mock_dependencies):
     # 2. Verify images were downloaded
     assert collector_mock.download_image.call_count == 2
 
-    # 3. Verify images were stored in database
-    assert image_crud_mock.create_product_image_with_conn.call_count == 2
+    # 3. Verify images were stored in database with one bulk insert
+    image_crud_mock.create_product_images_with_conn.assert_called_once()
+    stored_images = image_crud_mock.create_product_images_with_conn.call_args[0][0]
+    assert [image.img_id for image in stored_images] == [IMAGE_ID_0, IMAGE_ID_1]
+    assert [image.local_path for image in stored_images] == [LOCAL_PATH_0, LOCAL_PATH_1]
 
     # 4. Verify events were published
     assert broker_mock.publish_event.call_count == 2
@@ -90,13 +94,12 @@ async def test_store_product_handles_download_failure(mock_dependencies):
     # 2. Verify download attempts
     assert collector_mock.download_image.call_count == 2
 
-    # 3. Verify ProductImage insert was only called once for successful download
-    assert image_crud_mock.create_product_image_with_conn.call_count == 1
-    # Check the call parameters - the mock includes both image and conn parameters
-    actual_calls = image_crud_mock.create_product_image_with_conn.call_args_list
-    assert len(actual_calls) == 1
-    # Extract just the image parameter (first parameter) from the call
-    actual_image_param = actual_calls[0][0][0]  # First call, first positional argument (image)
+    # 3. Verify only the successful download was passed to the bulk insert
+    assert image_crud_mock.create_product_images_with_conn.call_count == 1
+    # Check the call parameters - the mock includes both images and conn parameters
+    actual_images = image_crud_mock.create_product_images_with_conn.call_args[0][0]
+    assert len(actual_images) == 1
+    actual_image_param = actual_images[0]
     assert actual_image_param.img_id == IMAGE_ID_0
     assert actual_image_param.product_id == PRODUCT_ID
     assert actual_image_param.local_path == LOCAL_PATH_0
@@ -124,11 +127,11 @@ async def test_store_product_handles_download_exception(mock_dependencies):
     assert collector_mock.download_image.call_count == 2
 
     # 3. Verify only one image was stored (successful download)
-    assert image_crud_mock.create_product_image_with_conn.call_count == 1
+    assert image_crud_mock.create_product_images_with_conn.call_count == 1
     # Check the call parameters
-    actual_calls = image_crud_mock.create_product_image_with_conn.call_args_list
-    assert len(actual_calls) == 1
-    actual_image_param = actual_calls[0][0][0]
+    actual_images = image_crud_mock.create_product_images_with_conn.call_args[0][0]
+    assert len(actual_images) == 1
+    actual_image_param = actual_images[0]
     assert actual_image_param.img_id == IMAGE_ID_0
     assert actual_image_param.product_id == PRODUCT_ID
     assert actual_image_param.local_path == LOCAL_PATH_0
@@ -163,7 +166,7 @@ async def test_store_product_handles_event_publishing_failure(mock_dependencies)
 
     # 1. Verify product and images were still stored despite publishing failure
     assert db_mock.pool.acquire.called
-    assert image_crud_mock.create_product_image_with_conn.call_count == 2
+    assert image_crud_mock.create_product_images_with_conn.call_count == 1
 
 
 @pytest.mark.asyncio
@@ -171,7 +174,7 @@ async def test_store_product_handles_insertion_failure(mock_dependencies):
     manager, db_mock, _, image_crud_mock, collector_mock = mock_dependencies
 
     # Simulate database insertion failure
-    image_crud_mock.create_product_image_with_conn = AsyncMock(side_effect=Exception("Database constraint"))
+    image_crud_mock.create_product_images_with_conn = AsyncMock(side_effect=Exception("Database constraint"))
 
     with patch('uuid.uuid4', return_value=MagicMock(spec=uuid.UUID, hex=PRODUCT_ID, __str__=lambda self: PRODUCT_ID)), \
             patch('services.image_storage_manager.logger'):
@@ -199,3 +202,86 @@ async def test_store_product_no_event_for_failed_download(mock_dependencies):
 
     # 2. Verify no events were published since no images were downloaded
     broker_mock.publish_event.assert_not_called()
+    image_crud_mock.create_product_images_with_conn.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_store_product_downloads_images_concurrently(mock_dependencies):
+    manager, _, _, image_crud_mock, collector_mock = mock_dependencies
+
+    started = []
+    release = asyncio.Event()
+
+    async def slow_download(image_url, product_id, image_id):
+        started.append(image_id)
+        await release.wait()
+        return f"/data/{image_id}.jpg"
+
+    collector_mock.download_image.side_effect = slow_download
+
+    with patch('uuid.uuid4', return_value=MagicMock(spec=uuid.UUID, hex=PRODUCT_ID, __str__=lambda self: PRODUCT_ID)), \
+            patch('services.image_storage_manager.logger'):
+        store_task = asyncio.create_task(
+            manager.store_product(PRODUCT_DATA, JOB_ID, SOURCE, "test_correlation_id")
+        )
+        while len(started) < 2 and not store_task.done():
+            await asyncio.sleep(0)
+
+        # Both downloads are in flight before either has finished
+        assert started == [IMAGE_ID_0, IMAGE_ID_1]
+        release.set()
+        await store_task
+
+    image_crud_mock.create_product_images_with_conn.assert_called_once()
+
+
+@pytest.fixture
+def dedup_manager(mock_dependencies):
+    manager, db_mock, broker_mock, image_crud_mock, collector_mock = mock_dependencies
+    deduplicator = MagicMock(
+        hash_image=AsyncMock(side_effect=[111, 222]),
+        resolve=AsyncMock(return_value={IMAGE_ID_1: "earlier_img"}),
+    )
+    manager.deduplicator = deduplicator
+    image_crud_mock.lock_product_images_with_conn = AsyncMock(return_value=["earlier_img"])
+    return manager, broker_mock, image_crud_mock, deduplicator
+
+
+@pytest.mark.asyncio
+async def test_store_product_links_duplicates_without_announcing_them(dedup_manager):
+    manager, broker_mock, image_crud_mock, deduplicator = dedup_manager
+
+    with patch('uuid.uuid4', return_value=MagicMock(spec=uuid.UUID, hex=PRODUCT_ID, __str__=lambda self: PRODUCT_ID)), \
+            patch('services.image_storage_manager.logger'):
+
+        await manager.store_product(PRODUCT_DATA, JOB_ID, SOURCE, "test_correlation_id")
+
+    deduplicator.resolve.assert_called_once_with(JOB_ID, [(IMAGE_ID_0, 111), (IMAGE_ID_1, 222)])
+
+    # Both images are stored; the duplicate points at its canonical image
+    stored_images = image_crud_mock.create_product_images_with_conn.call_args[0][0]
+    assert [(image.img_id, image.phash, image.canonical_img_id) for image in stored_images] == [
+        (IMAGE_ID_0, 111, None),
+        (IMAGE_ID_1, 222, "earlier_img"),
+    ]
+    assert image_crud_mock.lock_product_images_with_conn.call_args[0][0] == ["earlier_img"]
+
+    # Only the canonical image goes down the feature pipeline
+    announced = [call[0][1]["image_id"] for call in broker_mock.publish_event.call_args_list]
+    assert announced == [IMAGE_ID_0]
+    deduplicator.register.assert_called_once_with(JOB_ID, IMAGE_ID_0, 111)
+
+
+@pytest.mark.asyncio
+async def test_store_product_processes_duplicate_of_deleted_canonical(dedup_manager):
+    manager, broker_mock, image_crud_mock, _ = dedup_manager
+    image_crud_mock.lock_product_images_with_conn.return_value = []
+
+    with patch('uuid.uuid4', return_value=MagicMock(spec=uuid.UUID, hex=PRODUCT_ID, __str__=lambda self: PRODUCT_ID)), \
+            patch('services.image_storage_manager.logger'):
+
+        await manager.store_product(PRODUCT_DATA, JOB_ID, SOURCE, "test_correlation_id")
+
+    stored_images = image_crud_mock.create_product_images_with_conn.call_args[0][0]
+    assert [image.canonical_img_id for image in stored_images] == [None, None]
+    assert broker_mock.publish_event.call_count == 2
@@ -4,6 +4,7 @@ import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -49,6 +50,21 @@ class MatcherConfig:
 
     # Matching parameters (from service environment)
     RETRIEVAL_TOPK: int = int(os.getenv("RETRIEVAL_TOPK", 20))
+    # "memory" scores frames in-process; "pgvector" ranks them in Postgres
+    RETRIEVAL_BACKEND: str = os.getenv("RETRIEVAL_BACKEND", "memory")
+    RETRIEVAL_INDEX_CACHE_SIZE: int = int(os.getenv("RETRIEVAL_INDEX_CACHE_SIZE", 32))
+    # "pair" matches product/video pairs one by one; "job" scores the whole
+    # job as one image x frame similarity matrix
+    MATCHING_MODE: str = os.getenv("MATCHING_MODE", "pair")
+    SIMILARITY_BLOCK_SIZE: int = int(os.getenv("SIMILARITY_BLOCK_SIZE", 256))
+    # Keypoint verification (Lowe ratio test + RANSAC homography)
+    KEYPOINT_RATIO_TEST: float = float(os.getenv("KEYPOINT_RATIO_TEST", 0.75))
+    KEYPOINT_RANSAC_REPROJ: float = float(os.getenv("KEYPOINT_RANSAC_REPROJ", 5.0))
+    # 0 matches in a thread; unset uses one process per CPU
+    KEYPOINT_WORKERS: Optional[int] = (
+        int(os.environ["KEYPOINT_WORKERS"]) if os.getenv("KEYPOINT_WORKERS") else None
+    )
+    KEYPOINT_CACHE_SIZE: int = int(os.getenv("KEYPOINT_CACHE_SIZE", 512))
     SIM_DEEP_MIN: float = float(os.getenv("SIM_DEEP_MIN", 0.82))
     INLIERS_MIN: float = float(os.getenv("INLIERS_MIN", 0.35))
     MATCH_BEST_MIN: float = float(os.getenv("MATCH_BEST_MIN", 0.88))
@@ -20,6 +20,14 @@ class MatcherHandler:
             self.broker,
             config.DATA_ROOT,
             retrieval_topk=config.RETRIEVAL_TOPK,
+            retrieval_backend=config.RETRIEVAL_BACKEND,
+            index_cache_size=config.RETRIEVAL_INDEX_CACHE_SIZE,
+            matching_mode=config.MATCHING_MODE,
+            similarity_block_size=config.SIMILARITY_BLOCK_SIZE,
+            keypoint_ratio_test=config.KEYPOINT_RATIO_TEST,
+            keypoint_ransac_reproj=config.KEYPOINT_RANSAC_REPROJ,
+            keypoint_workers=config.KEYPOINT_WORKERS,
+            keypoint_cache_size=config.KEYPOINT_CACHE_SIZE,
             sim_deep_min=config.SIM_DEEP_MIN,
             inliers_min=config.INLIERS_MIN,
             match_best_min=config.MATCH_BEST_MIN,
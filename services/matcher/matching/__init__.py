@@ -1,10 +1,14 @@
 """Matching engine that coordinates search, scoring, and aggregation."""
 
+import asyncio
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from common_py.logging_config import configure_logging
 
+from matching_components.job_similarity import JobSimilarityMatrix
+from matching_components.keypoint_matcher import KeypointMatcher
 from matching_components.match_aggregator import MatchAggregator
 from matching_components.pair_score_calculator import PairScoreCalculator
 from matching_components.vector_searcher import VectorSearcher
@@ -25,11 +29,30 @@ class MatchingEngine:
         self.match_best_min = params.get("match_best_min", 0.88)
         self.match_cons_min = params.get("match_cons_min", 2)
         self.match_accept = params.get("match_accept", 0.80)
+        self.retrieval_backend = params.get("retrieval_backend", "memory")
+        self.index_cache_size = params.get("index_cache_size", 32)
+        self.similarity_block_size = params.get("similarity_block_size", 256)
+        self.keypoint_ratio_test = params.get("keypoint_ratio_test", 0.75)
+        self.keypoint_ransac_reproj = params.get("keypoint_ransac_reproj", 5.0)
+        self.keypoint_workers = params.get("keypoint_workers")
+        self.keypoint_cache_size = params.get("keypoint_cache_size", 512)
 
-        self.vector_searcher = VectorSearcher(db, self.retrieval_topk)
+        self.vector_searcher = VectorSearcher(
+            db,
+            self.retrieval_topk,
+            backend=self.retrieval_backend,
+            index_cache_size=self.index_cache_size,
+        )
+        self.keypoint_matcher = KeypointMatcher(
+            ratio_test=self.keypoint_ratio_test,
+            ransac_reproj_threshold=self.keypoint_ransac_reproj,
+            max_workers=self.keypoint_workers,
+            cache_size=self.keypoint_cache_size,
+        )
         self.pair_score_calculator = PairScoreCalculator(
             self.sim_deep_min,
             self.inliers_min,
+            keypoint_matcher=self.keypoint_matcher,
         )
         self.match_aggregator = MatchAggregator(
             self.match_best_min,
@@ -45,7 +68,17 @@ class MatchingEngine:
     async def cleanup(self) -> None:
         """Clean up any allocated resources."""
 
-        return None
+        self.vector_searcher.clear_cache()
+        await asyncio.to_thread(self.keypoint_matcher.shutdown)
+
+    def clear_job_caches(self, job_id: str) -> None:
+        """Drop the caches of ``job_id`` once it has been fully matched.
+
+        Entries of other jobs are kept so concurrent jobs are unaffected.
+        """
+
+        self.vector_searcher.clear_cache(job_id)
+        self.keypoint_matcher.clear_cache(job_id)
 
     async def match_product_video(
         self,
@@ -80,60 +113,202 @@ class MatchingEngine:
                 frame_count=len(video_frames),
             )
 
-            best_matches: List[Dict[str, Any]] = []
+            retrieve_similar_frames_batch = (
+                self.vector_searcher.retrieve_similar_frames_batch
+            )
+            similar_frames_per_image = await retrieve_similar_frames_batch(
+                product_images,
+                video_frames,
+                video_id=video_id,
+                job_id=job_id,
+            )
 
-            for image in product_images:
-                retrieve_similar_frames = (
-                    self.vector_searcher.retrieve_similar_frames
+            candidates = [
+                (image, frame, None)
+                for image, similar_frames in zip(
+                    product_images,
+                    similar_frames_per_image,
                 )
-                similar_frames = await retrieve_similar_frames(
-                    image,
-                    video_frames,
+                for frame in similar_frames
+            ]
+
+            return await self._score_and_aggregate(
+                candidates,
+                product_id,
+                video_id,
+                job_id,
+            )
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.error(
+                "Failed to match product vs video",
+                product_id=product_id,
+                video_id=video_id,
+                error=str(exc),
+            )
+            return None
+
+    async def match_job(
+        self,
+        job_id: str,
+        products: Sequence[Dict[str, Any]],
+        videos: Sequence[Dict[str, Any]],
+    ) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """Match every product of a job against every video in one pass.
+
+        All image and frame embeddings are fetched with two bulk queries and
+        scored as a single image x frame similarity matrix. Retrieval, pair
+        scoring and aggregation follow the same rules as
+        :meth:`match_product_video`. Returns ``(product_id, video_id,
+        match_result)`` for every accepted pair, in product x video order.
+        """
+
+        images = await self.get_job_product_images(job_id)
+        frames = await self.get_job_video_frames(job_id)
+
+        images_by_product: Dict[str, List[int]] = defaultdict(list)
+        for row, image in enumerate(images):
+            images_by_product[image["product_id"]].append(row)
+
+        frames_by_video: Dict[str, List[int]] = defaultdict(list)
+        for col, frame in enumerate(frames):
+            frames_by_video[frame["video_id"]].append(col)
+
+        logger.info(
+            "Matching job as a similarity matrix",
+            job_id=job_id,
+            product_count=len(products),
+            video_count=len(videos),
+            image_count=len(images),
+            frame_count=len(frames),
+        )
+
+        if not images or not frames:
+            return []
+
+        matrix = await asyncio.to_thread(
+            JobSimilarityMatrix,
+            images,
+            frames,
+            self.pair_score_calculator.embedding_similarity.weights,
+            self.similarity_block_size,
+        )
+
+        for video in videos:
+            if video["video_id"] not in frames_by_video:
+                logger.warning(
+                    "No frames found for video",
+                    video_id=video["video_id"],
                 )
 
-                for frame in similar_frames:
-                    calculate_pair_score = (
-                        self.pair_score_calculator.calculate_pair_score
+        results: List[Tuple[str, str, Dict[str, Any]]] = []
+        for product in products:
+            product_id = product["product_id"]
+            image_rows = images_by_product.get(product_id)
+            if not image_rows:
+                logger.warning(
+                    "No images found for product",
+                    product_id=product_id,
+                )
+                continue
+
+            for video in videos:
+                video_id = video["video_id"]
+                frame_cols = frames_by_video.get(video_id)
+                if not frame_cols:
+                    continue
+
+                candidates = [
+                    (
+                        images[row],
+                        frames[col],
+                        matrix.deep_similarity(row, col),
                     )
-                    pair_score = await calculate_pair_score(
-                        image,
-                        frame,
+                    for row in image_rows
+                    for col in matrix.retrieve(
+                        row,
+                        frame_cols,
+                        self.retrieval_topk,
                     )
+                ]
 
-                    if pair_score < self.sim_deep_min:
-                        continue
-
-                    best_matches.append(
-                        {
-                            "img_id": image["img_id"],
-                            "frame_id": frame["frame_id"],
-                            "ts": frame["ts"],
-                            "pair_score": pair_score,
-                        }
+                try:
+                    match_result = await self._score_and_aggregate(
+                        candidates,
+                        product_id,
+                        video_id,
+                        job_id,
+                    )
+                except Exception as exc:  # pragma: no cover - defensive logging
+                    logger.error(
+                        "Failed to match product vs video",
+                        product_id=product_id,
+                        video_id=video_id,
+                        error=str(exc),
                     )
+                    continue
 
-            if not best_matches:
-                logger.info(
-                    "No matches found above threshold",
-                    product_id=product_id,
-                    video_id=video_id,
+                if match_result:
+                    results.append((product_id, video_id, match_result))
+
+        return results
+
+    async def _score_and_aggregate(
+        self,
+        candidates: Sequence[Tuple[Dict[str, Any], Dict[str, Any], Optional[float]]],
+        product_id: str,
+        video_id: str,
+        job_id: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Score (image, frame, sim_deep) candidates and aggregate them.
+
+        All candidates are scored concurrently so keypoint matching can use
+        every worker of the keypoint process pool.
+        """
+
+        best_matches: List[Dict[str, Any]] = []
+        calculate_pair_score = self.pair_score_calculator.calculate_pair_score
+
+        pair_scores = await asyncio.gather(
+            *(
+                calculate_pair_score(image, frame, job_id=job_id)
+                if sim_deep is None
+                else calculate_pair_score(
+                    image,
+                    frame,
+                    sim_deep=sim_deep,
+                    job_id=job_id,
                 )
-                return None
+                for image, frame, sim_deep in candidates
+            )
+        )
 
-            return await self.match_aggregator.aggregate_matches(
-                best_matches,
-                product_id,
-                video_id,
+        for (image, frame, _), pair_score in zip(candidates, pair_scores):
+            if pair_score < self.sim_deep_min:
+                continue
+
+            best_matches.append(
+                {
+                    "img_id": image["img_id"],
+                    "frame_id": frame["frame_id"],
+                    "ts": frame["ts"],
+                    "pair_score": pair_score,
+                }
             )
-        except Exception as exc:  # pragma: no cover - defensive logging
-            logger.error(
-                "Failed to match product vs video",
+
+        if not best_matches:
+            logger.info(
+                "No matches found above threshold",
                 product_id=product_id,
                 video_id=video_id,
-                error=str(exc),
             )
             return None
 
+        return await self.match_aggregator.aggregate_matches(
+            best_matches,
+            product_id,
+            video_id,
+        )
+
     async def get_product_images(
         self,
         product_id: str,
@@ -160,3 +335,36 @@ class MatchingEngine:
         ORDER BY ts
         """
         return await self.db.fetch_all(query, video_id)
+
+    async def get_job_product_images(
+        self,
+        job_id: str,
+    ) -> List[Dict[str, Any]]:
+        """Fetch all images for every product of a job in one query."""
+
+        query = """
+        SELECT pi.product_id, pi.img_id, pi.local_path, pi.emb_rgb,
+               pi.emb_gray, pi.kp_blob_path
+        FROM product_images pi
+        JOIN products p ON p.product_id = pi.product_id
+        WHERE p.job_id = $1
+          AND (pi.emb_rgb IS NOT NULL OR pi.emb_gray IS NOT NULL)
+        """
+        return await self.db.fetch_all(query, job_id)
+
+    async def get_job_video_frames(
+        self,
+        job_id: str,
+    ) -> List[Dict[str, Any]]:
+        """Fetch all frames for every video of a job in one query."""
+
+        query = """
+        SELECT vf.video_id, vf.frame_id, vf.ts, vf.local_path, vf.emb_rgb,
+               vf.emb_gray, vf.kp_blob_path
+        FROM video_frames vf
+        JOIN job_videos jv ON jv.video_id = vf.video_id
+        WHERE jv.job_id = $1
+          AND (vf.emb_rgb IS NOT NULL OR vf.emb_gray IS NOT NULL)
+        ORDER BY vf.video_id, vf.ts
+        """
+        return await self.db.fetch_all(query, job_id)
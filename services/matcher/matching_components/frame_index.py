@@ -0,0 +1,157 @@
+"""In-process embedding index used for frame retrieval."""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from common_py.logging_config import configure_logging
+
+logger = configure_logging("matcher:frame_index")
+
+
+def to_float32_vector(embedding: Any) -> np.ndarray:
+    """Convert an array or sequence embedding to a float32 array.
+
+    Embeddings are decoded to ``np.ndarray`` by the binary pgvector codec
+    registered in ``DatabaseManager``; lists and tuples are accepted for
+    in-memory callers.
+    """
+
+    if isinstance(embedding, np.ndarray):
+        return embedding.astype(np.float32, copy=False)
+
+    if isinstance(embedding, (list, tuple)):
+        return np.asarray(embedding, dtype=np.float32)
+
+    raise ValueError(f"Unsupported embedding type: {type(embedding)}")
+
+
+def l2_normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalise each row in place; zero rows are left untouched."""
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+def stack_embeddings(
+    records: Sequence[Dict[str, Any]],
+    field: str,
+) -> Tuple[np.ndarray, List[int]]:
+    """Stack ``field`` of ``records`` into a contiguous normalised matrix.
+
+    Returns the matrix together with the positions (in ``records``) of the
+    rows that were stacked. Records without a usable embedding are skipped.
+    """
+
+    vectors: List[np.ndarray] = []
+    positions: List[int] = []
+    dim: Optional[int] = None
+
+    for position, record in enumerate(records):
+        embedding = record.get(field)
+        if embedding is None:
+            continue
+        try:
+            vector = to_float32_vector(embedding)
+        except (ValueError, TypeError) as exc:
+            logger.warning(
+                "Skipping unparsable embedding",
+                field=field,
+                position=position,
+                error=str(exc),
+            )
+            continue
+
+        if dim is None and vector.ndim == 1 and vector.shape[0] > 0:
+            dim = vector.shape[0]
+        if vector.ndim != 1 or vector.shape[0] != dim:
+            logger.warning(
+                "Skipping embedding with unexpected shape",
+                field=field,
+                position=position,
+                shape=vector.shape,
+            )
+            continue
+
+        vectors.append(vector)
+        positions.append(position)
+
+    if not vectors:
+        return np.empty((0, dim or 0), dtype=np.float32), positions
+
+    matrix = np.ascontiguousarray(np.vstack(vectors), dtype=np.float32)
+    return l2_normalize_rows(matrix), positions
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return the column indices of the ``k`` best scores per row, sorted."""
+
+    n_cols = scores.shape[1]
+    k = min(k, n_cols)
+    if k <= 0:
+        return np.empty((scores.shape[0], 0), dtype=np.intp)
+
+    if k < n_cols:
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.broadcast_to(np.arange(n_cols), scores.shape).copy()
+
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    order = np.argsort(-candidate_scores, axis=1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+class FrameEmbeddingIndex:
+    """Contiguous, L2-normalised matrix of a video's frame embeddings.
+
+    The index is built once per video and scores any number of product
+    image embeddings with a single matrix multiply.
+    """
+
+    def __init__(
+        self,
+        video_frames: Sequence[Dict[str, Any]],
+        field: str = "emb_rgb",
+    ) -> None:
+        self.field = field
+        self.frames = list(video_frames)
+        self.matrix, self.positions = stack_embeddings(self.frames, field)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @property
+    def dim(self) -> int:
+        return int(self.matrix.shape[1])
+
+    def search(
+        self,
+        query_matrix: np.ndarray,
+        topk: int,
+    ) -> List[List[Tuple[Dict[str, Any], float]]]:
+        """Return the ``topk`` (frame, cosine similarity) pairs per query row.
+
+        ``query_matrix`` is expected to be L2-normalised with shape
+        ``(n_queries, dim)``.
+        """
+
+        if len(self) == 0 or query_matrix.shape[0] == 0:
+            return [[] for _ in range(query_matrix.shape[0])]
+
+        scores = query_matrix @ self.matrix.T
+        best = top_k_indices(scores, topk)
+
+        results: List[List[Tuple[Dict[str, Any], float]]] = []
+        for row, columns in enumerate(best):
+            results.append(
+                [
+                    (
+                        self.frames[self.positions[column]],
+                        float(scores[row, column]),
+                    )
+                    for column in columns
+                ]
+            )
+        return results
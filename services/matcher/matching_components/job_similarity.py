@@ -0,0 +1,116 @@
+"""Job-wide product image x video frame similarity matrix."""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from common_py.logging_config import configure_logging
+
+from matching_components.frame_index import stack_embeddings, top_k_indices
+
+logger = configure_logging("matcher:job_similarity")
+
+
+class JobSimilarityMatrix:
+    """Cosine similarities between every image and frame of a job.
+
+    RGB and grayscale similarities are computed in blocks of
+    ``block_size`` image rows so the temporary matmul buffers stay bounded.
+    Entries are ``NaN`` where either side lacks the embedding. The combined
+    embedding score follows the same rules as
+    :class:`utils.embedding_similarity.EmbeddingSimilarity`.
+    """
+
+    def __init__(
+        self,
+        images: Sequence[Dict[str, Any]],
+        frames: Sequence[Dict[str, Any]],
+        weights: Dict[str, float],
+        block_size: int = 256,
+    ) -> None:
+        self.images = list(images)
+        self.frames = list(frames)
+        self.weights = weights
+        self.block_size = max(1, block_size)
+
+        self.rgb, rgb_rows = self._cosine_matrix("emb_rgb")
+        self.gray, _ = self._cosine_matrix("emb_gray")
+        self.deep = self._combine()
+        self._rgb_rows = set(rgb_rows)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.images), len(self.frames)
+
+    def _cosine_matrix(self, field: str) -> tuple[np.ndarray, List[int]]:
+        scores = np.full(self.shape, np.nan, dtype=np.float32)
+
+        image_matrix, image_rows = stack_embeddings(self.images, field)
+        frame_matrix, frame_cols = stack_embeddings(self.frames, field)
+        if not image_rows or not frame_cols:
+            return scores, image_rows
+
+        if image_matrix.shape[1] != frame_matrix.shape[1]:
+            logger.warning(
+                "Embedding dimension mismatch between images and frames",
+                field=field,
+                image_dim=image_matrix.shape[1],
+                frame_dim=frame_matrix.shape[1],
+            )
+            return scores, []
+
+        columns = np.asarray(frame_cols, dtype=np.intp)
+        frame_matrix_t = np.ascontiguousarray(frame_matrix.T)
+        for start in range(0, len(image_rows), self.block_size):
+            stop = start + self.block_size
+            rows = np.asarray(image_rows[start:stop], dtype=np.intp)
+            scores[np.ix_(rows, columns)] = image_matrix[start:stop] @ frame_matrix_t
+
+        return scores, image_rows
+
+    def _combine(self) -> np.ndarray:
+        rgb = np.clip(np.nan_to_num(self.rgb, nan=0.0), 0.0, 1.0)
+        gray = np.clip(np.nan_to_num(self.gray, nan=0.0), 0.0, 1.0)
+
+        combined = np.where(
+            (rgb > 0.0) & (gray > 0.0),
+            self.weights["rgb"] * rgb + self.weights["gray"] * gray,
+            np.where(gray > 0.0, gray, rgb),
+        )
+        combined = np.clip(combined, 0.0, 1.0).astype(np.float32)
+        combined[np.isnan(self.rgb) & np.isnan(self.gray)] = np.nan
+        return combined
+
+    def retrieve(
+        self,
+        image_row: int,
+        frame_cols: Sequence[int],
+        topk: int,
+    ) -> List[int]:
+        """Return the top-k frame columns for an image within ``frame_cols``.
+
+        Mirrors the in-memory :class:`VectorSearcher`: images without an RGB
+        embedding get the first ``topk`` frames, and frames without an RGB
+        embedding are never ranked.
+        """
+
+        if image_row not in self._rgb_rows:
+            return list(frame_cols[:topk])
+
+        columns = np.asarray(frame_cols, dtype=np.intp)
+        scores = self.rgb[image_row, columns]
+        valid = ~np.isnan(scores)
+        columns = columns[valid]
+        if columns.size == 0:
+            return []
+
+        best = top_k_indices(scores[valid][np.newaxis, :], topk)[0]
+        return columns[best].tolist()
+
+    def deep_similarity(self, image_row: int, frame_col: int) -> Optional[float]:
+        """Return the combined embedding similarity, or ``None`` if unknown."""
+
+        value = self.deep[image_row, frame_col]
+        if np.isnan(value):
+            return None
+        return float(value)
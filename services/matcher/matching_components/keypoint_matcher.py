@@ -0,0 +1,259 @@
+"""Descriptor matching and RANSAC verification for keypoint blobs."""
+
+import asyncio
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+from common_py.keypoint_blob import KeypointBlob, read_keypoint_blob
+from common_py.logging_config import configure_logging
+
+logger = configure_logging("matcher:keypoint_matcher")
+
+# Homography estimation needs at least four correspondences
+MIN_HOMOGRAPHY_MATCHES = 4
+
+# Cached blobs are keyed by (job_id, blob path)
+_BlobKey = Tuple[Optional[str], str]
+
+
+def load_keypoint_blob(kp_blob_path: str) -> Optional[KeypointBlob]:
+    """Load a blob written by the vision-keypoint service.
+
+    Current-format blobs are memory-mapped; legacy ``.npz`` blobs are
+    still accepted. Returns ``None`` when the blob is missing or unreadable.
+    """
+
+    try:
+        return read_keypoint_blob(kp_blob_path, mmap=True)
+    except (OSError, KeyError, ValueError) as exc:
+        logger.warning(
+            "Failed to load keypoint blob",
+            kp_blob_path=kp_blob_path,
+            error=str(exc),
+        )
+        return None
+
+
+def compute_inliers_ratio(
+    points_a: np.ndarray,
+    descriptors_a: np.ndarray,
+    points_b: np.ndarray,
+    descriptors_b: np.ndarray,
+    ratio_test: float = 0.75,
+    ransac_reproj_threshold: float = 5.0,
+) -> float:
+    """Match two descriptor sets and return the RANSAC inlier ratio.
+
+    Binary (AKAZE, uint8) descriptors are matched with Hamming distance and
+    float (SIFT) descriptors with L2. Matches passing Lowe's ratio test are
+    verified with a RANSAC homography and the ratio is
+    ``inliers / min(len(points_a), len(points_b))``.
+    """
+
+    min_keypoints = min(len(points_a), len(points_b))
+    if min_keypoints < MIN_HOMOGRAPHY_MATCHES:
+        return 0.0
+
+    if (
+        descriptors_a.dtype != descriptors_b.dtype
+        or descriptors_a.shape[1] != descriptors_b.shape[1]
+    ):
+        # Blobs extracted with different detectors cannot be compared
+        return 0.0
+
+    if descriptors_a.dtype == np.uint8:
+        matcher = cv2.BFMatcher(cv2.NORM_HAMMING)
+    else:
+        matcher = cv2.BFMatcher(cv2.NORM_L2)
+        descriptors_a = descriptors_a.astype(np.float32, copy=False)
+        descriptors_b = descriptors_b.astype(np.float32, copy=False)
+
+    knn_matches = matcher.knnMatch(descriptors_a, descriptors_b, k=2)
+    good = [
+        pair[0]
+        for pair in knn_matches
+        if len(pair) == 2 and pair[0].distance < ratio_test * pair[1].distance
+    ]
+    if len(good) < MIN_HOMOGRAPHY_MATCHES:
+        return 0.0
+
+    src = points_a[[match.queryIdx for match in good]].reshape(-1, 1, 2)
+    dst = points_b[[match.trainIdx for match in good]].reshape(-1, 1, 2)
+    _, mask = cv2.findHomography(src, dst, cv2.RANSAC, ransac_reproj_threshold)
+    if mask is None:
+        return 0.0
+
+    return min(1.0, int(mask.sum()) / min_keypoints)
+
+
+class KeypointMatcher:
+    """Compute keypoint inlier ratios for image/frame blob pairs.
+
+    Blobs are loaded once and kept in an LRU cache of ``cache_size``
+    entries keyed by job and path; call :meth:`clear_cache` with the job id
+    once a job finishes. Matching runs in a process pool of ``max_workers``
+    processes so the event loop stays responsive. Workers receive only blob
+    paths and keep their own LRU cache of the same size, so descriptors are
+    never pickled per pair; finished jobs age out of those caches.
+    ``max_workers=0`` runs matching in a worker thread instead.
+    """
+
+    def __init__(
+        self,
+        ratio_test: float = 0.75,
+        ransac_reproj_threshold: float = 5.0,
+        max_workers: Optional[int] = None,
+        cache_size: int = 512,
+    ) -> None:
+        self.ratio_test = ratio_test
+        self.ransac_reproj_threshold = ransac_reproj_threshold
+        self.max_workers = max_workers
+        self.cache_size = max(0, cache_size)
+        self._blob_cache: "OrderedDict[_BlobKey, Optional[KeypointBlob]]" = OrderedDict()
+        # Blobs are loaded from worker threads, so cache updates are locked
+        self._cache_lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.max_workers == 0:
+            return None
+        if self._executor is None:
+            # Spawned workers avoid inheriting the event loop and its threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(
+                    self.ratio_test,
+                    self.ransac_reproj_threshold,
+                    self.cache_size,
+                ),
+            )
+        return self._executor
+
+    def get_blob(
+        self,
+        kp_blob_path: str,
+        job_id: Optional[str] = None,
+    ) -> Optional[KeypointBlob]:
+        """Return the blob for ``kp_blob_path``, loading it on first use.
+
+        Loading reads from disk, so async callers should run this in a
+        worker thread.
+        """
+
+        path = str(Path(kp_blob_path))
+        key = (job_id, path)
+        with self._cache_lock:
+            if key in self._blob_cache:
+                self._blob_cache.move_to_end(key)
+                return self._blob_cache[key]
+
+        blob = load_keypoint_blob(path)
+        if self.cache_size:
+            with self._cache_lock:
+                self._blob_cache[key] = blob
+                while len(self._blob_cache) > self.cache_size:
+                    self._blob_cache.popitem(last=False)
+        return blob
+
+    async def inliers_ratio(
+        self,
+        image_kp_path: str,
+        frame_kp_path: str,
+        job_id: Optional[str] = None,
+    ) -> Optional[float]:
+        """Return the inlier ratio of two blobs, or ``None`` if unreadable."""
+
+        executor = self._get_executor()
+        if executor is None:
+            return await asyncio.to_thread(
+                self.match_blob_files,
+                image_kp_path,
+                frame_kp_path,
+                job_id,
+            )
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            _match_in_worker,
+            image_kp_path,
+            frame_kp_path,
+            job_id,
+        )
+
+    def match_blob_files(
+        self,
+        image_kp_path: str,
+        frame_kp_path: str,
+        job_id: Optional[str] = None,
+    ) -> Optional[float]:
+        """Blocking counterpart of :meth:`inliers_ratio` using this cache."""
+
+        blob_a = self.get_blob(image_kp_path, job_id)
+        blob_b = self.get_blob(frame_kp_path, job_id)
+        if blob_a is None or blob_b is None:
+            return None
+
+        return compute_inliers_ratio(
+            blob_a.points,
+            np.ascontiguousarray(blob_a.descriptors),
+            blob_b.points,
+            np.ascontiguousarray(blob_b.descriptors),
+            self.ratio_test,
+            self.ransac_reproj_threshold,
+        )
+
+    def clear_cache(self, job_id: Optional[str] = None) -> None:
+        """Drop the cached blobs of ``job_id``, or every blob if ``None``."""
+
+        with self._cache_lock:
+            if job_id is None:
+                self._blob_cache.clear()
+                return
+            for key in [key for key in self._blob_cache if key[0] == job_id]:
+                del self._blob_cache[key]
+
+    def shutdown(self) -> None:
+        """Release the cache and stop the worker processes."""
+
+        self.clear_cache()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+# Matcher owned by each pool worker process, created by ``_init_worker``
+_worker_matcher: Optional[KeypointMatcher] = None
+
+
+def _init_worker(
+    ratio_test: float,
+    ransac_reproj_threshold: float,
+    cache_size: int,
+) -> None:
+    global _worker_matcher
+    _worker_matcher = KeypointMatcher(
+        ratio_test=ratio_test,
+        ransac_reproj_threshold=ransac_reproj_threshold,
+        max_workers=0,
+        cache_size=cache_size,
+    )
+
+
+def _match_in_worker(
+    image_kp_path: str,
+    frame_kp_path: str,
+    job_id: Optional[str],
+) -> Optional[float]:
+    if _worker_matcher is None:
+        raise RuntimeError("Keypoint worker process was not initialised")
+    return _worker_matcher.match_blob_files(image_kp_path, frame_kp_path, job_id)
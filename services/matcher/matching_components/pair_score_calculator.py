@@ -1,13 +1,18 @@
 """Pair scoring helpers for individual image/frame combinations."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from common_py.logging_config import configure_logging
 
+from matching_components.keypoint_matcher import KeypointMatcher
 from utils.embedding_similarity import EmbeddingSimilarity
 
 logger = configure_logging("matcher:pair_score_calculator")
 
+WEIGHT_DEEP = 0.35
+WEIGHT_KP = 0.55
+WEIGHT_EDGE = 0.10
+
 
 class PairScoreCalculator:
     """Calculate similarity scores for image/frame pairs."""
@@ -17,27 +22,58 @@ class PairScoreCalculator:
         sim_deep_min: float,
         inliers_min: float,
         embedding_similarity: EmbeddingSimilarity | None = None,
+        keypoint_matcher: KeypointMatcher | None = None,
     ) -> None:
         self.sim_deep_min = sim_deep_min
         self.inliers_min = inliers_min
         self.embedding_similarity = embedding_similarity or EmbeddingSimilarity()
+        self.keypoint_matcher = keypoint_matcher or KeypointMatcher()
 
     async def calculate_pair_score(
         self,
         image: Dict[str, Any],
         frame: Dict[str, Any],
+        sim_deep: Optional[float] = None,
+        job_id: Optional[str] = None,
     ) -> float:
-        """Calculate a weighted similarity score for an image-frame pair."""
+        """Calculate a weighted similarity score for an image-frame pair.
+
+        ``sim_deep`` may be supplied when the embedding similarity has
+        already been computed, e.g. from a job-wide similarity matrix.
+        Keypoint matching is skipped when even a perfect keypoint score
+        could not lift the pair above ``sim_deep_min``. ``job_id`` scopes
+        the keypoint blob cache.
+        """
 
         try:
-            sim_deep = await self.calculate_embedding_similarity(image, frame)
-            sim_kp = await self.calculate_keypoint_similarity(image, frame)
+            if sim_deep is None:
+                sim_deep = await self.calculate_embedding_similarity(image, frame)
             sim_edge = 0.75  # Replaced random uniform with a fixed value
 
+            best_possible = (
+                WEIGHT_DEEP * sim_deep
+                + WEIGHT_KP * 1.0
+                + WEIGHT_EDGE * sim_edge
+            )
+            if best_possible < self.sim_deep_min:
+                logger.debug(
+                    "Skipping keypoint matching, embedding score too low",
+                    img_id=image["img_id"],
+                    frame_id=frame["frame_id"],
+                    sim_deep=sim_deep,
+                )
+                return WEIGHT_DEEP * sim_deep + WEIGHT_EDGE * sim_edge
+
+            sim_kp = await self.calculate_keypoint_similarity(
+                image,
+                frame,
+                job_id=job_id,
+            )
+
             pair_score = (
-                0.35 * sim_deep
-                + 0.55 * sim_kp
-                + 0.10 * sim_edge
+                WEIGHT_DEEP * sim_deep
+                + WEIGHT_KP * sim_kp
+                + WEIGHT_EDGE * sim_edge
             )
 
             logger.debug(
@@ -63,8 +99,14 @@ class PairScoreCalculator:
         """Calculate embedding similarity between an image and a frame."""
 
         try:
-            has_rgb = image.get("emb_rgb") and frame.get("emb_rgb")
-            has_gray = image.get("emb_gray") and frame.get("emb_gray")
+            has_rgb = (
+                image.get("emb_rgb") is not None
+                and frame.get("emb_rgb") is not None
+            )
+            has_gray = (
+                image.get("emb_gray") is not None
+                and frame.get("emb_gray") is not None
+            )
 
             if not has_rgb and not has_gray:
                 logger.warning(
@@ -91,8 +133,9 @@ class PairScoreCalculator:
         self,
         image: Dict[str, Any],
         frame: Dict[str, Any],
+        job_id: Optional[str] = None,
     ) -> float:
-        """Calculate keypoint similarity using a mock RANSAC flow."""
+        """Calculate keypoint similarity as a RANSAC homography inlier ratio."""
 
         try:
             if not image.get("kp_blob_path") or not frame.get("kp_blob_path"):
@@ -103,7 +146,18 @@ class PairScoreCalculator:
                 )
                 return 0.5  # Replaced random uniform with a fixed value
 
-            inliers_ratio = 1.0  # Mock: Assume perfect match if blobs exist to make score discriminatory
+            inliers_ratio = await self.keypoint_matcher.inliers_ratio(
+                image["kp_blob_path"],
+                frame["kp_blob_path"],
+                job_id=job_id,
+            )
+            if inliers_ratio is None:
+                logger.warning(
+                    "Unreadable keypoint blob for image or frame, using default similarity",
+                    img_id=image.get("img_id"),
+                    frame_id=frame.get("frame_id"),
+                )
+                return 0.5
 
             if inliers_ratio < self.inliers_min:
                 return 0.0
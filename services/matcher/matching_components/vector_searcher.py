@@ -1,108 +1,200 @@
 """Vector search utilities for retrieving candidate frames."""
 
-from typing import Any, Dict, List
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
 from common_py.logging_config import configure_logging
 
+from matching_components.frame_index import (
+    FrameEmbeddingIndex,
+    stack_embeddings,
+    to_float32_vector,
+)
+
 logger = configure_logging("matcher:vector_searcher")
 
+RETRIEVAL_BACKENDS = ("memory", "pgvector")
+
+# Cached frame indexes are keyed by (job_id, video_id, frame ids)
+_IndexKey = Tuple[Optional[str], str, Tuple[str, ...]]
+
 
 class VectorSearcher:
-    """Perform vector searches and provide fallbacks when necessary."""
+    """Perform vector searches and provide fallbacks when necessary.
+
+    Two backends sit behind the same interface:
+
+    * ``memory`` (default) scores frames in-process against a cached
+      :class:`FrameEmbeddingIndex`, one matrix multiply per video.
+    * ``pgvector`` delegates the cosine ranking to Postgres.
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        retrieval_topk: int,
+        backend: str = "memory",
+        index_cache_size: int = 32,
+    ) -> None:
+        if backend not in RETRIEVAL_BACKENDS:
+            raise ValueError(
+                f"Unsupported retrieval backend: {backend}. "
+                f"Expected one of {RETRIEVAL_BACKENDS}"
+            )
 
-    def __init__(self, db: Any, retrieval_topk: int) -> None:
         self.db = db
         self.retrieval_topk = retrieval_topk
+        self.backend = backend
+        self.index_cache_size = max(0, index_cache_size)
+        self._index_cache: "OrderedDict[_IndexKey, FrameEmbeddingIndex]" = OrderedDict()
 
     async def retrieve_similar_frames(
         self,
         image: Dict[str, Any],
         video_frames: List[Dict[str, Any]],
+        video_id: Optional[str] = None,
+        job_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Retrieve candidate frames using pgvector or a fallback."""
+        """Retrieve candidate frames for a single product image."""
 
-        try:
-            if not image.get("emb_rgb"):
-                return video_frames[: self.retrieval_topk]
-
-            # Convert image embedding to numpy array first
-            image_emb = self._convert_embedding(image["emb_rgb"])
-            perform_vector_search = self._perform_vector_search
-            return await perform_vector_search(image_emb.tolist(), video_frames)
-        except Exception as exc:  # pragma: no cover - defensive logging
-            logger.error("Failed to retrieve similar frames", error=str(exc))
-            return await self._fallback_similarity_search(image, video_frames)
+        results = await self.retrieve_similar_frames_batch(
+            [image],
+            video_frames,
+            video_id=video_id,
+            job_id=job_id,
+        )
+        return results[0]
 
-    async def _perform_vector_search(
+    async def retrieve_similar_frames_batch(
         self,
-        image_emb_data: List[float],
+        images: Sequence[Dict[str, Any]],
         video_frames: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
-        image_emb = np.array(image_emb_data, dtype=np.float32)
+        video_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Retrieve candidate frames for every image of a product at once.
 
-        await self._create_temp_embeddings_table(video_frames)
-        vector_similarity_search = self._vector_similarity_search
-        similar_frames = await vector_similarity_search(
-            image_emb,
-            video_frames,
+        Returns one list of frames per entry in ``images``, in the same
+        order. Each returned frame carries a ``similarity`` score.
+        """
+
+        if self.backend == "pgvector":
+            return [
+                await self._retrieve_with_pgvector(image, video_frames)
+                for image in images
+            ]
+
+        try:
+            return self._retrieve_in_memory(images, video_frames, video_id, job_id)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.error(
+                "Failed to retrieve similar frames in memory",
+                error=str(exc),
+            )
+            return [
+                (await self._fallback_similarity_search(image, video_frames))[
+                    : self.retrieval_topk
+                ]
+                for image in images
+            ]
+
+    def clear_cache(self, job_id: Optional[str] = None) -> None:
+        """Drop the frame indexes of ``job_id``, or every index if ``None``."""
+
+        if job_id is None:
+            self._index_cache.clear()
+            return
+        for key in [key for key in self._index_cache if key[0] == job_id]:
+            del self._index_cache[key]
+
+    def get_frame_index(
+        self,
+        video_frames: List[Dict[str, Any]],
+        video_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+    ) -> FrameEmbeddingIndex:
+        """Return the frame index for a video, building it on first use.
+
+        Indexes are cached per job so one job finishing does not evict
+        the indexes another job is still using.
+        """
+
+        if video_id is None or self.index_cache_size == 0:
+            return FrameEmbeddingIndex(video_frames)
+
+        key = (
+            job_id,
+            video_id,
+            tuple(str(frame["frame_id"]) for frame in video_frames),
         )
+        index = self._index_cache.get(key)
+        if index is not None:
+            self._index_cache.move_to_end(key)
+            return index
+
+        index = FrameEmbeddingIndex(video_frames)
+        self._index_cache[key] = index
+        while len(self._index_cache) > self.index_cache_size:
+            self._index_cache.popitem(last=False)
+        return index
+
+    def _retrieve_in_memory(
+        self,
+        images: Sequence[Dict[str, Any]],
+        video_frames: List[Dict[str, Any]],
+        video_id: Optional[str],
+        job_id: Optional[str] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        index = self.get_frame_index(video_frames, video_id, job_id)
+        query_matrix, positions = stack_embeddings(images, "emb_rgb")
+
+        results: List[List[Dict[str, Any]]] = [
+            video_frames[: self.retrieval_topk] for _ in images
+        ]
+        if not positions:
+            return results
+
+        if query_matrix.shape[1] != index.dim:
+            raise ValueError(
+                f"Embedding dimension mismatch: images={query_matrix.shape[1]} "
+                f"frames={index.dim}"
+            )
+
+        for position, hits in zip(
+            positions,
+            index.search(query_matrix, self.retrieval_topk),
+        ):
+            similar_frames: List[Dict[str, Any]] = []
+            for frame, similarity in hits:
+                frame_dict = dict(frame)
+                frame_dict["similarity"] = similarity
+                similar_frames.append(frame_dict)
+            results[position] = similar_frames
 
-        return similar_frames[: self.retrieval_topk]
+        return results
 
-    async def _create_temp_embeddings_table(
+    async def _retrieve_with_pgvector(
         self,
+        image: Dict[str, Any],
         video_frames: List[Dict[str, Any]],
-    ) -> None:
-        """Create a temporary table for frame embeddings."""
+    ) -> List[Dict[str, Any]]:
+        """Retrieve candidate frames using pgvector or a fallback."""
 
         try:
-            await self.db.execute("DROP TABLE IF EXISTS temp_video_embeddings")
-
-            await self.db.execute(
-                """
-                CREATE TEMP TABLE temp_video_embeddings (
-                    frame_id TEXT PRIMARY KEY,
-                    emb_rgb VECTOR(512),
-                    emb_gray VECTOR(512)
-                )
-                """
-            )
-
-            values_to_insert = []
-            for frame in video_frames:
-                if frame.get("emb_rgb"):
-                    # Convert embeddings to numpy arrays and then to vector strings for pgvector
-                    rgb_emb = self._convert_embedding(frame["emb_rgb"]).tolist()
-                    rgb_emb_str = f"[{','.join(str(x) for x in rgb_emb)}]"
-
-                    gray_emb_str = None
-                    if frame.get("emb_gray"):
-                        gray_emb = self._convert_embedding(frame["emb_gray"]).tolist()
-                        gray_emb_str = f"[{','.join(str(x) for x in gray_emb)}]"
-
-                    values_to_insert.append(
-                        (frame["frame_id"], rgb_emb_str, gray_emb_str)
-                    )
+            if image.get("emb_rgb") is None:
+                return video_frames[: self.retrieval_topk]
 
-            if values_to_insert:
-                await self.db.executemany(
-                    """
-                    INSERT INTO temp_video_embeddings (
-                        frame_id,
-                        emb_rgb,
-                        emb_gray
-                    )
-                    VALUES ($1, $2::vector, $3::vector)
-                    """,
-                    values_to_insert,
-                )
-        except Exception as exc:  # pragma: no cover - defensive logging
-            logger.error(
-                "Failed to create temp embeddings table",
-                error=str(exc),
+            image_emb = self._convert_embedding(image["emb_rgb"])
+            similar_frames = await self._vector_similarity_search(
+                image_emb,
+                video_frames,
             )
+            return similar_frames[: self.retrieval_topk]
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.error("Failed to retrieve similar frames", error=str(exc))
+            return await self._fallback_similarity_search(image, video_frames)
 
     async def _vector_similarity_search(
         self,
@@ -112,20 +204,27 @@ class VectorSearcher:
         """Perform vector similarity search using pgvector."""
 
         try:
-            emb_array = list(image_emb)
-            # Convert to pgvector format string
-            emb_vector_str = f"[{','.join(str(x) for x in emb_array)}]"
+            # Sent as a float32 buffer through the binary vector codec
+            emb_array = np.asarray(image_emb, dtype=np.float32)
 
+            # Rank against the persistent table in one statement so the
+            # query never depends on per-connection temporary state.
             query = """
                 SELECT v.frame_id, 1 - (v.emb_rgb <=> $1::vector) AS similarity
-                FROM temp_video_embeddings v
-                WHERE v.emb_rgb IS NOT NULL
+                FROM video_frames v
+                WHERE v.frame_id = ANY($2::text[]) AND v.emb_rgb IS NOT NULL
                 ORDER BY v.emb_rgb <=> $1::vector
-                LIMIT $2
+                LIMIT $3
             """
 
+            frame_ids = [frame["frame_id"] for frame in video_frames]
             fetch_all = self.db.fetch_all
-            results = await fetch_all(query, emb_vector_str, self.retrieval_topk)
+            results = await fetch_all(
+                query,
+                emb_array,
+                frame_ids,
+                self.retrieval_topk,
+            )
 
             frame_map = {frame["frame_id"]: frame for frame in video_frames}
             similar_frames: List[Dict[str, Any]] = []
@@ -153,28 +252,8 @@ class VectorSearcher:
 
     def _convert_embedding(self, embedding: Any) -> np.ndarray:
         """Convert embedding from various formats to numpy array."""
-        if isinstance(embedding, np.ndarray):
-            return embedding.astype(np.float32)
-
-        if isinstance(embedding, list):
-            return np.array(embedding, dtype=np.float32)
-
-        if isinstance(embedding, str):
-            try:
-                # Try to parse as Python literal first
-                import ast
-                parsed = ast.literal_eval(embedding)
-                return np.array(parsed, dtype=np.float32)
-            except (ValueError, SyntaxError):
-                # Fallback: split by comma and convert to float
-                try:
-                    values = [float(x.strip()) for x in embedding.strip('[]').split(',') if x.strip()]
-                    return np.array(values, dtype=np.float32)
-                except (ValueError, TypeError) as e:
-                    logger.error(f"Failed to convert embedding string to array: {embedding[:100]}...")
-                    raise e
-
-        raise ValueError(f"Unsupported embedding type: {type(embedding)}")
+
+        return to_float32_vector(embedding)
 
     async def _fallback_similarity_search(
         self,
@@ -192,7 +271,7 @@ class VectorSearcher:
                 # Convert asyncpg Record to mutable dict if needed
                 frame_dict = dict(frame) if hasattr(frame, 'keys') else frame
 
-                if frame_dict.get("emb_rgb"):
+                if frame_dict.get("emb_rgb") is not None:
                     try:
                         # Convert frame embedding to numpy array
                         frame_emb = self._convert_embedding(frame_dict["emb_rgb"])
@@ -213,22 +292,9 @@ class VectorSearcher:
                     )
                     similarity = 0.7
 
-                # Convert embeddings in frame_dict to numpy arrays for similarity calculation
                 frame_dict_rgb = frame_dict.get("emb_rgb")
                 frame_dict_gray = frame_dict.get("emb_gray")
 
-                # Convert string embeddings to numpy arrays for similarity calculation
-                if isinstance(frame_dict_rgb, str):
-                    try:
-                        frame_dict_rgb = self._convert_embedding(frame_dict_rgb)
-                    except (ValueError, TypeError):
-                        frame_dict_rgb = np.array([0.7])  # Fallback default similarity
-                if isinstance(frame_dict_gray, str):
-                    try:
-                        frame_dict_gray = self._convert_embedding(frame_dict_gray)
-                    except (ValueError, TypeError):
-                        frame_dict_gray = np.array([0.7])  # Fallback default similarity
-
                 if frame_dict_rgb is not None and frame_dict_gray is not None:
                     similarity = np.dot(frame_dict_rgb, frame_dict_gray) / (
                         np.linalg.norm(frame_dict_rgb) * np.linalg.norm(frame_dict_gray)
@@ -13,6 +13,8 @@ from matching import MatchingEngine
 
 logger = configure_logging("matcher:service")
 
+MATCHING_MODES = ("pair", "job")
+
 
 class MatcherService:
     """High-level coordination for matching jobs."""
@@ -30,6 +32,15 @@ class MatcherService:
         self.match_crud = MatchCRUD(db)
         self.matching_engine = MatchingEngine(db, data_root, **params)
 
+        # "pair" matches each product/video pair separately; "job" scores the
+        # whole job as one image x frame similarity matrix.
+        self.matching_mode = params.get("matching_mode", "pair")
+        if self.matching_mode not in MATCHING_MODES:
+            raise ValueError(
+                f"Unsupported matching mode: {self.matching_mode}. "
+                f"Expected one of {MATCHING_MODES}"
+            )
+
     async def initialize(self) -> None:
         """Initialise the matching engine."""
 
@@ -73,59 +84,42 @@ class MatcherService:
             )
 
             total_matches = 0
-            for product in products:
-                for video in videos:
-                    match_product_video = (
-                        self.matching_engine.match_product_video
-                    )
-                    match_result = await match_product_video(
-                        product["product_id"],
-                        video["video_id"],
+            if self.matching_mode == "job":
+                matches = await self.matching_engine.match_job(
+                    job_id,
+                    products,
+                    videos,
+                )
+                for product_id, video_id, match_result in matches:
+                    await self._record_match(
                         job_id,
+                        product_id,
+                        video_id,
+                        match_result,
                     )
-
-                    if not match_result:
-                        continue
-
-                    match = Match(
-                        match_id=str(uuid.uuid4()),
-                        job_id=job_id,
-                        product_id=product["product_id"],
-                        video_id=video["video_id"],
-                        best_img_id=match_result["best_img_id"],
-                        best_frame_id=match_result["best_frame_id"],
-                        ts=match_result["ts"],
-                        score=match_result["score"],
-                    )
-
-                    await self.match_crud.create_match(match)
-
-                    await self.broker.publish_event(
-                        "match.result",
-                        {
-                            "job_id": job_id,
-                            "product_id": product["product_id"],
-                            "video_id": video["video_id"],
-                            "best_pair": {
-                                "img_id": match_result["best_img_id"],
-                                "frame_id": match_result["best_frame_id"],
-                                "score_pair": match_result["best_pair_score"],
-                            },
-                            "score": match_result["score"],
-                            "ts": match_result["ts"],
-                        },
-                        correlation_id=job_id,
-                    )
-
                     total_matches += 1
-
-                    logger.info(
-                        "Found match",
-                        job_id=job_id,
-                        product_id=product["product_id"],
-                        video_id=video["video_id"],
-                        score=match_result["score"],
-                    )
+            else:
+                for product in products:
+                    for video in videos:
+                        match_product_video = (
+                            self.matching_engine.match_product_video
+                        )
+                        match_result = await match_product_video(
+                            product["product_id"],
+                            video["video_id"],
+                            job_id,
+                        )
+
+                        if not match_result:
+                            continue
+
+                        await self._record_match(
+                            job_id,
+                            product["product_id"],
+                            video["video_id"],
+                            match_result,
+                        )
+                        total_matches += 1
 
             await self.broker.publish_event(
                 "match.request.completed",
@@ -153,6 +147,57 @@ class MatcherService:
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.error("Failed to process match request", error=str(exc))
             raise
+        finally:
+            # Only this job's entries are dropped; concurrent jobs keep theirs
+            if "job_id" in event_data:
+                self.matching_engine.clear_job_caches(event_data["job_id"])
+
+    async def _record_match(
+        self,
+        job_id: str,
+        product_id: str,
+        video_id: str,
+        match_result: Dict[str, Any],
+    ) -> None:
+        """Persist an accepted match and publish its ``match.result`` event."""
+
+        match = Match(
+            match_id=str(uuid.uuid4()),
+            job_id=job_id,
+            product_id=product_id,
+            video_id=video_id,
+            best_img_id=match_result["best_img_id"],
+            best_frame_id=match_result["best_frame_id"],
+            ts=match_result["ts"],
+            score=match_result["score"],
+        )
+
+        await self.match_crud.create_match(match)
+
+        await self.broker.publish_event(
+            "match.result",
+            {
+                "job_id": job_id,
+                "product_id": product_id,
+                "video_id": video_id,
+                "best_pair": {
+                    "img_id": match_result["best_img_id"],
+                    "frame_id": match_result["best_frame_id"],
+                    "score_pair": match_result["best_pair_score"],
+                },
+                "score": match_result["score"],
+                "ts": match_result["ts"],
+            },
+            correlation_id=job_id,
+        )
+
+        logger.info(
+            "Found match",
+            job_id=job_id,
+            product_id=product_id,
+            video_id=video_id,
+            score=match_result["score"],
+        )
 
     async def get_job_products(self, job_id: str) -> List[Dict[str, Any]]:
         """Fetch all products associated with a job."""
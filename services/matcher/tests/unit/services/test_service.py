@@ -224,3 +224,69 @@ class TestMatcherService:
                 "video_001",
                 "job_001",
             )
+
+    @pytest.mark.asyncio
+    async def test_handle_match_request_job_mode(
+        self,
+        mock_db: MagicMock,
+        mock_broker: MagicMock,
+    ) -> None:
+        service = MatcherService(
+            mock_db,
+            mock_broker,
+            "/data",
+            matching_mode="job",
+        )
+        mock_db.fetch_all.side_effect = [
+            [{"product_id": "product_001", "title": "Product 1"}],
+            [{"video_id": "video_001", "title": "Video 1"}],
+        ]
+        match_result = {
+            "best_img_id": "img_001",
+            "best_frame_id": "frame_001",
+            "ts": 1.0,
+            "score": 0.9,
+            "best_pair_score": 0.9,
+            "consistency": 2,
+            "total_pairs": 2,
+        }
+
+        with patch.object(
+            service.matching_engine,
+            "match_job",
+            new_callable=AsyncMock,
+            return_value=[("product_001", "video_001", match_result)],
+        ) as mock_match_job, patch.object(
+            service.matching_engine,
+            "match_product_video",
+        ) as mock_match_pair, patch.object(
+            service.matching_engine,
+            "clear_job_caches",
+        ) as mock_clear_caches, patch.object(
+            service,
+            "match_crud",
+        ) as mock_crud:
+            mock_crud.create_match = AsyncMock()
+
+            await service.handle_match_request(
+                {
+                    "job_id": "job_001",
+                    "event_id": "a1b2c3d4-e5f6-7890-1234-567890abcdef",
+                }
+            )
+
+            mock_match_job.assert_awaited_once()
+            mock_match_pair.assert_not_called()
+            # Only the finished job's cache entries are dropped
+            mock_clear_caches.assert_called_once_with("job_001")
+            mock_crud.create_match.assert_called_once()
+            topics = [call[0][0] for call in mock_broker.publish_event.call_args_list]
+            assert topics == ["match.result", "match.request.completed"]
+
+    def test_rejects_unknown_matching_mode(
+        self,
+        mock_db: MagicMock,
+        mock_broker: MagicMock,
+    ) -> None:
+        with pytest.raises(ValueError):
+            MatcherService(mock_db, mock_broker, "/data", matching_mode="batch")
@@ -0,0 +1,165 @@
+"""Unit tests for the in-process frame retrieval engine."""
+
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from matching_components.frame_index import (
+    FrameEmbeddingIndex,
+    stack_embeddings,
+    to_float32_vector,
+    top_k_indices,
+)
+from matching_components.vector_searcher import VectorSearcher
+
+pytestmark = pytest.mark.unit
+
+
+def _frames(embeddings: np.ndarray) -> List[Dict[str, Any]]:
+    return [
+        {
+            "frame_id": f"frame_{i:03d}",
+            "ts": float(i),
+            "emb_rgb": embedding.tolist(),
+        }
+        for i, embedding in enumerate(embeddings)
+    ]
+
+
+def _cosine(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+class TestFrameIndexHelpers:
+    """Checks for the low-level index helpers."""
+
+    def test_to_float32_vector_accepts_supported_formats(self) -> None:
+        expected = np.array([0.5, -1.0, 2.0], dtype=np.float32)
+
+        for value in (expected, [0.5, -1.0, 2.0], (0.5, -1.0, 2.0)):
+            result = to_float32_vector(value)
+            assert result.dtype == np.float32
+            np.testing.assert_allclose(result, expected)
+
+    def test_to_float32_vector_rejects_unknown_types(self) -> None:
+        with pytest.raises(ValueError):
+            to_float32_vector(42)
+        with pytest.raises(ValueError):
+            to_float32_vector("[0.5,-1,2]")
+
+    def test_stack_embeddings_skips_missing_and_normalises(self) -> None:
+        records = [
+            {"emb_rgb": [3.0, 4.0]},
+            {"emb_rgb": None},
+            {"emb_rgb": [0.0, 2.0]},
+            {"emb_rgb": [1.0, 2.0, 3.0]},
+        ]
+
+        matrix, positions = stack_embeddings(records, "emb_rgb")
+
+        assert positions == [0, 2]
+        assert matrix.flags["C_CONTIGUOUS"]
+        np.testing.assert_allclose(np.linalg.norm(matrix, axis=1), [1.0, 1.0])
+
+    def test_top_k_indices_sorted_descending(self) -> None:
+        scores = np.array([[0.1, 0.9, 0.5, 0.7], [0.4, 0.3, 0.2, 0.1]])
+
+        best = top_k_indices(scores, 2)
+
+        assert best.tolist() == [[1, 3], [0, 1]]
+        assert top_k_indices(scores, 10).shape == (2, 4)
+
+
+class TestFrameEmbeddingIndex:
+    """Checks for the per-video embedding index."""
+
+    def test_search_matches_brute_force(self) -> None:
+        rng = np.random.default_rng(7)
+        frame_embs = rng.normal(size=(50, 16)).astype(np.float32)
+        image_embs = rng.normal(size=(3, 16)).astype(np.float32)
+        index = FrameEmbeddingIndex(_frames(frame_embs))
+
+        queries, _ = stack_embeddings(
+            [{"emb_rgb": emb} for emb in image_embs],
+            "emb_rgb",
+        )
+        results = index.search(queries, 5)
+
+        for image_emb, hits in zip(image_embs, results):
+            brute = sorted(
+                range(len(frame_embs)),
+                key=lambda i: _cosine(image_emb, frame_embs[i]),
+                reverse=True,
+            )[:5]
+            assert [frame["frame_id"] for frame, _ in hits] == [
+                f"frame_{i:03d}" for i in brute
+            ]
+            for frame, similarity in hits:
+                position = int(frame["frame_id"].split("_")[1])
+                assert similarity == pytest.approx(
+                    _cosine(image_emb, frame_embs[position]),
+                    abs=1e-5,
+                )
+
+    def test_empty_index_returns_empty_hits(self) -> None:
+        index = FrameEmbeddingIndex([{"frame_id": "f1", "emb_rgb": None}])
+
+        assert len(index) == 0
+        assert index.search(np.ones((2, 4), dtype=np.float32), 3) == [[], []]
+
+
+class TestInMemoryVectorSearcher:
+    """Checks for the default in-memory retrieval backend."""
+
+    @pytest.mark.asyncio
+    async def test_batch_retrieval_scores_all_images(self) -> None:
+        db = AsyncMock()
+        searcher = VectorSearcher(db, retrieval_topk=2)
+        frames = _frames(np.eye(3, dtype=np.float32))
+        images = [
+            {"img_id": "i1", "emb_rgb": [1.0, 0.1, 0.0]},
+            {"img_id": "i2", "emb_rgb": None},
+            {"img_id": "i3", "emb_rgb": np.array([0, 0, 1], dtype=np.float32)},
+        ]
+
+        results = await searcher.retrieve_similar_frames_batch(images, frames)
+
+        assert [f["frame_id"] for f in results[0]] == ["frame_000", "frame_001"]
+        assert results[0][0]["similarity"] > results[0][1]["similarity"]
+        assert results[1] == frames[:2]
+        assert results[2][0]["frame_id"] == "frame_002"
+        assert results[2][0]["similarity"] == pytest.approx(1.0)
+        assert "similarity" not in frames[0]
+        db.fetch_all.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_frame_index_is_cached_per_video(self) -> None:
+        searcher = VectorSearcher(AsyncMock(), retrieval_topk=2, index_cache_size=1)
+        frames = _frames(np.eye(3, dtype=np.float32))
+
+        first = searcher.get_frame_index(frames, "video_1")
+        assert searcher.get_frame_index(frames, "video_1") is first
+
+        searcher.get_frame_index(frames, "video_2")
+        assert searcher.get_frame_index(frames, "video_1") is not first
+
+        searcher.clear_cache()
+        assert not searcher._index_cache
+
+    def test_clearing_a_job_keeps_other_jobs_indexes(self) -> None:
+        searcher = VectorSearcher(AsyncMock(), retrieval_topk=2)
+        frames = _frames(np.eye(3, dtype=np.float32))
+
+        searcher.get_frame_index(frames, "video_1", job_id="job_1")
+        kept = searcher.get_frame_index(frames, "video_1", job_id="job_2")
+
+        searcher.clear_cache("job_1")
+
+        assert len(searcher._index_cache) == 1
+        assert searcher.get_frame_index(frames, "video_1", job_id="job_2") is kept
+
+    def test_rejects_unknown_backend(self) -> None:
+        with pytest.raises(ValueError):
+            VectorSearcher(AsyncMock(), retrieval_topk=2, backend="faiss")
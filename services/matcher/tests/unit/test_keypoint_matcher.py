@@ -0,0 +1,285 @@
+"""Unit tests for keypoint descriptor matching and RANSAC verification."""
+
+import threading
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import AsyncMock
+
+import cv2
+import numpy as np
+import pytest
+
+from common_py.keypoint_blob import keypoints_to_array, write_keypoint_blob
+from matching_components import keypoint_matcher
+from matching_components.keypoint_matcher import (
+    KeypointMatcher,
+    compute_inliers_ratio,
+    load_keypoint_blob,
+)
+from matching_components.pair_score_calculator import PairScoreCalculator
+
+pytestmark = pytest.mark.unit
+
+
+def _textured_image(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    image = np.zeros((240, 320), dtype=np.uint8)
+    for _ in range(40):
+        x, y = rng.integers(0, 300), rng.integers(0, 220)
+        w, h = rng.integers(10, 60), rng.integers(10, 60)
+        cv2.rectangle(image, (int(x), int(y)), (int(x + w), int(y + h)), int(rng.integers(60, 255)), -1)
+    for _ in range(20):
+        center = (int(rng.integers(0, 320)), int(rng.integers(0, 240)))
+        cv2.circle(image, center, int(rng.integers(5, 25)), int(rng.integers(0, 200)), 2)
+    return image
+
+
+def _save_blob(image: np.ndarray, path: Path) -> str:
+    """Write a blob the way vision-keypoint ``_save_keypoints`` does."""
+
+    keypoints, descriptors = cv2.AKAZE_create().detectAndCompute(image, None)
+    return write_keypoint_blob(path, keypoints_to_array(keypoints), descriptors)
+
+
+def _save_legacy_blob(image: np.ndarray, path: Path) -> str:
+    """Write a blob in the pre-versioning compressed ``.npz`` format."""
+
+    keypoints, descriptors = cv2.AKAZE_create().detectAndCompute(image, None)
+    kp_data = [
+        {
+            "pt": kp.pt,
+            "angle": kp.angle,
+            "response": kp.response,
+            "octave": kp.octave,
+            "size": kp.size,
+        }
+        for kp in keypoints
+    ]
+    np.savez_compressed(
+        path,
+        keypoints=kp_data,
+        descriptors=descriptors,
+        count=len(keypoints),
+    )
+    return str(path)
+
+
+@pytest.fixture
+def blobs(tmp_path: Path) -> Dict[str, str]:
+    product = _textured_image(1)
+    homography = np.array(
+        [[0.9, 0.05, 12.0], [-0.04, 0.95, 8.0], [0.0, 0.0, 1.0]],
+        dtype=np.float64,
+    )
+    frame = cv2.warpPerspective(product, homography, (320, 240))
+
+    return {
+        "product": _save_blob(product, tmp_path / "product.kpv2.npy"),
+        "frame": _save_blob(frame, tmp_path / "frame.kpv2.npy"),
+        "legacy_frame": _save_legacy_blob(frame, tmp_path / "frame.npz"),
+        "other": _save_blob(_textured_image(2), tmp_path / "other.kpv2.npy"),
+    }
+
+
+def _pair(image_kp: str, frame_kp: str) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    return (
+        {"img_id": "img_1", "kp_blob_path": image_kp},
+        {"frame_id": "frame_1", "kp_blob_path": frame_kp},
+    )
+
+
+class TestComputeInliersRatio:
+    """Checks for the pure matching function run in worker processes."""
+
+    def test_warped_view_verifies(self, blobs: Dict[str, str]) -> None:
+        product = load_keypoint_blob(blobs["product"])
+        frame = load_keypoint_blob(blobs["frame"])
+        assert product is not None and frame is not None
+        assert len(product) > 20
+
+        ratio = compute_inliers_ratio(
+            product.points,
+            product.descriptors,
+            frame.points,
+            frame.descriptors,
+        )
+
+        assert ratio >= 0.35
+
+    def test_unrelated_images_do_not_verify(self, blobs: Dict[str, str]) -> None:
+        product = load_keypoint_blob(blobs["product"])
+        other = load_keypoint_blob(blobs["other"])
+        assert product is not None and other is not None
+
+        ratio = compute_inliers_ratio(
+            product.points,
+            product.descriptors,
+            other.points,
+            other.descriptors,
+        )
+
+        assert ratio < 0.1
+
+    def test_legacy_blob_matches_like_current_format(
+        self,
+        blobs: Dict[str, str],
+    ) -> None:
+        product = load_keypoint_blob(blobs["product"])
+        current = load_keypoint_blob(blobs["frame"])
+        legacy = load_keypoint_blob(blobs["legacy_frame"])
+        assert product is not None and current is not None and legacy is not None
+        # Current-format blobs are read-only memory maps
+        assert not current.descriptors.flags.writeable
+
+        ratios = [
+            compute_inliers_ratio(
+                product.points,
+                np.ascontiguousarray(product.descriptors),
+                blob.points,
+                np.ascontiguousarray(blob.descriptors),
+            )
+            for blob in (current, legacy)
+        ]
+
+        assert ratios[0] == pytest.approx(ratios[1])
+
+    def test_mismatched_descriptor_types_score_zero(self) -> None:
+        points = np.zeros((10, 2), dtype=np.float32)
+        binary = np.zeros((10, 61), dtype=np.uint8)
+        floats = np.zeros((10, 128), dtype=np.float32)
+
+        assert compute_inliers_ratio(points, binary, points, floats) == 0.0
+
+    def test_missing_blob_loads_as_none(self, tmp_path: Path) -> None:
+        assert load_keypoint_blob(str(tmp_path / "missing.npz")) is None
+
+
+class TestKeypointMatcher:
+    """Checks for caching and executor dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_blobs_are_loaded_once(self, blobs: Dict[str, str]) -> None:
+        matcher = KeypointMatcher(max_workers=0, cache_size=2)
+
+        first = matcher.get_blob(blobs["product"])
+        assert matcher.get_blob(blobs["product"]) is first
+
+        matcher.get_blob(blobs["frame"])
+        matcher.get_blob(blobs["other"])
+        assert (None, blobs["product"]) not in matcher._blob_cache
+
+        matcher.clear_cache()
+        assert not matcher._blob_cache
+
+    @pytest.mark.asyncio
+    async def test_clearing_a_job_keeps_other_jobs_blobs(
+        self,
+        blobs: Dict[str, str],
+    ) -> None:
+        matcher = KeypointMatcher(max_workers=0)
+
+        await matcher.inliers_ratio(blobs["product"], blobs["frame"], job_id="job_1")
+        await matcher.inliers_ratio(blobs["product"], blobs["other"], job_id="job_2")
+
+        matcher.clear_cache("job_1")
+
+        assert set(matcher._blob_cache) == {
+            ("job_2", blobs["product"]),
+            ("job_2", blobs["other"]),
+        }
+
+    @pytest.mark.asyncio
+    async def test_blobs_load_off_the_event_loop(
+        self,
+        blobs: Dict[str, str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        loader_threads = []
+
+        def recording_loader(kp_blob_path: str):
+            loader_threads.append(threading.get_ident())
+            return load_keypoint_blob(kp_blob_path)
+
+        monkeypatch.setattr(keypoint_matcher, "load_keypoint_blob", recording_loader)
+        matcher = KeypointMatcher(max_workers=0)
+
+        await matcher.inliers_ratio(blobs["product"], blobs["frame"])
+
+        assert len(loader_threads) == 2
+        assert threading.get_ident() not in loader_threads
+
+    @pytest.mark.asyncio
+    async def test_process_pool_matches_inline(self, blobs: Dict[str, str]) -> None:
+        inline = KeypointMatcher(max_workers=0)
+        pooled = KeypointMatcher(max_workers=1)
+        try:
+            expected = await inline.inliers_ratio(blobs["product"], blobs["frame"])
+            actual = await pooled.inliers_ratio(blobs["product"], blobs["frame"])
+        finally:
+            pooled.shutdown()
+
+        assert actual == pytest.approx(expected)
+        assert pooled._executor is None
+        # Workers load blobs from the paths; the parent never reads them
+        assert not pooled._blob_cache
+
+    @pytest.mark.asyncio
+    async def test_unreadable_blob_returns_none(
+        self,
+        blobs: Dict[str, str],
+        tmp_path: Path,
+    ) -> None:
+        matcher = KeypointMatcher(max_workers=0)
+
+        ratio = await matcher.inliers_ratio(
+            blobs["product"],
+            str(tmp_path / "missing.npz"),
+        )
+
+        assert ratio is None
+
+
+class TestPairScoreKeypoints:
+    """Pair scoring with real blobs and the embedding early exit."""
+
+    @pytest.mark.asyncio
+    async def test_keypoints_separate_matching_frames(
+        self,
+        blobs: Dict[str, str],
+    ) -> None:
+        calculator = PairScoreCalculator(
+            sim_deep_min=0.82,
+            inliers_min=0.35,
+            keypoint_matcher=KeypointMatcher(max_workers=0),
+        )
+
+        matching = await calculator.calculate_pair_score(
+            *_pair(blobs["product"], blobs["frame"]),
+            sim_deep=0.9,
+        )
+        unrelated = await calculator.calculate_pair_score(
+            *_pair(blobs["product"], blobs["other"]),
+            sim_deep=0.9,
+        )
+
+        assert unrelated < 0.82
+        assert matching > unrelated
+
+    @pytest.mark.asyncio
+    async def test_low_embedding_score_skips_keypoints(self) -> None:
+        keypoint_matcher = KeypointMatcher(max_workers=0)
+        keypoint_matcher.inliers_ratio = AsyncMock(return_value=1.0)
+        calculator = PairScoreCalculator(
+            sim_deep_min=0.82,
+            inliers_min=0.35,
+            keypoint_matcher=keypoint_matcher,
+        )
+
+        # 0.35 * 0.4 + 0.55 + 0.075 < 0.82 even with a perfect keypoint score
+        score = await calculator.calculate_pair_score(
+            *_pair("/kp/a.npz", "/kp/b.npz"),
+            sim_deep=0.4,
+        )
+
+        keypoint_matcher.inliers_ratio.assert_not_called()
+        assert score < 0.82
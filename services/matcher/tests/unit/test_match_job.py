@@ -0,0 +1,168 @@
+"""Unit tests for job-level matching via the similarity matrix."""
+
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from matching import MatchingEngine
+from matching_components.job_similarity import JobSimilarityMatrix
+
+pytestmark = pytest.mark.unit
+
+PARAMS = {
+    "retrieval_topk": 3,
+    "sim_deep_min": 0.82,
+    "inliers_min": 0.35,
+    "match_best_min": 0.88,
+    "match_cons_min": 2,
+    "match_accept": 0.80,
+}
+
+
+def _build_job(seed: int = 3) -> Dict[str, List[Dict[str, Any]]]:
+    """Build a small job where some frames closely resemble product images."""
+
+    rng = np.random.default_rng(seed)
+    dim = 32
+    bases = rng.normal(size=(3, dim)).astype(np.float32)
+
+    images: List[Dict[str, Any]] = []
+    for p, base in enumerate(bases):
+        for i in range(2):
+            emb = base + 0.1 * rng.normal(size=dim)
+            images.append(
+                {
+                    "product_id": f"p{p}",
+                    "img_id": f"p{p}_img{i}",
+                    "local_path": f"/data/p{p}_{i}.jpg",
+                    "emb_rgb": None if (p, i) == (2, 1) else emb.tolist(),
+                    "emb_gray": (emb + 0.05).tolist(),
+                    "kp_blob_path": f"/data/kp/p{p}_{i}.npz",
+                }
+            )
+
+    frames: List[Dict[str, Any]] = []
+    for v in range(2):
+        for f in range(6):
+            source = bases[(v + f) % 3]
+            emb = source + 0.3 * rng.normal(size=dim)
+            frames.append(
+                {
+                    "video_id": f"v{v}",
+                    "frame_id": f"v{v}_f{f}",
+                    "ts": float(f),
+                    "local_path": f"/data/v{v}_{f}.jpg",
+                    "emb_rgb": emb.tolist(),
+                    "emb_gray": None if f == 4 else (emb - 0.05).tolist(),
+                    "kp_blob_path": f"/data/kp/v{v}_{f}.npz",
+                }
+            )
+
+    return {
+        "images": images,
+        "frames": frames,
+        "products": [{"product_id": f"p{p}"} for p in range(3)],
+        "videos": [{"video_id": f"v{v}"} for v in range(2)],
+    }
+
+
+def _mock_db(job: Dict[str, List[Dict[str, Any]]]) -> AsyncMock:
+    async def fetch_all(query: str, key: str) -> List[Dict[str, Any]]:
+        if "JOIN products" in query:
+            return job["images"]
+        if "JOIN job_videos" in query:
+            return job["frames"]
+        if "FROM product_images" in query:
+            return [img for img in job["images"] if img["product_id"] == key]
+        if "FROM video_frames" in query:
+            return [frame for frame in job["frames"] if frame["video_id"] == key]
+        raise AssertionError(f"Unexpected query: {query}")
+
+    db = AsyncMock()
+    db.fetch_all = AsyncMock(side_effect=fetch_all)
+    return db
+
+
+def _engine(job: Dict[str, List[Dict[str, Any]]], **params: Any) -> MatchingEngine:
+    engine = MatchingEngine(_mock_db(job), "/data", **params, **PARAMS)
+    # The fixture has no keypoint blobs; every verified pair scores 1.0
+    engine.keypoint_matcher.inliers_ratio = AsyncMock(return_value=1.0)
+    return engine
+
+
+class TestMatchJob:
+    """Job mode must reproduce the per-pair matching results."""
+
+    @pytest.mark.asyncio
+    async def test_job_mode_matches_pair_mode(self) -> None:
+        job = _build_job()
+        engine = _engine(job)
+
+        expected = []
+        for product in job["products"]:
+            for video in job["videos"]:
+                result = await engine.match_product_video(
+                    product["product_id"],
+                    video["video_id"],
+                    "job1",
+                )
+                if result:
+                    expected.append(
+                        (product["product_id"], video["video_id"], result)
+                    )
+
+        job_engine = _engine(job, similarity_block_size=2)
+        actual = await job_engine.match_job(
+            "job1",
+            job["products"],
+            job["videos"],
+        )
+
+        assert expected, "fixture should produce at least one match"
+        assert [(p, v) for p, v, _ in actual] == [(p, v) for p, v, _ in expected]
+        for (_, _, got), (_, _, want) in zip(actual, expected):
+            assert got.keys() == want.keys()
+            for key, value in want.items():
+                if isinstance(value, (float, np.floating)):
+                    assert got[key] == pytest.approx(value, abs=1e-5)
+                else:
+                    assert got[key] == value
+
+        # Two bulk queries regardless of the number of products and videos
+        assert job_engine.db.fetch_all.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_match_job_without_frames_returns_empty(self) -> None:
+        job = _build_job()
+        job["frames"] = []
+        engine = _engine(job)
+
+        assert await engine.match_job("job1", job["products"], job["videos"]) == []
+
+
+class TestJobSimilarityMatrix:
+    """Checks for the blocked similarity matrix."""
+
+    def test_block_size_does_not_change_scores(self) -> None:
+        job = _build_job(seed=11)
+        weights = {"rgb": 0.7, "gray": 0.3}
+
+        full = JobSimilarityMatrix(job["images"], job["frames"], weights, 1024)
+        blocked = JobSimilarityMatrix(job["images"], job["frames"], weights, 1)
+
+        np.testing.assert_allclose(full.rgb, blocked.rgb, atol=1e-6)
+        np.testing.assert_allclose(full.deep, blocked.deep, atol=1e-6)
+
+    def test_missing_embeddings_are_nan(self) -> None:
+        images = [{"emb_rgb": None, "emb_gray": None}, {"emb_rgb": [1.0, 0.0]}]
+        frames = [{"emb_rgb": [1.0, 0.0]}, {"emb_rgb": None}]
+
+        matrix = JobSimilarityMatrix(images, frames, {"rgb": 0.7, "gray": 0.3})
+
+        assert matrix.deep_similarity(0, 0) is None
+        assert matrix.deep_similarity(1, 0) == pytest.approx(1.0)
+        assert matrix.deep_similarity(1, 1) is None
+        assert matrix.retrieve(0, [0, 1], 1) == [0]
+        assert matrix.retrieve(1, [0, 1], 5) == [0]
@@ -7,6 +7,10 @@ import pytest
 from matching import MatchingEngine
 
 
+def _same_frames_for_each_image(images, video_frames, video_id=None, job_id=None):
+    return [video_frames for _ in images]
+
+
 class TestMatchProductVideo:
     """Test the match_product_video method."""
 
@@ -60,8 +64,8 @@ class TestMatchProductVideo:
         matching_engine.get_video_frames = AsyncMock(return_value=video_frames)
 
         # Mock vector searcher to return frames, but pair scorer returns low scores
-        matching_engine.vector_searcher.retrieve_similar_frames = AsyncMock(
-            return_value=video_frames
+        matching_engine.vector_searcher.retrieve_similar_frames_batch = AsyncMock(
+            side_effect=_same_frames_for_each_image
         )
         matching_engine.pair_score_calculator.calculate_pair_score = AsyncMock(
             return_value=0.75  # Below sim_deep_min of 0.82
@@ -82,8 +86,8 @@ class TestMatchProductVideo:
         matching_engine.get_video_frames = AsyncMock(return_value=video_frames)
 
         # Mock successful matching
-        matching_engine.vector_searcher.retrieve_similar_frames = AsyncMock(
-            return_value=video_frames
+        matching_engine.vector_searcher.retrieve_similar_frames_batch = AsyncMock(
+            side_effect=_same_frames_for_each_image
         )
         matching_engine.pair_score_calculator.calculate_pair_score = AsyncMock(
             return_value=0.90  # Above sim_deep_min
@@ -124,8 +128,8 @@ class TestMatchProductVideo:
         matching_engine.get_video_frames = AsyncMock(return_value=video_frames)
 
         # Mock vector search and pair scoring
-        matching_engine.vector_searcher.retrieve_similar_frames = AsyncMock(
-            return_value=video_frames
+        matching_engine.vector_searcher.retrieve_similar_frames_batch = AsyncMock(
+            side_effect=_same_frames_for_each_image
         )
         matching_engine.pair_score_calculator.calculate_pair_score = AsyncMock(
             return_value=0.90
@@ -149,8 +153,10 @@ class TestMatchProductVideo:
 
         assert result == expected_aggregation
 
-        # Verify vector searcher was called for each image
-        assert matching_engine.vector_searcher.retrieve_similar_frames.call_count == 2
+        # Verify all images were retrieved in a single batched call
+        retrieve_batch = matching_engine.vector_searcher.retrieve_similar_frames_batch
+        assert retrieve_batch.call_count == 1
+        assert retrieve_batch.call_args.kwargs["video_id"] == "video1"
 
         # Verify pair scorer was called for each image-frame combination
         assert matching_engine.pair_score_calculator.calculate_pair_score.call_count == 4
@@ -175,8 +181,8 @@ class TestMatchProductVideo:
         matching_engine.get_video_frames = AsyncMock(return_value=video_frames)
 
         # Mock vector search returns frames, but pair scorer returns varying scores
-        matching_engine.vector_searcher.retrieve_similar_frames = AsyncMock(
-            return_value=video_frames
+        matching_engine.vector_searcher.retrieve_similar_frames_batch = AsyncMock(
+            side_effect=_same_frames_for_each_image
         )
         matching_engine.pair_score_calculator.calculate_pair_score = AsyncMock(
             return_value=0.75  # All below sim_deep_min
@@ -198,8 +204,8 @@ class TestMatchProductVideo:
         matching_engine.get_video_frames = AsyncMock(return_value=video_frames)
 
         # Mock successful matching but aggregation rejects
-        matching_engine.vector_searcher.retrieve_similar_frames = AsyncMock(
-            return_value=video_frames
+        matching_engine.vector_searcher.retrieve_similar_frames_batch = AsyncMock(
+            side_effect=_same_frames_for_each_image
         )
         matching_engine.pair_score_calculator.calculate_pair_score = AsyncMock(
             return_value=0.90
@@ -224,11 +230,11 @@ class TestMatchProductVideo:
         matching_engine.get_video_frames = AsyncMock(return_value=video_frames)
 
         # Mock vector search and mixed pair scoring
-        matching_engine.vector_searcher.retrieve_similar_frames = AsyncMock(
-            return_value=video_frames
+        matching_engine.vector_searcher.retrieve_similar_frames_batch = AsyncMock(
+            side_effect=_same_frames_for_each_image
         )
 
-        def score_scorer(image, frame):
+        def score_scorer(image, frame, job_id=None):
             if frame["frame_id"] == "f1":
                 return 0.90  # Above threshold
             else:
@@ -272,8 +278,8 @@ class TestMatchProductVideo:
         matching_engine.get_product_images = AsyncMock(return_value=product_images)
         matching_engine.get_video_frames = AsyncMock(return_value=video_frames)
 
-        matching_engine.vector_searcher.retrieve_similar_frames = AsyncMock(
-            return_value=video_frames
+        matching_engine.vector_searcher.retrieve_similar_frames_batch = AsyncMock(
+            side_effect=_same_frames_for_each_image
         )
         matching_engine.pair_score_calculator.calculate_pair_score = AsyncMock(
             return_value=0.90
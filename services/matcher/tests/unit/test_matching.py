@@ -182,6 +182,7 @@ class TestMatchingEngine:
         sample_image: Dict[str, Any],
         sample_video_frames: List[Dict[str, Any]],
     ) -> None:
+        matching_engine.vector_searcher.backend = "pgvector"
         with patch.object(
             matching_engine.vector_searcher,
             "_vector_similarity_search",
@@ -346,13 +347,35 @@ class TestMatchingEngine:
         sample_image: Dict[str, Any],
         sample_video_frames: List[Dict[str, Any]],
     ) -> None:
-        similarity = await matching_engine.pair_score_calculator.calculate_keypoint_similarity(
-            sample_image,
-            sample_video_frames[0],
-        )
+        calculator = matching_engine.pair_score_calculator
+        with patch.object(
+            calculator.keypoint_matcher,
+            "inliers_ratio",
+            AsyncMock(side_effect=[0.8, 0.1, None]),
+        ) as mock_ratio:
+            verified = await calculator.calculate_keypoint_similarity(
+                sample_image,
+                sample_video_frames[0],
+                job_id="job_1",
+            )
+            rejected = await calculator.calculate_keypoint_similarity(
+                sample_image,
+                sample_video_frames[0],
+            )
+            unreadable = await calculator.calculate_keypoint_similarity(
+                sample_image,
+                sample_video_frames[0],
+            )
 
-        # Assert the mock behavior: keypoints exist, so it should return the mock perfect score (1.0)
-        assert similarity == 1.0
+        mock_ratio.assert_any_await(
+            sample_image["kp_blob_path"],
+            sample_video_frames[0]["kp_blob_path"],
+            job_id="job_1",
+        )
+        assert verified == 0.8
+        # Below INLIERS_MIN the keypoint signal is discarded
+        assert rejected == 0.0
+        assert unreadable == 0.5
 
     @pytest.mark.asyncio
     async def test_calculate_keypoint_similarity_no_keypoints(
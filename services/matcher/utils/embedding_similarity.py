@@ -47,7 +47,6 @@ class EmbeddingSimilarity:
             )
 
             # Skip validation for now - proceed with embedding calculation
-            # String embeddings from pgvector will be handled in the calculation logic
             # if not self._validate_embeddings(image_embedding, frame_embedding):
             #     logger.warning(
             #         "Invalid embeddings provided",
@@ -90,28 +89,9 @@ class EmbeddingSimilarity:
             image_embedding.get("emb_rgb") is not None
             and frame_embedding.get("emb_rgb") is not None
         ):
-            # Handle string embeddings from database
-            img_rgb = image_embedding["emb_rgb"]
-            frame_rgb = frame_embedding["emb_rgb"]
-
-            # Convert string representations to lists if needed
-            if isinstance(img_rgb, str):
-                import ast
-                try:
-                    img_rgb = ast.literal_eval(img_rgb)
-                except (ValueError, SyntaxError):
-                    img_rgb = [float(x) for x in img_rgb.strip('[]').split(',') if x.strip()]
-
-            if isinstance(frame_rgb, str):
-                import ast
-                try:
-                    frame_rgb = ast.literal_eval(frame_rgb)
-                except (ValueError, SyntaxError):
-                    frame_rgb = [float(x) for x in frame_rgb.strip('[]').split(',') if x.strip()]
-
             rgb_similarity = self._calculate_cosine_similarity(
-                img_rgb,
-                frame_rgb,
+                image_embedding["emb_rgb"],
+                frame_embedding["emb_rgb"],
             )
 
         gray_similarity = 0.0
@@ -119,26 +99,9 @@ class EmbeddingSimilarity:
             image_embedding.get("emb_gray") is not None
             and frame_embedding.get("emb_gray") is not None
         ):
-            # Handle string embeddings from database
-            img_gray = image_embedding["emb_gray"]
-            frame_gray = frame_embedding["emb_gray"]
-
-            # Convert string representations to lists if needed
-            if isinstance(img_gray, str):
-                try:
-                    img_gray = ast.literal_eval(img_gray)
-                except (ValueError, SyntaxError):
-                    img_gray = [float(x) for x in img_gray.strip('[]').split(',') if x.strip()]
-
-            if isinstance(frame_gray, str):
-                try:
-                    frame_gray = ast.literal_eval(frame_gray)
-                except (ValueError, SyntaxError):
-                    frame_gray = [float(x) for x in frame_gray.strip('[]').split(',') if x.strip()]
-
             gray_similarity = self._calculate_cosine_similarity(
-                img_gray,
-                frame_gray,
+                image_embedding["emb_gray"],
+                frame_embedding["emb_gray"],
             )
 
         if gray_similarity > 0.0 and rgb_similarity > 0.0:
@@ -160,18 +123,16 @@ class EmbeddingSimilarity:
     ) -> bool:
         """Validate that embeddings are present and of the expected shape."""
 
-        # Get embeddings and check if they're valid (support string from pgvector)
+        # Get embeddings and check if they're valid
         img_rgb = image_embedding.get("emb_rgb")
         frame_rgb = frame_embedding.get("emb_rgb")
         img_gray = image_embedding.get("emb_gray")
         frame_gray = frame_embedding.get("emb_gray")
 
-        # Helper function to check if embedding is valid (string, list, tuple, or ndarray with content)
+        # Helper function to check if embedding is valid (list, tuple, or ndarray with content)
         def is_embedding_valid(emb):
             if emb is None:
                 return False
-            if isinstance(emb, str):
-                return len(emb.strip()) > 2  # String like "[0.1,0.2,...]"
             if isinstance(emb, (list, tuple)):
                 return len(emb) > 0
             if hasattr(emb, '__len__'):
@@ -259,18 +220,17 @@ class EmbeddingSimilarity:
             gray_similarities: List[float] = []
 
             for embedding in embeddings:
-                if embedding.get("emb_rgb") and embedding.get("emb_gray"):
+                if (
+                    embedding.get("emb_rgb") is not None
+                    and embedding.get("emb_gray") is not None
+                ):
+                    emb_rgb = np.asarray(embedding["emb_rgb"], dtype=np.float32)
+                    emb_gray = np.asarray(embedding["emb_gray"], dtype=np.float32)
                     rgb_similarities.append(
-                        self._calculate_cosine_similarity(
-                            embedding["emb_rgb"],
-                            embedding["emb_rgb"],
-                        )
+                        self._calculate_cosine_similarity(emb_rgb, emb_rgb)
                     )
                     gray_similarities.append(
-                        self._calculate_cosine_similarity(
-                            embedding["emb_gray"],
-                            embedding["emb_gray"],
-                        )
+                        self._calculate_cosine_similarity(emb_gray, emb_gray)
                     )
 
             return {
@@ -0,0 +1,96 @@
+"""Benchmark segmentation throughput (images/sec) against batch size.
+
+Run from the service directory::
+
+    python benchmarks/batch_throughput.py --batch-sizes 1 2 4 8 --images 32
+
+Synthetic images are written to a temporary directory, so the numbers cover
+image decoding, the batched forward pass and mask post-processing, i.e. the
+work done per coalesced batch by ``BatchingSegmentor``. Batch size 1 uses
+``segment_image``, the path taken before batching. CUDA is hidden unless
+``--device cuda`` is given.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+from PIL import Image
+
+SERVICE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SERVICE_DIR))
+
+
+def _write_images(directory: Path, count: int, size: int) -> List[str]:
+    rng = np.random.default_rng(0)
+    paths = []
+    for index in range(count):
+        pixels = rng.integers(0, 256, (size, size, 3), dtype=np.uint8)
+        path = directory / f"bench_{index:04d}.jpg"
+        Image.fromarray(pixels).save(path, quality=90)
+        paths.append(str(path))
+    return paths
+
+
+def _build_segmentor(model: str):
+    if model == "yolo":
+        from config_loader import config
+        from segmentation.models.yolo_segmentor import YOLOSegmentor
+
+        return YOLOSegmentor(config.PEOPLE_SEG_MODEL_NAME)
+
+    from services.foreground_segmentor_factory import create_segmentor
+
+    return create_segmentor(model)
+
+
+async def _run(args: argparse.Namespace) -> None:
+    if args.device == "cpu":
+        os.environ["CUDA_VISIBLE_DEVICES"] = ""
+
+    segmentor = _build_segmentor(args.model)
+    await segmentor.initialize()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_images(Path(tmp), args.images, args.image_size)
+
+        # Warm-up pass so lazy initialisation does not skew the first size
+        await segmentor.segment_batch(paths[: max(args.batch_sizes)])
+
+        print(f"device={args.device} model={segmentor.model_name} images={args.images}")
+        print(f"{'batch_size':>10} {'seconds':>10} {'images/sec':>12}")
+        for batch_size in args.batch_sizes:
+            start = time.perf_counter()
+            for offset in range(0, len(paths), batch_size):
+                if batch_size == 1:
+                    await segmentor.segment_image(paths[offset])
+                else:
+                    await segmentor.segment_batch(paths[offset:offset + batch_size])
+            elapsed = time.perf_counter() - start
+            print(f"{batch_size:>10} {elapsed:>10.2f} {len(paths) / elapsed:>12.1f}")
+
+    segmentor.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--images", type=int, default=32)
+    parser.add_argument("--image-size", type=int, default=640)
+    parser.add_argument("--device", default="cpu", choices=["cpu", "cuda"])
+    parser.add_argument(
+        "--model",
+        default="briaai/RMBG-1.4",
+        help="Foreground model name (briaai/RMBG-1.4, briaai/RMBG-2.0) or 'yolo' for people segmentation",
+    )
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
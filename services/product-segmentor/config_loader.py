@@ -46,12 +46,23 @@ class ProductSegmentorConfig:
     MASK_QUALITY: float = float(os.getenv("MASK_QUALITY", "0.8"))
     IMG_SIZE: tuple[int, int] = global_config.IMG_SIZE
 
+    # Request coalescing: concurrent images share one model forward pass
+    SEGMENTATION_BATCH_SIZE: int = int(os.getenv("SEGMENTATION_BATCH_SIZE", "8"))
+    SEGMENTATION_BATCH_WAIT_MS: float = float(os.getenv("SEGMENTATION_BATCH_WAIT_MS", "10"))
+
     # GPU Memory Management
     USE_FP16: bool = _parse_bool("USE_FP16", "true")
     RETRY_ON_OOM: bool = _parse_bool("RETRY_ON_OOM", "true")
     MAX_OOM_RETRIES: int = int(os.getenv("MAX_OOM_RETRIES", "3"))
     GPU_MEMORY_THRESHOLD: float = float(os.getenv("GPU_MEMORY_THRESHOLD", "0.85"))
 
+    # Skip people segmentation for product images when a low-resolution YOLO pass finds nobody
+    PEOPLE_PRESENCE_CHECK: bool = _parse_bool("PEOPLE_PRESENCE_CHECK", "false")
+    PEOPLE_PRESENCE_IMGSZ: int = int(os.getenv("PEOPLE_PRESENCE_IMGSZ", "320"))
+
+    # Also write the intermediate foreground and people masks (in the background)
+    SAVE_DEBUG_MASKS: bool = _parse_bool("SAVE_DEBUG_MASKS", "false")
+
     # File paths
     FOREGROUND_MASK_DIR_PATH: str = os.path.join(global_config.DATA_ROOT_CONTAINER,
                                                  os.getenv("FOREGROUND_MASK_REL_PATH", "./masks_foreground"))
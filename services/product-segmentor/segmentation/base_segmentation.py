@@ -1,6 +1,7 @@
 """Base abstract class for segmentation models with common functionality."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import numpy as np
 from .interface import SegmentationInterface
@@ -29,6 +30,25 @@ class BaseSegmentation(SegmentationInterface, ABC):
     def __init__(self):
         """Initialize the base segmentation model."""
         self._initialized = False
+        self._inference_executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_inference_executor(self) -> ThreadPoolExecutor:
+        """Single-thread executor for this model's forward passes.
+
+        Each model gets its own thread, so the foreground and people models
+        run concurrently without queueing behind each other's work in the
+        default thread pool.
+        """
+        if self._inference_executor is None:
+            self._inference_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"{type(self).__name__}-inference"
+            )
+        return self._inference_executor
+
+    def _shutdown_inference_executor(self) -> None:
+        if self._inference_executor is not None:
+            self._inference_executor.shutdown(wait=False)
+            self._inference_executor = None
 
     @abstractmethod
     async def initialize(self) -> None:
@@ -0,0 +1,117 @@
+"""Request coalescing in front of a segmentation model."""
+
+import asyncio
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from common_py.logging_config import configure_logging
+from .interface import SegmentationInterface
+
+logger = configure_logging("product-segmentor:batching_segmentor")
+
+
+class BatchingSegmentor(SegmentationInterface):
+    """Coalesces concurrent ``segment_image`` calls into ``segment_batch`` calls.
+
+    Requests are queued and served by a single worker task. The worker waits
+    up to ``max_wait_ms`` after the first request for more to arrive, then
+    runs up to ``max_batch_size`` images through the wrapped segmentor at once.
+    Requests that arrive while a batch is running form the next batch.
+    """
+
+    def __init__(self, segmentor: SegmentationInterface, max_batch_size: int = 8, max_wait_ms: float = 10.0):
+        self.segmentor = segmentor
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def segment_image(self, image_path: str) -> Optional[np.ndarray]:
+        if self.max_batch_size == 1:
+            return await self.segmentor.segment_image(image_path)
+
+        if not os.path.exists(image_path):
+            raise FileNotFoundError(f"Image file not found: {image_path}")
+
+        future = asyncio.get_running_loop().create_future()
+        self._ensure_worker()
+        await self._queue.put((image_path, future))
+        return await future
+
+    async def segment_batch(self, image_paths: List[str]) -> List[Optional[np.ndarray]]:
+        return await self.segmentor.segment_batch(image_paths)
+
+    async def close(self) -> None:
+        """Stop the worker; requests still queued fail with ``CancelledError``."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    def _ensure_worker(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect_batch()
+            try:
+                await self._process(batch)
+            except Exception as e:
+                # Never let one batch take the worker down
+                logger.error("Segmentation batch failed", batch_size=len(batch), error=str(e))
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    async def _collect_batch(self) -> List[Tuple[str, asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _process(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        # Callers that gave up while queued no longer need a mask
+        batch = [(path, future) for path, future in batch if not future.done()]
+        if not batch:
+            return
+
+        if len(batch) == 1:
+            path, future = batch[0]
+            try:
+                mask = await self.segmentor.segment_image(path)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                return
+            if not future.done():
+                future.set_result(mask)
+            return
+
+        masks = await self.segmentor.segment_batch([path for path, _ in batch])
+        logger.debug("Segmented coalesced batch", batch_size=len(batch))
+        for (_, future), mask in zip(batch, masks):
+            if not future.done():
+                future.set_result(mask)
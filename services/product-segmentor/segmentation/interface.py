@@ -1,7 +1,7 @@
 """Abstract segmentation interface for pluggable segmentation models."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 import numpy as np
 
 
@@ -24,3 +24,23 @@ class SegmentationInterface(ABC):
             Exception: If segmentation processing fails
         """
         raise NotImplementedError
+
+    async def segment_batch(self, image_paths: List[str]) -> List[Optional[np.ndarray]]:
+        """Generate masks for several images, ideally in one forward pass.
+
+        The default implementation segments the images one at a time; models
+        that can stack inputs override it.
+
+        Args:
+            image_paths: Paths to input image files
+
+        Returns:
+            One mask (or None if segmentation fails) per path, in input order
+        """
+        masks: List[Optional[np.ndarray]] = []
+        for image_path in image_paths:
+            try:
+                masks.append(await self.segment_image(image_path))
+            except FileNotFoundError:
+                masks.append(None)
+        return masks
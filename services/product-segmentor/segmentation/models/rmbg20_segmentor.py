@@ -2,7 +2,7 @@
 
 import asyncio
 import os
-from typing import Optional
+from typing import List, Optional
 
 import numpy as np
 import torch
@@ -13,7 +13,14 @@ from common_py.logging_config import configure_logging
 
 from config_loader import config
 from segmentation.base_segmentation import BaseSegmentation
-from segmentation.segmentation_utils import normalize_and_resize_mask, prepare_image
+from segmentation.segmentation_utils import (
+    create_inference_stream,
+    masks_from_batch,
+    normalize_and_resize_mask,
+    prepare_image,
+    prepare_images,
+    run_on_stream,
+)
 
 logger = configure_logging("product-segmentor:rmbg20_segmentor")
 
@@ -28,6 +35,7 @@ class RMBG20Segmentor(BaseSegmentation):
         self._model = None
         self._transform = None
         self._device = None
+        self._stream = None
         self._image_size = config.IMG_SIZE
 
     async def initialize(self) -> None:
@@ -127,14 +135,55 @@ class RMBG20Segmentor(BaseSegmentation):
             logger.error("Segmentation failed", path=image_path, error=str(e))
             return None
 
+    async def segment_batch(self, image_paths: List[str]) -> List[Optional[np.ndarray]]:
+        """Generate product masks for several images with one RMBG-2.0 forward pass.
+
+        Images are resized to the model input size, so their tensors are
+        stacked as-is. Decoding and mask post-processing run in the default
+        thread pool.
+
+        Args:
+            image_paths: Paths to input images
+
+        Returns:
+            One binary mask (or None if segmentation fails) per path, in input order
+        """
+        if not self._initialized:
+            logger.error("Model not initialized")
+            return [None] * len(image_paths)
+
+        existing = [path for path in image_paths if os.path.exists(path)]
+        if len(existing) < len(image_paths):
+            logger.error("Image files not found", paths=[path for path in image_paths if path not in existing])
+
+        try:
+            images, input_tensor = await prepare_images(existing, self._transform, self._device)
+            if input_tensor is None:
+                return [None] * len(image_paths)
+
+            loop = asyncio.get_event_loop()
+            preds = await self._run_inference(input_tensor, loop)
+            masks = dict(zip(existing, await masks_from_batch(preds, images)))
+
+            logger.debug("Batch segmentation completed", batch_size=input_tensor.shape[0])
+            return [masks.get(path) for path in image_paths]
+
+        except Exception as e:
+            logger.error("Batch segmentation failed", batch_size=len(image_paths), error=str(e))
+            return [None] * len(image_paths)
+
     async def _run_inference(self, input_tensor: torch.Tensor, loop: asyncio.BaseEventLoop) -> torch.Tensor:
         with torch.no_grad():
             # Convert input to FP16 if model is in FP16
             if config.USE_FP16 and self._device == "cuda":
                 input_tensor = input_tensor.half()
             
+            if self._stream is None:
+                self._stream = create_inference_stream(self._device)
             preds = await loop.run_in_executor(
-                None,
+                self._get_inference_executor(),
+                run_on_stream,
+                self._stream,
                 lambda: self._model(input_tensor)[-1].sigmoid().cpu()
             )
         return preds
@@ -153,6 +202,9 @@ class RMBG20Segmentor(BaseSegmentation):
             if self._device == "cuda" and torch.cuda.is_available():
                 torch.cuda.empty_cache()
 
+            self._shutdown_inference_executor()
+            self._stream = None
+
             # Mark as not initialized
             self._initialized = False
             logger.info("RMBG-2.0 model resources cleaned up")
@@ -1,15 +1,21 @@
 from ultralytics import YOLO
+import asyncio
 import numpy as np
 import cv2
 import os
-from typing import Optional
+from typing import List, Optional
 
 from segmentation.base_segmentation import BaseSegmentation
+from segmentation.segmentation_utils import create_inference_stream, get_shared_image, run_on_stream
 from config_loader import config
 from common_py.logging_config import configure_logging
 
 logger = configure_logging("product-segmentor:yolo_segmentor")
 
+# Only the 'person' class (class ID 0) above this confidence is segmented
+PERSON_CLASS_ID = 0
+PERSON_CONFIDENCE = 0.5
+
 
 class YOLOSegmentor(BaseSegmentation):
     """YOLOv8 segmentation model for people segmentation."""
@@ -33,6 +39,8 @@ class YOLOSegmentor(BaseSegmentation):
         self._model_path = os.path.join(model_cache_dir, model_filename)
         self._model_cache_dir = model_cache_dir
         self._model: Optional[YOLO] = None
+        self._stream = None
+        self._stream_checked = False
 
     async def initialize(self) -> None:
         """Initialize the YOLO segmentation model."""
@@ -125,45 +133,13 @@ class YOLOSegmentor(BaseSegmentation):
             raise FileNotFoundError(f"Image file not found: {image_path}")
 
         try:
-            # Perform inference, filtering for the 'person' class (class ID 0)
-            # conf=0.5 is a confidence threshold, adjust as needed
-            results = self._model.predict(image_path, classes=0, conf=0.5, verbose=False)
+            loop = asyncio.get_event_loop()
+            results = await self._run_predict(loop, get_shared_image(image_path) or image_path)
 
             people_mask = None
             for r in results:
-                if r.masks is not None:
-                    # Get original image dimensions
-                    orig_height, orig_width = r.masks.orig_shape[:2]
-
-                    # Combine all person masks into a single mask with original dimensions
-                    combined_mask = np.zeros((orig_height, orig_width), dtype=np.uint8)
-                    for mask_tensor in r.masks.data:
-                        mask_np = mask_tensor.cpu().numpy()
-                        if mask_np.ndim == 3:
-                            mask_np = mask_np.squeeze()
-
-                        # Resize mask to original image dimensions (not config.IMG_SIZE)
-                        resized_mask = cv2.resize(mask_np, (orig_width, orig_height), interpolation=cv2.INTER_LINEAR)
-                        binary_mask = (resized_mask > 0.5).astype(np.uint8) * 255
-
-                        # Ensure both masks have the same shape before bitwise operation
-                        if combined_mask.shape == binary_mask.shape:
-                            combined_mask = cv2.bitwise_or(combined_mask, binary_mask)
-                        else:
-                            logger.warning("Mask shape mismatch, skipping mask",
-                                           combined_shape=combined_mask.shape,
-                                           binary_shape=binary_mask.shape)
-
-                    people_mask = combined_mask
-                else:
-                    logger.debug("No persons detected",
-                                 image_path=image_path)
-
-            # If no people mask was generated, return None
-            if people_mask is None:
-                return None
-
-            return people_mask.reshape(people_mask.shape[0], people_mask.shape[1], 1)
+                people_mask = self._people_mask_from_result(r, image_path)
+            return people_mask
 
         except Exception as e:
             logger.error("Item processing failed",
@@ -172,11 +148,133 @@ class YOLOSegmentor(BaseSegmentation):
                          error_type=type(e).__name__)
             return None
 
+    async def segment_batch(self, image_paths: List[str]) -> List[Optional[np.ndarray]]:
+        """Generate people masks for several images with one ``predict`` call.
+
+        Images are decoded in the default thread pool; Ultralytics letterboxes
+        them to a common size for the batched forward pass. Mask
+        post-processing also runs in the thread pool.
+
+        Args:
+            image_paths: Paths to input image files
+
+        Returns:
+            One people mask (or None) per path, in input order
+        """
+        if not self._initialized:
+            raise Exception("YOLO segmentor not initialized. Call initialize() first.")
+
+        loop = asyncio.get_event_loop()
+        images = await asyncio.gather(
+            *(loop.run_in_executor(None, self._load_image, path) for path in image_paths)
+        )
+        loaded = [index for index, image in enumerate(images) if image is not None]
+        if len(loaded) < len(image_paths):
+            logger.error("Failed to load images for people segmentation",
+                         paths=[path for path, image in zip(image_paths, images) if image is None])
+
+        masks: List[Optional[np.ndarray]] = [None] * len(image_paths)
+        if not loaded:
+            return masks
+
+        try:
+            results = await self._run_predict(loop, [images[index] for index in loaded])
+            batch_masks = await asyncio.gather(*(
+                loop.run_in_executor(None, self._people_mask_from_result, r, image_paths[index])
+                for index, r in zip(loaded, results)
+            ))
+        except Exception as e:
+            logger.error("Batch people segmentation failed",
+                         batch_size=len(loaded),
+                         error=str(e),
+                         error_type=type(e).__name__)
+            return masks
+
+        for index, mask in zip(loaded, batch_masks):
+            masks[index] = mask
+        return masks
+
+    async def detect_people(self, image_path: str, imgsz: int) -> bool:
+        """Cheap person-presence check using a low-resolution pass.
+
+        Only the detection boxes of the result are read; a False answer lets
+        callers skip the full-resolution people segmentation.
+
+        Args:
+            image_path: Path to input image file
+            imgsz: Inference size of the check (e.g. 320)
+
+        Returns:
+            True if at least one person is detected
+        """
+        if not self._initialized:
+            raise Exception("YOLO segmentor not initialized. Call initialize() first.")
+
+        loop = asyncio.get_event_loop()
+        results = await self._run_predict(loop, get_shared_image(image_path) or image_path, imgsz)
+        return any(r.boxes is not None and len(r.boxes) > 0 for r in results)
+
+    async def _run_predict(self, loop: asyncio.AbstractEventLoop, source, imgsz: Optional[int] = None):
+        # Own thread and CUDA stream, so people inference overlaps the foreground model
+        return await loop.run_in_executor(
+            self._get_inference_executor(), run_on_stream, self._get_stream(), self._predict, source, imgsz
+        )
+
+    def _predict(self, source, imgsz: Optional[int] = None):
+        options = {"imgsz": imgsz} if imgsz else {}
+        return self._model.predict(source, classes=PERSON_CLASS_ID, conf=PERSON_CONFIDENCE, verbose=False, **options)
+
+    def _get_stream(self):
+        if not self._stream_checked:
+            import torch
+            self._stream = create_inference_stream("cuda" if torch.cuda.is_available() else "cpu")
+            self._stream_checked = True
+        return self._stream
+
+    @staticmethod
+    def _load_image(image_path: str):
+        """The shared decoded image for ``image_path`` if registered, else a BGR decode."""
+        return get_shared_image(image_path) or cv2.imread(image_path)
+
+    def _people_mask_from_result(self, r, image_path: str) -> Optional[np.ndarray]:
+        """Combine the person masks of one prediction result into an (H, W, 1) mask."""
+        if r.masks is None:
+            logger.debug("No persons detected",
+                         image_path=image_path)
+            return None
+
+        # Get original image dimensions
+        orig_height, orig_width = r.masks.orig_shape[:2]
+
+        # Combine all person masks into a single mask with original dimensions
+        combined_mask = np.zeros((orig_height, orig_width), dtype=np.uint8)
+        for mask_tensor in r.masks.data:
+            mask_np = mask_tensor.cpu().numpy()
+            if mask_np.ndim == 3:
+                mask_np = mask_np.squeeze()
+
+            # Resize mask to original image dimensions (not config.IMG_SIZE)
+            resized_mask = cv2.resize(mask_np, (orig_width, orig_height), interpolation=cv2.INTER_LINEAR)
+            binary_mask = (resized_mask > 0.5).astype(np.uint8) * 255
+
+            # Ensure both masks have the same shape before bitwise operation
+            if combined_mask.shape == binary_mask.shape:
+                combined_mask = cv2.bitwise_or(combined_mask, binary_mask)
+            else:
+                logger.warning("Mask shape mismatch, skipping mask",
+                               combined_shape=combined_mask.shape,
+                               binary_shape=binary_mask.shape)
+
+        return combined_mask.reshape(orig_height, orig_width, 1)
+
     def cleanup(self) -> None:
         """Cleanup model resources."""
         logger.info("Cleaning up model resources",
                     model_name=self.model_name)
         self._model = None
+        self._shutdown_inference_executor()
+        self._stream = None
+        self._stream_checked = False
         self._initialized = False
 
     @property
@@ -1,3 +1,8 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
 import numpy as np
 from PIL import Image
 import torch
@@ -6,17 +11,83 @@ from common_py.logging_config import configure_logging
 
 logger = configure_logging("product-segmentor:segmentation_utils")
 
+# Decoded images shared by the segmentors while an image is being masked:
+# path -> [image, number of active shared_image() blocks]
+_shared_images: Dict[str, list] = {}
+_shared_images_lock = threading.Lock()
 
-def prepare_image(image_path: str, transform: transforms.Compose, device: torch.device):
-    """Prepare image for inference."""
-    # Load image
+
+def decode_image(image_path: str) -> Image.Image:
+    """Decode an image file into a fully loaded RGB image."""
     image = Image.open(image_path)
 
     # Convert to RGBA first to handle potential alpha channels, then to RGB
     # This can sometimes resolve issues with images having unusual modes
     if image.mode != 'RGBA':
         image = image.convert('RGBA')
-    image = image.convert('RGB')
+    return image.convert('RGB')
+
+
+@contextmanager
+def shared_image(image_path: str, image: Image.Image) -> Iterator[None]:
+    """Let every segmentor reuse ``image`` instead of decoding ``image_path`` again.
+
+    Segmentors read images through :func:`load_image` (or
+    :func:`get_shared_image`), so running the foreground and people models
+    inside this block decodes the file once.
+    """
+    with _shared_images_lock:
+        entry = _shared_images.setdefault(image_path, [image, 0])
+        entry[1] += 1
+    try:
+        yield
+    finally:
+        with _shared_images_lock:
+            entry[1] -= 1
+            if entry[1] == 0:
+                _shared_images.pop(image_path, None)
+
+
+def get_shared_image(image_path: str) -> Optional[Image.Image]:
+    """The image registered for ``image_path`` by :func:`shared_image`, if any."""
+    entry = _shared_images.get(image_path)
+    return entry[0] if entry else None
+
+
+def load_image(image_path: str) -> Image.Image:
+    """The shared decoded image for ``image_path``, or a fresh decode."""
+    return get_shared_image(image_path) or decode_image(image_path)
+
+
+def create_inference_stream(device) -> Optional["torch.cuda.Stream"]:
+    """A dedicated CUDA stream for one model, or None when not running on CUDA."""
+    if str(device) != "cuda":
+        return None
+    try:
+        return torch.cuda.Stream()
+    except Exception as e:
+        logger.warning("CUDA stream unavailable, using the default stream", error=str(e))
+        return None
+
+
+def run_on_stream(stream: Optional["torch.cuda.Stream"], func: Callable, *args):
+    """Run ``func(*args)`` on ``stream`` and wait for it to finish.
+
+    Separate streams let the foreground and people models overlap on the GPU.
+    Work queued on the default stream (e.g. input copies) is waited for first.
+    """
+    if stream is None:
+        return func(*args)
+    stream.wait_stream(torch.cuda.current_stream())
+    with torch.cuda.stream(stream):
+        result = func(*args)
+    stream.synchronize()
+    return result
+
+
+def prepare_image(image_path: str, transform: transforms.Compose, device: torch.device):
+    """Prepare image for inference."""
+    image = load_image(image_path)
 
     # Transform image
     input_tensor = transform(image).unsqueeze(0).to(device, non_blocking=True)
@@ -64,3 +135,53 @@ def normalize_and_resize_mask(preds: torch.Tensor, original_size: tuple) -> np.n
     except Exception as e:
         logger.error(f"Error processing model output: {e}")
         raise
+
+
+async def prepare_images(
+    image_paths: List[str], transform: transforms.Compose, device: torch.device
+) -> Tuple[List[Optional[Image.Image]], Optional[torch.Tensor]]:
+    """Decode and transform images in the default thread pool and stack them.
+
+    The transform must produce tensors of one size (e.g. a fixed ``Resize``).
+    Images that fail to load are logged and returned as None; the stacked
+    batch holds only the loaded images, in input order.
+    """
+    loop = asyncio.get_running_loop()
+    prepared = await asyncio.gather(
+        *(loop.run_in_executor(None, prepare_image, path, transform, "cpu") for path in image_paths),
+        return_exceptions=True,
+    )
+
+    images: List[Optional[Image.Image]] = []
+    tensors = []
+    for path, item in zip(image_paths, prepared):
+        if isinstance(item, BaseException):
+            logger.error("Failed to prepare image", path=path, error=str(item))
+            images.append(None)
+            continue
+        images.append(item[0])
+        tensors.append(item[1])
+
+    if not tensors:
+        return images, None
+    return images, torch.cat(tensors).to(device, non_blocking=True)
+
+
+async def masks_from_batch(
+    preds: torch.Tensor, images: List[Optional[Image.Image]]
+) -> List[Optional[np.ndarray]]:
+    """Turn batched predictions back into one mask per image, in the default thread pool.
+
+    ``preds`` holds one prediction per loaded (non-None) entry of ``images``.
+    """
+    loop = asyncio.get_running_loop()
+    loaded = [index for index, image in enumerate(images) if image is not None]
+    masks = await asyncio.gather(*(
+        loop.run_in_executor(None, normalize_and_resize_mask, preds[row:row + 1], images[index].size)
+        for row, index in enumerate(loaded)
+    ))
+
+    results: List[Optional[np.ndarray]] = [None] * len(images)
+    for index, mask in zip(loaded, masks):
+        results[index] = mask
+    return results
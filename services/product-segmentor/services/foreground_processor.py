@@ -13,6 +13,8 @@ to other modules.
 import time
 from typing import Optional
 
+import numpy as np
+
 from common_py.logging_config import configure_logging
 from segmentation.interface import SegmentationInterface
 from utils.file_manager import FileManager
@@ -36,29 +38,15 @@ class ForegroundProcessor:
         """
         self.segmentor = segmentor
 
-    async def process_image(
-        self,
-        image_id: str,
-        local_path: str,
-        image_type: str,
-        file_manager: FileManager
-    ) -> Optional[str]:
-        """Process a single image to generate mask.
-
-        This method handles the complete image segmentation pipeline:
-        1. Applies segmentation model to extract product region
-        2. Measures and logs segmentation performance
-        3. Saves generated mask to filesystem via FileManager
-        4. Handles errors gracefully
+    async def generate_mask(self, image_id: str, local_path: str) -> Optional[np.ndarray]:
+        """Segment a single image and return its foreground mask without saving it.
 
         Args:
             image_id: Unique identifier for the image
             local_path: Path to the source image file
-            image_type: Type of image ("product" or "frame")
-            file_manager: FileManager instance for mask storage
 
         Returns:
-            Path to generated mask file or None if processing failed
+            Foreground mask as numpy array or None if segmentation failed
         """
         try:
             # Start timing for segmentation
@@ -80,7 +68,46 @@ class ForegroundProcessor:
                 segmentation_time_seconds=f"{segmentation_time:.2f}",
                 local_path=local_path,
             )
+            return mask
 
+        except Exception as e:
+            # Re-raise CUDA OOM errors so retry logic can handle them
+            error_str = str(e).lower()
+            if any(indicator in error_str for indicator in ["cuda out of memory", "cudnn error", "out of memory"]):
+                logger.error("CUDA OOM error during image processing", image_id=image_id, error=str(e))
+                raise  # Re-raise to allow retry logic to handle
+
+            logger.error("Error processing image", image_id=image_id, error=str(e))
+            return None
+
+    async def process_image(
+        self,
+        image_id: str,
+        local_path: str,
+        image_type: str,
+        file_manager: FileManager
+    ) -> Optional[str]:
+        """Process a single image to generate mask.
+
+        This method handles the complete image segmentation pipeline:
+        1. Generates the mask via generate_mask()
+        2. Saves generated mask to filesystem via FileManager
+        3. Handles errors gracefully
+
+        Args:
+            image_id: Unique identifier for the image
+            local_path: Path to the source image file
+            image_type: Type of image ("product" or "frame")
+            file_manager: FileManager instance for mask storage
+
+        Returns:
+            Path to generated mask file or None if processing failed
+        """
+        mask = await self.generate_mask(image_id, local_path)
+        if mask is None:
+            return None
+
+        try:
             # Save mask to filesystem
             if image_type == "product":
                 mask_path = await file_manager.save_product_mask(image_id, mask)
@@ -90,11 +117,5 @@ class ForegroundProcessor:
             return mask_path
 
         except Exception as e:
-            # Re-raise CUDA OOM errors so retry logic can handle them
-            error_str = str(e).lower()
-            if any(indicator in error_str for indicator in ["cuda out of memory", "cudnn error", "out of memory"]):
-                logger.error("CUDA OOM error during image processing", image_id=image_id, error=str(e))
-                raise  # Re-raise to allow retry logic to handle
-            
-            logger.error("Error processing image", image_id=image_id, error=str(e))
+            logger.error("Error saving mask", image_id=image_id, error=str(e))
             return None
@@ -1,22 +1,48 @@
+import asyncio
+from contextlib import nullcontext
+
 import numpy as np
 import cv2
 from typing import Optional
 from common_py.logging_config import configure_logging
+from config_loader import config
+from segmentation.segmentation_utils import decode_image, shared_image
+from utils.file_manager import normalize_mask
+from utils.mask_writer import BackgroundMaskWriter
 
 logger = configure_logging("product-segmentor:image_masking_processor")
 
+# Product images arrive as "image" from AssetProcessor and as "product" from direct callers
+PRODUCT_IMAGE_TYPES = ("product", "image")
+
 
 class ImageMaskingProcessor:
     """
     Handles the core logic for image masking, including foreground and people segmentation
     and combining masks.
+
+    Each image is decoded once and shared by both models, which run
+    concurrently. Foreground and people masks are handed between stages as
+    arrays; only the final product mask is written before the result is
+    returned. With ``save_debug_masks`` the intermediate masks are also
+    written, in the background, to their usual directories.
+
+    When a ``people_detector`` is given, product images first get a cheap
+    low-resolution person-presence check, and people segmentation is skipped
+    when it finds nobody.
     """
 
-    def __init__(self, foreground_segmentor, people_segmentor, file_manager, image_processor):
+    def __init__(self, foreground_segmentor, people_segmentor, file_manager, image_processor,
+                 save_debug_masks: Optional[bool] = None, mask_writer: Optional[BackgroundMaskWriter] = None,
+                 people_detector=None, people_check_imgsz: Optional[int] = None):
         self.foreground_segmentor = foreground_segmentor
         self.people_segmentor = people_segmentor
         self.file_manager = file_manager
         self.image_processor = image_processor  # This is the ForegroundProcessor from service.py
+        self.save_debug_masks = config.SAVE_DEBUG_MASKS if save_debug_masks is None else save_debug_masks
+        self.mask_writer = mask_writer or BackgroundMaskWriter()
+        self.people_detector = people_detector
+        self.people_check_imgsz = people_check_imgsz or config.PEOPLE_PRESENCE_IMGSZ
 
     async def process_single_image(self, image_id: str, local_path: str, image_type: str, job_id: str = "unknown") -> Optional[str]:
         """Process a single image to generate mask.
@@ -31,12 +57,15 @@ class ImageMaskingProcessor:
             Path to generated mask or None if processing failed
         """
         try:
-            foreground_mask = await self._generate_and_load_foreground_mask(image_id, local_path, image_type, job_id)
+            image = await self._decode_image(local_path)
+            with shared_image(local_path, image) if image is not None else nullcontext():
+                foreground_mask, people_mask = await asyncio.gather(
+                    self._generate_foreground_mask(image_id, local_path, image_type, job_id),
+                    self._generate_people_mask(image_id, local_path, image_type, job_id),
+                )
             if foreground_mask is None:
                 return None
 
-            people_mask = await self._generate_and_save_people_mask(image_id, local_path, image_type, job_id)
-
             final_mask = await self._subtract_people_mask(foreground_mask, people_mask, image_id, job_id)
 
             mask_path = await self._save_final_product_mask(image_id, final_mask, image_type, job_id)
@@ -52,16 +81,20 @@ class ImageMaskingProcessor:
                          error_type=type(e).__name__)
             return None
 
-    async def _generate_and_load_foreground_mask(
+    async def _decode_image(self, local_path: str):
+        """Decode the source image once for both segmentors; None leaves decoding to them."""
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, decode_image, local_path)
+        except Exception as e:
+            logger.debug("Shared decode failed, segmentors will load the image", local_path=local_path, error=str(e))
+            return None
+
+    async def _generate_foreground_mask(
         self, image_id: str, local_path: str, image_type: str, job_id: str
     ) -> Optional[np.ndarray]:
         try:
-            foreground_mask_path = await self.image_processor.process_image(
-                image_id=image_id,
-                local_path=local_path,
-                image_type=image_type,
-                file_manager=self.file_manager,
-            )
+            foreground_mask = await self.image_processor.generate_mask(image_id=image_id, local_path=local_path)
         except Exception as e:
             # Re-raise CUDA OOM errors for retry logic
             error_str = str(e).lower()
@@ -71,7 +104,7 @@ class ImageMaskingProcessor:
             logger.error("Error generating foreground mask", job_id=job_id, asset_id=image_id, error=str(e))
             return None
 
-        if foreground_mask_path is None:
+        if foreground_mask is None:
             logger.warning("Item processing failed",
                            job_id=job_id,
                            asset_id=image_id,
@@ -79,34 +112,27 @@ class ImageMaskingProcessor:
                            error="Failed to generate foreground mask")
             return None
 
-        foreground_mask = cv2.imread(foreground_mask_path, cv2.IMREAD_GRAYSCALE)
-        if foreground_mask is None:
-            logger.error("Resource not found",
-                         job_id=job_id,
-                         asset_id=image_id,
-                         asset_type="image",
-                         resource_type="foreground_mask",
-                         mask_path=foreground_mask_path)
-            return None
+        if self.save_debug_masks:
+            save = self.file_manager.save_product_mask if image_type == "product" else self.file_manager.save_frame_mask
+            self.mask_writer.submit(save, image_id, foreground_mask)
 
-        if foreground_mask.ndim == 3 and foreground_mask.shape[2] == 1:
-            foreground_mask = foreground_mask.squeeze(axis=2)
+        # Same 2D 0/255 mask that a save-and-reload through the file manager produces
+        return normalize_mask(foreground_mask)
 
-        logger.info("Loading foreground mask from: {foreground_mask_path}", mask_path=foreground_mask_path)
-        return foreground_mask
-
-    async def _generate_and_save_people_mask(self, image_id: str, local_path: str, image_type: str, job_id: str) -> Optional[np.ndarray]:
+    async def _generate_people_mask(self, image_id: str, local_path: str, image_type: str, job_id: str) -> Optional[np.ndarray]:
         try:
+            if self.people_detector is not None and image_type in PRODUCT_IMAGE_TYPES:
+                if not await self.people_detector.detect_people(local_path, self.people_check_imgsz):
+                    logger.debug("No people found by presence check, skipping people segmentation",
+                                 job_id=job_id, asset_id=image_id)
+                    return None
+
             logger.debug("Attempting to segment people mask", local_path=local_path)
             people_mask = await self.people_segmentor.segment_image(local_path)
             if people_mask is not None:
                 logger.debug("People mask segmented successfully", people_mask_shape=people_mask.shape)
-                try:
-                    await self.file_manager.save_people_mask(image_id, people_mask, image_type)
-                    logger.debug("People mask saved successfully", image_id=image_id, image_type=image_type)
-                except Exception as save_e:
-                    logger.error("Error saving people mask", error=str(save_e), error_type=type(save_e).__name__, image_id=image_id)
-                    return None
+                if self.save_debug_masks:
+                    self.mask_writer.submit(self.file_manager.save_people_mask, image_id, people_mask, image_type)
             else:
                 logger.debug("No people mask generated by segmentor")
             return people_mask
@@ -125,7 +151,7 @@ class ImageMaskingProcessor:
             logger.info("People mask shape: {people_mask_shape}", people_mask_shape=people_mask.shape)
 
             # Ensure both masks have the same dimensionality
-            # Foreground mask is already squeezed to 2D in _generate_and_load_foreground_mask
+            # Foreground mask is already squeezed to 2D in _generate_foreground_mask
             # People mask might be 3D with shape (H, W, 1), so we need to squeeze it too
             if people_mask.ndim == 3 and people_mask.shape[2] == 1:
                 people_mask = people_mask.squeeze(axis=2)
@@ -22,6 +22,7 @@ from .foreground_processor import ForegroundProcessor
 from .image_masking_processor import ImageMaskingProcessor
 from utils.db_updater import DatabaseUpdater
 from .foreground_segmentor_factory import create_segmentor
+from segmentation.batching_segmentor import BatchingSegmentor
 from segmentation.models.yolo_segmentor import YOLOSegmentor
 from .asset_processor import AssetProcessor
 from vision_common import JobProgressManager
@@ -76,11 +77,23 @@ class ProductSegmentorService:
         self.foreground_segmentor = create_segmentor(foreground_model_name, config.HF_TOKEN)
         self.people_segmentor = YOLOSegmentor(config.PEOPLE_SEG_MODEL_NAME)
 
+        # Coalesce concurrent requests into batched forward passes
+        self.foreground_batcher = BatchingSegmentor(
+            self.foreground_segmentor,
+            max_batch_size=config.SEGMENTATION_BATCH_SIZE,
+            max_wait_ms=config.SEGMENTATION_BATCH_WAIT_MS,
+        )
+        self.people_batcher = BatchingSegmentor(
+            self.people_segmentor,
+            max_batch_size=config.SEGMENTATION_BATCH_SIZE,
+            max_wait_ms=config.SEGMENTATION_BATCH_WAIT_MS,
+        )
+
         # Initialize event emitter
         self.event_emitter = EventEmitter(broker)
 
         # Initialize processing helpers
-        self.image_processor = ForegroundProcessor(self.foreground_segmentor)
+        self.image_processor = ForegroundProcessor(self.foreground_batcher)
         self.db_updater = DatabaseUpdater(self.db)
 
         # Initialize new modules
@@ -89,9 +102,10 @@ class ProductSegmentorService:
 
         self.image_masking_processor = ImageMaskingProcessor(
             self.foreground_segmentor,
-            self.people_segmentor,
+            self.people_batcher,
             self.file_manager,
-            self.image_processor
+            self.image_processor,
+            people_detector=self.people_segmentor if config.PEOPLE_PRESENCE_CHECK else None,
         )
 
         self._processing_semaphore = asyncio.Semaphore(int(max_concurrent))
@@ -162,6 +176,10 @@ class ProductSegmentorService:
             except asyncio.TimeoutError:
                 logger.warning("Timeout waiting for processing to complete")
 
+            await self.foreground_batcher.close()
+            await self.people_batcher.close()
+            await self.image_masking_processor.mask_writer.close()
+
             # Cleanup segmentation model (ensure foreground only once)
             if self.foreground_segmentor and not cleanup_called:
                 self.foreground_segmentor.cleanup()
@@ -359,30 +377,35 @@ class ProductSegmentorService:
         # Log GPU memory at batch start
         self.gpu_memory_monitor.log_memory_stats(f"video_batch_start_{video_id}")
 
-        processed_frames = []
+        # Frames run concurrently (up to max_concurrent) so the segmentors can batch them
+        frame_semaphore = asyncio.Semaphore(int(self.max_concurrent))
 
-        for frame in frames:
-            frame_id = frame["frame_id"]
-            ts = frame["ts"]
-
-            mask_path = await self.asset_processor.handle_single_asset_processing(
-                event_data=frame,
-                asset_type="video",
-                asset_id_key="frame_id",
-                db_update_func=self.db_updater.update_video_frame_mask,
-                emit_masked_func=None,  # Individual frame masked event handled by batch emitter
-                job_id=job_id,  # Pass job_id explicitly for frames
-            )
-
-            if mask_path:
-                processed_frames.append({
-                    "frame_id": frame_id,
-                    "ts": ts,
-                    "mask_path": mask_path
-                })
+        async def process_frame(frame: dict):
+            async with frame_semaphore:
+                mask_path = await self.asset_processor.handle_single_asset_processing(
+                    event_data=frame,
+                    asset_type="video",
+                    asset_id_key="frame_id",
+                    db_update_func=self.db_updater.update_video_frame_mask,
+                    emit_masked_func=None,  # Individual frame masked event handled by batch emitter
+                    job_id=job_id,  # Pass job_id explicitly for frames
+                )
 
-            # Periodic GPU cleanup during video processing
-            self.gpu_memory_monitor.periodic_cleanup()
+                # Periodic GPU cleanup during video processing
+                self.gpu_memory_monitor.periodic_cleanup()
+                return mask_path
+
+        mask_paths = await asyncio.gather(*(process_frame(frame) for frame in frames))
+
+        processed_frames = [
+            {
+                "frame_id": frame["frame_id"],
+                "ts": frame["ts"],
+                "mask_path": mask_path
+            }
+            for frame, mask_path in zip(frames, mask_paths)
+            if mask_path
+        ]
 
         if processed_frames:
             await self.event_emitter.emit_video_keyframes_masked(
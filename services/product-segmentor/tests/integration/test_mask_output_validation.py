@@ -156,6 +156,9 @@ class TestMaskOutputValidation:
                     self.segmentor = segmentor
                     self.file_manager = file_manager
                 
+                async def generate_mask(self, image_id, local_path):
+                    return await self.segmentor.segment_image(local_path)
+
                 async def process_image(self, image_id, local_path, image_type, file_manager):
                     mask = await self.segmentor.segment_image(local_path)
                     if mask is None:
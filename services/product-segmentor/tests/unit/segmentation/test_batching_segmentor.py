@@ -0,0 +1,118 @@
+"""Tests for request coalescing in BatchingSegmentor."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from segmentation.batching_segmentor import BatchingSegmentor
+from segmentation.interface import SegmentationInterface
+
+pytestmark = pytest.mark.unit
+
+
+class RecordingSegmentor(SegmentationInterface):
+    """Returns a mask filled with the image index and records each call."""
+
+    def __init__(self):
+        self.single_calls = []
+        self.batch_calls = []
+
+    async def segment_image(self, image_path: str) -> np.ndarray:
+        self.single_calls.append(image_path)
+        await asyncio.sleep(0.01)
+        return self._mask(image_path)
+
+    async def segment_batch(self, image_paths):
+        self.batch_calls.append(list(image_paths))
+        await asyncio.sleep(0.01)
+        return [self._mask(path) for path in image_paths]
+
+    @staticmethod
+    def _mask(image_path: str) -> np.ndarray:
+        return np.full((4, 4), int(image_path.rsplit("_", 1)[-1].split(".")[0]), dtype=np.uint8)
+
+
+@pytest.fixture
+def image_paths(tmp_path):
+    paths = []
+    for index in range(6):
+        path = tmp_path / f"image_{index}.jpg"
+        path.write_bytes(b"")
+        paths.append(str(path))
+    return paths
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_batches(image_paths):
+    segmentor = RecordingSegmentor()
+    batcher = BatchingSegmentor(segmentor, max_batch_size=4, max_wait_ms=50)
+
+    masks = await asyncio.gather(*(batcher.segment_image(path) for path in image_paths))
+    await batcher.close()
+
+    assert [int(mask[0, 0]) for mask in masks] == list(range(6))
+    assert [len(batch) for batch in segmentor.batch_calls] == [4, 2]
+    assert segmentor.single_calls == []
+
+
+@pytest.mark.asyncio
+async def test_lone_request_uses_segment_image(image_paths):
+    segmentor = RecordingSegmentor()
+    batcher = BatchingSegmentor(segmentor, max_batch_size=4, max_wait_ms=1)
+
+    mask = await batcher.segment_image(image_paths[3])
+    await batcher.close()
+
+    assert int(mask[0, 0]) == 3
+    assert segmentor.single_calls == [image_paths[3]]
+    assert segmentor.batch_calls == []
+
+
+@pytest.mark.asyncio
+async def test_missing_file_fails_before_queueing(tmp_path):
+    segmentor = RecordingSegmentor()
+    batcher = BatchingSegmentor(segmentor, max_batch_size=4)
+
+    with pytest.raises(FileNotFoundError):
+        await batcher.segment_image(str(tmp_path / "missing.jpg"))
+
+    assert segmentor.single_calls == segmentor.batch_calls == []
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_is_raised_to_every_caller(image_paths):
+    segmentor = RecordingSegmentor()
+
+    async def failing_batch(paths):
+        raise RuntimeError("forward pass failed")
+
+    segmentor.segment_batch = failing_batch
+    batcher = BatchingSegmentor(segmentor, max_batch_size=4, max_wait_ms=50)
+
+    results = await asyncio.gather(
+        *(batcher.segment_image(path) for path in image_paths[:3]), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    # The worker survives a failed batch
+    segmentor.segment_batch = RecordingSegmentor.segment_batch.__get__(segmentor)
+    mask = await batcher.segment_image(image_paths[5])
+    await batcher.close()
+    assert int(mask[0, 0]) == 5
+
+
+@pytest.mark.asyncio
+async def test_default_segment_batch_falls_back_to_single_images(image_paths):
+    class SingleImageSegmentor(SegmentationInterface):
+        async def segment_image(self, image_path):
+            if image_path.endswith("_1.jpg"):
+                raise FileNotFoundError(image_path)
+            return RecordingSegmentor._mask(image_path)
+
+    masks = await SingleImageSegmentor().segment_batch(image_paths[:3])
+
+    assert int(masks[0][0, 0]) == 0
+    assert masks[1] is None
+    assert int(masks[2][0, 0]) == 2
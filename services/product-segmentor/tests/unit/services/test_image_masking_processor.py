@@ -0,0 +1,171 @@
+"""Tests for the in-memory mask pipeline of ImageMaskingProcessor."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from segmentation.segmentation_utils import get_shared_image
+from services.image_masking_processor import ImageMaskingProcessor
+from utils.mask_writer import BackgroundMaskWriter
+
+pytestmark = pytest.mark.unit
+
+
+def _foreground_mask() -> np.ndarray:
+    # Soft model output: only values >= 128 count as foreground
+    mask = np.zeros((4, 4), dtype=np.uint8)
+    mask[:, 2:] = 200
+    mask[0, 0] = 100
+    return mask
+
+
+def _people_mask() -> np.ndarray:
+    mask = np.zeros((4, 4, 1), dtype=np.uint8)
+    mask[0, 3] = 255
+    return mask
+
+
+@pytest.fixture
+def file_manager():
+    manager = Mock()
+    manager.save_product_mask = AsyncMock(return_value="/masks_foreground/img.png")
+    manager.save_frame_mask = AsyncMock(return_value="/masks_foreground/frame.png")
+    manager.save_people_mask = AsyncMock(return_value="/masks_people/img.png")
+    manager.save_product_final_mask = AsyncMock(return_value="/masks_product/img.png")
+    return manager
+
+
+def _processor(file_manager, save_debug_masks: bool = False, people_detector=None) -> ImageMaskingProcessor:
+    image_processor = Mock()
+    image_processor.generate_mask = AsyncMock(return_value=_foreground_mask())
+    people_segmentor = Mock()
+    people_segmentor.segment_image = AsyncMock(return_value=_people_mask())
+    return ImageMaskingProcessor(
+        foreground_segmentor=Mock(),
+        people_segmentor=people_segmentor,
+        file_manager=file_manager,
+        image_processor=image_processor,
+        save_debug_masks=save_debug_masks,
+        people_detector=people_detector,
+        people_check_imgsz=320,
+    )
+
+
+@pytest.mark.asyncio
+async def test_only_final_mask_is_written(file_manager):
+    processor = _processor(file_manager, save_debug_masks=False)
+
+    mask_path = await processor.process_single_image("img", "/images/img.jpg", "product")
+
+    assert mask_path == "/masks_product/img.png"
+    file_manager.save_product_mask.assert_not_called()
+    file_manager.save_people_mask.assert_not_called()
+
+    final_mask = file_manager.save_product_final_mask.call_args[0][1]
+    expected = np.zeros((4, 4), dtype=np.uint8)
+    expected[:, 2:] = 255
+    expected[0, 3] = 0
+    np.testing.assert_array_equal(final_mask, expected)
+
+
+@pytest.mark.asyncio
+async def test_debug_masks_are_written_in_background(file_manager):
+    processor = _processor(file_manager, save_debug_masks=True)
+
+    await processor.process_single_image("frame", "/frames/frame.jpg", "frame")
+    await processor.mask_writer.close()
+
+    file_manager.save_frame_mask.assert_awaited_once()
+    assert file_manager.save_frame_mask.call_args[0][0] == "frame"
+    file_manager.save_people_mask.assert_awaited_once()
+    assert file_manager.save_people_mask.call_args[0][2] == "frame"
+    file_manager.save_product_final_mask.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_debug_mask_failure_does_not_fail_image(file_manager):
+    file_manager.save_product_mask.side_effect = OSError("disk full")
+    processor = _processor(file_manager, save_debug_masks=True)
+
+    mask_path = await processor.process_single_image("img", "/images/img.jpg", "product")
+    await processor.mask_writer.close()
+
+    assert mask_path == "/masks_product/img.png"
+
+
+@pytest.mark.asyncio
+async def test_models_run_concurrently_on_one_decode(file_manager, tmp_path):
+    image_path = str(tmp_path / "img.png")
+    Image.new("RGB", (4, 4), color="red").save(image_path)
+    processor = _processor(file_manager)
+    people_started = asyncio.Event()
+    shared = []
+
+    async def foreground(image_id, local_path):
+        shared.append(get_shared_image(local_path))
+        # Only finishes if the people model is already running alongside
+        await asyncio.wait_for(people_started.wait(), timeout=1)
+        return _foreground_mask()
+
+    async def people(local_path):
+        shared.append(get_shared_image(local_path))
+        people_started.set()
+        return _people_mask()
+
+    processor.image_processor.generate_mask.side_effect = foreground
+    processor.people_segmentor.segment_image.side_effect = people
+
+    assert await processor.process_single_image("img", image_path, "product") == "/masks_product/img.png"
+    assert shared[0] is not None and shared[0] is shared[1]
+    assert shared[0].size == (4, 4)
+    assert get_shared_image(image_path) is None
+
+
+@pytest.mark.asyncio
+async def test_presence_check_skips_people_segmentation_for_products(file_manager):
+    detector = Mock(detect_people=AsyncMock(return_value=False))
+    processor = _processor(file_manager, people_detector=detector)
+
+    await processor.process_single_image("img", "/images/img.jpg", "image")
+
+    detector.detect_people.assert_awaited_once_with("/images/img.jpg", 320)
+    processor.people_segmentor.segment_image.assert_not_called()
+    final_mask = file_manager.save_product_final_mask.call_args[0][1]
+    assert final_mask[0, 3] == 255
+
+
+@pytest.mark.asyncio
+async def test_presence_check_runs_segmentation_when_people_found(file_manager):
+    detector = Mock(detect_people=AsyncMock(return_value=True))
+    processor = _processor(file_manager, people_detector=detector)
+
+    await processor.process_single_image("img", "/images/img.jpg", "product")
+
+    processor.people_segmentor.segment_image.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_presence_check_does_not_apply_to_video_frames(file_manager):
+    detector = Mock(detect_people=AsyncMock(return_value=False))
+    processor = _processor(file_manager, people_detector=detector)
+
+    await processor.process_single_image("frame", "/frames/frame.jpg", "video")
+
+    detector.detect_people.assert_not_called()
+    processor.people_segmentor.segment_image.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_mask_writer_drops_masks_when_full():
+    save = AsyncMock()
+    writer = BackgroundMaskWriter(max_pending=1)
+
+    assert writer.submit(save, "a", np.zeros((2, 2), dtype=np.uint8))
+    assert not writer.submit(save, "b", np.zeros((2, 2), dtype=np.uint8))
+    await writer.close()
+
+    save.assert_awaited_once()
+    assert save.call_args[0][0] == "a"
@@ -13,6 +13,29 @@ from common_py.logging_config import configure_logging
 logger = configure_logging("product-segmentor:file_manager")
 
 
+def normalize_mask(mask: np.ndarray) -> np.ndarray:
+    """Return ``mask`` as a 2D uint8 array holding only 0 and 255.
+
+    This is exactly what a mask looks like after a PNG round trip through
+    :class:`FileManager`, so in-memory masks can be combined without saving
+    and reloading them first.
+    """
+    # Ensure values are clipped to 0-255 range first
+    mask = np.clip(mask, 0, 255)
+
+    # Ensure mask is in correct format (0-255 uint8)
+    if mask.dtype != np.uint8:
+        mask = mask.astype(np.uint8)
+
+    # Ensure values are 0 or 255 (values >= 128 become 255)
+    mask = np.where(mask >= 128, 255, 0).astype(np.uint8)
+
+    # Squeeze the mask to remove single-dimensional entries (e.g., (H, W, 1) -> (H, W))
+    if mask.ndim == 3 and mask.shape[2] == 1:
+        mask = mask.squeeze(axis=2)
+    return mask
+
+
 class FileManager:
     """Manages file operations for mask storage."""
 
@@ -173,20 +196,7 @@ class FileManager:
         mask_image.save(file_path, 'PNG', optimize=True)
 
     def _normalize_and_prepare_mask_for_save(self, mask: np.ndarray) -> np.ndarray:
-        # Ensure values are clipped to 0-255 range first
-        mask = np.clip(mask, 0, 255)
-
-        # Ensure mask is in correct format (0-255 uint8)
-        if mask.dtype != np.uint8:
-            mask = mask.astype(np.uint8)
-
-        # Ensure values are 0 or 255 (values >= 128 become 255)
-        mask = np.where(mask >= 128, 255, 0).astype(np.uint8)
-
-        # Squeeze the mask to remove single-dimensional entries (e.g., (H, W, 1) -> (H, W))
-        if mask.ndim == 3 and mask.shape[2] == 1:
-            mask = mask.squeeze(axis=2)
-        return mask
+        return normalize_mask(mask)
 
     async def mask_exists(self, mask_path: str) -> bool:
         """Check if mask file exists.
@@ -0,0 +1,66 @@
+"""Background writer for masks that nothing downstream waits on."""
+
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+import numpy as np
+from common_py.logging_config import configure_logging
+
+logger = configure_logging("product-segmentor:mask_writer")
+
+SaveFunc = Callable[..., Awaitable[str]]
+
+
+class BackgroundMaskWriter:
+    """Saves masks from a single background task so callers never wait on PNG encoding.
+
+    Used for the foreground and people debug masks. The queue is bounded; when
+    it is full, further masks are dropped with a warning rather than holding
+    more arrays in memory.
+    """
+
+    def __init__(self, max_pending: int = 64):
+        self.max_pending = max(1, max_pending)
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def submit(self, save: SaveFunc, image_id: str, mask: np.ndarray, *args) -> bool:
+        """Queue ``save(image_id, mask, *args)``; returns False if the mask was dropped."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        try:
+            self._queue.put_nowait((save, image_id, mask, args))
+        except asyncio.QueueFull:
+            logger.warning("Mask writer queue full, dropping mask", image_id=image_id)
+            return False
+        return True
+
+    async def flush(self) -> None:
+        """Wait until every queued mask has been written."""
+        if self._queue is not None and self._worker is not None and not self._worker.done():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Write the remaining masks, then stop the worker."""
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self) -> None:
+        while True:
+            save, image_id, mask, args = await self._queue.get()
+            try:
+                await save(image_id, mask, *args)
+            except Exception as e:
+                logger.error("Failed to write mask", image_id=image_id, error=str(e),
+                             error_type=type(e).__name__)
+            finally:
+                self._queue.task_done()
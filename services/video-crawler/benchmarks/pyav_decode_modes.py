@@ -0,0 +1,80 @@
+"""Benchmark PyAV keyframe extraction in single-pass and per-timestamp modes.
+
+Run from the service directory::
+
+    python benchmarks/pyav_decode_modes.py path/to/clip_av1.mp4 path/to/clip_h264.mp4
+
+Without clip arguments a synthetic clip is written to a temporary directory.
+Each clip is extracted ``--repeats`` times per mode and the best wall time is
+reported, covering decoding, blur scoring and JPEG writes, i.e. the work done
+per video by ``PyAVKeyframeExtractor``.
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import List
+
+import cv2
+import numpy as np
+
+SERVICE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SERVICE_DIR))
+
+MODES = ("per_timestamp", "single_pass")
+
+
+def _write_clip(directory: Path, seconds: int, fps: int = 30) -> str:
+    path = directory / "synthetic.mp4"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), fps, (640, 360))
+    for index in range(seconds * fps):
+        frame = np.zeros((360, 640, 3), dtype=np.uint8)
+        cv2.rectangle(frame, (40, 40), (600, 320), (50 + index % 200, 100, 200), 3)
+        cv2.putText(frame, f"F{index}", (80, 200), cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3)
+        writer.write(frame)
+    writer.release()
+    return str(path)
+
+
+async def _time_mode(mode: str, clip: str, output_dir: Path, repeats: int) -> float:
+    from config_loader import config
+    from keyframe_extractor.pyav_extractor import PyAVKeyframeExtractor
+
+    settings = replace(config.PYAV_SETTINGS, decode_mode=mode, min_blur_threshold=0.0)
+    extractor = PyAVKeyframeExtractor(keyframe_root_dir=str(output_dir / mode), settings=settings)
+
+    best = float("inf")
+    for attempt in range(repeats):
+        video_id = f"{Path(clip).stem}-{attempt}"
+        start = time.perf_counter()
+        await extractor.extract_keyframes("", video_id, clip)
+        best = min(best, time.perf_counter() - start)
+        extractor.cleanup_extracted_frames(video_id)
+    return best
+
+
+async def _run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        clips: List[str] = args.clips or [_write_clip(Path(tmp), args.seconds)]
+
+        print(f"{'clip':<40} {'mode':>14} {'seconds':>10}")
+        for clip in clips:
+            for mode in MODES:
+                elapsed = await _time_mode(mode, clip, Path(tmp), args.repeats)
+                print(f"{Path(clip).name:<40} {mode:>14} {elapsed:>10.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("clips", nargs="*", help="Video files to benchmark")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seconds", type=int, default=60, help="Length of the synthetic clip")
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -62,6 +62,9 @@ class PySceneDetectSettings:
     frame_format: str = "jpg"
     max_scenes: int = 50  # 0 => unlimited timestamps
     frame_skip: int = 1  # 0=every frame, 1=every 2nd, 2=every 3rd, 3=every 4th
+    single_pass: bool = True  # detect scenes and capture candidates in one decode
+    candidate_buffer_size: int = 16  # candidate frames held per scene in single-pass mode
+    candidate_max_side: int = 960  # longest side of buffered candidate frames
 
 
 @dataclass
@@ -76,6 +79,23 @@ class PyAVSettings:
     min_blur_threshold: float = float(os.getenv("PYAV_MIN_BLUR_THRESHOLD", "100.0"))
     boundary_guard_seconds: float = float(os.getenv("PYAV_BOUNDARY_GUARD_SECONDS", "0.25"))
     seek_tolerance_seconds: float = float(os.getenv("PYAV_SEEK_TOLERANCE_SECONDS", "1.0"))
+    # "single_pass" opens the container once and decodes forward through sorted
+    # timestamps; "per_timestamp" reopens and seeks for every timestamp.
+    decode_mode: str = os.getenv("PYAV_DECODE_MODE", "single_pass")
+    # GOP length assumed until two keyframes have been observed while decoding
+    default_gop_seconds: float = float(os.getenv("PYAV_DEFAULT_GOP_SECONDS", "2.0"))
+
+
+@dataclass
+class KeyframeDedupSettings:
+    """Near-duplicate suppression applied to every extractor's keyframes."""
+
+    enabled: bool = os.getenv("KEYFRAME_DEDUP_ENABLED", "true").lower() == "true"
+    # "dhash" (grayscale difference hash) or "histogram" (hue/saturation histogram)
+    method: str = os.getenv("KEYFRAME_DEDUP_METHOD", "dhash")
+    # Frames within these distances of an accepted frame are dropped
+    max_hamming_distance: int = int(os.getenv("KEYFRAME_DEDUP_MAX_HAMMING_DISTANCE", "5"))
+    max_histogram_distance: float = float(os.getenv("KEYFRAME_DEDUP_MAX_HISTOGRAM_DISTANCE", "0.1"))
 
 
 @dataclass
@@ -97,12 +117,26 @@ class VideoCrawlerConfig:
     VIDEO_DIR: str = os.path.join(global_config.DATA_ROOT_CONTAINER, os.getenv("VIDEO_REL_PATH", "videos"))
     KEYFRAME_DIR: str = os.path.join(global_config.DATA_ROOT_CONTAINER, os.getenv("KEYFRAME_REL_PATH", "keyframes"))
 
+    # Content-addressed keyframe cache: videos with identical bytes reuse the
+    # keyframes of the first copy instead of being decoded again
+    CONTENT_CACHE_ENABLED: bool = os.getenv("CONTENT_CACHE_ENABLED", "true").lower() == "true"
+    CONTENT_CACHE_DIR: str = os.path.join(global_config.DATA_ROOT_CONTAINER, os.getenv("CONTENT_CACHE_REL_PATH", "content_cache"))
+
     # Number of videos to search for per query
     NUM_VIDEOS: int = int(os.getenv("NUM_VIDEOS", "5"))
 
     # Number of concurrent video downloads (reduced to avoid 403 errors)
     NUM_PARALLEL_DOWNLOADS: int = int(os.getenv("NUM_PARALLEL_DOWNLOADS", "3"))  # Reduced from 5 to 3
 
+    # Staged video processing: videos admitted per job at once, then per-stage limits
+    VIDEO_PIPELINE_MAX_IN_FLIGHT: int = int(os.getenv("VIDEO_PIPELINE_MAX_IN_FLIGHT", "8"))
+    VIDEO_DOWNLOAD_CONCURRENCY: int = int(os.getenv("VIDEO_DOWNLOAD_CONCURRENCY", os.getenv("NUM_PARALLEL_DOWNLOADS", "3")))
+    VIDEO_DECODE_CONCURRENCY: int = int(os.getenv("VIDEO_DECODE_CONCURRENCY", "2"))
+    VIDEO_DB_WRITE_CONCURRENCY: int = int(os.getenv("VIDEO_DB_WRITE_CONCURRENCY", "4"))
+
+    # Run searches, downloads and processing as one streaming pipeline
+    VIDEO_STREAMING_PIPELINE: bool = os.getenv("VIDEO_STREAMING_PIPELINE", "false").lower() == "true"
+
     # Maximum number of concurrent platforms (-1 means no limit, default to len(platforms))
     MAX_CONCURRENT_PLATFORMS: int = int(os.getenv("MAX_CONCURRENT_PLATFORMS", "-1"))
 
@@ -116,6 +150,13 @@ class VideoCrawlerConfig:
     # Video cleanup configuration
     CLEANUP_OLD_VIDEOS: bool = os.getenv("CLEANUP_OLD_VIDEOS", "false").lower() == "true"
     VIDEO_RETENTION_DAYS: int = int(os.getenv("VIDEO_RETENTION_DAYS", "7"))
+    # Oldest videos are also removed while the video directory exceeds this size (0 disables)
+    VIDEO_STORAGE_BUDGET_GB: float = float(os.getenv("VIDEO_STORAGE_BUDGET_GB", "0"))
+    # Cleanup runs in the background on this interval instead of after every job
+    CLEANUP_INTERVAL_MINUTES: int = int(os.getenv("CLEANUP_INTERVAL_MINUTES", "60"))
+    # Persistent index of downloaded files, rebuilt from disk on this interval
+    FILE_INDEX_PATH: str = os.path.join(global_config.DATA_ROOT_CONTAINER, os.getenv("FILE_INDEX_REL_PATH", "video_file_index.sqlite3"))
+    FILE_INDEX_RESCAN_HOURS: int = int(os.getenv("FILE_INDEX_RESCAN_HOURS", "24"))
 
     # TikTok API configuration
     TIKTOK_CRAWL_HOST: str = os.getenv("TIKTOK_CRAWL_HOST", "host.docker.internal")
@@ -125,6 +166,15 @@ class VideoCrawlerConfig:
     TIKTOK_DOWNLOAD_STRATEGY: str = os.getenv("TIKTOK_DOWNLOAD_STRATEGY", "scrapling-api")
     TIKTOK_DOWNLOAD_TIMEOUT: int = int(os.getenv("TIKTOK_DOWNLOAD_TIMEOUT", "180"))
 
+    # Pooled HTTP client shared by each TikTok download strategy
+    TIKTOK_HTTP_MAX_CONNECTIONS: int = int(os.getenv("TIKTOK_HTTP_MAX_CONNECTIONS", "20"))
+    TIKTOK_HTTP_PER_HOST_LIMIT: int = int(os.getenv("TIKTOK_HTTP_PER_HOST_LIMIT", "4"))
+    TIKTOK_HTTP2: bool = os.getenv("TIKTOK_HTTP2", "true").lower() == "true"
+    # Range-resumes per download after a dropped transfer, and concurrent byte
+    # ranges per large file (1 disables parallel ranges)
+    TIKTOK_DOWNLOAD_RESUME_ATTEMPTS: int = int(os.getenv("TIKTOK_DOWNLOAD_RESUME_ATTEMPTS", "3"))
+    TIKTOK_DOWNLOAD_PARALLEL_RANGES: int = int(os.getenv("TIKTOK_DOWNLOAD_PARALLEL_RANGES", "1"))
+
     # TikTok storage paths
     TIKTOK_VIDEO_STORAGE_PATH: str = os.path.join(global_config.DATA_ROOT_CONTAINER, 'videos', 'tiktok')
     TIKTOK_KEYFRAME_STORAGE_PATH: str = os.path.join(global_config.DATA_ROOT_CONTAINER, 'keyframes', 'tiktok')
@@ -132,6 +182,7 @@ class VideoCrawlerConfig:
     # Scene detection tuning
     PYSCENEDETECT_SETTINGS: PySceneDetectSettings = field(default_factory=PySceneDetectSettings)
     PYAV_SETTINGS: PyAVSettings = field(default_factory=PyAVSettings)
+    KEYFRAME_DEDUP_SETTINGS: KeyframeDedupSettings = field(default_factory=KeyframeDedupSettings)
 
 
 # Create config instance
@@ -1,6 +1,7 @@
 import asyncio
 import time
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
+from platform_crawler.common.base_crawler import BaseVideoCrawler
 from platform_crawler.interface import PlatformCrawlerInterface
 from common_py.logging_config import configure_logging
 
@@ -143,3 +144,65 @@ class VideoFetcher:
         })
 
         return all_videos
+
+    async def stream_platform_videos(
+        self,
+        platform: str,
+        queries: List[str],
+        recency_days: int,
+        download_dir: str,
+        num_videos: int
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield search results for one platform page by page, before downloading
+
+        Crawlers without page-wise search are run once through
+        ``search_and_download_videos`` and their (already downloaded) videos
+        are yielded as a single page.
+
+        Args:
+            platform: Platform name
+            queries: List of search queries
+            recency_days: How many days back to search for videos
+            download_dir: Download directory for crawlers that download while searching
+            num_videos: Number of videos to search for per query
+
+        Yields:
+            Lists of video metadata dictionaries
+        """
+        crawler = self.platform_crawlers.get(platform)
+        if crawler is None:
+            logger.warning(f"Platform crawler not available for: {platform}")
+            return
+
+        if isinstance(crawler, BaseVideoCrawler):
+            async for page in crawler.iter_search_pages(queries, recency_days, num_videos):
+                yield page
+            return
+
+        videos = await crawler.search_and_download_videos(
+            queries=queries,
+            recency_days=recency_days,
+            download_dir=download_dir,
+            num_videos=num_videos
+        )
+        if videos:
+            yield videos
+
+    async def download_video(
+        self,
+        platform: str,
+        video: Dict[str, Any],
+        download_dir: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Download a single video yielded by ``stream_platform_videos``
+
+        Returns:
+            Video metadata with ``local_path``, or None if the download failed
+        """
+        crawler = self.platform_crawlers.get(platform)
+        if isinstance(crawler, BaseVideoCrawler):
+            return await crawler.download_single_video(video, download_dir)
+        # Other crawlers download while searching
+        return video if video.get("local_path") else None
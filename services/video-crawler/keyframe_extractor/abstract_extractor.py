@@ -7,8 +7,10 @@ including shared utilities, logging, and common validation logic.
 
 from __future__ import annotations
 
+import asyncio
 import shutil
 from abc import ABC, abstractmethod
+from dataclasses import replace
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Optional, Tuple
 
@@ -24,6 +26,7 @@ except ImportError:  # pragma: no cover
 
 from common_py.logging_config import configure_logging
 from config_loader import config
+from .frame_dedup import KeyframeDeduplicator, read_frame_for_dedup
 from .interface import KeyframeExtractorInterface
 
 logger = configure_logging("video-crawler:abstract_extractor")
@@ -53,6 +56,7 @@ class AbstractKeyframeExtractor(KeyframeExtractorInterface, ABC):
         if create_dirs:
             self.keyframe_root_dir.mkdir(parents=True, exist_ok=True)
         self.supported_formats = ['.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm']
+        self.dedup_settings = replace(config.KEYFRAME_DEDUP_SETTINGS)
 
     def calculate_blur_score_from_file(self, image_path: str) -> float:
         """
@@ -489,7 +493,8 @@ class AbstractKeyframeExtractor(KeyframeExtractorInterface, ABC):
         1. Validate inputs
         2. Create keyframe directory
         3. Delegate to subclass-specific extraction logic
-        4. Handle errors gracefully
+        4. Drop near-duplicate keyframes
+        5. Handle errors gracefully
 
         Subclasses should override _extract_frames_from_video() to implement
         their specific extraction strategy.
@@ -503,6 +508,7 @@ class AbstractKeyframeExtractor(KeyframeExtractorInterface, ABC):
 
         try:
             keyframes = await self._extract_frames_from_video(local_path, keyframe_dir, video_id)
+            keyframes = await asyncio.to_thread(self._suppress_near_duplicates, keyframes, video_id)
 
             logger.info("Keyframe extraction completed",
                         video_id=video_id,
@@ -541,6 +547,53 @@ class AbstractKeyframeExtractor(KeyframeExtractorInterface, ABC):
 
             return []
 
+    def _suppress_near_duplicates(
+        self,
+        keyframes: List[Tuple[float, str]],
+        video_id: str
+    ) -> List[Tuple[float, str]]:
+        """
+        Drop keyframes that look like an earlier kept keyframe of the same video.
+
+        Frames are compared in extraction order using the signature selected by
+        the dedup settings; suppressed frame files are deleted. Frames that
+        cannot be read back are kept.
+
+        Args:
+            keyframes: List of (timestamp, frame_path) tuples
+            video_id: Video identifier for logging
+
+        Returns:
+            The kept (timestamp, frame_path) tuples
+        """
+        if not self.dedup_settings.enabled or cv2 is None or len(keyframes) < 2:
+            return keyframes
+
+        deduplicator = KeyframeDeduplicator(self.dedup_settings)
+        kept: List[Tuple[float, str]] = []
+        for timestamp, frame_path in keyframes:
+            image = read_frame_for_dedup(frame_path)
+            if image is None or deduplicator.offer(image):
+                kept.append((timestamp, frame_path))
+                continue
+            try:
+                Path(frame_path).unlink()
+            except OSError as e:
+                logger.warning("Failed to remove duplicate keyframe",
+                               video_id=video_id,
+                               frame_path=frame_path,
+                               error=str(e))
+
+        suppressed = len(keyframes) - len(kept)
+        logger.info("Near-duplicate keyframes suppressed",
+                    video_id=video_id,
+                    method=self.dedup_settings.method,
+                    candidates=len(keyframes),
+                    kept=len(kept),
+                    suppressed=suppressed,
+                    suppression_rate=round(suppressed / len(keyframes), 3))
+        return kept
+
     @abstractmethod
     async def _extract_frames_from_video(
         self,
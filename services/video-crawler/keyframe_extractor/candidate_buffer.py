@@ -0,0 +1,75 @@
+"""Bounded candidate frame buffer used by the single-pass scene extractor."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Collection, List, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@dataclass
+class CandidateFrame:
+    """A downscaled frame kept as a keyframe candidate."""
+
+    frame_num: int
+    timestamp: float
+    image: np.ndarray
+    blur_score: float
+
+
+class CandidateBuffer:
+    """Evenly spaced sample of candidate frames for the scene being decoded.
+
+    Frames are sampled every ``stride`` offered frames. When the buffer fills,
+    every other candidate is dropped and the stride doubles, so at most
+    ``capacity`` frames are held while the samples still span the whole scene.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self.capacity = max(2, capacity)
+        self._candidates: List[CandidateFrame] = []
+        self._stride = 1
+        self._offered = 0
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    @property
+    def candidates(self) -> List[CandidateFrame]:
+        return list(self._candidates)
+
+    def should_sample(self) -> bool:
+        """Advance by one frame and report whether it should be added."""
+        sample = self._offered % self._stride == 0
+        self._offered += 1
+        return sample
+
+    def add(self, candidate: CandidateFrame) -> None:
+        self._candidates.append(candidate)
+        if len(self._candidates) >= self.capacity:
+            self._candidates = self._candidates[::2]
+            self._stride *= 2
+
+    def split_at(self, frame_num: int) -> List[CandidateFrame]:
+        """Remove and return candidates before ``frame_num`` and restart sampling."""
+        closed = [c for c in self._candidates if c.frame_num < frame_num]
+        self._candidates = [c for c in self._candidates if c.frame_num >= frame_num]
+        self._stride = 1
+        self._offered = 0
+        return closed
+
+    @staticmethod
+    def pick(
+        candidates: List[CandidateFrame],
+        target: float,
+        min_blur: float,
+        exclude: Collection[int] = (),
+    ) -> Optional[CandidateFrame]:
+        """Return the sharp-enough candidate closest to ``target``, if any."""
+        sharp = [
+            c for c in candidates
+            if c.blur_score >= min_blur and c.frame_num not in exclude
+        ]
+        return min(sharp, key=lambda c: abs(c.timestamp - target), default=None)
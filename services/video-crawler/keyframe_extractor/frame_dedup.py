@@ -0,0 +1,81 @@
+"""Near-duplicate keyframe suppression shared by the keyframe extractors."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional
+
+try:
+    import cv2
+except ImportError:  # pragma: no cover
+    cv2 = None
+
+if TYPE_CHECKING:
+    import numpy as np
+    from config_loader import KeyframeDedupSettings
+
+# dHash compares a 9x8 grayscale thumbnail column by column: 64 bits
+DHASH_SIZE = 8
+# Hue x saturation bins of the colour-histogram signature
+HISTOGRAM_BINS = [16, 16]
+
+
+def frame_dhash(image: np.ndarray) -> int:
+    """64-bit difference hash of a BGR or grayscale frame."""
+    gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(gray, (DHASH_SIZE + 1, DHASH_SIZE), interpolation=cv2.INTER_AREA)
+    value = 0
+    for bit in (small[:, 1:] > small[:, :-1]).flatten():
+        value = (value << 1) | int(bit)
+    return value
+
+
+def frame_histogram(image: np.ndarray) -> np.ndarray:
+    """Normalized hue/saturation histogram of a BGR frame."""
+    hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+    hist = cv2.calcHist([hsv], [0, 1], None, HISTOGRAM_BINS, [0, 180, 0, 256])
+    cv2.normalize(hist, hist, 0, 1, cv2.NORM_MINMAX)
+    return hist
+
+
+class KeyframeDeduplicator:
+    """Accepts frames that differ from every frame accepted before them.
+
+    ``method="dhash"`` compares 64-bit difference hashes by Hamming distance;
+    ``method="histogram"`` compares hue/saturation histograms by Bhattacharyya
+    distance. One instance covers one video.
+    """
+
+    def __init__(self, settings: KeyframeDedupSettings):
+        self.settings = settings
+        self._hashes: List[int] = []
+        self._histograms: List[np.ndarray] = []
+
+    @property
+    def accepted(self) -> int:
+        return len(self._hashes) + len(self._histograms)
+
+    def offer(self, image: np.ndarray) -> bool:
+        """Return False if ``image`` is a near duplicate of an accepted frame."""
+        if self.settings.method == "histogram":
+            return self._offer_histogram(frame_histogram(image))
+        return self._offer_hash(frame_dhash(image))
+
+    def _offer_hash(self, value: int) -> bool:
+        limit = self.settings.max_hamming_distance
+        if any(bin(value ^ accepted).count("1") <= limit for accepted in self._hashes):
+            return False
+        self._hashes.append(value)
+        return True
+
+    def _offer_histogram(self, hist: np.ndarray) -> bool:
+        limit = self.settings.max_histogram_distance
+        for accepted in self._histograms:
+            if cv2.compareHist(accepted, hist, cv2.HISTCMP_BHATTACHARYYA) <= limit:
+                return False
+        self._histograms.append(hist)
+        return True
+
+
+def read_frame_for_dedup(frame_path: str) -> Optional[np.ndarray]:
+    """Load a saved keyframe at reduced resolution; the signatures need little detail."""
+    return cv2.imread(frame_path, cv2.IMREAD_REDUCED_COLOR_4)
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import replace
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 
 from common_py.logging_config import configure_logging
 from config_loader import PyAVSettings, config
 
 from .abstract_extractor import AbstractKeyframeExtractor
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = configure_logging("video-crawler:pyav_extractor")
 
+DECODE_MODE_SINGLE_PASS = "single_pass"
+DECODE_MODE_PER_TIMESTAMP = "per_timestamp"
+
 
 class PyAVKeyframeExtractor(AbstractKeyframeExtractor):
     """Keyframe extractor that uses PyAV for codecs unsupported by OpenCV."""
@@ -35,31 +42,50 @@ class PyAVKeyframeExtractor(AbstractKeyframeExtractor):
         video_id: str,
     ) -> List[Tuple[float, str]]:
         try:
-            import av  # type: ignore
+            import av  # type: ignore  # noqa: F401
         except Exception as exc:  # pragma: no cover - import guard
             raise RuntimeError("PyAV is required for AV1 keyframe extraction") from exc
 
         if not Path(video_path).exists():
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
+        # Decoding is CPU bound; keep it off the crawler's event loop
+        return await asyncio.to_thread(
+            self._extract_frames_sync, video_path, keyframe_dir, video_id
+        )
+
+    def _extract_frames_sync(
+        self,
+        video_path: str,
+        keyframe_dir: Path,
+        video_id: str,
+    ) -> List[Tuple[float, str]]:
+        import av  # type: ignore
+
         container = None
         try:
             container = av.open(video_path)
             stream = self._get_video_stream(container, video_id)
             duration = self._get_duration_seconds(container, stream, video_path)
             timestamps = self._calculate_timestamps(duration)
+            single_pass = self.settings.decode_mode != DECODE_MODE_PER_TIMESTAMP
 
             logger.info(
                 "Starting PyAV extraction",
                 video_id=video_id,
                 duration_seconds=duration,
                 timestamps=timestamps,
+                decode_mode=DECODE_MODE_SINGLE_PASS if single_pass else DECODE_MODE_PER_TIMESTAMP,
             )
 
+            if single_pass:
+                decoded = self._decode_frames_single_pass(container, stream, timestamps)
+            else:
+                decoded = self._decode_frames_per_timestamp(video_path, stream.index, timestamps)
+
             extracted: List[Tuple[float, str]] = []
-            for ts in timestamps:
+            for ts, frame_image in decoded:
                 try:
-                    frame_image = self._decode_frame_at_timestamp(video_path, stream.index, ts)
                     if frame_image is None:
                         logger.warning(
                             "PyAV decode returned no frame",
@@ -187,6 +213,123 @@ class PyAVKeyframeExtractor(AbstractKeyframeExtractor):
 
         return timestamps
 
+    def _decode_frames_per_timestamp(
+        self,
+        video_path: str,
+        stream_index: int,
+        timestamps: List[float],
+    ) -> List[Tuple[float, Optional[np.ndarray]]]:
+        """Decode each timestamp independently by reopening the container and seeking."""
+        decoded = []
+        for ts in timestamps:
+            try:
+                decoded.append((ts, self._decode_frame_at_timestamp(video_path, stream_index, ts)))
+            except Exception as exc:
+                logger.error(
+                    "Error extracting frame via PyAV",
+                    video_path=video_path,
+                    timestamp=ts,
+                    error=str(exc),
+                )
+        return decoded
+
+    def _decode_frames_single_pass(
+        self,
+        container,
+        stream,
+        timestamps: List[float],
+    ) -> List[Tuple[float, Optional[np.ndarray]]]:
+        """Decode forward once through sorted timestamps on an already open container.
+
+        For each target the first frame at or after it is taken. Before each
+        target the gap from the current decode position is compared with the
+        GOP length: a seek lands on the keyframe preceding the target, so it
+        only pays off when the gap is longer than a GOP. The GOP length is
+        measured from keyframe spacing as decoding proceeds.
+        """
+        gop_seconds = max(0.0, self.settings.default_gop_seconds)
+        frames: Optional[Iterator] = None
+        position: Optional[float] = None  # timestamp of the last decoded frame
+        last_keyframe_ts: Optional[float] = None
+        current = None  # last decoded frame, reused when it already covers a target
+        exhausted = False
+
+        decoded: List[Tuple[float, Optional[np.ndarray]]] = []
+        for target in sorted(timestamps):
+            if exhausted:
+                decoded.append((target, None))
+                continue
+
+            gap = target - (position if position is not None else 0.0)
+            if gap > gop_seconds:
+                if self._seek(container, stream, target):
+                    frames = None
+                    current = None
+                    position = None
+                    last_keyframe_ts = None
+            if frames is None:
+                frames = iter(container.decode(stream))
+
+            frame = None
+            if current is not None and position is not None and position >= target:
+                frame = current
+            while frame is None:
+                try:
+                    candidate = next(frames)
+                except StopIteration:
+                    exhausted = True
+                    break
+
+                frame_ts = self._frame_timestamp(candidate)
+                if frame_ts is not None:
+                    if getattr(candidate, "key_frame", False):
+                        if last_keyframe_ts is not None and frame_ts > last_keyframe_ts:
+                            gop_seconds = max(gop_seconds, frame_ts - last_keyframe_ts)
+                        last_keyframe_ts = frame_ts
+                    position = frame_ts
+                current = candidate
+
+                if frame_ts is None or frame_ts >= target:
+                    frame = candidate
+
+            decoded.append((target, self._frame_to_ndarray(frame, target) if frame is not None else None))
+
+        return decoded
+
+    def _seek(self, container, stream, timestamp: float) -> bool:
+        try:
+            if getattr(stream, "time_base", None):
+                container.seek(int(timestamp / stream.time_base), stream=stream, any_frame=False)
+                return True
+        except Exception as exc:
+            logger.debug(
+                "PyAV seek failed, continuing sequential decode",
+                timestamp=timestamp,
+                error=str(exc),
+            )
+        return False
+
+    @staticmethod
+    def _frame_timestamp(frame) -> Optional[float]:
+        try:
+            if frame.pts is not None and frame.time_base:
+                return float(frame.pts * frame.time_base)
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def _frame_to_ndarray(frame, timestamp: float):
+        try:
+            return frame.to_ndarray(format="bgr24")
+        except Exception as exc:
+            logger.debug(
+                "Failed to convert PyAV frame to ndarray",
+                timestamp=timestamp,
+                error=str(exc),
+            )
+            return None
+
     def _decode_frame_at_timestamp(self, video_path: str, stream_index: int, timestamp: float):
         """Seek to a timestamp using PyAV and return the closest decoded frame as ndarray."""
         try:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from dataclasses import replace
 from pathlib import Path
@@ -25,10 +26,17 @@ except ImportError:  # pragma: no cover
     StatsManager = None
     VideoManager = None
 
+try:  # pragma: no cover - helper location differs across scenedetect releases
+    from scenedetect.scene_manager import compute_downscale_factor
+except ImportError:  # pragma: no cover
+    def compute_downscale_factor(frame_width: int, effective_width: int = 256) -> int:
+        return max(1, frame_width // effective_width)
+
 from common_py.logging_config import configure_logging
 from config_loader import PySceneDetectSettings, config
 
 from .abstract_extractor import AbstractKeyframeExtractor
+from .candidate_buffer import CandidateBuffer, CandidateFrame
 
 logger = configure_logging("video-crawler:pyscene_detect_extractor")
 
@@ -58,6 +66,12 @@ class PySceneDetectKeyframeExtractor(AbstractKeyframeExtractor):
         if SceneManager is None or AdaptiveDetector is None or VideoManager is None:
             raise RuntimeError("PySceneDetect is not available. Install scenedetect[opencv].")
 
+        if self.settings.single_pass:
+            # Decoding is CPU bound; keep it off the crawler's event loop
+            return await asyncio.to_thread(
+                self._extract_frames_single_pass, video_path, keyframe_dir, video_id
+            )
+
         start_time = time.time()
         cap = self._open_video_capture(video_path, video_id)
         try:
@@ -131,6 +145,178 @@ class PySceneDetectKeyframeExtractor(AbstractKeyframeExtractor):
             if cap is not None:
                 cap.release()
 
+    def _extract_frames_single_pass(
+        self,
+        video_path: str,
+        keyframe_dir: Path,
+        video_id: str,
+    ) -> List[Tuple[float, str]]:
+        """Detect scenes and pick keyframes from one sequential decode.
+
+        Every processed frame is fed to the AdaptiveDetector at detection
+        resolution while a bounded CandidateBuffer keeps downscaled frames of
+        the current scene with their blur scores. When a cut is reported the
+        closed scene's keyframe is chosen from the buffer and written, so the
+        video is never decoded a second time.
+        """
+        start_time = time.time()
+        cap = self._open_video_capture(video_path, video_id)
+        try:
+            video_props = self._get_video_properties(cap, video_id)
+            fps = video_props.fps
+            duration = video_props.duration
+            detector = self._build_detector()
+            downscale = compute_downscale_factor(video_props.width)
+            step = max(0, self.settings.frame_skip) + 1
+            max_scenes = max(0, self.settings.max_scenes)
+
+            buffer = CandidateBuffer(self.settings.candidate_buffer_size)
+            extracted_frames: List[Tuple[float, str]] = []
+            scenes = 0
+            scene_start = 0
+            blur_rejections = 0
+            write_failures = 0
+            decoded = 0
+            frame_num = -1
+
+            def close_scene(end_frame: int, candidates: List[CandidateFrame]) -> None:
+                nonlocal scenes, blur_rejections, write_failures
+                scenes += 1
+                target = self._scene_midpoint(scene_start / fps, end_frame / fps, duration)
+                if target is None:
+                    return
+                chosen = CandidateBuffer.pick(candidates, target, self.settings.min_blur_threshold)
+                if chosen is None:
+                    blur_rejections += 1
+                    return
+                if not self._save_candidate(chosen, keyframe_dir, video_id, extracted_frames):
+                    write_failures += 1
+
+            decode_start = time.perf_counter()
+            while True:
+                frame_num += 1
+                if frame_num % step:
+                    if not cap.grab():
+                        break
+                    decoded += 1
+                    continue
+
+                ret, frame = cap.read()
+                if not ret or frame is None:
+                    break
+                decoded += 1
+
+                if buffer.should_sample():
+                    buffer.add(CandidateFrame(
+                        frame_num=frame_num,
+                        timestamp=frame_num / fps,
+                        image=self._resize_longest_side(frame, self.settings.candidate_max_side),
+                        blur_score=self._calculate_blur_score(frame),
+                    ))
+
+                detection_frame = frame
+                if downscale > 1:
+                    detection_frame = cv2.resize(
+                        frame,
+                        (max(1, frame.shape[1] // downscale), max(1, frame.shape[0] // downscale)),
+                        interpolation=cv2.INTER_LINEAR,
+                    )
+                for cut in detector.process_frame(frame_num, detection_frame) or []:
+                    close_scene(cut, buffer.split_at(cut))
+                    scene_start = cut
+
+                if max_scenes and scenes >= max_scenes:
+                    break
+            decode_seconds = time.perf_counter() - decode_start
+
+            if not (max_scenes and scenes >= max_scenes):
+                for cut in detector.post_process(frame_num) or []:
+                    close_scene(cut, buffer.split_at(cut))
+                    scene_start = cut
+
+            end_frame = max(frame_num, 1)
+            if scenes == 0:
+                # No cut: the whole video is one scene, so several evenly
+                # spaced keyframes are taken from the buffer.
+                scene_duration = duration if duration > 0 else end_frame / fps
+                candidates = buffer.candidates
+                used: set = set()
+                for target in self._select_midpoint_timestamps([(0.0, scene_duration)], scene_duration):
+                    chosen = CandidateBuffer.pick(
+                        candidates, target, self.settings.min_blur_threshold, exclude=used
+                    )
+                    if chosen is None:
+                        blur_rejections += 1
+                        continue
+                    used.add(chosen.frame_num)
+                    if not self._save_candidate(chosen, keyframe_dir, video_id, extracted_frames):
+                        write_failures += 1
+            elif not (max_scenes and scenes >= max_scenes):
+                close_scene(end_frame, buffer.split_at(end_frame + 1))
+
+            logger.info(
+                "PySceneDetect single-pass extraction finished",
+                video_id=video_id,
+                scenes=max(scenes, 1),
+                extracted=len(extracted_frames),
+                blur_rejections=blur_rejections,
+                write_failures=write_failures,
+                decoded_frames=decoded,
+                decode_fps=round(decoded / decode_seconds, 1) if decode_seconds > 0 else 0.0,
+                elapsed_ms=int((time.time() - start_time) * 1000)
+            )
+            return extracted_frames
+
+        finally:
+            if cap is not None:
+                cap.release()
+
+    def _save_candidate(
+        self,
+        candidate: CandidateFrame,
+        keyframe_dir: Path,
+        video_id: str,
+        extracted_frames: List[Tuple[float, str]],
+    ) -> bool:
+        frame_filename = self._generate_frame_filename(
+            video_id,
+            candidate.timestamp,
+            format=self.settings.frame_format
+        )
+        frame_path = keyframe_dir / frame_filename
+        if not self._save_frame(candidate.image, str(frame_path), self.settings.frame_quality):
+            return False
+        extracted_frames.append((candidate.timestamp, str(frame_path)))
+        return True
+
+    @staticmethod
+    def _resize_longest_side(frame, max_side: int):
+        height, width = frame.shape[:2]
+        longest = max(height, width)
+        if max_side <= 0 or longest <= max_side:
+            return frame.copy()
+        scale = max_side / longest
+        return cv2.resize(
+            frame,
+            (max(1, round(width * scale)), max(1, round(height * scale))),
+            interpolation=cv2.INTER_AREA,
+        )
+
+    def _build_detector(self):
+        weights = ContentDetector.Components(
+            delta_lum=1.0,
+            delta_hue=0.0 if self.settings.weights_luma_only else 1.0,
+            delta_sat=0.0 if self.settings.weights_luma_only else 1.0,
+            delta_edges=0.0
+        )
+        return AdaptiveDetector(
+            adaptive_threshold=self.settings.adaptive_threshold,
+            min_scene_len=self.settings.min_scene_len,
+            window_width=self.settings.window_width,
+            min_content_val=self.settings.min_content_val,
+            weights=weights
+        )
+
     def _detect_scenes(self, video_path: str) -> List[Tuple[float, float]]:
         """Run PySceneDetect to obtain scene boundaries in seconds."""
         if SceneManager is None or AdaptiveDetector is None or VideoManager is None:
@@ -146,20 +332,7 @@ class PySceneDetectKeyframeExtractor(AbstractKeyframeExtractor):
             stats_manager = StatsManager()
             scene_manager = SceneManager(stats_manager)
 
-        weights = ContentDetector.Components(
-            delta_lum=1.0,
-            delta_hue=0.0 if self.settings.weights_luma_only else 1.0,
-            delta_sat=0.0 if self.settings.weights_luma_only else 1.0,
-            delta_edges=0.0
-        )
-        detector = AdaptiveDetector(
-            adaptive_threshold=self.settings.adaptive_threshold,
-            min_scene_len=self.settings.min_scene_len,
-            window_width=self.settings.window_width,
-            min_content_val=self.settings.min_content_val,
-            weights=weights
-        )
-        scene_manager.add_detector(detector)
+        scene_manager.add_detector(self._build_detector())
 
         boundaries: List[Tuple[float, float]] = []
 
@@ -277,22 +450,9 @@ class PySceneDetectKeyframeExtractor(AbstractKeyframeExtractor):
 
         # Multiple scenes detected - use normal midpoint extraction
         for start, end in scenes:
-            start = max(0.0, start)
-            if video_duration > 0:
-                end = min(end, video_duration)
-
-            if end <= start:
+            midpoint = self._scene_midpoint(start, end, video_duration)
+            if midpoint is None:
                 continue
-
-            duration = end - start
-            midpoint = start + (duration / 2.0)
-            upper_limit = max(start, end - min(guard, duration / 2.0))
-            midpoint = min(midpoint, upper_limit)
-
-            if duration < min_duration:
-                midpoint = start + min(duration / 2.0, fallback)
-
-            midpoint = max(start, min(midpoint, end))
             timestamps.append(midpoint)
 
             if max_scenes and len(timestamps) >= max_scenes:
@@ -300,6 +460,29 @@ class PySceneDetectKeyframeExtractor(AbstractKeyframeExtractor):
 
         return timestamps
 
+    def _scene_midpoint(self, start: float, end: float, video_duration: float) -> Optional[float]:
+        """Midpoint of one scene of a multi-scene video, clamped by the boundary guard."""
+        guard = max(0.0, self.settings.boundary_guard_seconds)
+        min_duration = max(0.0, self.settings.min_scene_duration_seconds)
+        fallback = max(0.0, self.settings.fallback_offset_seconds)
+
+        start = max(0.0, start)
+        if video_duration > 0:
+            end = min(end, video_duration)
+
+        if end <= start:
+            return None
+
+        duration = end - start
+        midpoint = start + (duration / 2.0)
+        upper_limit = max(start, end - min(guard, duration / 2.0))
+        midpoint = min(midpoint, upper_limit)
+
+        if duration < min_duration:
+            midpoint = start + min(duration / 2.0, fallback)
+
+        return max(start, min(midpoint, end))
+
     def _open_video_capture(self, video_path: str, video_id: str):
         """Open a cv2.VideoCapture with safe software decoding flags."""
         import os
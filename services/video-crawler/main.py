@@ -1,5 +1,7 @@
 from config_loader import config
 from handlers.video_crawl_handler import VideoCrawlHandler
+from platform_crawler.tiktok.download_strategies.http_transport import close_shared_transports
+from services.video_cleanup_service import VideoCleanupService
 from common_py.logging_config import configure_logging
 import asyncio
 import sys
@@ -16,15 +18,21 @@ logger = configure_logging("video-crawler:main", log_level=config.LOG_LEVEL)
 async def service_context():
     """Context manager for service resources"""
     handler = VideoCrawlHandler()
+    cleanup_task = None
     try:
         # Initialize connections
         await handler.db.connect()
         await handler.broker.connect()
+        cleanup_task = VideoCleanupService().start_background_cleanup()
         yield handler
     finally:
         # Cleanup resources
+        if cleanup_task:
+            cleanup_task.cancel()
+            await asyncio.gather(cleanup_task, return_exceptions=True)
         await handler.db.disconnect()
         await handler.broker.disconnect()
+        await close_shared_transports()
 
 
 async def main():
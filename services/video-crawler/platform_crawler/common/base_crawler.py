@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
 
 from platform_crawler.interface import PlatformCrawlerInterface
 from .utils import deduplicate_by_key, deduplicate_videos_by_id_and_title
@@ -11,6 +12,9 @@ from .utils import deduplicate_by_key, deduplicate_videos_by_id_and_title
 class BaseVideoCrawler(PlatformCrawlerInterface, ABC):
     """Shared implementation for platform crawlers."""
 
+    # Pause between consecutive queries when searching page by page
+    query_delay_s: float = 1.0
+
     def __init__(self, platform_name: str, logger, enable_title_deduplication: bool = True) -> None:
         self.platform_name = platform_name
         self.logger = logger
@@ -62,6 +66,62 @@ class BaseVideoCrawler(PlatformCrawlerInterface, ABC):
         )
         return downloaded_videos
 
+    async def iter_search_pages(
+        self,
+        queries: List[str],
+        recency_days: int,
+        num_videos: int,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield deduplicated candidates one search page at a time.
+
+        The searchers return a query's results in one call, so each query is a
+        page. Candidates already yielded for an earlier query are dropped, and
+        every candidate is normalised by ``_to_candidate`` so it carries
+        ``platform``, ``video_id``, ``url``, ``title`` and ``duration_s``.
+        """
+        prepared_queries = self._prepare_queries(queries, recency_days, num_videos)
+        seen: set = set()
+
+        for index, query in enumerate(prepared_queries):
+            if index:
+                await asyncio.sleep(self.query_delay_s)
+
+            results = await self._search_videos_for_queries([query], recency_days, num_videos)
+            page: List[Dict[str, Any]] = []
+            for video in self._deduplicate_videos(results).values():
+                key = self._video_key(video)
+                if not key or key in seen:
+                    continue
+                seen.add(key)
+                page.append(self._to_candidate(video))
+
+            self.logger.info(
+                "Search page for query '%s' yielded %s new videos",
+                query,
+                len(page),
+            )
+            if page:
+                yield page
+
+    async def download_single_video(
+        self,
+        video: Dict[str, Any],
+        download_dir: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Download one candidate from ``iter_search_pages``."""
+        Path(download_dir).mkdir(parents=True, exist_ok=True)
+        downloaded = await self._download_videos({"video_0": video}, download_dir)
+        return downloaded[0] if downloaded else None
+
+    def _video_key(self, video: Dict[str, Any]) -> Any:
+        if callable(self._dedupe_key):
+            return self._dedupe_key(video)
+        return video.get(self._dedupe_key)
+
+    def _to_candidate(self, video: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a raw search result to the metadata shape used downstream."""
+        return {"platform": self.platform_name, **video}
+
     def _prepare_queries(
         self,
         queries: Iterable[str] | str,
@@ -16,7 +16,7 @@ class TikTokDownloadStrategy(ABC):
         self.timeout = config.get("timeout", 30)
 
     @abstractmethod
-    def download_video(self, url: str, video_id: str, output_path: str) -> Optional[str]:
+    async def download_video(self, url: str, video_id: str, output_path: str) -> Optional[str]:
         """
         Download a TikTok video using the specific strategy.
 
@@ -30,6 +30,10 @@ class TikTokDownloadStrategy(ABC):
         """
         pass
 
+    async def close(self) -> None:
+        """Release per-instance resources; shared HTTP transports stay open."""
+        pass
+
     @abstractmethod
     async def extract_keyframes(
         self, video_path: str, video_id: str
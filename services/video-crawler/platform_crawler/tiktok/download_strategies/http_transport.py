@@ -0,0 +1,434 @@
+"""
+Shared, connection-pooled HTTP transport for TikTok download strategies.
+
+Every strategy gets one long-lived ``httpx.AsyncClient`` for the whole process,
+so TCP connections and TLS sessions to the media CDNs are reused across
+videos instead of being re-established for every HEAD and GET request.
+"""
+import asyncio
+import hashlib
+import importlib.util
+import os
+import re
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from common_py.logging_config import configure_logging
+
+from utils.content_hash import record_content_hash
+
+from ..loop_aware_async_client import LoopAwareAsyncClient
+
+logger = configure_logging("video-crawler:tiktok_http_transport")
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_PER_HOST_LIMIT = 4
+DEFAULT_RESUME_ATTEMPTS = 3
+DEFAULT_PARALLEL_RANGES = 1
+DEFAULT_PARALLEL_MIN_SIZE = 16 * 1024 * 1024
+RESUME_BACKOFF_S = 0.5
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)")
+
+
+class DownloadIntegrityError(Exception):
+    """Raised when a finished download does not match its expected size or hash."""
+
+
+class DownloadSizeLimitError(Exception):
+    """Raised when a streamed response grows beyond the allowed size."""
+
+    def __init__(self, size: int, max_size: int) -> None:
+        super().__init__(f"Download of {size} bytes exceeds size limit of {max_size} bytes")
+        self.size = size
+        self.max_size = max_size
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of a completed ``stream_to_file`` call."""
+
+    path: str
+    size: int
+    sha256: str
+    bytes_transferred: int
+    retries: int = 0
+
+
+@dataclass
+class TransferStats:
+    """
+    Running totals for one download, kept up to date while it is in flight.
+
+    Pass one to ``stream_to_file`` to read the bytes moved and the resumes
+    made even when the download ultimately fails.
+    """
+
+    bytes_transferred: int = 0
+    retries: int = 0
+    # Digest of the contiguous prefix written so far, for resumable downloads
+    sha256: Optional[Any] = None
+    hashed_bytes: int = 0
+    contiguous: bool = True
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _sha256_prefix(path: str, length: int) -> Any:
+    """Hash the first ``length`` bytes of ``path``."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        remaining = length
+        while remaining > 0:
+            block = f.read(min(remaining, 1024 * 1024))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest
+
+
+def _parse_content_range(value: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """Return ``(start, total)`` from a ``Content-Range`` header such as ``bytes 0-99/1000``."""
+    match = _CONTENT_RANGE.match(value or "")
+    if not match:
+        return None, None
+    start, total = match.group(1), match.group(2)
+    return (int(start) if start else None), (int(total) if total != "*" else None)
+
+
+def _is_resumable_error(exc: Exception) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status >= 500 or status == 429
+    return isinstance(exc, httpx.TransportError)
+
+
+def http2_available() -> bool:
+    """Return True when the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class PooledHttpTransport:
+    """
+    Long-lived AsyncClient with per-host concurrency limits and streaming downloads.
+
+    ``client_factory`` replaces the default pooled client builder, e.g. to
+    route requests through an ``httpx.MockTransport`` in tests.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        timeout: float,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+        http2: bool = True,
+        resume_attempts: int = DEFAULT_RESUME_ATTEMPTS,
+        parallel_ranges: int = DEFAULT_PARALLEL_RANGES,
+        parallel_min_size: int = DEFAULT_PARALLEL_MIN_SIZE,
+        client_factory: Optional[Callable[[], httpx.AsyncClient]] = None,
+    ) -> None:
+        self.name = name
+        self.timeout = timeout
+        self.max_connections = max(1, max_connections)
+        self.per_host_limit = max(1, per_host_limit)
+        self.resume_attempts = max(0, resume_attempts)
+        self.parallel_ranges = max(1, parallel_ranges)
+        self.parallel_min_size = parallel_min_size
+        self.http2 = http2 and http2_available()
+        if http2 and not self.http2:
+            logger.info("h2 is not installed, using HTTP/1.1", transport=name)
+
+        self._client_manager = LoopAwareAsyncClient(client_factory or self._build_client, logger)
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            follow_redirects=True,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client_manager.get_client()
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        # Semaphores bind to the loop they first wait on; start over on a new loop
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._host_slots = {}
+            self._slots_loop = loop
+
+        host = urlsplit(url).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.per_host_limit)
+        return slot
+
+    @asynccontextmanager
+    async def limit_host(self, url: str) -> AsyncIterator[None]:
+        """Hold one of the ``per_host_limit`` request slots for the host of ``url``."""
+        async with self._host_slot(url):
+            yield
+
+    async def head(self, url: str, **kwargs: Any) -> httpx.Response:
+        async with self.limit_host(url):
+            return await self.client.head(url, **kwargs)
+
+    async def stream_to_file(
+        self,
+        url: str,
+        output_filename: str,
+        max_size: int,
+        expected_sha256: Optional[str] = None,
+        stats: Optional[TransferStats] = None,
+    ) -> DownloadResult:
+        """
+        Download ``url`` into ``output_filename``, resuming after transient failures.
+
+        The body is written to a ``.part`` file. After a dropped connection,
+        timeout or 5xx response the download resumes from the end of that file
+        with an HTTP Range request, up to ``resume_attempts`` times. A ``.part``
+        file left behind by an earlier call is resumed the same way. Large
+        files from servers that accept ranges are fetched as
+        ``parallel_ranges`` concurrent byte ranges. Once complete, the size is
+        checked against the server's total (and the SHA-256 against
+        ``expected_sha256`` if given), then the file is renamed into place
+        and its SHA-256 recorded in a ``.sha256`` sidecar.
+
+        Raises ``httpx.HTTPError`` when the download fails, ``DownloadSizeLimitError``
+        when the body exceeds ``max_size`` and ``DownloadIntegrityError`` when
+        the finished file fails verification.
+        """
+        part_filename = f"{output_filename}.part"
+        progress = stats if stats is not None else TransferStats()
+        try:
+            while True:
+                try:
+                    total = await self._fetch_part(url, part_filename, max_size, progress)
+                    break
+                except httpx.HTTPError as exc:
+                    if not _is_resumable_error(exc) or progress.retries >= self.resume_attempts:
+                        raise
+                    progress.retries += 1
+                    logger.warning(
+                        "Download interrupted, resuming",
+                        transport=self.name,
+                        url=url,
+                        resume_from=_file_size(part_filename),
+                        attempt=progress.retries,
+                        error=str(exc),
+                    )
+                    await asyncio.sleep(min(RESUME_BACKOFF_S * 2 ** (progress.retries - 1), 10.0))
+
+            size = _file_size(part_filename)
+            if total is not None and size != total:
+                raise DownloadIntegrityError(f"Downloaded {size} bytes but the server reported {total}")
+
+            if progress.sha256 is not None and progress.hashed_bytes == size:
+                digest = progress.sha256.hexdigest()
+            else:
+                digest = (await asyncio.to_thread(_sha256_prefix, part_filename, size)).hexdigest()
+            if expected_sha256 and digest != expected_sha256.lower():
+                raise DownloadIntegrityError(f"SHA-256 mismatch: expected {expected_sha256}, got {digest}")
+
+            os.replace(part_filename, output_filename)
+            record_content_hash(output_filename, digest)
+            return DownloadResult(
+                path=output_filename,
+                size=size,
+                sha256=digest,
+                bytes_transferred=progress.bytes_transferred,
+                retries=progress.retries,
+            )
+        except BaseException as exc:
+            # Keep a contiguous partial file around for the next attempt to resume
+            if not (progress.contiguous and isinstance(exc, httpx.HTTPError) and _is_resumable_error(exc)):
+                _remove(part_filename)
+            raise
+
+    async def _fetch_part(self, url: str, part_filename: str, max_size: int, progress: TransferStats) -> Optional[int]:
+        """Fetch the rest of ``part_filename`` and return the total size, if known."""
+        offset = _file_size(part_filename)
+        split_total = None
+
+        async with self.limit_host(url):
+            async with self.client.stream("GET", url, headers={"Range": f"bytes={offset}-"}) as response:
+                if response.status_code == 416 and offset:
+                    # Either the partial file is already complete or it is stale
+                    _, total = _parse_content_range(response.headers.get("content-range"))
+                    if total == offset:
+                        return total
+                    _remove(part_filename)
+                    offset = None
+                else:
+                    response.raise_for_status()
+
+                    if response.status_code == 206:
+                        start, total = _parse_content_range(response.headers.get("content-range"))
+                        if start != offset:
+                            raise DownloadIntegrityError(f"Server resumed at byte {start}, expected {offset}")
+                    else:
+                        # Range ignored; the full body follows
+                        offset = 0
+                        content_length = response.headers.get("content-length")
+                        total = int(content_length) if content_length else None
+
+                    if total is not None and total > max_size:
+                        raise DownloadSizeLimitError(total, max_size)
+
+                    if (
+                        response.status_code == 206 and offset == 0 and total
+                        and self.parallel_ranges > 1 and total >= self.parallel_min_size
+                    ):
+                        split_total = total
+                    else:
+                        await self._write_body(response, part_filename, offset, max_size, progress)
+                        return total
+
+        if offset is None:
+            # Stale partial file removed; start over outside the host slot
+            return await self._fetch_part(url, part_filename, max_size, progress)
+
+        # The probe response is closed first so each range takes its own host slot
+        await self._fetch_ranges(url, part_filename, split_total, progress)
+        return split_total
+
+    async def _write_body(
+        self,
+        response: httpx.Response,
+        part_filename: str,
+        offset: int,
+        max_size: int,
+        progress: TransferStats,
+    ) -> None:
+        if offset == 0:
+            progress.sha256 = hashlib.sha256()
+            progress.hashed_bytes = 0
+        elif progress.sha256 is None or progress.hashed_bytes != offset:
+            progress.sha256 = await asyncio.to_thread(_sha256_prefix, part_filename, offset)
+            progress.hashed_bytes = offset
+
+        # Chunks are written as they arrive, so a dropped connection keeps every byte received
+        with open(part_filename, "ab" if offset else "wb") as f:
+            async for chunk in response.aiter_bytes():
+                progress.bytes_transferred += len(chunk)
+                if offset + len(chunk) > max_size:
+                    raise DownloadSizeLimitError(offset + len(chunk), max_size)
+                f.write(chunk)
+                progress.sha256.update(chunk)
+                offset += len(chunk)
+                progress.hashed_bytes = offset
+
+    async def _fetch_ranges(self, url: str, part_filename: str, total: int, progress: TransferStats) -> None:
+        """Fill a preallocated ``part_filename`` with ``parallel_ranges`` concurrent range requests."""
+        progress.contiguous = False
+        progress.sha256 = None
+        with open(part_filename, "wb") as f:
+            f.truncate(total)
+
+        step = -(-total // self.parallel_ranges)
+        tasks = [
+            asyncio.create_task(self._fetch_range(url, part_filename, start, min(start + step, total) - 1, progress))
+            for start in range(0, total, step)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        progress.contiguous = True
+
+    async def _fetch_range(self, url: str, part_filename: str, start: int, end: int, progress: TransferStats) -> None:
+        """Write bytes ``start``..``end`` (inclusive) of ``url`` into ``part_filename``."""
+        position = start
+        attempts = 0
+        while position <= end:
+            try:
+                async with self.limit_host(url):
+                    headers = {"Range": f"bytes={position}-{end}"}
+                    async with self.client.stream("GET", url, headers=headers) as response:
+                        response.raise_for_status()
+                        if response.status_code != 206:
+                            raise DownloadIntegrityError("Server ignored a byte range request")
+
+                        with open(part_filename, "r+b") as f:
+                            f.seek(position)
+                            async for chunk in response.aiter_bytes():
+                                if position + len(chunk) > end + 1:
+                                    raise DownloadIntegrityError("Server sent more bytes than the requested range")
+                                f.write(chunk)
+                                position += len(chunk)
+                                progress.bytes_transferred += len(chunk)
+
+                if position <= end:
+                    raise httpx.RemoteProtocolError("Byte range ended early")
+            except httpx.HTTPError as exc:
+                if not _is_resumable_error(exc) or attempts >= self.resume_attempts:
+                    raise
+                attempts += 1
+                progress.retries += 1
+                await asyncio.sleep(min(RESUME_BACKOFF_S * 2 ** (attempts - 1), 10.0))
+
+    async def close(self) -> None:
+        await self._client_manager.close()
+
+
+_transports: Dict[str, PooledHttpTransport] = {}
+
+
+def get_shared_transport(name: str, config: Dict[str, Any], timeout: float) -> PooledHttpTransport:
+    """
+    Return the process-wide transport for strategy ``name``, creating it on first use.
+
+    Pool settings are read from ``TIKTOK_HTTP_MAX_CONNECTIONS``,
+    ``TIKTOK_HTTP_PER_HOST_LIMIT`` and ``TIKTOK_HTTP2`` in ``config``, and
+    download settings from ``TIKTOK_DOWNLOAD_RESUME_ATTEMPTS`` and
+    ``TIKTOK_DOWNLOAD_PARALLEL_RANGES``; the first caller's settings win for
+    the lifetime of the process.
+    """
+    transport = _transports.get(name)
+    if transport is None:
+        transport = _transports[name] = PooledHttpTransport(
+            name,
+            timeout=timeout,
+            max_connections=int(config.get("TIKTOK_HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)),
+            per_host_limit=int(config.get("TIKTOK_HTTP_PER_HOST_LIMIT", DEFAULT_PER_HOST_LIMIT)),
+            http2=bool(config.get("TIKTOK_HTTP2", True)),
+            resume_attempts=int(config.get("TIKTOK_DOWNLOAD_RESUME_ATTEMPTS", DEFAULT_RESUME_ATTEMPTS)),
+            parallel_ranges=int(config.get("TIKTOK_DOWNLOAD_PARALLEL_RANGES", DEFAULT_PARALLEL_RANGES)),
+        )
+    return transport
+
+
+async def close_shared_transports() -> None:
+    """Close every shared transport, e.g. on service shutdown."""
+    transports = list(_transports.values())
+    _transports.clear()
+    for transport in transports:
+        await transport.close()
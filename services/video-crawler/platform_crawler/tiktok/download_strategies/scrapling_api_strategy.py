@@ -1,3 +1,4 @@
+import asyncio
 import os
 import shutil
 import time
@@ -9,6 +10,7 @@ from common_py.logging_config import configure_logging
 from keyframe_extractor.router import build_keyframe_extractor
 
 from .base import TikTokDownloadStrategy
+from .http_transport import DownloadSizeLimitError, TransferStats, get_shared_transport
 from ..metrics import record_download_metrics
 
 logger = configure_logging("video-crawler:tiktok_scrapling_api_strategy")
@@ -28,8 +30,9 @@ class ScraplingApiDownloadStrategy(TikTokDownloadStrategy):
         # Video processing limits (same as yt-dlp strategy)
         self.max_file_size = 500 * 1024 * 1024  # 500MB
 
-        # Initialize client on demand
+        # API client on demand; video files go through the shared pooled transport
         self._client = None
+        self.transport = get_shared_transport("scrapling-api", config, self.api_timeout)
         self.keyframe_storage_path = (
             config.get("keyframe_storage_path") or
             config.get("TIKTOK_KEYFRAME_STORAGE_PATH") or
@@ -58,43 +61,17 @@ class ScraplingApiDownloadStrategy(TikTokDownloadStrategy):
             await self._client.close()
             self._client = None
 
-    def download_video(self, url: str, video_id: str, output_path: str) -> Optional[str]:
-        """
-        Download a TikTok video using the Scrapling API.
-
-        This method is synchronous to match the strategy interface, but uses
-        asyncio internally to handle the async HTTP client.
-        """
-        import asyncio
-
+    async def download_video(self, url: str, video_id: str, output_path: str) -> Optional[str]:
+        """Download a TikTok video using the Scrapling API."""
         start_time = time.time()
         success = False
         error_code = None
         file_size = None
         api_execution_time = None
+        transfer = TransferStats()
 
         try:
-            # Check if we're already in an event loop
-            try:
-                # We're in a running loop, we need to run in a thread to avoid blocking
-                import concurrent.futures
-
-                def run_async_in_thread():
-                    # Create a new event loop in the thread
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        return new_loop.run_until_complete(self._download_video_async(url, video_id, output_path))
-                    finally:
-                        new_loop.close()
-                        asyncio.set_event_loop(None)
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(run_async_in_thread)
-                    result, api_exec_time = future.result()
-            except RuntimeError:
-                # No running loop, safe to use asyncio.run
-                result, api_exec_time = asyncio.run(self._download_video_async(url, video_id, output_path))
+            result, api_exec_time = await self._download_video_async(url, video_id, output_path, transfer)
 
             if result:
                 success = True
@@ -122,10 +99,14 @@ class ScraplingApiDownloadStrategy(TikTokDownloadStrategy):
                 error_code=error_code,
                 execution_time=execution_time,
                 file_size=file_size,
-                api_execution_time=api_execution_time
+                api_execution_time=api_execution_time,
+                retries=transfer.retries,
+                bytes_transferred=transfer.bytes_transferred
             )
 
-    async def _download_video_async(self, url: str, video_id: str, output_path: str) -> Optional[str]:
+    async def _download_video_async(
+        self, url: str, video_id: str, output_path: str, transfer: Optional[TransferStats] = None
+    ) -> Optional[str]:
         """Async implementation of video download."""
         output_filename = os.path.join(output_path, f"{video_id}.mp4")
         api_execution_time = None
@@ -157,7 +138,8 @@ class ScraplingApiDownloadStrategy(TikTokDownloadStrategy):
             success = await self._stream_video_file(
                 api_response.download_url,
                 output_filename,
-                video_id
+                video_id,
+                transfer
             )
 
             if not success:
@@ -213,70 +195,37 @@ class ScraplingApiDownloadStrategy(TikTokDownloadStrategy):
                     pass
 
             return None, api_execution_time
-        finally:
-            # Ensure we don't keep an event-loop-bound HTTP client alive between calls.
-            if self._client:
-                try:
-                    await self._client.close()
-                except Exception:
-                    logger.debug(
-                        "Failed to close TikTok download client after request.",
-                        exc_info=True
-                    )
-                finally:
-                    self._client = None
 
     async def _stream_video_file(
         self,
         download_url: str,
         output_filename: str,
-        video_id: str
+        video_id: str,
+        transfer: Optional[TransferStats] = None
     ) -> bool:
-        """Stream video file from download URL to local file."""
+        """Stream video file from download URL to local file, resuming interrupted transfers."""
         try:
-            async with httpx.AsyncClient(timeout=self.api_timeout) as client:
-                async with client.stream("GET", download_url) as response:
-                    response.raise_for_status()
-
-                    # Check content length if available
-                    content_length = response.headers.get("content-length")
-                    if content_length and int(content_length) > self.max_file_size:
-                        logger.warning(
-                            "Content-Length exceeds size limit, skipping download",
-                            video_id=video_id,
-                            content_length=content_length,
-                            max_size=self.max_file_size
-                        )
-                        return False
-
-                    # Stream to file
-                    with open(output_filename, "wb") as f:
-                        async for chunk in response.aiter_bytes(chunk_size=8192):
-                            f.write(chunk)
-
-                            # Check file size during download
-                            if f.tell() > self.max_file_size:
-                                logger.warning(
-                                    "Download exceeded size limit during streaming",
-                                    video_id=video_id,
-                                    current_size=f.tell(),
-                                    max_size=self.max_file_size
-                                )
-                                f.close()
-                                try:
-                                    os.remove(output_filename)
-                                except Exception:
-                                    pass
-                                return False
-
-                    logger.info(
-                        "Successfully streamed video file",
-                        video_id=video_id,
-                        output_filename=output_filename,
-                        final_size=os.path.getsize(output_filename)
-                    )
-                    return True
+            result = await self.transport.stream_to_file(
+                download_url, output_filename, self.max_file_size, stats=transfer
+            )
+            logger.info(
+                "Successfully streamed video file",
+                video_id=video_id,
+                output_filename=output_filename,
+                final_size=result.size,
+                sha256=result.sha256,
+                resumes=result.retries
+            )
+            return True
 
+        except DownloadSizeLimitError as exc:
+            logger.warning(
+                "Download exceeds size limit, skipping",
+                video_id=video_id,
+                current_size=exc.size,
+                max_size=self.max_file_size
+            )
+            return False
         except httpx.HTTPStatusError as exc:
             logger.error(
                 "HTTP error while streaming video",
@@ -361,8 +310,7 @@ class ScraplingApiDownloadStrategy(TikTokDownloadStrategy):
                         retry_delay,
                         strategy="scrapling-api"
                     )
-                    import time
-                    time.sleep(retry_delay)
+                    await asyncio.sleep(retry_delay)
                     # Clean up directory before retry
                     shutil.rmtree(keyframes_dir, ignore_errors=True)
                     continue
@@ -388,8 +336,7 @@ class ScraplingApiDownloadStrategy(TikTokDownloadStrategy):
                         retry_delay,
                         strategy="scrapling-api"
                     )
-                    import time
-                    time.sleep(retry_delay)
+                    await asyncio.sleep(retry_delay)
                     # Clean up directory before retry
                     if keyframes_dir:
                         shutil.rmtree(keyframes_dir, ignore_errors=True)
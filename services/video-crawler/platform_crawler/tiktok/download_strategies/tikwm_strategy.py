@@ -11,6 +11,7 @@ from common_py.logging_config import configure_logging
 from keyframe_extractor.router import build_keyframe_extractor
 
 from .base import TikTokDownloadStrategy
+from .http_transport import DownloadIntegrityError, DownloadSizeLimitError, TransferStats, get_shared_transport
 from ..metrics import record_download_metrics
 
 logger = configure_logging("video-crawler:tiktok_tikwm_strategy")
@@ -29,6 +30,9 @@ class TikwmDownloadStrategy(TikTokDownloadStrategy):
         self.max_retries = 2  # Small retry envelope for transient HTTP failures
         self.retry_delay = 1  # seconds
 
+        # One pooled client per strategy, shared by every downloader in the process
+        self.transport = get_shared_transport("tikwm", config, self.download_timeout)
+
         # Video storage configuration
         self.keyframe_storage_path = self.config.get("keyframe_storage_path", "/app/data/keyframes/tiktok")
         self.keyframe_extractor = build_keyframe_extractor(
@@ -36,46 +40,17 @@ class TikwmDownloadStrategy(TikTokDownloadStrategy):
             create_dirs=False  # Directories already created by TikTokDownloader
         )
 
-    def download_video(self, url: str, video_id: str, output_path: str) -> Optional[str]:
-        """
-        Download a TikTok video using the TikWM public endpoint.
-
-        This method is synchronous to match the strategy interface, but uses
-        asyncio internally to handle the async HTTP client.
-        """
+    async def download_video(self, url: str, video_id: str, output_path: str) -> Optional[str]:
+        """Download a TikTok video using the TikWM public endpoint."""
         start_time = time.time()
         success = False
         error_code = None
         file_size = None
         retries = 0
+        transfer = TransferStats()
 
         try:
-            # Check if we're already in an event loop
-            try:
-                # We're in a running loop, we need to run in a thread to avoid blocking
-                import concurrent.futures
-
-                def run_async_in_thread():
-                    # Create a new event loop in the thread
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        return new_loop.run_until_complete(
-                            self._download_video_async_with_retries(url, video_id, output_path)
-                        )
-                    finally:
-                        new_loop.close()
-                        asyncio.set_event_loop(None)
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(run_async_in_thread)
-                    result, attempt_retries = future.result()
-                    retries = attempt_retries
-            except RuntimeError:
-                # No running loop, safe to use asyncio.run
-                result, retries = asyncio.run(
-                    self._download_video_async_with_retries(url, video_id, output_path)
-                )
+            result, retries = await self._download_video_async_with_retries(url, video_id, output_path, transfer)
 
             if result:
                 success = True
@@ -103,17 +78,18 @@ class TikwmDownloadStrategy(TikTokDownloadStrategy):
                 error_code=error_code,
                 execution_time=execution_time,
                 file_size=file_size,
-                retries=retries
+                retries=retries + transfer.retries,
+                bytes_transferred=transfer.bytes_transferred
             )
 
     async def _download_video_async_with_retries(
-        self, url: str, video_id: str, output_path: str
+        self, url: str, video_id: str, output_path: str, transfer: Optional[TransferStats] = None
     ) -> Tuple[Optional[str], int]:
         """Async implementation of video download with retry logic."""
 
         for attempt in range(self.max_retries + 1):
             try:
-                result = await self._download_video_async(url, video_id, output_path)
+                result = await self._download_video_async(url, video_id, output_path, transfer)
                 return result, attempt
             except Exception as exc:
                 # Determine if this is a retryable error
@@ -161,7 +137,9 @@ class TikwmDownloadStrategy(TikTokDownloadStrategy):
         match = re.search(pattern, url)
         return match.group(1) if match else None
 
-    async def _download_video_async(self, url: str, video_id: str, output_path: str) -> Optional[str]:
+    async def _download_video_async(
+        self, url: str, video_id: str, output_path: str, transfer: Optional[TransferStats] = None
+    ) -> Optional[str]:
         """Async implementation of video download."""
         output_filename = os.path.join(output_path, f"{video_id}.mp4")
 
@@ -204,7 +182,7 @@ class TikwmDownloadStrategy(TikTokDownloadStrategy):
                 return None
 
             # Step 4: Stream the video file
-            success = await self._stream_video_file(final_url, output_filename, video_id)
+            success = await self._stream_video_file(final_url, output_filename, video_id, transfer)
             if not success:
                 return None
 
@@ -280,60 +258,59 @@ class TikwmDownloadStrategy(TikTokDownloadStrategy):
     async def _resolve_url_with_head(self, url: str, video_id: str) -> Optional[str]:
         """Perform HEAD request to resolve redirects and validate."""
         try:
-            async with httpx.AsyncClient(timeout=self.download_timeout, follow_redirects=True) as client:
-                response = await client.head(url)
-
-                if response.status_code != 200:
-                    logger.error(
-                        "HEAD request failed",
-                        video_id=video_id,
-                        url=url,
-                        status_code=response.status_code,
-                        strategy="tikwm"
-                    )
-                    error = ValueError(f"HEAD request failed with status {response.status_code}")
-                    error.error_code = "HEAD_FAILED"
-                    raise error
-
-                # Check content type
-                content_type = response.headers.get("content-type", "")
-                if not content_type.startswith("video/"):
-                    logger.error(
-                        "Invalid content type",
-                        video_id=video_id,
-                        content_type=content_type,
-                        strategy="tikwm"
-                    )
-                    error = ValueError(f"Invalid content type: {content_type}")
-                    error.error_code = "INVALID_CONTENT_TYPE"
-                    raise error
+            response = await self.transport.head(url)
 
-                # Check content length if available
-                content_length = response.headers.get("content-length")
-                if content_length and int(content_length) > self.max_file_size:
-                    logger.error(
-                        "Content-Length exceeds size limit",
-                        video_id=video_id,
-                        content_length=content_length,
-                        max_size=self.max_file_size,
-                        strategy="tikwm"
-                    )
-                    error = ValueError("Content-Length exceeds size limit")
-                    error.error_code = "SIZE_LIMIT_EXCEEDED"
-                    raise error
+            if response.status_code != 200:
+                logger.error(
+                    "HEAD request failed",
+                    video_id=video_id,
+                    url=url,
+                    status_code=response.status_code,
+                    strategy="tikwm"
+                )
+                error = ValueError(f"HEAD request failed with status {response.status_code}")
+                error.error_code = "HEAD_FAILED"
+                raise error
 
-                final_url = str(response.url)
-                logger.debug(
-                    "HEAD request successful",
+            # Check content type
+            content_type = response.headers.get("content-type", "")
+            if not content_type.startswith("video/"):
+                logger.error(
+                    "Invalid content type",
                     video_id=video_id,
-                    original_url=url,
-                    final_url=final_url,
                     content_type=content_type,
+                    strategy="tikwm"
+                )
+                error = ValueError(f"Invalid content type: {content_type}")
+                error.error_code = "INVALID_CONTENT_TYPE"
+                raise error
+
+            # Check content length if available
+            content_length = response.headers.get("content-length")
+            if content_length and int(content_length) > self.max_file_size:
+                logger.error(
+                    "Content-Length exceeds size limit",
+                    video_id=video_id,
                     content_length=content_length,
+                    max_size=self.max_file_size,
                     strategy="tikwm"
                 )
+                error = ValueError("Content-Length exceeds size limit")
+                error.error_code = "SIZE_LIMIT_EXCEEDED"
+                raise error
 
-                return final_url
+            final_url = str(response.url)
+            logger.debug(
+                "HEAD request successful",
+                video_id=video_id,
+                original_url=url,
+                final_url=final_url,
+                content_type=content_type,
+                content_length=content_length,
+                strategy="tikwm"
+            )
+
+            return final_url
 
         except Exception as exc:
             if hasattr(exc, 'error_code'):
@@ -355,48 +332,45 @@ class TikwmDownloadStrategy(TikTokDownloadStrategy):
         self,
         url: str,
         output_filename: str,
-        video_id: str
+        video_id: str,
+        transfer: Optional[TransferStats] = None
     ) -> bool:
-        """Stream video file from URL to local file."""
+        """Stream video file from URL to local file, resuming interrupted transfers."""
         try:
-            async with httpx.AsyncClient(timeout=self.download_timeout) as client:
-                async with client.stream("GET", url) as response:
-                    response.raise_for_status()
-
-                    # Stream to file
-                    with open(output_filename, "wb") as f:
-                        downloaded_bytes = 0
-                        async for chunk in response.aiter_bytes(chunk_size=8192):
-                            f.write(chunk)
-                            downloaded_bytes += len(chunk)
-
-                            # Check file size during download
-                            if downloaded_bytes > self.max_file_size:
-                                logger.warning(
-                                    "Download exceeded size limit during streaming",
-                                    video_id=video_id,
-                                    current_size=downloaded_bytes,
-                                    max_size=self.max_file_size,
-                                    strategy="tikwm"
-                                )
-                                f.close()
-                                try:
-                                    os.remove(output_filename)
-                                except Exception:
-                                    pass
-                                error = ValueError("Download exceeded size limit during streaming")
-                                error.error_code = "SIZE_LIMIT_EXCEEDED"
-                                raise error
-
-                    logger.debug(
-                        "Successfully streamed video file",
-                        video_id=video_id,
-                        output_filename=output_filename,
-                        final_size=os.path.getsize(output_filename),
-                        strategy="tikwm"
-                    )
-                    return True
+            result = await self.transport.stream_to_file(url, output_filename, self.max_file_size, stats=transfer)
+            logger.debug(
+                "Successfully streamed video file",
+                video_id=video_id,
+                output_filename=output_filename,
+                final_size=result.size,
+                sha256=result.sha256,
+                resumes=result.retries,
+                strategy="tikwm"
+            )
+            return True
 
+        except DownloadIntegrityError as exc:
+            logger.error(
+                "Downloaded video failed verification",
+                video_id=video_id,
+                error=str(exc),
+                strategy="tikwm"
+            )
+            error = ValueError(f"Downloaded file failed verification: {exc}")
+            error.error_code = "INTEGRITY_ERROR"
+            raise error
+
+        except DownloadSizeLimitError as exc:
+            logger.warning(
+                "Download exceeded size limit during streaming",
+                video_id=video_id,
+                current_size=exc.size,
+                max_size=self.max_file_size,
+                strategy="tikwm"
+            )
+            error = ValueError("Download exceeded size limit during streaming")
+            error.error_code = "SIZE_LIMIT_EXCEEDED"
+            raise error
         except httpx.HTTPStatusError as exc:
             logger.error(
                 "HTTP error while streaming video",
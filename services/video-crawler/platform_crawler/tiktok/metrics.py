@@ -24,6 +24,7 @@ class DownloadMetrics:
     file_size: Optional[int] = None
     api_execution_time: Optional[float] = None
     retries: int = 0
+    bytes_transferred: Optional[int] = None
     timestamp: float = field(default_factory=time.time)
 
 
@@ -49,6 +50,10 @@ class TikTokMetricsCollector:
         # Error counts
         self._error_counts = defaultdict(int)
 
+        # Network bytes and retries by strategy, including failed downloads
+        self._bytes_transferred = defaultdict(int)
+        self._retries = defaultdict(int)
+
     def record_download_attempt(self, metrics: DownloadMetrics) -> None:
         """Record metrics for a download attempt."""
         # Update counters
@@ -59,6 +64,10 @@ class TikTokMetricsCollector:
         if not metrics.success and metrics.error_code:
             self._error_counts[metrics.error_code] += 1
 
+        # Record transfer volume
+        self._bytes_transferred[metrics.strategy] += metrics.bytes_transferred or 0
+        self._retries[metrics.strategy] += metrics.retries
+
         # Record timing
         if metrics.execution_time:
             self._timings[metrics.strategy].append(metrics.execution_time)
@@ -78,7 +87,8 @@ class TikTokMetricsCollector:
             api_execution_time=metrics.api_execution_time,
             file_size=metrics.file_size,
             error_code=metrics.error_code,
-            retries=metrics.retries
+            retries=metrics.retries,
+            bytes_transferred=metrics.bytes_transferred
         )
 
     def get_strategy_stats(self, strategy: str) -> Dict[str, any]:
@@ -98,7 +108,9 @@ class TikTokMetricsCollector:
             "failed_downloads": counters.get("failure", 0),
             "success_rate": round(success_rate, 2),
             "avg_execution_time": round(avg_execution_time, 2) if avg_execution_time else None,
-            "total_samples": len(timings)
+            "total_samples": len(timings),
+            "bytes_transferred": self._bytes_transferred.get(strategy, 0),
+            "total_retries": self._retries.get(strategy, 0)
         }
 
     def get_all_stats(self) -> Dict[str, any]:
@@ -164,7 +176,8 @@ def record_download_metrics(
     execution_time: Optional[float] = None,
     file_size: Optional[int] = None,
     api_execution_time: Optional[float] = None,
-    retries: int = 0
+    retries: int = 0,
+    bytes_transferred: Optional[int] = None
 ) -> None:
     """
     Record download metrics using the global collector.
@@ -180,7 +193,8 @@ def record_download_metrics(
         execution_time=execution_time,
         file_size=file_size,
         api_execution_time=api_execution_time,
-        retries=retries
+        retries=retries,
+        bytes_transferred=bytes_transferred
     )
 
     _metrics_collector.record_download_attempt(metrics)
@@ -26,6 +26,11 @@ class TikTokCrawler(BaseVideoCrawler):
             "TIKTOK_CRAWL_HOST_PORT": config.TIKTOK_CRAWL_HOST_PORT,
             "TIKTOK_DOWNLOAD_STRATEGY": config.TIKTOK_DOWNLOAD_STRATEGY,
             "TIKTOK_DOWNLOAD_TIMEOUT": config.TIKTOK_DOWNLOAD_TIMEOUT,
+            "TIKTOK_HTTP_MAX_CONNECTIONS": config.TIKTOK_HTTP_MAX_CONNECTIONS,
+            "TIKTOK_HTTP_PER_HOST_LIMIT": config.TIKTOK_HTTP_PER_HOST_LIMIT,
+            "TIKTOK_HTTP2": config.TIKTOK_HTTP2,
+            "TIKTOK_DOWNLOAD_RESUME_ATTEMPTS": config.TIKTOK_DOWNLOAD_RESUME_ATTEMPTS,
+            "TIKTOK_DOWNLOAD_PARALLEL_RANGES": config.TIKTOK_DOWNLOAD_PARALLEL_RANGES,
             "retries": 3,
             "timeout": 30,
             "platform_name": self.platform_name,
@@ -93,6 +98,19 @@ class TikTokCrawler(BaseVideoCrawler):
             self.max_parallel_downloads,
         )
 
+    def _to_candidate(self, video: Dict[str, Any]) -> Dict[str, Any]:
+        # Keep the raw keys: the downloader needs ``id`` and ``webViewUrl``
+        return {
+            **video,
+            "platform": self.platform_name,
+            "video_id": video.get("id"),
+            "url": video.get("webViewUrl"),
+            "title": video.get("caption"),
+            # The search API returns no duration, so TikTok candidates all get the
+            # priority the streaming pipeline gives videos of unknown length
+            "duration_s": None,
+        }
+
     def _deduplicate_videos(
         self,
         videos: Iterable[Dict[str, Any]],
@@ -1,11 +1,14 @@
 import asyncio
-import inspect
 import os
 import tempfile
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from common_py.logging_config import configure_logging
+from services.cleanup_service import cleanup_service
+from services.content_store import content_store
+from services.processing_stages import ProcessingStages
 
 from .download_strategies.factory import TikTokDownloadStrategyFactory
 from .download_strategies.base import TikTokAntiBotError
@@ -88,8 +91,6 @@ class TikTokDownloader:
         semaphore = asyncio.Semaphore(max_parallel)
         results: List[Dict[str, Any]] = []
 
-        download_is_async = inspect.iscoroutinefunction(self.download_video)
-
         async def process(video: Dict[str, Any]):
             url = video.get("webViewUrl")
             video_id = video.get("id")
@@ -100,10 +101,7 @@ class TikTokDownloader:
 
             async with semaphore:
                 try:
-                    if download_is_async:
-                        local_path = await self.download_video(url, video_id)  # type: ignore[arg-type]
-                    else:
-                        local_path = await asyncio.to_thread(self.download_video, url, video_id)
+                    local_path = await self.download_video(url, video_id)
                 except TikTokAntiBotError as exc:
                     logger.warning(
                         "Anti-bot blocked TikTok download",
@@ -159,15 +157,41 @@ class TikTokDownloader:
         finally:
             self.video_storage_path = original_video_path
 
-    def download_video(self, url: str, video_id: str) -> Optional[str]:
+    async def download_video(self, url: str, video_id: str) -> Optional[str]:
         """Download a TikTok video using the configured strategy."""
-        return self.download_strategy.download_video(url, video_id, self.video_storage_path)
+        local_path = await self.download_strategy.download_video(url, video_id, self.video_storage_path)
+        if local_path:
+            await cleanup_service.record_file(local_path)
+        return local_path
+
+    async def close(self) -> None:
+        """Release the strategy's per-instance clients."""
+        await self.download_strategy.close()
 
     async def extract_keyframes(
-        self, video_path: str, video_id: str
+        self, video_path: str, video_id: str, stages: Optional[ProcessingStages] = None
     ) -> Tuple[Optional[str], List[Tuple[float, str]]]:
-        """Extract keyframes from a downloaded TikTok video using the configured strategy."""
-        return await self.download_strategy.extract_keyframes(video_path, video_id)
+        """Extract keyframes from a downloaded TikTok video using the configured strategy.
+
+        Content already decoded under another video ID reuses its cached keyframes.
+        With ``stages`` given, decoding runs inside the decode stage limit.
+        """
+        content_hash = await content_store.content_hash(video_path)
+        if not content_hash:
+            async with stages.decode if stages else nullcontext():
+                return await self.download_strategy.extract_keyframes(video_path, video_id)
+
+        async with content_store.lock(content_hash):
+            keyframes_dir = os.path.join(self.keyframe_storage_path, video_id)
+            cached = await content_store.get_keyframes(content_hash, keyframes_dir)
+            if cached:
+                logger.info("Reusing cached keyframes for video %s (content %s)", video_id, content_hash)
+                return keyframes_dir, cached
+
+            async with stages.decode if stages else nullcontext():
+                keyframes_dir, keyframes = await self.download_strategy.extract_keyframes(video_path, video_id)
+            await content_store.put_keyframes(content_hash, keyframes)
+            return keyframes_dir, keyframes
 
     async def orchestrate_download_and_extract(
         self,
@@ -175,8 +199,15 @@ class TikTokDownloader:
         video_id: str,
         video: Optional[Any] = None,
         db: Optional[Any] = None,
+        stages: Optional[ProcessingStages] = None,
     ) -> bool:
-        """Orchestrate video download and keyframe extraction."""
+        """
+        Orchestrate video download and keyframe extraction.
+
+        With ``stages`` given, the download, keyframe decode and keyframe
+        persistence each run inside the matching stage limit, as for other
+        platforms in ``VideoProcessor``.
+        """
         logger.info(
             "Starting orchestration of download and extraction for video %s from URL: %s",
             video_id,
@@ -184,14 +215,15 @@ class TikTokDownloader:
         )
 
         try:
-            local_path = self.download_video(url, video_id)
+            async with stages.download if stages else nullcontext():
+                local_path = await self.download_video(url, video_id)
             if not local_path:
                 logger.error("Download failed for video %s", video_id)
                 return False
 
             logger.info("Video download successful for video %s: %s", video_id, local_path)
 
-            keyframes_dir, keyframes = await self.extract_keyframes(local_path, video_id)
+            keyframes_dir, keyframes = await self.extract_keyframes(local_path, video_id, stages)
 
             # Enhanced error handling for keyframe extraction
             if not keyframes_dir or not keyframes:
@@ -238,7 +270,8 @@ class TikTokDownloader:
                 )
 
             if db and HAS_DB and keyframes:
-                await self._persist_keyframes(video_id, keyframes, db)
+                async with stages.db_write if stages else nullcontext():
+                    await self._persist_keyframes(video_id, keyframes, db)
             elif not HAS_DB:
                 logger.info("Database persistence skipped - libs.common_py not available")
 
@@ -49,9 +49,9 @@ class YoutubeDownloader:
         # Download the video with resilient format selection and retry mechanism
         download_result = await self._download_with_retries(video, download_dir, title, start_time)
 
-        # Perform cleanup after successful download
+        # Index the new file for the background cleanup
         if download_result and download_result.get('local_path'):
-            await self._perform_cleanup_after_download(download_dir)
+            await cleanup_service.record_file(download_result['local_path'])
 
         return download_result
 
@@ -101,12 +101,14 @@ class YoutubeDownloader:
         Returns:
             Video metadata with local_path if successful, None otherwise
         """
+        format_attempt = 0
         for attempt in range(self.config.MAX_RETRIES):
             # Rotate user agent for each attempt to avoid detection
             user_agent = self.config.get_random_user_agent()
 
-            # Get format selection based on attempt number
-            format_selection = self.config.get_format_option(attempt)
+            # Keep the format after an interrupted transfer so yt-dlp resumes its
+            # .part file instead of starting a different format from byte 0
+            format_selection = self.config.get_format_option(format_attempt)
 
             # Configure proxy - use SOCKS5 proxy on first attempt only if USE_PRIVATE_PROXY is false, otherwise skip proxy
             proxy_config = self.config.SOCKS_PROXY if attempt == 0 and not self.config.USE_PRIVATE_PROXY else None
@@ -138,6 +140,11 @@ class YoutubeDownloader:
                 error_msg = str(e)
                 logger.error(f"[DOWNLOAD-FAILED] Video: {title} | Duration: {duration:.2f}s | Attempt {attempt+1} failed: {error_msg}")
 
+                if self.error_handler.is_transfer_error(error_msg):
+                    logger.info(f"[DOWNLOAD-RESUME] Video: {title} | Transfer interrupted, next attempt resumes the partial file")
+                else:
+                    format_attempt += 1
+
                 # Handle the exception
                 result = await self._handle_download_exception(video, title, attempt, error_msg)
                 if result == "retry":
@@ -252,28 +259,3 @@ class YoutubeDownloader:
         # If we've exhausted all retries
         logger.error(f"[DOWNLOAD-FAILED-FINAL] Video: {title} | All {self.config.MAX_RETRIES} attempts failed. Skipping this video.")
         return "fail"
-
-    async def _perform_cleanup_after_download(self, download_dir: str) -> None:
-        """
-        Perform cleanup of old videos after a successful download.
-
-        Args:
-            download_dir: Directory where videos are stored
-        """
-        try:
-            logger.info("[CLEANUP-AFTER-DOWNLOAD] Starting cleanup after successful download")
-
-            # Perform cleanup with dry_run=False to actually remove files
-            cleanup_results = await cleanup_service.perform_cleanup(download_dir, dry_run=False)
-
-            if cleanup_results['files_removed']:
-                freed_mb = cleanup_results['total_size_freed'] / (1024 * 1024)
-                logger.info(
-                    f"[CLEANUP-AFTER-DOWNLOAD-COMPLETE] Removed {len(cleanup_results['files_removed'])} files, freed {freed_mb:.2f}MB"
-                )
-            else:
-                logger.info("[CLEANUP-AFTER-DOWNLOAD] No old files to remove")
-
-        except Exception as e:
-            logger.error(f"[CLEANUP-AFTER-DOWNLOAD-ERROR] Failed to perform cleanup: {str(e)}")
-            # Don't let cleanup errors affect the download process
@@ -4,6 +4,19 @@ from common_py.logging_config import configure_logging
 
 logger = configure_logging("video-crawler:error_handler")
 
+TRANSFER_ERROR_MARKERS = (
+    "timed out",
+    "connection reset",
+    "connection aborted",
+    "connection broken",
+    "incompleteread",
+    "incomplete read",
+    "content too short",
+    "contenttooshort",
+    "did not get any data blocks",
+    "broken pipe",
+)
+
 
 class ErrorHandler:
     """Handles error logging and debugging for YouTube downloads"""
@@ -48,3 +61,20 @@ class ErrorHandler:
         else:
             # Generic retry with exponential backoff, capped at 5 minutes
             return min(2 ** attempt, 300)  # Cap at 5 minutes
+
+    @staticmethod
+    def is_transfer_error(error_msg: str) -> bool:
+        """
+        Check whether an error interrupted the transfer itself
+
+        Such downloads leave a resumable .part file, so the retry should keep
+        the same format instead of moving on to the next one.
+
+        Args:
+            error_msg: Error message
+
+        Returns:
+            True if the error is a dropped or stalled transfer
+        """
+        lowered = error_msg.lower()
+        return any(marker in lowered for marker in TRANSFER_ERROR_MARKERS)
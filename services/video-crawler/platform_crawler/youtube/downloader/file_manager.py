@@ -6,6 +6,9 @@ from common_py.logging_config import configure_logging
 
 logger = configure_logging("video-crawler:file_manager")
 
+# yt-dlp keeps unfinished downloads under these suffixes so later attempts can resume them
+PARTIAL_SUFFIXES = (".part", ".ytdl", ".temp")
+
 
 class FileManager:
     """Handles file operations for YouTube video downloads"""
@@ -26,6 +29,14 @@ class FileManager:
         download_path.mkdir(parents=True, exist_ok=True)
         return download_path
 
+    @staticmethod
+    def _completed_files(uploader_dir: Path, title: str) -> list:
+        """Files named after ``title``, excluding yt-dlp partial downloads."""
+        return [
+            path for path in uploader_dir.glob(f"{title}.*")
+            if not path.name.endswith(PARTIAL_SUFFIXES) and ".part-Frag" not in path.name
+        ]
+
     @staticmethod
     def check_existing_file(uploader_dir: Path, title: str) -> str:
         """
@@ -38,7 +49,7 @@ class FileManager:
         Returns:
             str: Path to existing file or None if not found
         """
-        existing_files = list(uploader_dir.glob(f"{title}.*"))
+        existing_files = FileManager._completed_files(uploader_dir, title)
         if existing_files:
             return str(existing_files[0].absolute())
         return None
@@ -55,7 +66,7 @@ class FileManager:
         Returns:
             str: Path to downloaded file or None if not found
         """
-        downloaded_files = list(uploader_dir.glob(f"{title}.*"))
+        downloaded_files = FileManager._completed_files(uploader_dir, title)
         if downloaded_files:
             return str(downloaded_files[0].absolute())
         return None
@@ -50,6 +50,8 @@ class YTDLPOptionsBuilder:
             'buffersize': 10240,  # Larger buffer size (10KB)
             'noresizebuffer': False,  # Allow automatic buffer resizing
             'http_chunk_size': 10485760,  # 10MB chunks for bypassing throttling
+            'continuedl': True,  # Resume an existing .part file with a Range request
+            'nopart': False,  # Write to .part files so interrupted downloads can resume
             'concurrent_fragment_downloads': 3,  # Concurrent fragment downloads
         }
 
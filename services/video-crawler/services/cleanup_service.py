@@ -2,23 +2,30 @@
 Video cleanup service for automatically removing old video files.
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import sqlite3
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from common_py.logging_config import configure_logging
 from config_loader import config
+from services.content_store import content_store
 from utils.file_cleanup import VideoCleanupManager
+from utils.file_index import FileIndex
 
 logger = configure_logging("video-crawler:cleanup_service")
 
+# Index of downloaded files shared by the downloaders and cleanup
+file_index = FileIndex(config.FILE_INDEX_PATH)
+
 
 class VideoCleanupService:
     """Service for managing automatic video cleanup."""
 
-    def __init__(self):
+    def __init__(self, index: Optional[FileIndex] = None):
         self.cleanup_manager = VideoCleanupManager(config.VIDEO_RETENTION_DAYS)
         self.enabled = config.CLEANUP_OLD_VIDEOS
+        self.file_index = index or file_index
 
     async def perform_cleanup(self, video_dir: str, dry_run: bool = False) -> Dict[str, Any]:
         """
@@ -61,16 +68,20 @@ class VideoCleanupService:
                 }
 
             # Clean up old files
-            cleanup_results = self.cleanup_manager.cleanup_old_files(video_dir, dry_run)
+            cleanup_results = await asyncio.to_thread(self._cleanup_files, video_dir, dry_run)
 
             # Clean up empty directories
             removed_dirs = self.cleanup_manager.cleanup_empty_directories(video_dir, dry_run)
 
+            # Keyframe cache entries follow the same retention policy
+            removed_cache_entries = content_store.evict_expired(config.VIDEO_RETENTION_DAYS, dry_run)
+
             # Combine results
             final_results = {
                 **cleanup_results,
                 'empty_dirs_removed': removed_dirs,
                 'total_dirs_removed': len(removed_dirs),
+                'cache_entries_removed': removed_cache_entries,
                 'enabled': True
             }
 
@@ -95,6 +106,27 @@ class VideoCleanupService:
                 'error': str(e),
             }
 
+    def _cleanup_files(self, video_dir: str, dry_run: bool) -> Dict[str, Any]:
+        """Remove files through the file index, or by listing the directory if it is unavailable."""
+        try:
+            return self.cleanup_manager.cleanup_indexed(
+                self.file_index,
+                video_dir,
+                dry_run,
+                max_total_bytes=int(config.VIDEO_STORAGE_BUDGET_GB * 1024 ** 3),
+                rescan_after_s=config.FILE_INDEX_RESCAN_HOURS * 3600,
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"[CLEANUP-INDEX-UNAVAILABLE] Falling back to a directory scan: {str(e)}")
+            return self.cleanup_manager.cleanup_old_files(video_dir, dry_run)
+
+    async def record_file(self, path: str, job_id: Optional[str] = None) -> None:
+        """Add a downloaded file to the index; failures only cost cleanup precision."""
+        try:
+            await asyncio.to_thread(self.file_index.record, path, job_id)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"[CLEANUP-INDEX-ERROR] Failed to index {path}: {str(e)}")
+
     async def get_cleanup_info(self, video_dir: str) -> Dict[str, Any]:
         """
         Get information about what would be cleaned up.
@@ -144,6 +176,7 @@ class VideoCleanupService:
         return {
             'enabled': self.enabled,
             'retention_days': config.VIDEO_RETENTION_DAYS,
+            'storage_budget_gb': config.VIDEO_STORAGE_BUDGET_GB,
             'video_dir': config.VIDEO_DIR
         }
 
@@ -175,60 +208,35 @@ class VideoCleanupService:
                     'error': 'Directory does not exist'
                 }
 
-            cutoff_date = datetime.now() - timedelta(days=days)
-            videos_removed = []
-            videos_skipped = []
-            total_size_freed = 0
-
-            # Scan for TikTok video files
-            for file_path in Path(tiktok_video_path).glob("*.mp4"):
-                try:
-                    # Check file modification time
-                    file_mod_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-
-                    if file_mod_time < cutoff_date:
-                        # Remove old video file
-                        file_size = file_path.stat().st_size
-                        file_path.unlink()
-
-                        videos_removed.append({
-                            'filename': file_path.name,
-                            'path': str(file_path),
-                            'size_bytes': file_size,
-                            'modified_time': file_mod_time.isoformat(),
-                            'days_old': (datetime.now() - file_mod_time).days
-                        })
-
-                        total_size_freed += file_size
-                        logger.info(
-                            f"[TIKTOK-CLEANUP] Removed old video: {file_path.name} "
-                            f"({file_size} bytes, {(datetime.now() - file_mod_time).days} days old)")
-                    else:
-                        videos_skipped.append({
-                            'filename': file_path.name,
-                            'path': str(file_path),
-                            'modified_time': file_mod_time.isoformat(),
-                            'days_old': (datetime.now() - file_mod_time).days
-                        })
-
-                except Exception as e:
-                    logger.error(f"[TIKTOK-CLEANUP] Error processing file {file_path}: {str(e)}")
-                    videos_skipped.append({
-                        'filename': file_path.name,
-                        'path': str(file_path),
-                        'error': str(e)
-                    })
-
-            logger.info(f"[TIKTOK-CLEANUP] Cleanup completed: {len(videos_removed)} videos removed, {len(videos_skipped)} videos kept")
+            results = await asyncio.to_thread(
+                VideoCleanupManager(days).cleanup_indexed,
+                self.file_index,
+                tiktok_video_path,
+                rescan_after_s=config.FILE_INDEX_RESCAN_HOURS * 3600,
+            )
+            videos_removed = [
+                {
+                    'filename': info['filename'],
+                    'path': info['path'],
+                    'size_bytes': info['file_size'],
+                    'modified_time': info['create_time'].isoformat(),
+                    'days_old': info['file_age_days']
+                }
+                for info in results['files_removed']
+            ]
+            videos_kept = await asyncio.to_thread(self.file_index.count, tiktok_video_path)
+
+            logger.info(f"[TIKTOK-CLEANUP] Cleanup completed: {len(videos_removed)} videos removed, {videos_kept} files kept")
 
             return {
                 'videos_removed': videos_removed,
-                'videos_skipped': videos_skipped,
-                'total_size_freed': total_size_freed,
-                'total_videos': len(videos_removed) + len(videos_skipped),
+                'videos_skipped': results['files_skipped'],
+                'videos_kept': videos_kept,
+                'total_size_freed': results['total_size_freed'],
+                'total_videos': len(videos_removed) + videos_kept,
                 'days_threshold': days,
                 'path': tiktok_video_path,
-                'size_freed_mb': total_size_freed / (1024 * 1024)
+                'size_freed_mb': results['total_size_freed'] / (1024 * 1024)
             }
 
         except Exception as e:
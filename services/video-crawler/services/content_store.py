@@ -0,0 +1,196 @@
+"""
+Content-addressed keyframe cache.
+
+Keyframes are stored under the SHA-256 of the video bytes and a key of the
+extractor settings, so the same clip found under another URL, video ID or
+platform reuses the frames of its first copy instead of being decoded again.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from common_py.logging_config import configure_logging
+from config_loader import config
+from utils.content_hash import compute_content_hash, read_content_hash
+
+logger = configure_logging("video-crawler:content_store")
+
+MANIFEST_NAME = "manifest.json"
+# Bump when the extractors change output for unchanged settings
+EXTRACTOR_VERSION = 1
+
+
+def extractor_settings_key() -> str:
+    """Short key identifying the keyframe extractor settings in effect."""
+    settings = {
+        "version": EXTRACTOR_VERSION,
+        "pyscenedetect": asdict(config.PYSCENEDETECT_SETTINGS),
+        "pyav": asdict(config.PYAV_SETTINGS),
+        "dedup": asdict(config.KEYFRAME_DEDUP_SETTINGS),
+    }
+    encoded = json.dumps(settings, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _link_or_copy(source: str, destination: str) -> None:
+    """Hard-link ``source`` to ``destination``, copying across filesystems."""
+    Path(destination).parent.mkdir(parents=True, exist_ok=True)
+    if os.path.lexists(destination):
+        if os.path.samefile(source, destination):
+            return
+        os.remove(destination)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+class ContentStore:
+    """Keyframes keyed by (video content hash, extractor settings)."""
+
+    def __init__(self, root: Optional[str] = None, enabled: Optional[bool] = None):
+        self.root = Path(root or config.CONTENT_CACHE_DIR)
+        self.enabled = config.CONTENT_CACHE_ENABLED if enabled is None else enabled
+        self.settings_key = extractor_settings_key()
+        self._locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
+
+    async def content_hash(self, video_path: Optional[str]) -> Optional[str]:
+        """SHA-256 of a local video, from its download sidecar or hashed from disk."""
+        if not self.enabled or not video_path or not os.path.isfile(video_path):
+            return None
+        return read_content_hash(video_path) or await asyncio.to_thread(compute_content_hash, video_path)
+
+    @asynccontextmanager
+    async def lock(self, content_hash: str) -> AsyncIterator[None]:
+        """Serialize extraction per content hash, so concurrent copies decode only once."""
+        lock, users = self._locks.get(content_hash) or (asyncio.Lock(), 0)
+        self._locks[content_hash] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._locks[content_hash]
+            if users > 1:
+                self._locks[content_hash] = (lock, users - 1)
+            else:
+                del self._locks[content_hash]
+
+    def entry_dir(self, content_hash: str) -> Path:
+        return self.root / "keyframes" / content_hash[:2] / content_hash / self.settings_key
+
+    async def get_keyframes(self, content_hash: str, keyframes_dir: str) -> Optional[List[Tuple[float, str]]]:
+        """Link the cached keyframes into ``keyframes_dir`` and return them, or None on a miss."""
+        try:
+            return await asyncio.to_thread(self._get_keyframes, content_hash, keyframes_dir)
+        except Exception as e:
+            logger.warning("Content cache lookup failed", content_hash=content_hash, error=str(e))
+            return None
+
+    async def put_keyframes(self, content_hash: str, keyframes: List[Tuple[float, str]]) -> bool:
+        """Store ``keyframes`` for ``content_hash``; returns False when nothing was stored."""
+        if not keyframes:
+            return False
+        try:
+            return await asyncio.to_thread(self._put_keyframes, content_hash, keyframes)
+        except Exception as e:
+            logger.warning("Content cache store failed", content_hash=content_hash, error=str(e))
+            return False
+
+    def _get_keyframes(self, content_hash: str, keyframes_dir: str) -> Optional[List[Tuple[float, str]]]:
+        entry = self.entry_dir(content_hash)
+        manifest_path = entry / MANIFEST_NAME
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+
+        frames = manifest.get("frames") or []
+        if not frames or not all((entry / frame["file"]).is_file() for frame in frames):
+            logger.warning("Discarding incomplete content cache entry", content_hash=content_hash)
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+
+        keyframes = []
+        for frame in frames:
+            destination = os.path.join(keyframes_dir, frame["file"])
+            _link_or_copy(str(entry / frame["file"]), destination)
+            keyframes.append((frame["ts"], destination))
+
+        # Hits keep the entry alive for the retention policy
+        os.utime(manifest_path)
+        return keyframes
+
+    def _put_keyframes(self, content_hash: str, keyframes: List[Tuple[float, str]]) -> bool:
+        entry = self.entry_dir(content_hash)
+        if (entry / MANIFEST_NAME).exists():
+            return False
+
+        staging = entry.with_name(f".{entry.name}.{os.getpid()}.{time.monotonic_ns()}")
+        try:
+            frames = []
+            for ts, frame_path in keyframes:
+                if not frame_path or not os.path.isfile(frame_path):
+                    return False
+                name = os.path.basename(frame_path)
+                _link_or_copy(frame_path, str(staging / name))
+                frames.append({"ts": ts, "file": name})
+
+            manifest = {"content_hash": content_hash, "settings_key": self.settings_key, "frames": frames}
+            (staging / MANIFEST_NAME).write_text(json.dumps(manifest), encoding="utf-8")
+            try:
+                os.rename(staging, entry)
+            except OSError:
+                # Another worker stored the same content first
+                return False
+            return True
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def evict_expired(self, retention_days: int, dry_run: bool = False) -> List[str]:
+        """Remove entries not stored or hit within ``retention_days``; returns their paths."""
+        keyframes_root = self.root / "keyframes"
+        if not keyframes_root.is_dir():
+            return []
+
+        cutoff = time.time() - retention_days * 86400
+        removed = []
+        for manifest_path in keyframes_root.glob(f"*/*/*/{MANIFEST_NAME}"):
+            try:
+                if manifest_path.stat().st_mtime >= cutoff:
+                    continue
+            except FileNotFoundError:
+                continue
+            entry = manifest_path.parent
+            removed.append(str(entry))
+            if not dry_run:
+                shutil.rmtree(entry, ignore_errors=True)
+
+        if not dry_run:
+            for directory in sorted(keyframes_root.glob("*/*"), reverse=True) + sorted(keyframes_root.glob("*")):
+                try:
+                    directory.rmdir()
+                except OSError:
+                    pass
+
+        if removed:
+            logger.info(f"[CACHE-CLEANUP] {'Would remove' if dry_run else 'Removed'} {len(removed)} keyframe cache entries")
+        return removed
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.enabled,
+            'root': str(self.root),
+            'settings_key': self.settings_key,
+        }
+
+
+# Global content store instance
+content_store = ContentStore()
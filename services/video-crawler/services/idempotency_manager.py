@@ -7,11 +7,12 @@ ensuring that duplicate videos and frames are not created or processed multiple
 
 import hashlib
 import asyncio
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
 
 from common_py.database import DatabaseManager
 from common_py.logging_config import configure_logging
+from common_py.models import Video
 
 logger = configure_logging("video-crawler:idempotency_manager")
 
@@ -281,6 +282,67 @@ class IdempotencyManager:
             logger.error(f"Error creating frame with idempotency: {e}")
             raise
 
+    @database_retry(max_attempts=3, delay=0.5)
+    async def create_frames_with_idempotency(
+        self,
+        video_id: str,
+        keyframes: Sequence[Tuple[float, str]],
+        video: Optional[Video] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Create all frame records of a video in one statement.
+
+        Frame ids follow ``create_frame_with_idempotency``. When ``video`` is
+        given, its row is inserted first in the same transaction so the frame
+        foreign key always holds.
+
+        Returns:
+            frame_id, ts and local_path of every requested frame, new or
+            already stored, ordered by timestamp
+        """
+        if not keyframes:
+            return []
+
+        frame_ids = [f"{video_id}_frame_{index}" for index in range(len(keyframes))]
+        timestamps = [float(timestamp) for timestamp, _ in keyframes]
+        local_paths = [local_path for _, local_path in keyframes]
+
+        async with self.db.pool.acquire() as conn:
+            async with conn.transaction():
+                if video is not None:
+                    await conn.execute(
+                        """
+                        INSERT INTO videos (video_id, platform, url, title, duration_s, created_at)
+                        VALUES ($1, $2, $3, $4, $5, NOW())
+                        ON CONFLICT (video_id, platform) DO NOTHING
+                        """,
+                        video_id, video.platform, video.url, video.title, video.duration_s
+                    )
+
+                # Existing rows come from the statement snapshot, which does not
+                # include the rows inserted by the CTE, so the union has no overlap
+                rows = await conn.fetch(
+                    """
+                    WITH input AS (
+                        SELECT * FROM unnest($1::text[], $3::float8[], $4::text[]) AS t(frame_id, ts, local_path)
+                    ), inserted AS (
+                        INSERT INTO video_frames (frame_id, video_id, ts, local_path, created_at)
+                        SELECT frame_id, $2, ts, local_path, NOW() FROM input
+                        ON CONFLICT (frame_id) DO NOTHING
+                        RETURNING frame_id, ts, local_path
+                    )
+                    SELECT frame_id, ts, local_path FROM inserted
+                    UNION ALL
+                    SELECT vf.frame_id, vf.ts, vf.local_path
+                    FROM video_frames vf JOIN input USING (frame_id)
+                    ORDER BY ts
+                    """,
+                    frame_ids, video_id, timestamps, local_paths
+                )
+
+        logger.info(f"Saved {len(rows)} frame records for video {video_id}")
+        return [dict(row) for row in rows]
+
     @staticmethod
     def calculate_file_hash(file_path: str) -> str:
         """Calculate SHA-256 hash of file for content verification."""
@@ -8,10 +8,12 @@ full idempotency and backward compatibility.
 
 from typing import Any, Dict, List, Optional
 import asyncio
+import os
 
 from common_py.database import DatabaseManager
 from common_py.logging_config import configure_logging
 from handlers.event_emitter import EventEmitter
+from platform_crawler.interface import PlatformCrawlerInterface
 from services.idempotency_manager import IdempotencyManager
 from services.streaming_pipeline import StreamingVideoPipeline, PipelineConfig
 from services.video_processor import VideoProcessor
@@ -36,7 +38,9 @@ class ParallelVideoService:
         db: DatabaseManager,
         event_emitter: Optional[EventEmitter] = None,
         job_progress_manager: Optional[JobProgressManager] = None,
-        config: Optional[PipelineConfig] = None
+        config: Optional[PipelineConfig] = None,
+        platform_crawlers: Optional[Dict[str, PlatformCrawlerInterface]] = None,
+        video_processor: Optional[VideoProcessor] = None
     ):
         self.db = db
         self.event_emitter = event_emitter
@@ -48,7 +52,7 @@ class ParallelVideoService:
 
         # Initialize components
         self.idempotency_manager = IdempotencyManager(db)
-        self.video_processor = VideoProcessor(
+        self.video_processor = video_processor or VideoProcessor(
             db=db,
             event_emitter=event_emitter,
             job_progress_manager=job_progress_manager,
@@ -57,7 +61,9 @@ class ParallelVideoService:
         self.pipeline = StreamingVideoPipeline(
             db=db,
             pipeline_config=config,
-            idempotency_manager=self.idempotency_manager
+            idempotency_manager=self.idempotency_manager,
+            platform_crawlers=platform_crawlers,
+            video_processor=self.video_processor
         )
 
     async def process_videos_parallel(
@@ -65,7 +71,11 @@ class ParallelVideoService:
         platform_queries: Dict[str, List[str]],
         job_id: str,
         use_streaming: bool = True,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        recency_days: Optional[int] = None,
+        num_videos: Optional[int] = None,
+        download_dirs: Optional[Dict[str, str]] = None,
+        max_concurrent_platforms: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Process videos using parallel approach.
@@ -74,11 +84,22 @@ class ParallelVideoService:
             platform_queries: Dictionary mapping platforms to search queries
             job_id: Job identifier for tracking
             use_streaming: Whether to use streaming approach (recommended)
+            recency_days: Search recency filter for the streaming pipeline
+            num_videos: Videos to search for per query in the streaming pipeline
+            download_dirs: Download directory per platform for the streaming pipeline
+            max_concurrent_platforms: Platforms searched at once by the streaming pipeline (-1 means no limit)
 
         Returns:
             Processing results with statistics
         """
         if use_streaming:
+            self.pipeline.configure_search(
+                recency_days=recency_days,
+                num_videos=num_videos,
+                download_dirs=download_dirs,
+                max_videos=self._integration_max_videos(job_id),
+                max_concurrent_platforms=max_concurrent_platforms
+            )
             return await self._process_videos_streaming(platform_queries, job_id, progress_callback)
         else:
             return await self._process_videos_batch(platform_queries, job_id)
@@ -178,18 +199,9 @@ class ParallelVideoService:
                     total_errors += 1
 
             # Integration workload throttling: apply env-driven slice once per job
-            try:
-                import os  # local import to avoid top-level changes
-                enforce_real = os.getenv("INTEGRATION_TESTS_ENFORCE_REAL_SERVICES", "").lower() == "true"
-                max_videos_env = os.getenv("PVM_MAX_VIDEOS_FOR_IT")
-                if enforce_real and max_videos_env:
-                    max_videos = int(max_videos_env)
-                    if max_videos > 0 and isinstance(all_videos, list):
-                        if len(all_videos) > max_videos:
-                            all_videos = all_videos[:max_videos]
-                        logger.info(f"Integration max videos applied: {max_videos} for job_id {job_id}")
-            except Exception as e:
-                logger.warning(f"Failed to apply integration workload limit in ParallelVideoService: {e}")
+            max_videos = self._integration_max_videos(job_id)
+            if max_videos and len(all_videos) > max_videos:
+                all_videos = all_videos[:max_videos]
 
             # Process videos in parallel batches
             semaphore = asyncio.Semaphore(self.config.max_concurrent_processing)
@@ -245,22 +257,34 @@ class ParallelVideoService:
             }
         }
 
+    def _integration_max_videos(self, job_id: str) -> Optional[int]:
+        """Per-job video cap for integration runs, from PVM_MAX_VIDEOS_FOR_IT."""
+        try:
+            enforce_real = os.getenv("INTEGRATION_TESTS_ENFORCE_REAL_SERVICES", "").lower() == "true"
+            max_videos_env = os.getenv("PVM_MAX_VIDEOS_FOR_IT")
+            if enforce_real and max_videos_env:
+                max_videos = int(max_videos_env)
+                if max_videos > 0:
+                    logger.info(f"Integration max videos applied: {max_videos} for job_id {job_id}")
+                    return max_videos
+        except Exception as e:
+            logger.warning(f"Failed to apply integration workload limit in ParallelVideoService: {e}")
+        return None
+
     async def _update_progress_callback(self, stats: Dict[str, Any]) -> None:
         """Callback for progress updates during processing."""
         if self.job_progress_manager:
-            # Update job progress based on current statistics
-            total_started = stats.get("processing_started", 0)
-            total_completed = stats.get("processing_completed", 0)
-
-            if total_started > 0:
-                _ = (total_completed / total_started) * 100
-
+            # search_results_found keeps growing while searches run; publishing it
+            # early would let the completed count reach a provisional total. Wait
+            # until it is final. VideoProcessor increments the completed count itself,
+            # and this update re-checks completion against the final total.
+            if not stats.get("searches_complete"):
+                return
+
+            expected = stats.get("search_results_found", 0)
+            if expected > 0:
                 await self.job_progress_manager.update_job_progress(
-                    job_id=self._current_job_id or stats.get("job_id", ""),
-                    item_type="video",
-                    completed=total_completed,
-                    total=total_started,
-                    phase="processing"
+                    self._current_job_id or stats.get("job_id", ""), "video", expected, 0, "crawling"
                 )
 
     async def get_processing_stats(self, job_id: Optional[str] = None) -> Dict[str, Any]:
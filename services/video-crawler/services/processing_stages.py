@@ -0,0 +1,31 @@
+"""Per-stage concurrency limits for the video processing pipeline."""
+
+import asyncio
+
+from config_loader import config
+
+
+class ProcessingStages:
+    """Semaphores bounding how many videos are in each processing stage.
+
+    One instance is shared by every job a crawler process handles, so the
+    limits cap total downloads, keyframe decodes and database writes for the
+    pod rather than per job.
+    """
+
+    def __init__(self, download: int, decode: int, db_write: int):
+        self.download_limit = max(1, download)
+        self.decode_limit = max(1, decode)
+        self.db_write_limit = max(1, db_write)
+
+        self.download = asyncio.Semaphore(self.download_limit)
+        self.decode = asyncio.Semaphore(self.decode_limit)
+        self.db_write = asyncio.Semaphore(self.db_write_limit)
+
+    @classmethod
+    def from_config(cls) -> "ProcessingStages":
+        return cls(
+            download=config.VIDEO_DOWNLOAD_CONCURRENCY,
+            decode=config.VIDEO_DECODE_CONCURRENCY,
+            db_write=config.VIDEO_DB_WRITE_CONCURRENCY,
+        )
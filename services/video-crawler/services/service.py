@@ -13,6 +13,7 @@ from platform_crawler.interface import PlatformCrawlerInterface
 from platform_crawler.mock_crawler import MockPlatformCrawler
 from platform_crawler.tiktok.tiktok_crawler import TikTokCrawler
 from platform_crawler.youtube.youtube_crawler import YoutubeCrawler
+from services.parallel_video_service import ParallelVideoService
 from services.platform_query_processor import PlatformQueryProcessor
 from services.video_cleanup_service import VideoCleanupService
 from services.video_processor import VideoProcessor
@@ -106,6 +107,16 @@ class VideoCrawlerService:
             # Prepare download directories
             platform_download_dirs = self._prepare_platform_download_dirs(platforms)
 
+            if config.VIDEO_STREAMING_PIPELINE:
+                await self._stream_and_emit_videos(
+                    platform_queries={platform: platform_queries for platform in platforms},
+                    recency_days=recency_days,
+                    platform_download_dirs=platform_download_dirs,
+                    job_id=job_id,
+                    correlation_id=correlation_id
+                )
+                return
+
             # Search and download videos
             all_videos = await self._search_platforms_parallel(
                 platforms=platforms,
@@ -237,27 +248,77 @@ class VideoCrawlerService:
     async def _process_and_emit_videos(self, all_videos: List[Dict[str, Any]], job_id: str, correlation_id: str) -> None:
         """Process all videos and emit completion events.
 
+        Each video emits its own ``videos.keyframes.ready`` event as soon as it
+        finishes; the batch event with the job totals follows once all videos
+        are done.
+
         Args:
             all_videos: List of video data to process
             job_id: Job identifier
         """
-        batch_payload: List[Dict[str, Any]] = []
-
-        # Process videos in parallel instead of sequentially
-        tasks = [self.video_processor.process_video(video_data, job_id) for video_data in all_videos]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Collect results, handling exceptions
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error("Video processing failed", error=str(result), job_id=job_id)
-                continue
-            # Only include videos that have frames in the batch payload
-            if result.get("video_id") and result.get("frames"):
-                batch_payload.append(result)
-
-        # Run automatic cleanup after video processing if enabled
-        await self.cleanup_service.run_auto_cleanup(job_id)
+        results = await self._process_videos_bounded(all_videos, job_id)
+        await self._emit_completion_events(results, job_id, correlation_id)
+
+    async def _stream_and_emit_videos(
+        self,
+        platform_queries: Dict[str, List[str]],
+        recency_days: int,
+        platform_download_dirs: Dict[str, str],
+        job_id: str,
+        correlation_id: str
+    ) -> None:
+        """Search, download and process videos through the streaming pipeline.
+
+        Downloads start as soon as the first search page arrives. Per-video
+        events are emitted by ``VideoProcessor`` exactly as in the batch path.
+
+        Args:
+            platform_queries: Queries for each platform
+            recency_days: Video recency filter in days
+            platform_download_dirs: Download directories per platform
+            job_id: Job identifier
+        """
+        # One pipeline per job: its queues and stats must not be shared between jobs
+        parallel_service = ParallelVideoService(
+            self.db,
+            event_emitter=self.event_emitter,
+            job_progress_manager=self.job_progress_manager,
+            platform_crawlers=self.platform_crawlers,
+            video_processor=self.video_processor
+        )
+        outcome = await parallel_service.process_videos_parallel(
+            platform_queries=platform_queries,
+            job_id=job_id,
+            use_streaming=True,
+            recency_days=recency_days,
+            num_videos=config.NUM_VIDEOS,
+            download_dirs=platform_download_dirs,
+            max_concurrent_platforms=config.MAX_CONCURRENT_PLATFORMS
+        )
+
+        if not outcome["stats"].get("search_results_found"):
+            await self._handle_zero_videos_case(job_id, correlation_id)
+            return
+
+        results = [
+            item["result"] for item in outcome["results"]
+            if item.get("type") == "video_processed"
+        ]
+        await self._emit_completion_events(results, job_id, correlation_id)
+
+        logger.info(
+            "Completed streaming video search",
+            job_id=job_id,
+            total_videos=outcome["stats"]["search_results_found"]
+        )
+
+    async def _emit_completion_events(self, results: List[Dict[str, Any]], job_id: str, correlation_id: str) -> None:
+        """Emit the batch and collections-completed events."""
+        # Only include videos that have frames in the batch payload
+        batch_payload: List[Dict[str, Any]] = [
+            result for result in results
+            if result.get("video_id") and result.get("frames")
+        ]
 
         # Emit batch completion events (only if there are videos with frames)
         if self.event_emitter and batch_payload:
@@ -266,6 +327,46 @@ class VideoCrawlerService:
         if self.event_emitter:
             await self.event_emitter.publish_videos_collections_completed(job_id, correlation_id)
 
+    async def _process_videos_bounded(self, all_videos: List[Dict[str, Any]], job_id: str) -> List[Dict[str, Any]]:
+        """Feed videos through a bounded queue to a fixed pool of workers.
+
+        At most ``VIDEO_PIPELINE_MAX_IN_FLIGHT`` videos are being processed at
+        once and the producer blocks while the queue is full, so a large job
+        never holds every download and decode open at the same time. The
+        download, decode and DB-write stages inside ``VideoProcessor`` apply
+        their own limits on top of this.
+
+        Returns:
+            Processing results in the order of ``all_videos``; failed videos are omitted
+        """
+        if not all_videos:
+            return []
+
+        max_in_flight = max(1, config.VIDEO_PIPELINE_MAX_IN_FLIGHT)
+        worker_count = min(max_in_flight, len(all_videos))
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_in_flight)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(all_videos)
+
+        async def produce() -> None:
+            for index, video_data in enumerate(all_videos):
+                await queue.put((index, video_data))
+            for _ in range(worker_count):
+                await queue.put(None)
+
+        async def work() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                index, video_data = item
+                try:
+                    results[index] = await self.video_processor.process_video(video_data, job_id)
+                except Exception as e:
+                    logger.error("Video processing failed", error=str(e), job_id=job_id)
+
+        await asyncio.gather(produce(), *(work() for _ in range(worker_count)))
+        return [result for result in results if result is not None]
+
     def _get_video_dir(self) -> str:
         """Get the video directory path.
 
@@ -6,18 +6,26 @@ they're found, allowing downloads and processing to start in parallel with ongoi
 """
 
 import asyncio
-from asyncio import Queue, Semaphore
+import itertools
+import os
+from contextlib import aclosing
+from asyncio import PriorityQueue, Queue, Semaphore
 from typing import Any, Dict, List, Optional, AsyncGenerator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from common_py.database import DatabaseManager
 from common_py.logging_config import configure_logging
 
+from config_loader import config as crawler_config
+from platform_crawler.interface import PlatformCrawlerInterface
 from services.idempotency_manager import IdempotencyManager
+from services.video_processor import VideoProcessor
 from fetcher.video_fetcher import VideoFetcher
 
 logger = configure_logging("video-crawler:streaming_pipeline")
 
+DEFAULT_RECENCY_DAYS = 30
+
 
 @dataclass
 class VideoTask:
@@ -26,6 +34,14 @@ class VideoTask:
     job_id: str
     platform: str
     priority: int = 0  # Higher priority = processed first
+    sequence: int = field(default=0, compare=False)  # FIFO tie-break within a priority
+
+    def __lt__(self, other: "VideoTask") -> bool:
+        return (-self.priority, self.sequence) < (-other.priority, other.sequence)
+
+
+# Queued behind every real task, telling a worker to exit
+_STOP = VideoTask(video_data={}, job_id="", platform="", priority=-1)
 
 
 @dataclass
@@ -44,24 +60,46 @@ class StreamingVideoPipeline:
     Async streaming pipeline for parallel video processing.
 
     The pipeline consists of three main stages:
-    1. Search → Results Stream (immediate emission)
+    1. Search → Results Stream (each search page is queued as it arrives)
     2. Download Queue → Parallel Downloads
-    3. Processing Queue → Parallel Keyframe Extraction
+    3. Processing Queue → Parallel Keyframe Extraction (``VideoProcessor``)
+
+    Both queues are priority queues, so short videos are downloaded and
+    processed ahead of long ones found by the same searches.
     """
 
     def __init__(
         self,
         db: DatabaseManager,
         pipeline_config: Optional[PipelineConfig] = None,
-        idempotency_manager: Optional[IdempotencyManager] = None
+        idempotency_manager: Optional[IdempotencyManager] = None,
+        platform_crawlers: Optional[Dict[str, PlatformCrawlerInterface]] = None,
+        video_processor: Optional[VideoProcessor] = None
     ):
         self.db = db
         self.config = pipeline_config or PipelineConfig()
         self.idempotency_manager = idempotency_manager or IdempotencyManager(db)
+        self.video_fetcher = VideoFetcher(platform_crawlers=platform_crawlers)
+        self.video_processor = video_processor or VideoProcessor(
+            db=db,
+            idempotency_manager=self.idempotency_manager
+        )
+
+        # Search parameters, see configure_search()
+        self.recency_days = DEFAULT_RECENCY_DAYS
+        self.num_videos = crawler_config.NUM_VIDEOS
+        self.download_dirs: Dict[str, str] = {}
+        self.max_videos: Optional[int] = None
+        self.max_concurrent_platforms = -1
+
+        # Set once every search has finished, i.e. search_results_found is final
+        self.searches_complete = False
 
         # Initialize queues and semaphores
-        self.download_queue: Queue[VideoTask] = Queue(maxsize=self.config.download_queue_size)
-        self.processing_queue: Queue[VideoTask] = Queue(maxsize=self.config.processing_queue_size)
+        self.download_queue: PriorityQueue[VideoTask] = PriorityQueue(maxsize=self.config.download_queue_size)
+        self.processing_queue: PriorityQueue[VideoTask] = PriorityQueue(maxsize=self.config.processing_queue_size)
+        self.results_queue: Queue[Optional[Dict[str, Any]]] = Queue()
+        self._sequence = itertools.count(1)
 
         self.download_semaphore = Semaphore(self.config.max_concurrent_downloads)
         self.processing_semaphore = Semaphore(self.config.max_concurrent_processing)
@@ -82,6 +120,31 @@ class StreamingVideoPipeline:
         self.processing_workers: List[asyncio.Task] = []
         self.is_running = False
 
+    def configure_search(
+        self,
+        recency_days: Optional[int] = None,
+        num_videos: Optional[int] = None,
+        download_dirs: Optional[Dict[str, str]] = None,
+        max_videos: Optional[int] = None,
+        max_concurrent_platforms: Optional[int] = None
+    ) -> None:
+        """
+        Set the search parameters used by the next streaming run.
+
+        ``max_videos`` caps the videos queued per run across all platforms;
+        searches stop once it is reached. ``max_concurrent_platforms`` limits
+        how many platforms are searched at once (-1 means no limit).
+        """
+        if recency_days is not None:
+            self.recency_days = recency_days
+        if num_videos is not None:
+            self.num_videos = num_videos
+        if download_dirs is not None:
+            self.download_dirs = dict(download_dirs)
+        self.max_videos = max_videos
+        if max_concurrent_platforms is not None:
+            self.max_concurrent_platforms = max_concurrent_platforms
+
     async def start_pipeline(self) -> None:
         """Start the background workers for the pipeline."""
         if self.is_running:
@@ -126,6 +189,12 @@ class StreamingVideoPipeline:
         self.download_workers.clear()
         self.processing_workers.clear()
 
+        # Drop anything left behind by an aborted run
+        for queue in (self.download_queue, self.processing_queue, self.results_queue):
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
+
         logger.info("Pipeline stopped")
 
     async def process_videos_streaming(
@@ -137,112 +206,156 @@ class StreamingVideoPipeline:
         """
         Process videos using streaming approach.
 
+        Downloads start as soon as the first search page is queued, while the
+        remaining queries are still being searched.
+
         Args:
             platform_queries: Dictionary mapping platforms to their search queries
             job_id: Job identifier for tracking
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback, called with the stats after each
+                queued search page, once all searches have finished
+                (``searches_complete`` is then True) and once at the end
 
         Yields:
-            Processing results as they complete
+            ``{"type": "video_processed", "platform": ..., "result": ...}`` for each
+            video as it finishes, then ``{"type": "pipeline_complete", "stats": ...}``
         """
+        self.searches_complete = False
         await self.start_pipeline()
+        coordinator = asyncio.create_task(
+            self._run_to_completion(platform_queries, job_id, progress_callback)
+        )
 
         try:
-            # Start parallel searches
-            search_tasks = []
-            for platform, queries in platform_queries.items():
-                search_task = asyncio.create_task(
-                    self._search_and_stream_results(platform, queries, job_id)
-                )
-                search_tasks.append(search_task)
-
-            # Wait for all searches to complete
-            await asyncio.gather(*search_tasks, return_exceptions=True)
-
-            # Signal completion by putting sentinel values
-            for _ in range(self.config.max_concurrent_downloads):
-                await self.download_queue.put(None)  # Sentinel value
+            while True:
+                item = await self.results_queue.get()
+                self.results_queue.task_done()
+                if item is None:
+                    break
+                yield item
 
-            # Wait for queues to be processed
-            await self.download_queue.join()
-            await self.processing_queue.join()
+            await coordinator
 
             # Final progress update
             if progress_callback:
-                await progress_callback(self.stats)
+                await progress_callback(self.get_stats())
 
-            yield {"type": "pipeline_complete", "stats": self.stats}
+            yield {"type": "pipeline_complete", "stats": self.get_stats()}
 
         finally:
+            if not coordinator.done():
+                coordinator.cancel()
+                await asyncio.gather(coordinator, return_exceptions=True)
             await self.stop_pipeline()
 
+    async def _run_to_completion(
+        self,
+        platform_queries: Dict[str, List[str]],
+        job_id: str,
+        progress_callback: Optional[callable] = None
+    ) -> None:
+        """Run all searches, then drain the download and processing stages in turn."""
+        limit = self.max_concurrent_platforms
+        platform_semaphore = Semaphore(limit if limit > 0 else max(1, len(platform_queries)))
+
+        async def search_platform(platform: str, queries: List[str]) -> None:
+            async with platform_semaphore:
+                await self._search_and_stream_results(platform, queries, job_id, progress_callback)
+
+        try:
+            await asyncio.gather(
+                *(search_platform(platform, queries) for platform, queries in platform_queries.items()),
+                return_exceptions=True
+            )
+
+            # The number of videos found is final from here on
+            self.searches_complete = True
+            if progress_callback:
+                await progress_callback(self.get_stats())
+
+            await self._stop_workers(self.download_queue, self.download_workers)
+            await self._stop_workers(self.processing_queue, self.processing_workers)
+        finally:
+            await self.results_queue.put(None)
+
+    async def _stop_workers(self, queue: PriorityQueue, workers: List[asyncio.Task]) -> None:
+        """Let ``workers`` finish the queued tasks and exit."""
+        for _ in workers:
+            await queue.put(_STOP)
+        await asyncio.gather(*workers, return_exceptions=True)
+
     async def _search_and_stream_results(
         self,
         platform: str,
         queries: List[str],
-        job_id: str
+        job_id: str,
+        progress_callback: Optional[callable] = None
     ) -> None:
         """
         Search for videos and stream results immediately to download queue.
 
-        This is the key innovation - results are queued as soon as found,
-        not waiting for the entire search to complete.
+        Each search page is queued as soon as it arrives, not after the
+        platform's whole search completes. ``put`` waits while the download
+        queue is full, which throttles the searches instead of dropping videos.
         """
+        download_dir = self.download_dirs.get(platform) or os.path.join(crawler_config.VIDEO_DIR, platform)
+
+        pages = self.video_fetcher.stream_platform_videos(
+            platform,
+            queries,
+            self.recency_days,
+            download_dir,
+            self.num_videos
+        )
         try:
-            video_fetcher = VideoFetcher(self.db)
-
-            for query in queries:
-                logger.info(f"Starting search for {platform}: {query}")
-
-                # Get search results - this might need to be modified to support streaming
-                # For now, we'll use the existing search but optimize the queuing
-                search_results = await video_fetcher.fetch_videos(platform, [query])
-
-                # Stream each result to download queue immediately
-                for video_data in search_results:
-                    task = VideoTask(
-                        video_data=video_data,
-                        job_id=job_id,
-                        platform=platform,
-                        priority=self._calculate_priority(video_data)
-                    )
-
-                    try:
+            async with aclosing(pages):
+                async for page in pages:
+                    logger.info(f"Queueing {len(page)} search results from {platform} for job {job_id}")
+
+                    for video_data in page:
+                        if self._video_limit_reached():
+                            break
+                        task = VideoTask(
+                            video_data=video_data,
+                            job_id=job_id,
+                            platform=platform,
+                            priority=self._calculate_priority(video_data),
+                            sequence=next(self._sequence)
+                        )
                         await self.download_queue.put(task)
                         self.stats["search_results_found"] += 1
 
-                    except asyncio.QueueFull:
-                        logger.warning(f"Download queue full, dropping video: {video_data.get('video_id')}")
-                        self.stats["errors"] += 1
+                    if progress_callback:
+                        await progress_callback(self.get_stats())
+
+                    if self._video_limit_reached():
+                        logger.info(f"Video limit of {self.max_videos} reached, stopping {platform} search for job {job_id}")
+                        break
 
         except Exception as e:
             logger.error(f"Error in search and stream for {platform}: {e}")
             self.stats["errors"] += 1
 
+    def _video_limit_reached(self) -> bool:
+        return bool(self.max_videos) and self.stats["search_results_found"] >= self.max_videos
+
     async def _download_worker(self, worker_name: str) -> None:
         """Background worker that downloads videos from the queue."""
         logger.info(f"Started {worker_name}")
 
-        while self.is_running:
+        while True:
+            task = await self.download_queue.get()
             try:
-                # Get task from queue with timeout
-                task = await asyncio.wait_for(
-                    self.download_queue.get(),
-                    timeout=1.0
-                )
-
-                if task is None:  # Sentinel value
+                if task is _STOP:
                     break
 
                 async with self.download_semaphore:
                     await self._download_video(task)
-                    self.download_queue.task_done()
 
-            except asyncio.TimeoutError:
-                continue  # Check if we should continue
             except Exception as e:
                 logger.error(f"Error in {worker_name}: {e}")
                 self.stats["errors"] += 1
+            finally:
                 self.download_queue.task_done()
 
         logger.info(f"Stopped {worker_name}")
@@ -251,26 +364,19 @@ class StreamingVideoPipeline:
         """Background worker that processes downloaded videos."""
         logger.info(f"Started {worker_name}")
 
-        while self.is_running:
+        while True:
+            task = await self.processing_queue.get()
             try:
-                # Get task from queue with timeout
-                task = await asyncio.wait_for(
-                    self.processing_queue.get(),
-                    timeout=1.0
-                )
-
-                if task is None:  # Sentinel value
+                if task is _STOP:
                     break
 
                 async with self.processing_semaphore:
                     await self._process_video(task)
-                    self.processing_queue.task_done()
 
-            except asyncio.TimeoutError:
-                continue  # Check if we should continue
             except Exception as e:
                 logger.error(f"Error in {worker_name}: {e}")
                 self.stats["errors"] += 1
+            finally:
                 self.processing_queue.task_done()
 
         logger.info(f"Stopped {worker_name}")
@@ -278,24 +384,28 @@ class StreamingVideoPipeline:
     async def _download_video(self, task: VideoTask) -> None:
         """Download a single video with idempotency checks."""
         try:
-            self.stats["downloads_started"] += 1
             video_data = task.video_data
             video_id = video_data.get("video_id")
             platform = task.platform
 
-            # Check if video already processed (idempotency)
-            if await self.idempotency_manager.check_video_exists(video_id, platform):
-                logger.info(f"Video already exists, skipping download: {video_id}")
-                self.stats["duplicates_skipped"] += 1
+            # Videos whose frames already exist need no download; the processor
+            # reuses the frames and links the video to this job
+            if (
+                await self.idempotency_manager.check_video_exists(video_id, platform)
+                and await self.idempotency_manager.get_existing_frames(video_id)
+            ):
+                logger.info(f"Video already processed, skipping download: {video_id}")
+                await self.processing_queue.put(task)
                 return
 
+            self.stats["downloads_started"] += 1
+
             # Check if file already exists locally
             existing_file = self._check_existing_file(video_data)
             if existing_file:
                 video_data["local_path"] = existing_file
                 logger.info(f"Video file already exists: {existing_file}")
             else:
-                # Download the video (implement platform-specific download logic)
                 downloaded_path = await self._download_video_file(video_data, platform)
                 if downloaded_path:
                     video_data["local_path"] = downloaded_path
@@ -313,35 +423,25 @@ class StreamingVideoPipeline:
             self.stats["errors"] += 1
 
     async def _process_video(self, task: VideoTask) -> None:
-        """Process a downloaded video (keyframe extraction) with idempotency."""
+        """Extract and persist keyframes for a downloaded video and publish the result."""
         try:
             self.stats["processing_started"] += 1
-            video_data = task.video_data
-            video_id = video_data.get("video_id")
-            platform = task.platform
 
-            # Create video record with idempotency
-            created_new, actual_video_id = await self.idempotency_manager.create_video_with_idempotency(
-                video_id=video_id,
-                platform=platform,
-                url=video_data.get("url"),
-                title=video_data.get("title"),
-                duration_s=video_data.get("duration_s"),
-                job_id=task.job_id
-            )
+            result = await self.video_processor.process_video(task.video_data, task.job_id)
 
-            if not created_new:
-                logger.info(f"Video record already exists, skipping processing: {video_id}")
+            if result.get("skipped"):
                 self.stats["duplicates_skipped"] += 1
-                return
-
-            # Process keyframes (this would use the existing video processor)
-            # For now, we'll create a placeholder
-            frames_data = await self._extract_keyframes_with_idempotency(video_data, actual_video_id)
-
-            self.stats["processing_completed"] += 1
+            elif result.get("video_id"):
+                self.stats["processing_completed"] += 1
+                logger.info(f"Completed processing video: {result['video_id']}, frames: {len(result.get('frames', []))}")
+            else:
+                self.stats["errors"] += 1
 
-            logger.info(f"Completed processing video: {actual_video_id}, frames: {len(frames_data)}")
+            await self.results_queue.put({
+                "type": "video_processed",
+                "platform": task.platform,
+                "result": result
+            })
 
         except Exception as e:
             logger.error(f"Error processing video {task.video_data.get('video_id')}: {e}")
@@ -350,7 +450,7 @@ class StreamingVideoPipeline:
     def _calculate_priority(self, video_data: Dict[str, Any]) -> int:
         """Calculate processing priority based on video characteristics."""
         # Simple priority based on duration - shorter videos get higher priority
-        duration = video_data.get("duration_s", 0)
+        duration = video_data.get("duration_s") or 0
         if duration < 30:
             return 3  # High priority for short videos
         elif duration < 120:
@@ -359,25 +459,24 @@ class StreamingVideoPipeline:
             return 1  # Low priority for long videos
 
     def _check_existing_file(self, video_data: Dict[str, Any]) -> Optional[str]:
-        """Check if video file already exists locally."""
-        # This would integrate with existing file management logic
-        # For now, return None to indicate no existing file
+        """Return the video's local file if a crawler already downloaded it."""
+        local_path = video_data.get("local_path")
+        if local_path and os.path.exists(local_path):
+            return local_path
         return None
 
     async def _download_video_file(self, video_data: Dict[str, Any], platform: str) -> Optional[str]:
-        """Download video file - platform-specific implementation."""
-        # This would integrate with existing download logic
-        # For now, return None as placeholder
-        logger.info(f"Would download video: {video_data.get('video_id')} on {platform}")
-        return None
+        """Download the video with its platform crawler and merge the returned metadata."""
+        download_dir = self.download_dirs.get(platform) or os.path.join(crawler_config.VIDEO_DIR, platform)
+        downloaded = await self.video_fetcher.download_video(platform, video_data, download_dir)
+        if not downloaded or not downloaded.get("local_path"):
+            return None
 
-    async def _extract_keyframes_with_idempotency(self, video_data: Dict[str, Any], video_id: str) -> List[Dict[str, Any]]:
-        """Extract keyframes with idempotency checks."""
-        # This would integrate with existing keyframe extraction logic
-        # For now, return empty list as placeholder
-        logger.info(f"Would extract keyframes for video: {video_id}")
-        return []
+        video_data.update(downloaded)
+        return downloaded["local_path"]
 
     def get_stats(self) -> Dict[str, Any]:
         """Get current pipeline statistics."""
-        return self.stats.copy()
+        stats = self.stats.copy()
+        stats["searches_complete"] = self.searches_complete
+        return stats
@@ -1,5 +1,6 @@
 """Video cleanup operations extracted from main service."""
 
+import asyncio
 from typing import Any, Dict, Optional
 
 from common_py.logging_config import configure_logging
@@ -42,6 +43,20 @@ class VideoCleanupService:
         except Exception as e:
             logger.error(f"[AUTO-CLEANUP-ERROR] Failed to run cleanup for job {job_id}: {str(e)}")
 
+    async def run_periodic_cleanup(self, interval_s: float) -> None:
+        """Run automatic cleanup every ``interval_s`` seconds until cancelled."""
+        while True:
+            await self.run_auto_cleanup("background")
+            await asyncio.sleep(interval_s)
+
+    def start_background_cleanup(self) -> Optional[asyncio.Task]:
+        """Schedule periodic cleanup off the job path; returns None when cleanup is disabled."""
+        if not config.CLEANUP_OLD_VIDEOS:
+            return None
+        interval_s = max(config.CLEANUP_INTERVAL_MINUTES, 1) * 60
+        logger.info(f"[AUTO-CLEANUP] Running cleanup in the background every {interval_s // 60} minutes")
+        return asyncio.create_task(self.run_periodic_cleanup(interval_s), name="video_cleanup")
+
     async def run_manual_cleanup(self, dry_run: bool = False) -> Dict[str, Any]:
         """Run manual cleanup for debugging/testing purposes.
 
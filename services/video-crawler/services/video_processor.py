@@ -2,7 +2,6 @@
 
 import os
 import uuid
-import asyncio
 from typing import Any, Dict, List, Optional, Tuple
 
 from common_py.crud import VideoCRUD, VideoFrameCRUD
@@ -14,7 +13,10 @@ from config_loader import config
 from handlers.event_emitter import EventEmitter
 from keyframe_extractor.router import build_keyframe_extractor
 from platform_crawler.tiktok.tiktok_downloader import TikTokDownloader
+from services.cleanup_service import cleanup_service
+from services.content_store import ContentStore, content_store as default_content_store
 from services.idempotency_manager import IdempotencyManager
+from services.processing_stages import ProcessingStages
 # Unused exceptions imported but not used in this file
 # from services.exceptions import VideoProcessingError, VideoDownloadError, DatabaseOperationError
 from vision_common import JobProgressManager
@@ -31,16 +33,21 @@ class VideoProcessor:
         event_emitter: Optional[EventEmitter] = None,
         job_progress_manager: Optional[JobProgressManager] = None,
         video_dir_override: Optional[str] = None,
-        idempotency_manager: Optional[IdempotencyManager] = None
+        idempotency_manager: Optional[IdempotencyManager] = None,
+        stages: Optional[ProcessingStages] = None,
+        content_store: Optional[ContentStore] = None
     ):
         self.db = db
         self.event_emitter = event_emitter
         self.job_progress_manager = job_progress_manager
         self._video_dir_override = video_dir_override
         self.idempotency_manager = idempotency_manager or IdempotencyManager(db)
+        self.stages = stages or ProcessingStages.from_config()
+        self.content_store = content_store or default_content_store
 
         self.video_crud = VideoCRUD(db) if db else None
         self.frame_crud = VideoFrameCRUD(db) if db else None
+        self.keyframe_dir = config.KEYFRAME_DIR
         self.keyframe_extractor = build_keyframe_extractor(create_dirs=False)
 
     async def process_video(self, video_data: Dict[str, Any], job_id: str) -> Dict[str, Any]:
@@ -67,7 +74,8 @@ class VideoProcessor:
                 # Re-raise to be handled by outer exception handler
                 raise
 
-            video, created_new = await self._create_and_save_video_record(video_data, job_id)
+            async with self.stages.db_write:
+                video, created_new = await self._create_and_save_video_record(video_data, job_id)
 
             # If video already existed, check if frames already processed
             if not created_new:
@@ -107,6 +115,9 @@ class VideoProcessor:
             else:
                 keyframes_data = await self._process_standard_video(video, video_data)
 
+            if video_data.get("local_path"):
+                await cleanup_service.record_file(video_data["local_path"], job_id=job_id)
+
             await self._emit_keyframes_ready_event(video, keyframes_data, job_id)
             await self._update_progress(job_id)
 
@@ -151,12 +162,8 @@ class VideoProcessor:
             video.has_download = True
             # Extract keyframes from existing local file
             try:
-                keyframes = await self.keyframe_extractor.extract_keyframes(
-                    video_url="",
-                    video_id=video.video_id,
-                    local_path=local_path
-                )
-                return await self._save_keyframes(keyframes, video.video_id)
+                keyframes = await self._extract_keyframes(video.video_id, local_path)
+                return await self._persist_keyframes(keyframes, video)
             except Exception as e:
                 logger.error(f"Failed to extract keyframes from existing video {video.video_id}: {e}")
                 return []
@@ -169,17 +176,27 @@ class VideoProcessor:
             "TIKTOK_CRAWL_HOST_PORT": config.TIKTOK_CRAWL_HOST_PORT,
             "TIKTOK_DOWNLOAD_STRATEGY": config.TIKTOK_DOWNLOAD_STRATEGY,
             "TIKTOK_DOWNLOAD_TIMEOUT": config.TIKTOK_DOWNLOAD_TIMEOUT,
+            "TIKTOK_HTTP_MAX_CONNECTIONS": config.TIKTOK_HTTP_MAX_CONNECTIONS,
+            "TIKTOK_HTTP_PER_HOST_LIMIT": config.TIKTOK_HTTP_PER_HOST_LIMIT,
+            "TIKTOK_HTTP2": config.TIKTOK_HTTP2,
+            "TIKTOK_DOWNLOAD_RESUME_ATTEMPTS": config.TIKTOK_DOWNLOAD_RESUME_ATTEMPTS,
+            "TIKTOK_DOWNLOAD_PARALLEL_RANGES": config.TIKTOK_DOWNLOAD_PARALLEL_RANGES,
             "retries": 3,
             "timeout": 30
         }
 
         downloader = TikTokDownloader(tiktok_config)
-        success = await downloader.orchestrate_download_and_extract(
-            url=video_data["url"],
-            video_id=video.video_id,
-            video=video,
-            db=self.db
-        )
+        try:
+            # The downloader enters the download, decode and DB-write limits per step
+            success = await downloader.orchestrate_download_and_extract(
+                url=video_data["url"],
+                video_id=video.video_id,
+                video=video,
+                db=self.db,
+                stages=self.stages
+            )
+        finally:
+            await downloader.close()
 
         logger.info(f"TikTok download and extraction result for video {video.video_id}: success={success}")
 
@@ -207,14 +224,10 @@ class VideoProcessor:
                     logger.warning(f"No frames found in database for video {video.video_id}, attempting fallback extraction")
                     if video.local_path:
                         try:
-                            keyframes = await self.keyframe_extractor.extract_keyframes(
-                                video_url="",
-                                video_id=video.video_id,
-                                local_path=video.local_path
-                            )
+                            keyframes = await self._extract_keyframes(video.video_id, video.local_path)
                             if keyframes:
                                 logger.info(f"Fallback extraction successful for video {video.video_id}: {len(keyframes)} keyframes")
-                                return await self._save_keyframes(keyframes, video.video_id)
+                                return await self._persist_keyframes(keyframes, video)
                             else:
                                 logger.warning(f"Fallback extraction also returned no keyframes for video {video.video_id}")
                         except Exception as fallback_error:
@@ -229,13 +242,51 @@ class VideoProcessor:
         """Process standard video (YouTube, etc.) with keyframe extraction."""
         local_path = video_data.get("local_path")
 
-        keyframes = await self.keyframe_extractor.extract_keyframes(
-            video_url=video_data.get("url", ""),
-            video_id=video.video_id,
-            local_path=local_path
+        keyframes = await self._extract_keyframes(
+            video.video_id,
+            local_path,
+            video_url=video_data.get("url", "")
         )
 
-        return await self._save_keyframes(keyframes, video.video_id)
+        return await self._persist_keyframes(keyframes, video)
+
+    async def _extract_keyframes(
+        self,
+        video_id: str,
+        local_path: Optional[str],
+        video_url: str = ""
+    ) -> List[tuple]:
+        """Run keyframe extraction inside the decode stage limit.
+
+        A video whose content was decoded before, under any video ID, gets the
+        cached keyframes linked into its own keyframe directory instead.
+        """
+        content_hash = await self.content_store.content_hash(local_path)
+        if not content_hash:
+            return await self._decode_keyframes(video_id, local_path, video_url)
+
+        async with self.content_store.lock(content_hash):
+            cached = await self.content_store.get_keyframes(content_hash, os.path.join(self.keyframe_dir, video_id))
+            if cached:
+                logger.info("Reusing cached keyframes", video_id=video_id, content_hash=content_hash, frame_count=len(cached))
+                return cached
+
+            keyframes = await self._decode_keyframes(video_id, local_path, video_url)
+            await self.content_store.put_keyframes(content_hash, keyframes)
+            return keyframes
+
+    async def _decode_keyframes(self, video_id: str, local_path: Optional[str], video_url: str) -> List[tuple]:
+        async with self.stages.decode:
+            return await self.keyframe_extractor.extract_keyframes(
+                video_url=video_url,
+                video_id=video_id,
+                local_path=local_path
+            )
+
+    async def _persist_keyframes(self, keyframes: List[tuple], video: Video) -> List[Dict[str, Any]]:
+        """Save keyframes inside the DB-write stage limit."""
+        async with self.stages.db_write:
+            return await self._save_keyframes(keyframes, video.video_id, video)
 
     async def _create_and_save_video_record(self, video_data: Dict[str, Any], job_id: str) -> Tuple[Video, bool]:
         """Create and save video record to database with idempotency.
@@ -296,94 +347,35 @@ class VideoProcessor:
 
         return video, created_new
 
-    async def _save_keyframes(self, keyframes: List[tuple], video_id: str) -> List[Dict[str, Any]]:
-        """Save keyframes to database with idempotency and FK‑resilient retry, then return frame data."""
-        frame_data = []
+    async def _save_keyframes(
+        self,
+        keyframes: List[tuple],
+        video_id: str,
+        video: Optional[Video] = None
+    ) -> List[Dict[str, Any]]:
+        """Save all keyframes of a video in one statement and return their frame data.
+
+        Frames stored by an earlier run are returned as stored. When ``video``
+        is given its row is inserted in the same transaction, so the frames
+        never reference a parent that is not visible yet.
+        """
+        if not keyframes:
+            return []
 
-        # Ensure parent video visibility/commit before inserting frames (short bounded check)
         try:
-            video_visible = False
-            elapsed = 0.0
-            delay = 0.2
-            max_wait = 2.0
-            while elapsed < max_wait:
-                v = await (self.video_crud.get_video(video_id) if self.video_crud else None)  # type: ignore
-                if v:
-                    video_visible = True
-                    break
-                await asyncio.sleep(delay)
-                elapsed += delay
-                delay = min(delay * 2, 2.0)
-            if not video_visible:
-                logger.warning("Parent video not yet visible before frame inserts", video_id=video_id)
+            return await self.idempotency_manager.create_frames_with_idempotency(
+                video_id=video_id,
+                keyframes=keyframes,
+                video=video
+            )
         except Exception as e:
-            logger.warning(f"Video visibility check failed for {video_id}: {e}")
-
-        for i, (timestamp, frame_path) in enumerate(keyframes):
-            # FK‑resilient insert with bounded backoff on SQLSTATE 23503 (foreign key violation)
-            attempts = 0
-            elapsed = 0.0
-            delay = 0.2
-            max_total = 20.0
-            while True:
-                try:
-                    created_new, frame_id = await self.idempotency_manager.create_frame_with_idempotency(  # type: ignore
-                        video_id=video_id,
-                        frame_index=i,
-                        timestamp=timestamp,
-                        local_path=frame_path
-                    )
-                    if created_new:
-                        frame_data.append({
-                            "frame_id": frame_id,
-                            "ts": timestamp,
-                            "local_path": frame_path
-                        })
-                    else:
-                        # Frame already exists, fetch its data
-                        existing_frames = await self.idempotency_manager.get_existing_frames(video_id)  # type: ignore
-                        existing_frame_data = next((f for f in existing_frames if f["frame_id"] == frame_id), None)
-                        if existing_frame_data:
-                            frame_data.append(existing_frame_data)
-                    break  # success
-                except Exception as e:
-                    sqlstate = getattr(e, "sqlstate", "")
-                    msg = str(e).lower()
-                    is_fk_violation = (sqlstate == "23503") or ("foreign key violation" in msg)
-                    if is_fk_violation:
-                        attempts += 1
-                        if elapsed >= max_total:
-                            logger.error(
-                                "FK violation persists, skipping frame insert after retries",
-                                video_id=video_id,
-                                frame_index=i,
-                                ts=timestamp,
-                                attempts=attempts
-                            )
-                            break
-                        logger.warning(
-                            "FK violation on frame insert, retrying with backoff",
-                            video_id=video_id,
-                            frame_index=i,
-                            ts=timestamp,
-                            attempts=attempts
-                        )
-                        await asyncio.sleep(delay)
-                        elapsed += delay
-                        delay = min(delay * 2, 2.0)
-                        continue
-                    else:
-                        # Non‑FK error: log and skip this frame, do not crash pipeline
-                        logger.error(
-                            "Unexpected error on frame insert; skipping frame",
-                            video_id=video_id,
-                            frame_index=i,
-                            ts=timestamp,
-                            error=str(e)
-                        )
-                        break
-
-        return frame_data
+            logger.error(
+                "Failed to save keyframes",
+                video_id=video_id,
+                frame_count=len(keyframes),
+                error=str(e)
+            )
+            return []
 
     async def _emit_keyframes_ready_event(
         self,
@@ -412,6 +404,7 @@ class VideoProcessor:
 
     def initialize_keyframe_extractor(self, keyframe_dir: Optional[str] = None) -> None:
         """Initialize keyframe extractor with specific directory."""
+        self.keyframe_dir = keyframe_dir or config.KEYFRAME_DIR
         self.keyframe_extractor = build_keyframe_extractor(
             keyframe_dir=keyframe_dir,
             create_dirs=True
@@ -49,7 +49,8 @@ def extractor(temp_dir):
         min_blur_threshold=10.0,
         frame_quality=90,
         frame_format="jpg",
-        max_scenes=0
+        max_scenes=0,
+        single_pass=False,
     )
     return PySceneDetectKeyframeExtractor(keyframe_root_dir=temp_dir, settings=settings)
 
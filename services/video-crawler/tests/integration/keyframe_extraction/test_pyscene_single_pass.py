@@ -0,0 +1,78 @@
+"""Integration tests for the single-pass PySceneDetect extraction path."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+pytest.importorskip("scenedetect")
+
+from config_loader import PySceneDetectSettings  # noqa: E402
+from keyframe_extractor.pyscene_detect_extractor import PySceneDetectKeyframeExtractor  # noqa: E402
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def temp_dir():
+    path = tempfile.mkdtemp()
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _write_video(path: Path, scene_colors, frames_per_scene: int = 60) -> str:
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), 30, (320, 240))
+    for color in scene_colors:
+        for i in range(frames_per_scene):
+            frame = np.full((240, 320, 3), color, dtype=np.uint8)
+            cv2.rectangle(frame, (40, 40), (280, 200), (255 - color[0], 255, 0), 3)
+            cv2.putText(frame, f"F{i}", (100, 130), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+            writer.write(frame)
+    writer.release()
+    return str(path)
+
+
+def _extractor(temp_dir: str, **overrides) -> PySceneDetectKeyframeExtractor:
+    settings = PySceneDetectSettings(
+        adaptive_threshold=1.5,
+        min_scene_len=10,
+        window_width=2,
+        min_content_val=10.0,
+        min_blur_threshold=10.0,
+        frame_skip=0,
+        max_scenes=0,
+        candidate_buffer_size=8,
+        candidate_max_side=160,
+        **overrides,
+    )
+    return PySceneDetectKeyframeExtractor(keyframe_root_dir=temp_dir, settings=settings)
+
+
+@pytest.mark.asyncio
+async def test_single_pass_picks_one_frame_per_scene(temp_dir):
+    video = _write_video(Path(temp_dir) / "cuts.mp4", [(20, 20, 20), (230, 230, 230), (20, 120, 230)])
+    extractor = _extractor(temp_dir)
+
+    frames = await extractor.extract_keyframes("", "video_cuts", video)
+
+    assert len(frames) == 3
+    timestamps = [ts for ts, _ in frames]
+    assert timestamps[0] < 2.0 < timestamps[1] < 4.0 < timestamps[2] < 6.0
+    for _, path in frames:
+        image = cv2.imread(path)
+        assert image is not None
+        assert max(image.shape[:2]) <= 160
+
+
+@pytest.mark.asyncio
+async def test_single_pass_without_cuts_spreads_frames(temp_dir):
+    video = _write_video(Path(temp_dir) / "static.mp4", [(60, 60, 60)], frames_per_scene=240)
+    extractor = _extractor(temp_dir)
+
+    frames = await extractor.extract_keyframes("", "video_static", video)
+
+    assert len(frames) == 3
+    assert len({path for _, path in frames}) == 3
@@ -69,13 +69,15 @@ class StubDetector(CodecDetector):
 
 
 @pytest.mark.asyncio
-async def test_pyav_extractor_extracts_frames(sample_video: str, temp_dir: str):
+@pytest.mark.parametrize("decode_mode", ["single_pass", "per_timestamp"])
+async def test_pyav_extractor_extracts_frames(sample_video: str, temp_dir: str, decode_mode: str):
     settings = PyAVSettings(
         frame_quality=80,
         min_blur_threshold=1.0,
         max_frames=4,
         boundary_guard_seconds=0.1,
         seek_tolerance_seconds=0.5,
+        decode_mode=decode_mode,
     )
     extractor = PyAVKeyframeExtractor(keyframe_root_dir=temp_dir, settings=settings)
 
@@ -5,7 +5,7 @@ Tests database-level and file-level idempotency functionality.
 """
 
 import pytest
-from unittest.mock import patch, mock_open
+from unittest.mock import AsyncMock, MagicMock, patch, mock_open
 
 pytestmark = pytest.mark.integration
 
@@ -375,3 +375,58 @@ class TestIdempotencyManagerIntegration:
 
         with pytest.raises(Exception):
             await idempotency_manager.create_frame_with_idempotency("test", 0, 0.0, "/path")
+
+
+class TestBulkFrameIdempotency:
+    """Test inserting all frames of a video in one statement."""
+
+    @staticmethod
+    def _pool_with_connection(rows):
+        conn = MagicMock()
+        conn.execute = AsyncMock()
+        conn.fetch = AsyncMock(return_value=rows)
+        pool = MagicMock()
+        pool.acquire.return_value.__aenter__.return_value = conn
+        return pool, conn
+
+    @pytest.mark.asyncio
+    async def test_create_frames_inserts_video_and_frames_in_one_transaction(self, idempotency_manager, mock_db):
+        from common_py.models import Video
+
+        rows = [
+            {"frame_id": "vid_frame_0", "ts": 0.0, "local_path": "/f0.jpg"},
+            {"frame_id": "vid_frame_1", "ts": 5.0, "local_path": "/f1.jpg"},
+        ]
+        mock_db.pool, conn = self._pool_with_connection(rows)
+        video = Video(video_id="vid", platform="youtube", url="https://youtube.com/vid", title="t", duration_s=10)
+
+        frames = await idempotency_manager.create_frames_with_idempotency(
+            "vid", [(0, "/f0.jpg"), (5, "/f1.jpg")], video=video
+        )
+
+        assert frames == rows
+        conn.transaction.assert_called_once()
+        assert "INSERT INTO videos" in conn.execute.call_args.args[0]
+        sql, frame_ids, video_id, timestamps, local_paths = conn.fetch.call_args.args
+        assert "unnest" in sql and "ON CONFLICT (frame_id) DO NOTHING" in sql
+        assert frame_ids == ["vid_frame_0", "vid_frame_1"]
+        assert video_id == "vid"
+        assert timestamps == [0.0, 5.0]
+        assert local_paths == ["/f0.jpg", "/f1.jpg"]
+        conn.fetch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_frames_without_video_skips_parent_insert(self, idempotency_manager, mock_db):
+        mock_db.pool, conn = self._pool_with_connection([])
+
+        await idempotency_manager.create_frames_with_idempotency("vid", [(0.0, "/f0.jpg")])
+
+        conn.execute.assert_not_called()
+        conn.fetch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_frames_empty(self, idempotency_manager, mock_db):
+        mock_db.pool, conn = self._pool_with_connection([])
+
+        assert await idempotency_manager.create_frames_with_idempotency("vid", []) == []
+        conn.fetch.assert_not_called()
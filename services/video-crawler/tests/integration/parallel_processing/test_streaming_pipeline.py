@@ -7,7 +7,7 @@ queue operations, and parallel processing coordination.
 
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 from services.streaming_pipeline import StreamingVideoPipeline, PipelineConfig, VideoTask
 
@@ -193,6 +193,26 @@ class TestQueueOperations:
                 VideoTask(video_data=sample_video_data_list[-1], job_id="test_job", platform="youtube")
             )
 
+    @pytest.mark.asyncio
+    async def test_download_queue_serves_short_videos_first(self, streaming_pipeline):
+        """Test higher priority (shorter) videos leave the queue first, FIFO within a priority."""
+        durations = [300, 20, 60, 25, 400]
+        for sequence, duration in enumerate(durations):
+            video_data = {"video_id": f"v{sequence}", "duration_s": duration}
+            await streaming_pipeline.download_queue.put(VideoTask(
+                video_data=video_data,
+                job_id="test_job",
+                platform="youtube",
+                priority=streaming_pipeline._calculate_priority(video_data),
+                sequence=sequence
+            ))
+
+        order = []
+        while not streaming_pipeline.download_queue.empty():
+            order.append((await streaming_pipeline.download_queue.get()).video_data["video_id"])
+
+        assert order == ["v1", "v3", "v2", "v0", "v4"]
+
 
 class TestWorkerFunctionality:
     """Test worker functionality and error handling."""
@@ -231,24 +251,38 @@ class TestWorkerFunctionality:
 
     @pytest.mark.asyncio
     async def test_download_worker_with_duplicate_video(self, streaming_pipeline, sample_video_data):
-        """Test download worker skips duplicate videos."""
-        # Mock idempotency manager to return existing video
+        """Test already processed videos skip the download but still reach processing for this job."""
         streaming_pipeline.idempotency_manager.check_video_exists = AsyncMock(return_value=True)
-
-        # Mock the processing queue put method
-        original_put = streaming_pipeline.processing_queue.put
-        streaming_pipeline.processing_queue.put = MagicMock()
+        streaming_pipeline.idempotency_manager.get_existing_frames = AsyncMock(return_value=[
+            {"frame_id": "existing_frame", "ts": 0.0, "local_path": "/path/to/frame.jpg"}
+        ])
+        streaming_pipeline._download_video_file = AsyncMock()
+        streaming_pipeline.processing_queue.put = AsyncMock()
 
         task = VideoTask(video_data=sample_video_data, job_id="test_job", platform="youtube")
 
         await streaming_pipeline._download_video(task)
 
-        # Verify task was not queued for processing
-        streaming_pipeline.processing_queue.put.assert_not_called()
-        assert streaming_pipeline.stats["duplicates_skipped"] == 1
+        streaming_pipeline._download_video_file.assert_not_called()
+        streaming_pipeline.processing_queue.put.assert_called_once_with(task)
+        assert streaming_pipeline.stats["downloads_started"] == 0
 
-        # Restore original method
-        streaming_pipeline.processing_queue.put = original_put
+    @pytest.mark.asyncio
+    async def test_download_video_file_uses_platform_fetcher(self, streaming_pipeline, sample_video_data):
+        """Test downloads go through the platform crawler and merge its metadata."""
+        streaming_pipeline.configure_search(download_dirs={"youtube": "/videos/youtube"})
+        streaming_pipeline.video_fetcher.download_video = AsyncMock(return_value={
+            **sample_video_data, "local_path": "/videos/youtube/test_video_123.mp4"
+        })
+        video_data = dict(sample_video_data)
+
+        path = await streaming_pipeline._download_video_file(video_data, "youtube")
+
+        assert path == "/videos/youtube/test_video_123.mp4"
+        assert video_data["local_path"] == path
+        streaming_pipeline.video_fetcher.download_video.assert_called_once_with(
+            "youtube", video_data, "/videos/youtube"
+        )
 
     @pytest.mark.asyncio
     async def test_download_worker_download_failure(self, streaming_pipeline, sample_video_data):
@@ -274,25 +308,28 @@ class TestWorkerFunctionality:
     @pytest.mark.asyncio
     async def test_processing_worker_with_valid_task(self, streaming_pipeline, sample_video_data):
         """Test processing worker processes valid task correctly."""
-        # Mock the processing methods
-        streaming_pipeline.idempotency_manager.create_video_with_idempotency = AsyncMock(return_value=(True, "video_123"))
-        streaming_pipeline.idempotency_manager.get_existing_frames = AsyncMock(return_value=[])
-        streaming_pipeline._extract_keyframes_with_idempotency = AsyncMock(return_value=[])
+        result = {"video_id": "video_123", "platform": "youtube", "frames": [], "created_new": True}
+        streaming_pipeline.video_processor.process_video = AsyncMock(return_value=result)
 
         task = VideoTask(video_data=sample_video_data, job_id="test_job", platform="youtube")
 
         await streaming_pipeline._process_video(task)
 
+        streaming_pipeline.video_processor.process_video.assert_called_once_with(sample_video_data, "test_job")
         assert streaming_pipeline.stats["processing_completed"] == 1
+        assert streaming_pipeline.results_queue.get_nowait() == {
+            "type": "video_processed", "platform": "youtube", "result": result
+        }
 
     @pytest.mark.asyncio
     async def test_processing_worker_with_duplicate_video(self, streaming_pipeline, sample_video_data):
         """Test processing worker handles duplicate video correctly."""
-        # Mock idempotency manager to return existing video with frames
-        streaming_pipeline.idempotency_manager.create_video_with_idempotency = AsyncMock(return_value=(False, "existing_video"))
-        streaming_pipeline.idempotency_manager.get_existing_frames = AsyncMock(return_value=[
-            {"frame_id": "existing_frame", "ts": 0.0, "local_path": "/path/to/frame.jpg"}
-        ])
+        streaming_pipeline.video_processor.process_video = AsyncMock(return_value={
+            "video_id": "existing_video",
+            "platform": "youtube",
+            "frames": [{"frame_id": "existing_frame", "ts": 0.0, "local_path": "/path/to/frame.jpg"}],
+            "skipped": True
+        })
 
         task = VideoTask(video_data=sample_video_data, job_id="test_job", platform="youtube")
 
@@ -305,7 +342,7 @@ class TestWorkerFunctionality:
     async def test_worker_error_handling(self, streaming_pipeline, sample_video_data):
         """Test worker handles exceptions gracefully."""
         # Mock method to raise exception
-        streaming_pipeline.idempotency_manager.create_video_with_idempotency = AsyncMock(side_effect=Exception("Database error"))
+        streaming_pipeline.video_processor.process_video = AsyncMock(side_effect=Exception("Database error"))
 
         task = VideoTask(video_data=sample_video_data, job_id="test_job", platform="youtube")
 
@@ -321,30 +358,113 @@ class TestSearchAndStreamResults:
     @pytest.mark.asyncio
     async def test_search_and_stream_success(self, streaming_pipeline, sample_video_data_list, platform_queries):
         """Test successful search and stream results."""
-        # Mock video fetcher
-        mock_fetcher = AsyncMock()
-        mock_fetcher.fetch_videos = AsyncMock(return_value=sample_video_data_list)
+        async def stream_pages(platform, queries, recency_days, download_dir, num_videos):
+            yield sample_video_data_list[:2]
+            yield sample_video_data_list[2:]
 
-        with patch('services.streaming_pipeline.VideoFetcher', return_value=mock_fetcher):
-            await streaming_pipeline._search_and_stream_results("youtube", ["test query"], "job_123")
+        streaming_pipeline.video_fetcher.stream_platform_videos = stream_pages
+        progress_callback = AsyncMock()
 
-        # Verify all videos were queued
+        await streaming_pipeline._search_and_stream_results("youtube", ["test query"], "job_123", progress_callback)
+
+        # Verify all videos were queued, with a progress update per page
         assert streaming_pipeline.stats["search_results_found"] == len(sample_video_data_list)
+        assert streaming_pipeline.download_queue.qsize() == len(sample_video_data_list)
+        assert progress_callback.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_and_stream_stops_at_video_limit(self, streaming_pipeline, sample_video_data_list):
+        """Test searches stop queueing once the per-run video limit is reached."""
+        pages_requested = []
+
+        async def stream_pages(platform, queries, recency_days, download_dir, num_videos):
+            for index in range(0, len(sample_video_data_list), 2):
+                pages_requested.append(index)
+                yield sample_video_data_list[index:index + 2]
+
+        streaming_pipeline.video_fetcher.stream_platform_videos = stream_pages
+        streaming_pipeline.configure_search(max_videos=3)
+
+        await streaming_pipeline._search_and_stream_results("youtube", ["test query"], "job_123")
+
+        assert streaming_pipeline.stats["search_results_found"] == 3
+        assert streaming_pipeline.download_queue.qsize() == 3
+        assert pages_requested == [0, 2]
 
     @pytest.mark.asyncio
     async def test_search_and_stream_fetcher_error(self, streaming_pipeline, platform_queries):
         """Test search handles fetcher errors gracefully."""
-        # Mock video fetcher to raise exception
-        mock_fetcher = AsyncMock()
-        mock_fetcher.fetch_videos = AsyncMock(side_effect=Exception("Search failed"))
+        async def failing_stream(platform, queries, recency_days, download_dir, num_videos):
+            raise Exception("Search failed")
+            yield []
+
+        streaming_pipeline.video_fetcher.stream_platform_videos = failing_stream
 
         initial_errors = streaming_pipeline.stats["errors"]
 
-        with patch('services.streaming_pipeline.VideoFetcher', return_value=mock_fetcher):
-            await streaming_pipeline._search_and_stream_results("youtube", ["test query"], "job_123")
+        await streaming_pipeline._search_and_stream_results("youtube", ["test query"], "job_123")
 
         assert streaming_pipeline.stats["errors"] > initial_errors
 
 
+class TestStreamingRun:
+    """Test a full streaming run from search pages to processed videos."""
+
+    @pytest.mark.asyncio
+    async def test_process_videos_streaming_end_to_end(self, streaming_pipeline, sample_video_data_list):
+        """Test every searched video is downloaded, processed and reported before completion."""
+        async def stream_pages(platform, queries, recency_days, download_dir, num_videos):
+            for query in queries:
+                yield [dict(video, platform=platform) for video in sample_video_data_list if query in video["video_id"]]
+
+        async def download(platform, video, download_dir):
+            return {**video, "local_path": f"/videos/{video['video_id']}.mp4"}
+
+        async def process(video_data, job_id):
+            return {"video_id": video_data["video_id"], "platform": video_data["platform"], "frames": [{"frame_id": "f"}]}
+
+        streaming_pipeline.video_fetcher.stream_platform_videos = stream_pages
+        streaming_pipeline.video_fetcher.download_video = download
+        streaming_pipeline.idempotency_manager.check_video_exists = AsyncMock(return_value=False)
+        streaming_pipeline.video_processor.process_video = AsyncMock(side_effect=process)
+
+        items = [
+            item async for item in streaming_pipeline.process_videos_streaming(
+                platform_queries={"youtube": ["video_0", "video_1"], "tiktok": ["video_2"]},
+                job_id="job_123"
+            )
+        ]
+
+        processed = sorted(item["result"]["video_id"] for item in items if item["type"] == "video_processed")
+        assert processed == ["video_0", "video_1", "video_2"]
+        assert items[-1]["type"] == "pipeline_complete"
+        assert items[-1]["stats"]["processing_completed"] == 3
+        assert not streaming_pipeline.is_running
+
+    @pytest.mark.asyncio
+    async def test_search_total_is_marked_final_once_searches_finish(self, streaming_pipeline, sample_video_data_list):
+        """Test progress updates only report a final total after every search has finished."""
+        async def stream_pages(platform, queries, recency_days, download_dir, num_videos):
+            for video in sample_video_data_list[:3]:
+                yield [dict(video, platform=platform)]
+
+        async def download(platform, video, download_dir):
+            return {**video, "local_path": f"/videos/{video['video_id']}.mp4"}
+
+        updates = []
+
+        async def progress_callback(stats):
+            updates.append((stats["search_results_found"], stats["searches_complete"]))
+
+        streaming_pipeline.video_fetcher.stream_platform_videos = stream_pages
+        streaming_pipeline.video_fetcher.download_video = download
+        streaming_pipeline.idempotency_manager.check_video_exists = AsyncMock(return_value=False)
+        streaming_pipeline.video_processor.process_video = AsyncMock(return_value={"video_id": "v", "frames": []})
 
+        async for _ in streaming_pipeline.process_videos_streaming(
+            platform_queries={"youtube": ["q"]}, job_id="job_123", progress_callback=progress_callback
+        ):
+            pass
 
+        assert updates[:3] == [(1, False), (2, False), (3, False)]
+        assert updates[3:] == [(3, True), (3, True)]
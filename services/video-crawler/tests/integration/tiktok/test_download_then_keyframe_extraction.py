@@ -28,7 +28,7 @@ async def test_download_then_keyframe_extraction():
     try:
         # Step 1: Download the video first
         print("Downloading TikTok video...")
-        video_path = downloader.download_video(test_url, video_id)
+        video_path = await downloader.download_video(test_url, video_id)
 
         # Verify video download
         assert video_path is not None, "Video download should return a valid path"
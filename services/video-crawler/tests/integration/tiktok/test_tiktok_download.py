@@ -44,7 +44,7 @@ async def test_tiktok_download():
     try:
         # Test 1: Download video
         print("1. Testing video download...")
-        video_path = downloader.download_video(test_url, video_id)
+        video_path = await downloader.download_video(test_url, video_id)
 
         # Assertions for video download
         assert video_path is not None, "Video download should return a valid path"
@@ -256,7 +256,7 @@ async def test_tiktok_format_selection():
 
     try:
         # Test download with new format selection
-        video_path = downloader.download_video(test_url, video_id)
+        video_path = await downloader.download_video(test_url, video_id)
 
         # Assertions
         assert video_path is not None, "Video download should return a valid path"
@@ -325,7 +325,7 @@ async def test_tiktok_retry_logic():
     try:
         # Test download with retry logic
         start_time = asyncio.get_event_loop().time()
-        video_path = downloader.download_video(test_url, video_id)
+        video_path = await downloader.download_video(test_url, video_id)
         end_time = asyncio.get_event_loop().time()
 
         # Assertions
@@ -0,0 +1,49 @@
+"""Unit tests for the bounded candidate buffer of the single-pass extractor."""
+
+import pytest
+
+from keyframe_extractor.candidate_buffer import CandidateBuffer, CandidateFrame
+
+pytestmark = pytest.mark.unit
+
+
+def _offer(buffer: CandidateBuffer, frame_nums, blur: float = 100.0):
+    for frame_num in frame_nums:
+        if buffer.should_sample():
+            buffer.add(CandidateFrame(frame_num, frame_num / 10.0, image=None, blur_score=blur))
+
+
+def test_buffer_stays_bounded_and_spans_the_scene():
+    buffer = CandidateBuffer(capacity=8)
+
+    _offer(buffer, range(1000))
+
+    frame_nums = [c.frame_num for c in buffer.candidates]
+    assert len(frame_nums) < 8
+    assert frame_nums[0] == 0
+    assert frame_nums[-1] > 500
+    spacing = {b - a for a, b in zip(frame_nums, frame_nums[1:])}
+    assert len(spacing) == 1
+
+
+def test_split_returns_closed_scene_and_keeps_later_frames():
+    buffer = CandidateBuffer(capacity=16)
+    _offer(buffer, range(10))
+
+    closed = buffer.split_at(7)
+
+    assert [c.frame_num for c in closed] == list(range(7))
+    assert [c.frame_num for c in buffer.candidates] == [7, 8, 9]
+    assert buffer.should_sample()
+
+
+def test_pick_prefers_closest_sharp_candidate():
+    candidates = [
+        CandidateFrame(10, 1.0, image=None, blur_score=500.0),
+        CandidateFrame(20, 2.0, image=None, blur_score=5.0),
+        CandidateFrame(30, 3.0, image=None, blur_score=300.0),
+    ]
+
+    assert CandidateBuffer.pick(candidates, 2.1, min_blur=100.0).frame_num == 30
+    assert CandidateBuffer.pick(candidates, 2.1, min_blur=100.0, exclude={30}).frame_num == 10
+    assert CandidateBuffer.pick(candidates, 2.1, min_blur=1000.0) is None
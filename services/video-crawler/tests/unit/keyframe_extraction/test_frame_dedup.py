@@ -0,0 +1,81 @@
+"""Unit tests for near-duplicate keyframe suppression."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+from config_loader import KeyframeDedupSettings  # noqa: E402
+from keyframe_extractor.frame_dedup import KeyframeDeduplicator, frame_dhash  # noqa: E402
+from keyframe_extractor.pyav_extractor import PyAVKeyframeExtractor  # noqa: E402
+
+pytestmark = pytest.mark.unit
+
+
+def _gradient(width: int = 320, height: int = 240, reverse: bool = False) -> np.ndarray:
+    row = np.linspace(0, 255, width, dtype=np.uint8)
+    if reverse:
+        row = row[::-1]
+    gray = np.tile(row, (height, 1))
+    return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+
+
+def _solid(bgr) -> np.ndarray:
+    image = np.zeros((240, 320, 3), dtype=np.uint8)
+    image[:] = bgr
+    return image
+
+
+def _settings(**overrides) -> KeyframeDedupSettings:
+    values = dict(enabled=True, method="dhash", max_hamming_distance=5, max_histogram_distance=0.1)
+    values.update(overrides)
+    return KeyframeDedupSettings(**values)
+
+
+def test_dhash_ignores_small_brightness_changes():
+    image = _gradient()
+    brighter = cv2.add(image, np.full(image.shape, 10, dtype=np.uint8))
+
+    assert frame_dhash(image) == frame_dhash(brighter)
+    assert frame_dhash(image) != frame_dhash(_gradient(reverse=True))
+
+
+def test_dhash_deduplicator_drops_near_copies_only():
+    deduplicator = KeyframeDeduplicator(_settings())
+
+    assert deduplicator.offer(_gradient())
+    assert not deduplicator.offer(_gradient(width=300))
+    assert deduplicator.offer(_gradient(reverse=True))
+    assert deduplicator.accepted == 2
+
+
+def test_histogram_deduplicator_compares_colours():
+    deduplicator = KeyframeDeduplicator(_settings(method="histogram"))
+
+    assert deduplicator.offer(_solid((0, 0, 200)))
+    assert not deduplicator.offer(_solid((0, 0, 200)))
+    assert deduplicator.offer(_solid((200, 0, 0)))
+
+
+def test_extractor_deletes_suppressed_frames(tmp_path):
+    extractor = PyAVKeyframeExtractor(keyframe_root_dir=str(tmp_path))
+    extractor.dedup_settings = _settings()
+    paths = []
+    for name, image in (("a", _gradient()), ("b", _gradient()), ("c", _gradient(reverse=True))):
+        path = tmp_path / f"{name}.jpg"
+        cv2.imwrite(str(path), image)
+        paths.append(str(path))
+    keyframes = [(1.0, paths[0]), (2.0, paths[1]), (3.0, paths[2]), (4.0, str(tmp_path / "missing.jpg"))]
+
+    kept = extractor._suppress_near_duplicates(keyframes, "video-1")
+
+    assert kept == [keyframes[0], keyframes[2], keyframes[3]]
+    assert not (tmp_path / "b.jpg").exists()
+
+
+def test_extractor_keeps_all_frames_when_disabled(tmp_path):
+    extractor = PyAVKeyframeExtractor(keyframe_root_dir=str(tmp_path))
+    extractor.dedup_settings = _settings(enabled=False)
+    keyframes = [(1.0, "a.jpg"), (2.0, "b.jpg")]
+
+    assert extractor._suppress_near_duplicates(keyframes, "video-1") == keyframes
@@ -0,0 +1,85 @@
+"""Unit tests for the single-pass PyAV decode path using a fake container."""
+
+from fractions import Fraction
+
+import pytest
+
+from config_loader import PyAVSettings
+from keyframe_extractor.pyav_extractor import PyAVKeyframeExtractor
+
+pytestmark = pytest.mark.unit
+
+TIME_BASE = Fraction(1, 10)
+
+
+class FakeFrame:
+    def __init__(self, index: int, gop: int):
+        self.pts = index
+        self.time_base = TIME_BASE
+        self.key_frame = index % gop == 0
+
+    def to_ndarray(self, format: str):
+        return self.pts
+
+
+class FakeStream:
+    type = "video"
+    index = 0
+    time_base = TIME_BASE
+
+
+class FakeContainer:
+    """Ten frames per second; seeking lands on the keyframe before the target."""
+
+    def __init__(self, total_frames: int, gop: int):
+        self.frames = [FakeFrame(i, gop) for i in range(total_frames)]
+        self.gop = gop
+        self.position = 0
+        self.seeks = []
+        self.decoded = 0
+
+    def seek(self, pts, stream=None, any_frame=False):
+        self.seeks.append(pts)
+        self.position = (pts // self.gop) * self.gop
+
+    def decode(self, stream):
+        start = self.position
+        for frame in self.frames[start:]:
+            self.decoded += 1
+            yield frame
+
+
+def _extractor(tmp_path, default_gop_seconds: float) -> PyAVKeyframeExtractor:
+    settings = PyAVSettings(decode_mode="single_pass", default_gop_seconds=default_gop_seconds)
+    return PyAVKeyframeExtractor(keyframe_root_dir=str(tmp_path), settings=settings)
+
+
+def test_short_gaps_decode_sequentially_without_seeking(tmp_path):
+    extractor = _extractor(tmp_path, default_gop_seconds=2.0)
+    container = FakeContainer(total_frames=60, gop=20)
+
+    decoded = extractor._decode_frames_single_pass(container, FakeStream(), [1.5, 0.25, 3.0])
+
+    assert container.seeks == []
+    assert decoded == [(0.25, 3), (1.5, 15), (3.0, 30)]
+    assert container.decoded == 31
+
+
+def test_gaps_longer_than_gop_seek_to_preceding_keyframe(tmp_path):
+    extractor = _extractor(tmp_path, default_gop_seconds=1.0)
+    container = FakeContainer(total_frames=600, gop=10)
+
+    decoded = extractor._decode_frames_single_pass(container, FakeStream(), [5.05, 30.0, 30.4])
+
+    assert container.seeks == [50, 300]
+    assert decoded == [(5.05, 51), (30.0, 300), (30.4, 304)]
+    assert container.decoded < 30
+
+
+def test_targets_past_end_of_stream_return_none(tmp_path):
+    extractor = _extractor(tmp_path, default_gop_seconds=10.0)
+    container = FakeContainer(total_frames=20, gop=10)
+
+    decoded = extractor._decode_frames_single_pass(container, FakeStream(), [0.5, 5.0, 8.0])
+
+    assert decoded == [(0.5, 5), (5.0, None), (8.0, None)]
@@ -361,14 +361,19 @@ class TestStatisticsAndMonitoring:
         parallel_video_service.job_progress_manager = mock_progress_manager
 
         stats = {
+            "search_results_found": 10,
             "processing_started": 10,
-            "processing_completed": 6
+            "processing_completed": 6,
+            "searches_complete": False
         }
 
+        # The total is provisional while searches run, so nothing is published
         await parallel_video_service._update_progress_callback(stats)
+        mock_progress_manager.update_job_progress.assert_not_called()
 
-        # Should update progress with 60% completion
-        mock_progress_manager.update_job_progress.assert_called_once()
+        # Once the searches finish, the final total is published without adding to done
+        await parallel_video_service._update_progress_callback({**stats, "searches_complete": True})
+        mock_progress_manager.update_job_progress.assert_called_once_with("", "video", 10, 0, "crawling")
 
 
 class TestResourceCleanup:
@@ -111,14 +111,11 @@ class TestKeyframeSaving:
         """Test saving new keyframes."""
         video_id = "test_video"
 
-        # Mock idempotency manager for new frames
-        video_processor.idempotency_manager.create_frame_with_idempotency = AsyncMock(
-            side_effect=[
-                (True, f"{video_id}_frame_0"),
-                (True, f"{video_id}_frame_1"),
-                (True, f"{video_id}_frame_2")
-            ]
-        )
+        rows = [
+            {"frame_id": f"{video_id}_frame_{i}", "ts": ts, "local_path": path}
+            for i, (ts, path) in enumerate(sample_keyframes)
+        ]
+        video_processor.idempotency_manager.create_frames_with_idempotency = AsyncMock(return_value=rows)
 
         frame_data = await video_processor._save_keyframes(sample_keyframes, video_id)
 
@@ -126,31 +123,48 @@ class TestKeyframeSaving:
         assert frame_data[0]["frame_id"] == f"{video_id}_frame_0"
         assert frame_data[0]["ts"] == 0.0
         assert frame_data[0]["local_path"] == "/path/to/frame_0.jpg"
+        # One bulk call for the whole video
+        video_processor.idempotency_manager.create_frames_with_idempotency.assert_called_once_with(
+            video_id=video_id, keyframes=sample_keyframes, video=None
+        )
 
     @pytest.mark.asyncio
     async def test_save_keyframes_existing_frames(self, video_processor, sample_keyframes):
         """Test saving keyframes when some already exist."""
         video_id = "test_video"
 
-        # Mock idempotency manager with mix of new and existing frames
-        video_processor.idempotency_manager.create_frame_with_idempotency = AsyncMock(
-            side_effect=[
-                (True, f"{video_id}_frame_0"),  # New frame
-                (False, f"{video_id}_frame_1"),  # Existing frame
-                (True, f"{video_id}_frame_2")   # New frame
-            ]
-        )
-
-        # Mock get_existing_frames for the existing frame
-        existing_frames = [{"frame_id": f"{video_id}_frame_1", "ts": 5.0, "local_path": "/path/to/frame_1.jpg"}]
-        video_processor.idempotency_manager.get_existing_frames = AsyncMock(return_value=existing_frames)
+        # The bulk statement returns new and already stored rows together
+        rows = [
+            {"frame_id": f"{video_id}_frame_0", "ts": 0.0, "local_path": "/path/to/frame_0.jpg"},  # New
+            {"frame_id": f"{video_id}_frame_1", "ts": 5.0, "local_path": "/path/to/frame_1.jpg"},  # Existing
+            {"frame_id": f"{video_id}_frame_2", "ts": 10.0, "local_path": "/path/to/frame_2.jpg"},  # New
+        ]
+        video_processor.idempotency_manager.create_frames_with_idempotency = AsyncMock(return_value=rows)
+        video_processor.idempotency_manager.get_existing_frames = AsyncMock()
 
         frame_data = await video_processor._save_keyframes(sample_keyframes, video_id)
 
-        assert len(frame_data) == 3
-        assert frame_data[0]["frame_id"] == f"{video_id}_frame_0"  # New
-        assert frame_data[1]["frame_id"] == f"{video_id}_frame_1"  # Existing, fetched from DB
-        assert frame_data[2]["frame_id"] == f"{video_id}_frame_2"  # New
+        assert [frame["frame_id"] for frame in frame_data] == [f"{video_id}_frame_{i}" for i in range(3)]
+        video_processor.idempotency_manager.get_existing_frames.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_keyframes_passes_video_for_same_transaction_insert(self, video_processor, sample_keyframes):
+        """Test the video row is handed to the bulk insert so it is written in the same transaction."""
+        from common_py.models import Video
+
+        video = Video(video_id="test_video", platform="youtube", url="https://youtube.com/test", title="t")
+        video_processor.idempotency_manager.create_frames_with_idempotency = AsyncMock(return_value=[])
+
+        await video_processor._persist_keyframes(sample_keyframes, video)
+
+        assert video_processor.idempotency_manager.create_frames_with_idempotency.call_args.kwargs["video"] is video
+
+    @pytest.mark.asyncio
+    async def test_save_keyframes_database_error(self, video_processor, sample_keyframes):
+        """Test a failed bulk insert returns no frames instead of raising."""
+        video_processor.idempotency_manager.create_frames_with_idempotency = AsyncMock(side_effect=Exception("DB down"))
+
+        assert await video_processor._save_keyframes(sample_keyframes, "test_video") == []
 
     @pytest.mark.asyncio
     async def test_save_keyframes_empty_list(self, video_processor):
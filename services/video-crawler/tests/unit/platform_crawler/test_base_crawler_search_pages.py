@@ -0,0 +1,80 @@
+"""
+Unit tests for page-wise search and single-video download in BaseVideoCrawler.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from platform_crawler.common.base_crawler import BaseVideoCrawler
+
+pytestmark = pytest.mark.unit
+
+
+class PagedCrawler(BaseVideoCrawler):
+    """Crawler whose search results are keyed by query."""
+
+    query_delay_s = 0.0
+
+    def __init__(self, results_by_query):
+        super().__init__("test", Mock(), enable_title_deduplication=True)
+        self.results_by_query = results_by_query
+        self.searched = []
+        self.downloaded = []
+
+    async def _search_videos_for_queries(self, queries, recency_days, num_videos):
+        self.searched.extend(queries)
+        return [video for query in queries for video in self.results_by_query.get(query, [])]
+
+    async def _download_videos(self, videos, download_dir):
+        self.downloaded.extend(videos.values())
+        return [{**video, "local_path": f"{download_dir}/{video['video_id']}.mp4"} for video in videos.values()]
+
+
+class TestIterSearchPages:
+
+    @pytest.mark.asyncio
+    async def test_yields_one_page_per_query(self):
+        crawler = PagedCrawler({
+            "a": [{"video_id": "v1", "title": "One"}, {"video_id": "v2", "title": "Two"}],
+            "b": [{"video_id": "v3", "title": "Three"}],
+        })
+
+        pages = [page async for page in crawler.iter_search_pages(["a", "b"], 30, 5)]
+
+        assert [[video["video_id"] for video in page] for page in pages] == [["v1", "v2"], ["v3"]]
+        assert all(video["platform"] == "test" for page in pages for video in page)
+
+    @pytest.mark.asyncio
+    async def test_drops_videos_seen_on_earlier_pages(self):
+        crawler = PagedCrawler({
+            "a": [{"video_id": "v1", "title": "One"}],
+            "b": [{"video_id": "v1", "title": "One"}],
+            "c": [{"video_id": "v2", "title": "Two"}],
+        })
+
+        pages = [page async for page in crawler.iter_search_pages(["a", "b", "c"], 30, 5)]
+
+        assert [[video["video_id"] for video in page] for page in pages] == [["v1"], ["v2"]]
+        assert crawler.searched == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_pages_are_yielded_before_later_queries_are_searched(self):
+        crawler = PagedCrawler({
+            "a": [{"video_id": "v1", "title": "One"}],
+            "b": [{"video_id": "v2", "title": "Two"}],
+        })
+
+        pages = crawler.iter_search_pages(["a", "b"], 30, 5)
+        await pages.__anext__()
+
+        assert crawler.searched == ["a"]
+        await pages.aclose()
+
+    @pytest.mark.asyncio
+    async def test_download_single_video(self, tmp_path):
+        crawler = PagedCrawler({})
+
+        result = await crawler.download_single_video({"video_id": "v1", "title": "One"}, str(tmp_path))
+
+        assert result["local_path"] == f"{tmp_path}/v1.mp4"
+        assert crawler.downloaded == [{"video_id": "v1", "title": "One"}]
@@ -0,0 +1,142 @@
+"""Unit tests for the content-addressed keyframe cache."""
+
+import hashlib
+import os
+import time
+
+import pytest
+
+from services.content_store import MANIFEST_NAME, ContentStore
+from utils.content_hash import read_content_hash, record_content_hash, sidecar_path
+
+pytestmark = pytest.mark.unit
+
+CLIP = b"video bytes" * 100
+CLIP_HASH = hashlib.sha256(CLIP).hexdigest()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(root=str(tmp_path / "cache"), enabled=True)
+
+
+def _frames(directory, count=2):
+    directory.mkdir(parents=True, exist_ok=True)
+    keyframes = []
+    for index in range(count):
+        frame = directory / f"frame_{index}_00s.jpg"
+        frame.write_bytes(f"frame {index}".encode())
+        keyframes.append((float(index), str(frame)))
+    return keyframes
+
+
+class TestContentHash:
+
+    async def test_hashes_file_and_records_sidecar(self, store, tmp_path):
+        video = tmp_path / "video.mp4"
+        video.write_bytes(CLIP)
+
+        assert await store.content_hash(str(video)) == CLIP_HASH
+        assert read_content_hash(str(video)) == CLIP_HASH
+
+    async def test_uses_sidecar_recorded_during_download(self, store, tmp_path):
+        video = tmp_path / "video.mp4"
+        video.write_bytes(CLIP)
+        record_content_hash(str(video), "a" * 64)
+
+        assert await store.content_hash(str(video)) == "a" * 64
+
+    def test_sidecar_older_than_video_is_ignored(self, tmp_path):
+        video = tmp_path / "video.mp4"
+        video.write_bytes(CLIP)
+        record_content_hash(str(video), "a" * 64)
+        past = time.time() - 60
+        os.utime(sidecar_path(str(video)), (past, past))
+
+        assert read_content_hash(str(video)) is None
+
+    async def test_missing_file_or_disabled_store_has_no_hash(self, tmp_path):
+        video = tmp_path / "video.mp4"
+        video.write_bytes(CLIP)
+
+        assert await ContentStore(root=str(tmp_path), enabled=True).content_hash(str(tmp_path / "missing.mp4")) is None
+        assert await ContentStore(root=str(tmp_path), enabled=False).content_hash(str(video)) is None
+
+
+class TestKeyframeCache:
+
+    async def test_stored_keyframes_are_linked_for_another_video(self, store, tmp_path):
+        keyframes = _frames(tmp_path / "keyframes" / "video-a")
+
+        assert await store.put_keyframes(CLIP_HASH, keyframes) is True
+        cached = await store.get_keyframes(CLIP_HASH, str(tmp_path / "keyframes" / "video-b"))
+
+        assert cached == [
+            (0.0, str(tmp_path / "keyframes" / "video-b" / "frame_0_00s.jpg")),
+            (1.0, str(tmp_path / "keyframes" / "video-b" / "frame_1_00s.jpg")),
+        ]
+        assert (tmp_path / "keyframes" / "video-b" / "frame_1_00s.jpg").read_bytes() == b"frame 1"
+
+    async def test_cached_frames_survive_removal_of_the_original(self, store, tmp_path):
+        keyframes = _frames(tmp_path / "keyframes" / "video-a")
+        await store.put_keyframes(CLIP_HASH, keyframes)
+        for _, path in keyframes:
+            os.remove(path)
+
+        cached = await store.get_keyframes(CLIP_HASH, str(tmp_path / "keyframes" / "video-b"))
+
+        assert len(cached) == 2
+
+    async def test_miss_for_unknown_content_or_other_settings(self, store, tmp_path):
+        await store.put_keyframes(CLIP_HASH, _frames(tmp_path / "keyframes" / "video-a"))
+        other_settings = ContentStore(root=str(store.root), enabled=True)
+        other_settings.settings_key = "different"
+
+        assert await store.get_keyframes("b" * 64, str(tmp_path / "out")) is None
+        assert await other_settings.get_keyframes(CLIP_HASH, str(tmp_path / "out")) is None
+
+    async def test_incomplete_entry_is_discarded(self, store, tmp_path):
+        await store.put_keyframes(CLIP_HASH, _frames(tmp_path / "keyframes" / "video-a"))
+        os.remove(store.entry_dir(CLIP_HASH) / "frame_0_00s.jpg")
+
+        assert await store.get_keyframes(CLIP_HASH, str(tmp_path / "out")) is None
+        assert not store.entry_dir(CLIP_HASH).exists()
+
+    async def test_keyframes_with_missing_files_are_not_stored(self, store, tmp_path):
+        keyframes = _frames(tmp_path / "keyframes" / "video-a") + [(5.0, str(tmp_path / "missing.jpg"))]
+
+        assert await store.put_keyframes(CLIP_HASH, keyframes) is False
+        assert not store.entry_dir(CLIP_HASH).exists()
+        assert list(store.entry_dir(CLIP_HASH).parent.iterdir()) == []
+
+
+class TestEviction:
+
+    async def test_evicts_entries_older_than_retention(self, store, tmp_path):
+        await store.put_keyframes(CLIP_HASH, _frames(tmp_path / "keyframes" / "video-a"))
+        await store.put_keyframes("b" * 64, _frames(tmp_path / "keyframes" / "video-b"))
+        past = time.time() - 10 * 86400
+        os.utime(store.entry_dir(CLIP_HASH) / MANIFEST_NAME, (past, past))
+
+        removed = store.evict_expired(retention_days=7)
+
+        assert removed == [str(store.entry_dir(CLIP_HASH))]
+        assert not (store.root / "keyframes" / CLIP_HASH[:2]).exists()
+        assert store.entry_dir("b" * 64).exists()
+
+    async def test_hit_refreshes_entry_age(self, store, tmp_path):
+        await store.put_keyframes(CLIP_HASH, _frames(tmp_path / "keyframes" / "video-a"))
+        past = time.time() - 10 * 86400
+        os.utime(store.entry_dir(CLIP_HASH) / MANIFEST_NAME, (past, past))
+
+        await store.get_keyframes(CLIP_HASH, str(tmp_path / "out"))
+
+        assert store.evict_expired(retention_days=7) == []
+
+    async def test_dry_run_keeps_entries(self, store, tmp_path):
+        await store.put_keyframes(CLIP_HASH, _frames(tmp_path / "keyframes" / "video-a"))
+        past = time.time() - 10 * 86400
+        os.utime(store.entry_dir(CLIP_HASH) / MANIFEST_NAME, (past, past))
+
+        assert len(store.evict_expired(retention_days=7, dry_run=True)) == 1
+        assert store.entry_dir(CLIP_HASH).exists()
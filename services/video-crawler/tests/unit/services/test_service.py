@@ -115,8 +115,8 @@ class TestProcessAndEmitVideos:
         assert batch_payload[1]["video_id"] == "video3"
         assert batch_payload[2]["video_id"] == "video5"
         
-        # Verify cleanup was called
-        mock_cleanup_service.run_auto_cleanup.assert_called_once_with(job_id)
+        # Cleanup runs in the background, not on the job path
+        mock_cleanup_service.run_auto_cleanup.assert_not_called()
         
         # Verify collections completed was called
         mock_event_emitter.publish_videos_collections_completed.assert_called_once_with(
@@ -357,5 +357,97 @@ class TestProcessAndEmitVideos:
         # Execute - should not raise exception
         await service._process_and_emit_videos(all_videos, job_id, correlation_id)
         
-        # Verify cleanup was still called
-        mock_cleanup_service.run_auto_cleanup.assert_called_once_with(job_id)
+        # Cleanup runs in the background, not on the job path
+        mock_cleanup_service.run_auto_cleanup.assert_not_called()
+
+
+class TestBoundedProcessing:
+    """Tests for bounded admission of videos into processing."""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_videos_bounded_and_order_preserved(
+        self,
+        service,
+        mock_cleanup_service,
+        mock_event_emitter
+    ):
+        """No more than VIDEO_PIPELINE_MAX_IN_FLIGHT videos are processed at once."""
+        import asyncio
+
+        service.cleanup_service = mock_cleanup_service
+        service.event_emitter = mock_event_emitter
+
+        active = 0
+        peak = 0
+
+        async def _process(video_data, job_id):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            # Later videos finish first so completion order differs from input order
+            await asyncio.sleep(0.001 * (10 - video_data["index"]))
+            active -= 1
+            if video_data["index"] == 3:
+                raise RuntimeError("boom")
+            return {"video_id": f"video{video_data['index']}", "frames": [{"frame_id": "f"}]}
+
+        service.video_processor = MagicMock()
+        service.video_processor.process_video = AsyncMock(side_effect=_process)
+        all_videos = [{"index": i} for i in range(10)]
+
+        with patch('services.service.config.VIDEO_PIPELINE_MAX_IN_FLIGHT', 3):
+            await service._process_and_emit_videos(all_videos, "job", "job")
+
+        assert peak == 3
+        assert service.video_processor.process_video.await_count == 10
+        batch_payload = mock_event_emitter.publish_videos_keyframes_ready_batch.call_args[0][1]
+        assert [video["video_id"] for video in batch_payload] == [
+            f"video{i}" for i in range(10) if i != 3
+        ]
+
+
+class TestStreamingSearch:
+    """Tests for the streaming pipeline path of a search request."""
+
+    @pytest.mark.asyncio
+    async def test_streamed_results_emit_batch_and_completion(
+        self,
+        service,
+        mock_cleanup_service,
+        mock_event_emitter
+    ):
+        """Processed videos with frames form the batch payload."""
+        service.cleanup_service = mock_cleanup_service
+        service.event_emitter = mock_event_emitter
+        outcome = {
+            "stats": {"search_results_found": 2},
+            "results": [
+                {"type": "video_processed", "platform": "youtube", "result": {"video_id": "v1", "frames": [{"frame_id": "f"}]}},
+                {"type": "video_processed", "platform": "tiktok", "result": {"video_id": None, "frames": []}},
+                {"type": "pipeline_complete", "stats": {"search_results_found": 2}},
+            ],
+        }
+
+        with patch('services.service.ParallelVideoService') as parallel_service_class:
+            parallel_service_class.return_value.process_videos_parallel = AsyncMock(return_value=outcome)
+            await service._stream_and_emit_videos({"youtube": ["q"]}, 30, {"youtube": "/test/videos/youtube"}, "job", "corr")
+
+        kwargs = parallel_service_class.return_value.process_videos_parallel.call_args.kwargs
+        assert kwargs["recency_days"] == 30
+        assert kwargs["download_dirs"] == {"youtube": "/test/videos/youtube"}
+        batch_payload = mock_event_emitter.publish_videos_keyframes_ready_batch.call_args[0][1]
+        assert batch_payload == [{"video_id": "v1", "frames": [{"frame_id": "f"}]}]
+        mock_event_emitter.publish_videos_collections_completed.assert_called_once_with("job", "corr")
+
+    @pytest.mark.asyncio
+    async def test_no_search_results_completes_with_zero_videos(self, service, mock_event_emitter):
+        service.event_emitter = mock_event_emitter
+
+        with patch('services.service.ParallelVideoService') as parallel_service_class:
+            parallel_service_class.return_value.process_videos_parallel = AsyncMock(
+                return_value={"stats": {"search_results_found": 0}, "results": []}
+            )
+            await service._stream_and_emit_videos({"youtube": ["q"]}, 30, {}, "job", "corr")
+
+        mock_event_emitter.publish_videos_keyframes_ready_batch.assert_not_called()
+        mock_event_emitter.publish_videos_collections_completed.assert_called_once_with("job", "corr")
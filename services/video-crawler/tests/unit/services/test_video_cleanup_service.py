@@ -1,6 +1,6 @@
 """Unit tests for VideoCleanupService."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -173,3 +173,36 @@ class TestVideoCleanupService:
                 assert result['retention_days'] == 30
                 assert result['video_dir'] == service._get_video_dir()
                 assert result['service_status']['status'] == 'inactive'
+
+    def test_background_cleanup_not_started_when_disabled(self):
+        """No background task is scheduled when cleanup is disabled."""
+        service = VideoCleanupService()
+
+        with patch('services.video_cleanup_service.config') as mock_config:
+            mock_config.CLEANUP_OLD_VIDEOS = False
+
+            assert service.start_background_cleanup() is None
+
+    @pytest.mark.asyncio
+    async def test_background_cleanup_runs_until_cancelled(self):
+        """The background task keeps running cleanup on its interval."""
+        import asyncio
+
+        service = VideoCleanupService()
+        service.run_auto_cleanup = AsyncMock()
+        # Keep the configured interval out of the test's runtime
+        run_periodic_cleanup = service.run_periodic_cleanup
+        service.run_periodic_cleanup = MagicMock(side_effect=lambda interval_s: run_periodic_cleanup(0))
+
+        with patch('services.video_cleanup_service.config') as mock_config:
+            mock_config.CLEANUP_OLD_VIDEOS = True
+            mock_config.CLEANUP_INTERVAL_MINUTES = 60
+            task = service.start_background_cleanup()
+            while service.run_auto_cleanup.await_count < 3:
+                await asyncio.sleep(0)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        service.run_periodic_cleanup.assert_called_once_with(3600)
+        service.run_auto_cleanup.assert_awaited_with("background")
+        assert task.cancelled()
@@ -64,19 +64,18 @@ def video_processor(mock_db, mock_event_emitter, mock_job_progress_manager):
         event_emitter=mock_event_emitter,
         job_progress_manager=mock_job_progress_manager
     )
-    # Ensure video_crud.get_video returns a visible object for FK visibility checks
-    if getattr(vp, "video_crud", None) is not None:
-        from unittest.mock import AsyncMock as _AsyncMock
-        vp.video_crud.get_video = _AsyncMock(return_value=object())
     # Stub idempotency manager methods to avoid DB awaits
     from unittest.mock import AsyncMock as _AsyncMock
     vp.idempotency_manager._validate_database_connection = _AsyncMock(return_value=True)
     vp.idempotency_manager.get_existing_video = _AsyncMock(return_value=None)
     vp.idempotency_manager.create_video_with_idempotency = _AsyncMock(return_value=(True, str(uuid.uuid4())))
 
-    async def _create_frame(video_id: str, frame_index: int, timestamp: float, local_path: str):
-        return True, f"{video_id}_frame_{frame_index}"
-    vp.idempotency_manager.create_frame_with_idempotency = _AsyncMock(side_effect=_create_frame)
+    async def _create_frames(video_id: str, keyframes, video=None):
+        return [
+            {"frame_id": f"{video_id}_frame_{index}", "ts": ts, "local_path": path}
+            for index, (ts, path) in enumerate(keyframes)
+        ]
+    vp.idempotency_manager.create_frames_with_idempotency = _AsyncMock(side_effect=_create_frames)
     vp.idempotency_manager.get_existing_frames = _AsyncMock(return_value=[])
     return vp
 
@@ -175,6 +174,7 @@ class TestVideoProcessor:
         # Mock TikTok downloader
         with patch('services.video_processor.TikTokDownloader') as mock_downloader_class:
             mock_downloader = MagicMock()
+            mock_downloader.close = AsyncMock()
             mock_downloader.orchestrate_download_and_extract = AsyncMock(return_value=True)
             mock_downloader_class.return_value = mock_downloader
 
@@ -200,6 +200,7 @@ class TestVideoProcessor:
         # Mock TikTok downloader failure
         with patch('services.video_processor.TikTokDownloader') as mock_downloader_class:
             mock_downloader = MagicMock()
+            mock_downloader.close = AsyncMock()
             mock_downloader.orchestrate_download_and_extract = AsyncMock(return_value=False)
             mock_downloader_class.return_value = mock_downloader
 
@@ -262,12 +263,6 @@ class TestVideoProcessor:
         keyframes = [(10, "/path/frame1.jpg"), (20, "/path/frame2.jpg")]
         video_id = str(uuid.uuid4())
 
-        # Mock database operations for idempotency manager
-        _ = str(uuid.uuid4())
-        video_processor.idempotency_manager.check_frame_exists = AsyncMock(return_value=False)
-        video_processor.db.execute = AsyncMock()
-        video_processor.db.fetch_one = AsyncMock(return_value=None)
-
         frame_data = await video_processor._save_keyframes(keyframes, video_id)
 
         assert len(frame_data) == 2
@@ -331,3 +326,64 @@ class TestVideoProcessor:
 
         # Verify the extractor was reinitialized
         assert video_processor.keyframe_extractor is not None
+
+
+class TestProcessingStages:
+    """Tests for per-stage concurrency limits."""
+
+    @pytest.mark.asyncio
+    async def test_decode_stage_limits_concurrent_extractions(self, video_processor):
+        """Keyframe extraction never exceeds the decode stage limit."""
+        import asyncio
+
+        from services.processing_stages import ProcessingStages
+
+        video_processor.stages = ProcessingStages(download=1, decode=2, db_write=1)
+        active = 0
+        peak = 0
+
+        async def _extract(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return []
+
+        video_processor.keyframe_extractor.extract_keyframes = AsyncMock(side_effect=_extract)
+
+        await asyncio.gather(*(
+            video_processor._extract_keyframes(f"video{i}", f"/videos/{i}.mp4") for i in range(6)
+        ))
+
+        assert video_processor.keyframe_extractor.extract_keyframes.await_count == 6
+        assert peak == 2
+
+
+class TestContentCache:
+    """Tests for keyframe reuse across videos with identical content."""
+
+    @pytest.mark.asyncio
+    async def test_identical_content_is_decoded_once(self, video_processor, tmp_path):
+        from services.content_store import ContentStore
+
+        video_processor.content_store = ContentStore(root=str(tmp_path / "cache"), enabled=True)
+        video_processor.keyframe_dir = str(tmp_path / "keyframes")
+        for name in ("a.mp4", "b.mp4"):
+            (tmp_path / name).write_bytes(b"same clip")
+
+        async def _extract(video_url, video_id, local_path):
+            frame = tmp_path / "keyframes" / video_id / "frame_1_00s.jpg"
+            frame.parent.mkdir(parents=True)
+            frame.write_bytes(b"jpeg")
+            return [(1.0, str(frame))]
+
+        video_processor.keyframe_extractor.extract_keyframes = AsyncMock(side_effect=_extract)
+
+        first = await video_processor._extract_keyframes("video-a", str(tmp_path / "a.mp4"))
+        second = await video_processor._extract_keyframes("video-b", str(tmp_path / "b.mp4"))
+
+        assert video_processor.keyframe_extractor.extract_keyframes.await_count == 1
+        assert first == [(1.0, str(tmp_path / "keyframes" / "video-a" / "frame_1_00s.jpg"))]
+        assert second == [(1.0, str(tmp_path / "keyframes" / "video-b" / "frame_1_00s.jpg"))]
+        assert (tmp_path / "keyframes" / "video-b" / "frame_1_00s.jpg").read_bytes() == b"jpeg"
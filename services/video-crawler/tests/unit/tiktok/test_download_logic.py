@@ -70,3 +70,45 @@ class TestDownloadLogic:
             # Verify all calls have the correct kwargs
             for call in mock_mkdir.call_args_list:
                 assert call.kwargs == {'parents': True, 'exist_ok': True}
+
+    async def test_orchestration_runs_each_step_inside_its_stage_limit(self):
+        """Download, decode and keyframe persistence each hold their own stage slot"""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from platform_crawler.tiktok import tiktok_downloader
+        from services.processing_stages import ProcessingStages
+
+        stages = ProcessingStages(download=1, decode=1, db_write=1)
+        held = {}
+
+        def _held_stages():
+            return {name for name in ("download", "decode", "db_write") if getattr(stages, name).locked()}
+
+        video_path = self.video_dir / "video123.mp4"
+
+        async def _download(url, video_id, storage_path):
+            held["download"] = _held_stages()
+            video_path.parent.mkdir(parents=True, exist_ok=True)
+            video_path.write_bytes(b"clip")
+            return str(video_path)
+
+        async def _extract(path, video_id):
+            held["decode"] = _held_stages()
+            return str(self.keyframe_dir / video_id), [(1.0, "/keyframes/frame_1.jpg")]
+
+        async def _persist(video_id, keyframes, db):
+            held["db_write"] = _held_stages()
+
+        self.downloader.download_strategy = MagicMock(
+            download_video=AsyncMock(side_effect=_download),
+            extract_keyframes=AsyncMock(side_effect=_extract),
+        )
+        self.downloader._persist_keyframes = AsyncMock(side_effect=_persist)
+
+        with patch.object(tiktok_downloader, "HAS_DB", True):
+            success = await self.downloader.orchestrate_download_and_extract(
+                url="https://www.tiktok.com/@user/video/123", video_id="video123", db=MagicMock(), stages=stages
+            )
+
+        assert success
+        assert held == {"download": {"download"}, "decode": {"decode"}, "db_write": {"db_write"}}
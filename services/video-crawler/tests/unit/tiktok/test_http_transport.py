@@ -0,0 +1,226 @@
+import asyncio
+import hashlib
+import re
+
+import httpx
+import pytest
+
+from platform_crawler.tiktok.download_strategies import http_transport
+from platform_crawler.tiktok.download_strategies.http_transport import (
+    DownloadIntegrityError,
+    DownloadSizeLimitError,
+    PooledHttpTransport,
+    TransferStats,
+    get_shared_transport,
+)
+
+pytestmark = pytest.mark.unit
+
+VIDEO = bytes(range(256)) * 40
+
+
+class _DroppingStream(httpx.AsyncByteStream):
+    """Response body that loses the connection after ``drop_after`` bytes."""
+
+    def __init__(self, body: bytes, drop_after=None) -> None:
+        self.body = body
+        self.drop_after = drop_after
+
+    async def __aiter__(self):
+        if self.drop_after is None:
+            yield self.body
+            return
+        yield self.body[:self.drop_after]
+        raise httpx.ReadError("connection dropped")
+
+
+def _range_server(data: bytes, drops=()):
+    """Handler serving ``data`` with Range support; each entry of ``drops`` cuts one response short."""
+    drops = list(drops)
+    seen_ranges = []
+
+    def handler(request):
+        requested = request.headers.get("range")
+        seen_ranges.append(requested)
+        match = re.match(r"bytes=(\d+)-(\d*)", requested or "")
+        start = int(match.group(1)) if match else 0
+        end = int(match.group(2)) if match and match.group(2) else len(data) - 1
+        if start >= len(data):
+            return httpx.Response(416, headers={"content-range": f"bytes */{len(data)}"})
+
+        body = data[start:end + 1]
+        headers = {"content-range": f"bytes {start}-{end}/{len(data)}", "content-length": str(len(body))}
+        return httpx.Response(206, headers=headers, stream=_DroppingStream(body, drops.pop(0) if drops else None))
+
+    handler.seen_ranges = seen_ranges
+    return handler
+
+
+@pytest.fixture(autouse=True)
+def no_resume_backoff(monkeypatch):
+    monkeypatch.setattr(http_transport, "RESUME_BACKOFF_S", 0)
+
+
+def _transport_with_handler(handler, **kwargs) -> PooledHttpTransport:
+    return PooledHttpTransport(
+        "test",
+        timeout=5,
+        http2=False,
+        client_factory=lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+class TestPooledHttpTransport:
+
+    async def test_stream_to_file_writes_complete_file(self, tmp_path):
+        transport = _transport_with_handler(lambda request: httpx.Response(200, content=b"x" * 100_000))
+        output = tmp_path / "video.mp4"
+
+        result = await transport.stream_to_file("https://cdn.example.com/v.mp4", str(output), max_size=1_000_000)
+
+        assert result.size == 100_000
+        assert result.bytes_transferred == 100_000
+        assert output.read_bytes() == b"x" * 100_000
+        assert not (tmp_path / "video.mp4.part").exists()
+        assert (tmp_path / "video.mp4.sha256").read_text() == hashlib.sha256(b"x" * 100_000).hexdigest()
+        await transport.close()
+
+    async def test_stream_to_file_enforces_size_limit(self, tmp_path):
+        transport = _transport_with_handler(lambda request: httpx.Response(200, content=b"x" * 2048))
+        output = tmp_path / "video.mp4"
+
+        with pytest.raises(DownloadSizeLimitError):
+            await transport.stream_to_file("https://cdn.example.com/v.mp4", str(output), max_size=1024)
+
+        assert list(tmp_path.iterdir()) == []
+        await transport.close()
+
+    async def test_stream_to_file_raises_on_error_status(self, tmp_path):
+        transport = _transport_with_handler(lambda request: httpx.Response(503))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await transport.stream_to_file("https://cdn.example.com/v.mp4", str(tmp_path / "v.mp4"), max_size=1024)
+
+        assert list(tmp_path.iterdir()) == []
+        await transport.close()
+
+    async def test_resumes_with_range_after_dropped_connection(self, tmp_path):
+        handler = _range_server(VIDEO, drops=[1000])
+        transport = _transport_with_handler(handler)
+        output = tmp_path / "video.mp4"
+
+        result = await transport.stream_to_file("https://cdn.example.com/v.mp4", str(output), max_size=len(VIDEO))
+
+        assert output.read_bytes() == VIDEO
+        assert handler.seen_ranges == ["bytes=0-", "bytes=1000-"]
+        assert result.retries == 1
+        assert result.bytes_transferred == len(VIDEO)
+        assert result.sha256 == hashlib.sha256(VIDEO).hexdigest()
+        await transport.close()
+
+    async def test_resumes_partial_file_from_earlier_call(self, tmp_path):
+        handler = _range_server(VIDEO)
+        transport = _transport_with_handler(handler)
+        output = tmp_path / "video.mp4"
+        (tmp_path / "video.mp4.part").write_bytes(VIDEO[:2000])
+
+        result = await transport.stream_to_file("https://cdn.example.com/v.mp4", str(output), max_size=len(VIDEO))
+
+        assert output.read_bytes() == VIDEO
+        assert handler.seen_ranges == ["bytes=2000-"]
+        assert result.bytes_transferred == len(VIDEO) - 2000
+        assert result.sha256 == hashlib.sha256(VIDEO).hexdigest()
+        await transport.close()
+
+    async def test_complete_partial_file_is_not_downloaded_again(self, tmp_path):
+        handler = _range_server(VIDEO)
+        transport = _transport_with_handler(handler)
+        output = tmp_path / "video.mp4"
+        (tmp_path / "video.mp4.part").write_bytes(VIDEO)
+
+        result = await transport.stream_to_file("https://cdn.example.com/v.mp4", str(output), max_size=len(VIDEO))
+
+        assert output.read_bytes() == VIDEO
+        assert result.bytes_transferred == 0
+        await transport.close()
+
+    async def test_keeps_partial_file_when_resumes_run_out(self, tmp_path):
+        transport = _transport_with_handler(_range_server(VIDEO, drops=[100, 100]), resume_attempts=1)
+        stats = TransferStats()
+
+        with pytest.raises(httpx.ReadError):
+            await transport.stream_to_file(
+                "https://cdn.example.com/v.mp4", str(tmp_path / "video.mp4"), max_size=len(VIDEO), stats=stats
+            )
+
+        assert (tmp_path / "video.mp4.part").read_bytes() == VIDEO[:200]
+        assert stats.retries == 1
+        assert stats.bytes_transferred == 200
+        await transport.close()
+
+    async def test_hash_mismatch_discards_download(self, tmp_path):
+        transport = _transport_with_handler(_range_server(VIDEO))
+
+        with pytest.raises(DownloadIntegrityError):
+            await transport.stream_to_file(
+                "https://cdn.example.com/v.mp4", str(tmp_path / "video.mp4"), max_size=len(VIDEO),
+                expected_sha256="0" * 64
+            )
+
+        assert list(tmp_path.iterdir()) == []
+        await transport.close()
+
+    async def test_large_files_are_fetched_as_parallel_ranges(self, tmp_path):
+        handler = _range_server(VIDEO, drops=[None, 50])
+        transport = _transport_with_handler(handler, parallel_ranges=4, parallel_min_size=1)
+        output = tmp_path / "video.mp4"
+
+        result = await transport.stream_to_file("https://cdn.example.com/v.mp4", str(output), max_size=len(VIDEO))
+
+        assert output.read_bytes() == VIDEO
+        assert result.sha256 == hashlib.sha256(VIDEO).hexdigest()
+        assert handler.seen_ranges[0] == "bytes=0-"
+        assert {"bytes=0-2559", "bytes=2560-5119", "bytes=5120-7679", "bytes=7680-10239"} <= set(handler.seen_ranges)
+        assert result.retries == 1
+        await transport.close()
+
+    async def test_client_is_reused_across_requests(self):
+        transport = _transport_with_handler(lambda request: httpx.Response(200))
+
+        first = transport.client
+        await transport.head("https://cdn.example.com/a.mp4")
+        await transport.head("https://cdn.example.com/b.mp4")
+
+        assert transport.client is first
+        await transport.close()
+
+    async def test_requests_are_limited_per_host(self):
+        in_flight = {"cdn-a.example.com": 0, "cdn-b.example.com": 0}
+        peak = dict(in_flight)
+
+        async def handler(request):
+            host = request.url.host
+            in_flight[host] += 1
+            peak[host] = max(peak[host], in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return httpx.Response(200)
+
+        transport = _transport_with_handler(handler, per_host_limit=2)
+
+        await asyncio.gather(*(
+            transport.head(f"https://{host}/{index}.mp4")
+            for host in in_flight
+            for index in range(6)
+        ))
+
+        assert peak == {"cdn-a.example.com": 2, "cdn-b.example.com": 2}
+        await transport.close()
+
+    def test_shared_transport_is_created_once_per_name(self):
+        first = get_shared_transport("test-shared", {"TIKTOK_HTTP_PER_HOST_LIMIT": 3}, timeout=10)
+        second = get_shared_transport("test-shared", {}, timeout=30)
+
+        assert first is second
+        assert first.per_host_limit == 3
@@ -1,10 +1,11 @@
 import os
 import pytest
-from unittest.mock import patch, MagicMock, AsyncMock, mock_open
+from unittest.mock import patch, MagicMock, AsyncMock, PropertyMock
 import httpx
 
 from platform_crawler.tiktok.download_strategies.factory import TikTokDownloadStrategyFactory, TikTokDownloadStrategyRegistry
 from platform_crawler.tiktok.download_strategies.base import TikTokAntiBotError
+from platform_crawler.tiktok.download_strategies.http_transport import PooledHttpTransport
 from platform_crawler.tiktok.download_strategies.scrapling_api_strategy import ScraplingApiDownloadStrategy
 from platform_crawler.tiktok.download_strategies.tikwm_strategy import TikwmDownloadStrategy
 
@@ -135,7 +136,7 @@ class TestScraplingApiDownloadStrategy:
 
     @patch('platform_crawler.tiktok.tiktok_download_client.TikTokDownloadClient')
     @patch('platform_crawler.tiktok.download_strategies.scrapling_api_strategy.record_download_metrics')
-    def test_download_video_success(self, mock_metrics, mock_client_class):
+    async def test_download_video_success(self, mock_metrics, mock_client_class):
         """Test successful video download."""
         # Mock the client and its response
         mock_client = AsyncMock()
@@ -154,7 +155,7 @@ class TestScraplingApiDownloadStrategy:
             mock_stream.return_value = True
 
             strategy = ScraplingApiDownloadStrategy({"retries": 1, "timeout": 30})
-            result = strategy.download_video("https://tiktok.com/test", "test_id", "/tmp")
+            result = await strategy.download_video("https://tiktok.com/test", "test_id", "/tmp")
 
         assert result is not None
         assert result.endswith("test_id.mp4")
@@ -162,7 +163,7 @@ class TestScraplingApiDownloadStrategy:
 
     @patch('platform_crawler.tiktok.tiktok_download_client.TikTokDownloadClient')
     @patch('platform_crawler.tiktok.download_strategies.scrapling_api_strategy.record_download_metrics')
-    def test_download_video_api_error(self, mock_metrics, mock_client_class):
+    async def test_download_video_api_error(self, mock_metrics, mock_client_class):
         """Test download with API error."""
         # Mock the client
         mock_client = AsyncMock()
@@ -175,14 +176,14 @@ class TestScraplingApiDownloadStrategy:
         mock_client.download_video_with_retry.return_value = mock_api_response
 
         strategy = ScraplingApiDownloadStrategy({"retries": 1, "timeout": 30})
-        result = strategy.download_video("https://tiktok.com/test", "test_id", "/tmp")
+        result = await strategy.download_video("https://tiktok.com/test", "test_id", "/tmp")
 
         assert result is None
         mock_metrics.assert_called_once()
 
     @patch('platform_crawler.tiktok.tiktok_download_client.TikTokDownloadClient')
     @patch('platform_crawler.tiktok.download_strategies.scrapling_api_strategy.record_download_metrics')
-    def test_download_video_file_too_large(self, mock_metrics, mock_client_class):
+    async def test_download_video_file_too_large(self, mock_metrics, mock_client_class):
         """Test download when file is too large."""
         # Mock the client and its response
         mock_client = MagicMock()
@@ -203,7 +204,7 @@ class TestScraplingApiDownloadStrategy:
             mock_stream.return_value = True
 
             strategy = ScraplingApiDownloadStrategy({"retries": 1, "timeout": 30})
-            result = strategy.download_video("https://tiktok.com/test", "test_id", "/tmp")
+            result = await strategy.download_video("https://tiktok.com/test", "test_id", "/tmp")
 
         assert result is None
         mock_metrics.assert_called_once()
@@ -253,7 +254,7 @@ class TestTikwmDownloadStrategy:
         assert video_id is None
 
     @patch('platform_crawler.tiktok.download_strategies.tikwm_strategy.record_download_metrics')
-    def test_download_video_success(self, mock_metrics):
+    async def test_download_video_success(self, mock_metrics):
         """Test successful video download."""
         # Mock the async helper method
         with patch.object(TikwmDownloadStrategy, '_download_video_async_with_retries',
@@ -263,7 +264,7 @@ class TestTikwmDownloadStrategy:
             with patch('os.path.exists', return_value=True), \
                     patch('os.path.getsize', return_value=1000000):  # 1MB file
                 strategy = TikwmDownloadStrategy({"retries": 1, "timeout": 30})
-                result = strategy.download_video("https://tiktok.com/test", "test_id", "/tmp")
+                result = await strategy.download_video("https://tiktok.com/test", "test_id", "/tmp")
 
         assert result == "/tmp/test_id.mp4"
         mock_metrics.assert_called_once()
@@ -274,7 +275,7 @@ class TestTikwmDownloadStrategy:
         assert call_args['file_size'] == 1000000
 
     @patch('platform_crawler.tiktok.download_strategies.tikwm_strategy.record_download_metrics')
-    def test_download_video_no_video_id(self, mock_metrics):
+    async def test_download_video_no_video_id(self, mock_metrics):
         """Test download with invalid URL (no video ID)."""
         with patch.object(TikwmDownloadStrategy, '_download_video_async_with_retries',
                           new_callable=AsyncMock) as mock_async_helper:
@@ -286,7 +287,7 @@ class TestTikwmDownloadStrategy:
             strategy = TikwmDownloadStrategy({"retries": 1, "timeout": 30})
 
             with pytest.raises(ValueError) as exc_info:
-                strategy.download_video("https://example.com/invalid", "test_id", "/tmp")
+                await strategy.download_video("https://example.com/invalid", "test_id", "/tmp")
 
             assert exc_info.value.error_code == "NO_VIDEO_ID"
 
@@ -297,7 +298,7 @@ class TestTikwmDownloadStrategy:
         assert call_args['error_code'] == 'NO_VIDEO_ID'
 
     @patch('platform_crawler.tiktok.download_strategies.tikwm_strategy.record_download_metrics')
-    def test_download_video_file_too_large(self, mock_metrics):
+    async def test_download_video_file_too_large(self, mock_metrics):
         """Test download when file is too large."""
         with patch.object(TikwmDownloadStrategy, '_download_video_async_with_retries',
                           new_callable=AsyncMock) as mock_async_helper:
@@ -309,7 +310,7 @@ class TestTikwmDownloadStrategy:
             strategy = TikwmDownloadStrategy({"retries": 1, "timeout": 30})
 
             with pytest.raises(ValueError) as exc_info:
-                strategy.download_video("https://tiktok.com/test", "test_id", "/tmp")
+                await strategy.download_video("https://tiktok.com/test", "test_id", "/tmp")
 
             assert exc_info.value.error_code == "SIZE_LIMIT_EXCEEDED"
 
@@ -323,48 +324,41 @@ class TestTikwmDownloadStrategy:
         """Test successful HEAD request to resolve URL."""
         strategy = TikwmDownloadStrategy({"timeout": 30})
 
-        with patch('platform_crawler.tiktok.download_strategies.tikwm_strategy.httpx.AsyncClient') as mock_httpx:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.url = "https://final-url.com/video.mp4"
-            mock_response.headers = {
-                "content-type": "video/mp4",
-                "content-length": "1000000"
-            }
-
-            # Make head method async
-            mock_session = MagicMock()
-            mock_session.head = AsyncMock(return_value=mock_response)
-            mock_httpx.return_value.__aenter__.return_value = mock_session
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.url = "https://final-url.com/video.mp4"
+        mock_response.headers = {
+            "content-type": "video/mp4",
+            "content-length": "1000000"
+        }
 
+        with patch.object(strategy.transport, 'head', AsyncMock(return_value=mock_response)) as mock_head:
             final_url = await strategy._resolve_url_with_head("https://tikwm.com/video.mp4", "test_id")
 
             assert final_url == "https://final-url.com/video.mp4"
+            mock_head.assert_awaited_once_with("https://tikwm.com/video.mp4")
 
     async def test_resolve_url_with_head_invalid_content_type(self):
         """Test HEAD request with non-video content type."""
         strategy = TikwmDownloadStrategy({"timeout": 30})
 
-        with patch('platform_crawler.tiktok.download_strategies.tikwm_strategy.httpx.AsyncClient') as mock_httpx:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.headers = {"content-type": "text/html"}
-
-            # Make head method async
-            mock_session = MagicMock()
-            mock_session.head = AsyncMock(return_value=mock_response)
-            mock_httpx.return_value.__aenter__.return_value = mock_session
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-type": "text/html"}
 
+        with patch.object(strategy.transport, 'head', AsyncMock(return_value=mock_response)):
             with pytest.raises(ValueError) as exc_info:
                 await strategy._resolve_url_with_head("https://tikwm.com/video.mp4", "test_id")
 
             assert exc_info.value.error_code == "INVALID_CONTENT_TYPE"
 
-    async def test_stream_video_file_success(self):
+    async def test_stream_video_file_success(self, tmp_path):
         """Test successful video file streaming."""
         strategy = TikwmDownloadStrategy({"timeout": 30})
+        output = tmp_path / "test.mp4"
 
         mock_response = MagicMock()
+        mock_response.status_code = 200
         mock_response.headers = {}
         mock_response.raise_for_status = MagicMock()
         mock_response.aiter_bytes.return_value = _AsyncBytesIterator([b'fake_video_data'])
@@ -375,27 +369,22 @@ class TestTikwmDownloadStrategy:
 
         mock_client = MagicMock()
         mock_client.stream.return_value = mock_stream_ctx
-        mock_client.stream.assert_not_called()
-
-        mock_client_ctx = MagicMock()
-        mock_client_ctx.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client_ctx.__aexit__ = AsyncMock(return_value=None)
-
-        with patch('platform_crawler.tiktok.download_strategies.tikwm_strategy.httpx.AsyncClient', return_value=mock_client_ctx), \
-                patch('builtins.open', mock_open()) as mocked_open, \
-                patch('os.path.getsize', return_value=1000000):  # 1MB file
 
+        with patch.object(PooledHttpTransport, 'client', new_callable=PropertyMock, return_value=mock_client):
             success = await strategy._stream_video_file(
                 "http://example.com/video.mp4",
-                "/tmp/test.mp4",
+                str(output),
                 "test_id"
             )
 
         assert success is True
-        mocked_open.assert_called_once_with("/tmp/test.mp4", "wb")
-        mock_client.stream.assert_called_once_with("GET", "http://example.com/video.mp4")
+        assert output.read_bytes() == b'fake_video_data'
+        assert not (tmp_path / "test.mp4.part").exists()
+        mock_client.stream.assert_called_once_with(
+            "GET", "http://example.com/video.mp4", headers={"Range": "bytes=0-"}
+        )
 
-    async def test_stream_video_file_size_exceeded(self):
+    async def test_stream_video_file_size_exceeded(self, tmp_path):
         """Test video file streaming with size exceeded."""
         strategy = TikwmDownloadStrategy({"timeout": 30})
 
@@ -405,6 +394,7 @@ class TestTikwmDownloadStrategy:
         oversized_chunk = b'a' * 2048
 
         mock_response = MagicMock()
+        mock_response.status_code = 200
         mock_response.headers = {}
         mock_response.raise_for_status = MagicMock()
         mock_response.aiter_bytes.return_value = _AsyncBytesIterator([oversized_chunk])
@@ -415,24 +405,17 @@ class TestTikwmDownloadStrategy:
 
         mock_client = MagicMock()
         mock_client.stream.return_value = mock_stream_ctx
-        mock_client_ctx = MagicMock()
-        mock_client_ctx.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client_ctx.__aexit__ = AsyncMock(return_value=None)
-
-        with patch('platform_crawler.tiktok.download_strategies.tikwm_strategy.httpx.AsyncClient', return_value=mock_client_ctx), \
-                patch('builtins.open', mock_open()) as mocked_open, \
-                patch('os.remove') as mock_remove:
 
+        with patch.object(PooledHttpTransport, 'client', new_callable=PropertyMock, return_value=mock_client):
             with pytest.raises(ValueError) as exc_info:
                 await strategy._stream_video_file(
                     "http://example.com/video.mp4",
-                    "/tmp/test.mp4",
+                    str(tmp_path / "test.mp4"),
                     "test_id"
                 )
 
         assert exc_info.value.error_code == "SIZE_LIMIT_EXCEEDED"
-        mocked_open.assert_called_once_with("/tmp/test.mp4", "wb")
-        mock_remove.assert_called_once_with("/tmp/test.mp4")
+        assert list(tmp_path.iterdir()) == []
 
     async def test_extract_keyframes_method_exists(self):
         """Test that extract_keyframes method exists and is callable."""
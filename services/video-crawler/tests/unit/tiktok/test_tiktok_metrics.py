@@ -207,6 +207,23 @@ class TestTikTokMetricsCollector:
         assert stats["avg_execution_time"] is None
         assert stats["total_samples"] == 0
 
+    def test_get_strategy_stats_transfer_totals(self):
+        """Test bytes transferred and retries are summed, including failures."""
+        collector = TikTokMetricsCollector()
+
+        collector.record_download_attempt(
+            DownloadMetrics("tikwm", "test1", "url1", True, retries=1, bytes_transferred=3000)
+        )
+        collector.record_download_attempt(
+            DownloadMetrics("tikwm", "test2", "url2", False, retries=2, bytes_transferred=500)
+        )
+        collector.record_download_attempt(DownloadMetrics("tikwm", "test3", "url3", True))
+
+        stats = collector.get_strategy_stats("tikwm")
+
+        assert stats["bytes_transferred"] == 3500
+        assert stats["total_retries"] == 3
+
     def test_get_all_stats(self):
         """Test getting all statistics."""
         collector = TikTokMetricsCollector()
@@ -0,0 +1,167 @@
+"""
+Unit tests for FileIndex and index-backed cleanup
+"""
+
+import os
+import time
+
+import pytest
+
+from utils.file_cleanup import VideoCleanupManager
+from utils.file_index import FileIndex
+
+pytestmark = pytest.mark.unit
+
+DAY = 86400
+
+
+@pytest.fixture
+def index(tmp_path):
+    file_index = FileIndex(str(tmp_path / "index.sqlite3"))
+    yield file_index
+    file_index.close()
+
+
+@pytest.fixture
+def video_dir(tmp_path):
+    path = tmp_path / "videos"
+    path.mkdir()
+    return path
+
+
+def _write(path, size, age_days):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    mtime = time.time() - age_days * DAY
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestFileIndex:
+
+    def test_record_and_walk_oldest_first(self, index, video_dir):
+        newest = _write(video_dir / "a" / "new.mp4", 10, 1)
+        oldest = _write(video_dir / "b" / "old.mp4", 20, 9)
+        middle = _write(video_dir / "mid.mp4", 30, 5)
+        for path in (newest, oldest, middle):
+            index.record(str(path), job_id="job-1")
+
+        entries = index.oldest(str(video_dir))
+
+        assert [entry.path for entry in entries] == [str(oldest), str(middle), str(newest)]
+        assert entries[0].size == 20
+        assert entries[0].job_id == "job-1"
+        assert index.total_size(str(video_dir)) == 60
+
+    def test_pages_continue_after_last_entry(self, index, video_dir):
+        paths = [_write(video_dir / f"{i}.mp4", 1, 10 - i) for i in range(5)]
+        for path in paths:
+            index.record(str(path))
+
+        first = index.oldest(str(video_dir), limit=2)
+        second = index.oldest(str(video_dir), limit=2, after=(first[-1].mtime, first[-1].path))
+
+        assert [entry.path for entry in first + second] == [str(path) for path in paths[:4]]
+
+    def test_rerecording_keeps_owning_job(self, index, video_dir):
+        path = _write(video_dir / "v.mp4", 10, 0)
+        index.record(str(path), job_id="job-1")
+        path.write_bytes(b"x" * 50)
+
+        index.record(str(path))
+
+        (entry,) = index.oldest(str(video_dir))
+        assert entry.size == 50
+        assert entry.job_id == "job-1"
+
+    def test_queries_are_limited_to_root(self, index, tmp_path, video_dir):
+        inside = _write(video_dir / "v.mp4", 10, 0)
+        sibling = _write(tmp_path / "videos-other" / "v.mp4", 10, 0)
+        index.record(str(inside))
+        index.record(str(sibling))
+
+        assert [entry.path for entry in index.oldest(str(video_dir))] == [str(inside)]
+        assert index.count(str(video_dir)) == 1
+
+    def test_scan_rebuilds_entries_from_disk(self, index, video_dir):
+        kept = _write(video_dir / "kept.mp4", 10, 0)
+        gone = _write(video_dir / "gone.mp4", 10, 0)
+        index.record(str(kept), job_id="job-1")
+        index.record(str(gone))
+        gone.unlink()
+        unindexed = _write(video_dir / "uploader" / "new.mp4", 10, 0)
+
+        assert index.needs_scan(str(video_dir), max_age_s=0)
+        assert index.scan(str(video_dir)) == 2
+
+        entries = {entry.path: entry for entry in index.oldest(str(video_dir))}
+        assert set(entries) == {str(kept), str(unindexed)}
+        assert entries[str(kept)].job_id == "job-1"
+        assert not index.needs_scan(str(video_dir), max_age_s=3600)
+
+
+class TestIndexedCleanup:
+
+    def test_removes_expired_files(self, index, video_dir):
+        old = _write(video_dir / "uploader" / "old.mp4", 100, 10)
+        recent = _write(video_dir / "uploader" / "recent.mp4", 100, 1)
+
+        results = VideoCleanupManager(7).cleanup_indexed(index, str(video_dir))
+
+        assert [info['path'] for info in results['files_removed']] == [str(old)]
+        assert results['files_removed'][0]['uploader'] == "uploader"
+        assert results['files_removed'][0]['reason'] == "expired"
+        assert results['total_size_freed'] == 100
+        assert not old.exists()
+        assert recent.exists()
+        assert [entry.path for entry in index.oldest(str(video_dir))] == [str(recent)]
+
+    def test_budget_removes_oldest_files_until_under_limit(self, index, video_dir):
+        files = [_write(video_dir / f"{i}.mp4", 100, 5 - i) for i in range(5)]
+
+        results = VideoCleanupManager(7).cleanup_indexed(index, str(video_dir), max_total_bytes=250)
+
+        assert [info['path'] for info in results['files_removed']] == [str(path) for path in files[:3]]
+        assert all(info['reason'] == "over_budget" for info in results['files_removed'])
+        assert results['bytes_remaining'] == 200
+        assert [path.exists() for path in files] == [False, False, False, True, True]
+
+    def test_dry_run_lists_without_removing(self, index, video_dir):
+        old = _write(video_dir / "old.mp4", 100, 10)
+
+        results = VideoCleanupManager(7).cleanup_indexed(index, str(video_dir), dry_run=True)
+
+        assert [info['path'] for info in results['files_skipped']] == [str(old)]
+        assert results['files_removed'] == []
+        assert old.exists()
+        assert index.count(str(video_dir)) == 1
+
+    def test_files_removed_outside_cleanup_are_forgotten(self, index, video_dir):
+        old = _write(video_dir / "old.mp4", 100, 10)
+        index.scan(str(video_dir))
+        old.unlink()
+
+        results = VideoCleanupManager(7).cleanup_indexed(index, str(video_dir))
+
+        assert results['files_removed'] == []
+        assert index.count(str(video_dir)) == 0
+
+    def test_rewritten_file_is_not_removed_by_its_old_age(self, index, video_dir):
+        path = _write(video_dir / "v.mp4", 100, 10)
+        index.scan(str(video_dir))
+        path.write_bytes(b"y" * 100)
+
+        results = VideoCleanupManager(7).cleanup_indexed(index, str(video_dir))
+
+        assert results['files_removed'] == []
+        assert path.exists()
+
+    def test_removes_content_hash_sidecar_with_video(self, index, video_dir):
+        video = _write(video_dir / "old.mp4", 100, 10)
+        index.record(str(video))
+        sidecar = video_dir / "old.mp4.sha256"
+        sidecar.write_text("0" * 64)
+
+        VideoCleanupManager(7).cleanup_indexed(index, str(video_dir))
+
+        assert not sidecar.exists()
@@ -0,0 +1,64 @@
+"""
+Content hashes of downloaded videos.
+
+Downloaders that hash a video while streaming it record the digest in a
+``<video>.sha256`` sidecar, so the processing side can address the file by
+its content without reading it a second time.
+"""
+
+import hashlib
+import os
+from typing import Optional
+
+from common_py.logging_config import configure_logging
+
+logger = configure_logging("video-crawler:content_hash")
+
+HASH_SIDECAR_SUFFIX = ".sha256"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def sidecar_path(video_path: str) -> str:
+    return f"{video_path}{HASH_SIDECAR_SUFFIX}"
+
+
+def record_content_hash(video_path: str, digest: str) -> None:
+    """Store ``digest`` as the SHA-256 of ``video_path``."""
+    try:
+        with open(sidecar_path(video_path), "w", encoding="ascii") as f:
+            f.write(digest)
+    except OSError as e:
+        logger.warning("Failed to record content hash", video_path=video_path, error=str(e))
+
+
+def read_content_hash(video_path: str) -> Optional[str]:
+    """Return the recorded SHA-256 of ``video_path``, or None when it is missing or stale.
+
+    A sidecar older than the video belongs to an earlier file at the same path.
+    """
+    sidecar = sidecar_path(video_path)
+    try:
+        if os.stat(sidecar).st_mtime < os.stat(video_path).st_mtime:
+            return None
+        with open(sidecar, "r", encoding="ascii") as f:
+            digest = f.read().strip().lower()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+        return None
+    return digest
+
+
+def compute_content_hash(video_path: str) -> Optional[str]:
+    """Hash ``video_path`` from disk and record the result; None if it cannot be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(video_path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    except OSError as e:
+        logger.warning("Failed to hash video file", video_path=video_path, error=str(e))
+        return None
+    hexdigest = digest.hexdigest()
+    record_content_hash(video_path, hexdigest)
+    return hexdigest
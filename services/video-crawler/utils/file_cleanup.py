@@ -1,7 +1,8 @@
 """
 File cleanup utilities for video crawler service.
 
-Provides functionality to automatically remove old video files based on age.
+Provides functionality to automatically remove old video files based on age,
+and to keep the video directory under a size budget.
 """
 
 import os
@@ -10,6 +11,9 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from common_py.logging_config import configure_logging
 
+from utils.content_hash import sidecar_path
+from utils.file_index import FileIndex, IndexedFile
+
 logger = configure_logging("video-crawler:file_cleanup")
 
 
@@ -174,6 +178,126 @@ class VideoCleanupManager:
 
         return results
 
+    def cleanup_indexed(
+        self,
+        index: FileIndex,
+        video_dir: str,
+        dry_run: bool = False,
+        max_total_bytes: int = 0,
+        rescan_after_s: float = 0,
+    ) -> Dict[str, Any]:
+        """
+        Remove indexed files oldest-first, without listing the directory.
+
+        Files past the retention period are removed, then further files while
+        the directory holds more than ``max_total_bytes`` (0 disables the
+        budget). The walk stops at the first file that is neither, so a run
+        only touches the files it removes. The directory is scanned into the
+        index on first use and again after ``rescan_after_s`` seconds.
+
+        Args:
+            index: File index covering ``video_dir``
+            video_dir: Directory to clean up
+            dry_run: If True, only list files that would be removed
+            max_total_bytes: Size budget for ``video_dir`` in bytes
+            rescan_after_s: Age after which the index is rebuilt from disk (0 = never)
+
+        Returns:
+            Dictionary with cleanup results
+        """
+        root = os.path.abspath(video_dir)
+        if index.needs_scan(root, rescan_after_s):
+            index.scan(root)
+
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).timestamp()
+        remaining = index.total_size(root)
+        results = {
+            'files_removed': [],
+            'files_skipped': [],
+            'total_size_freed': 0,
+            'total_files': 0,
+            'dry_run': dry_run,
+        }
+
+        after = None
+        done = False
+        while not done:
+            batch = index.oldest(root, after=after)
+            if not batch:
+                break
+            after = (batch[-1].mtime, batch[-1].path)
+            forgotten = []
+
+            for entry in batch:
+                expired = entry.mtime < cutoff
+                if not expired and not (max_total_bytes and remaining > max_total_bytes):
+                    done = True
+                    break
+
+                try:
+                    stat = os.stat(entry.path)
+                except FileNotFoundError:
+                    forgotten.append(entry.path)
+                    remaining -= entry.size
+                    continue
+                if stat.st_mtime != entry.mtime or stat.st_size != entry.size:
+                    # Rewritten since it was indexed; re-queue it under its new age
+                    index.record(entry.path, size=stat.st_size, mtime=stat.st_mtime)
+                    remaining += stat.st_size - entry.size
+                    continue
+
+                file_info = self._indexed_file_info(entry, root, 'expired' if expired else 'over_budget')
+                results['total_files'] += 1
+                remaining -= entry.size
+                if dry_run:
+                    results['files_skipped'].append(file_info)
+                    continue
+
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.error(f"[CLEANUP-ERROR] Failed to remove {file_info['filename']}: {str(e)}")
+                    results['files_skipped'].append(file_info)
+                    continue
+
+                forgotten.append(entry.path)
+                sidecar = sidecar_path(entry.path)
+                if os.path.exists(sidecar):
+                    os.remove(sidecar)
+                    forgotten.append(sidecar)
+                results['files_removed'].append(file_info)
+                results['total_size_freed'] += entry.size
+                logger.info(
+                    f"[CLEANUP-REMOVED] {file_info['filename']} | Size: {entry.size/1024/1024:.2f}MB | "
+                    f"Age: {file_info['file_age_days']} days | Reason: {file_info['reason']}")
+
+            index.forget(forgotten)
+
+        results['bytes_remaining'] = remaining
+        if results['files_removed']:
+            freed_mb = results['total_size_freed'] / (1024 * 1024)
+            logger.info(f"[CLEANUP-SUMMARY] Removed {len(results['files_removed'])} files, freed {freed_mb:.2f}MB (dry_run={dry_run})")
+
+        return results
+
+    def _indexed_file_info(self, entry: IndexedFile, root: str, reason: str) -> Dict[str, Any]:
+        """File info for an index entry, in the shape returned by ``find_old_files``."""
+        create_time = datetime.fromtimestamp(entry.mtime)
+        relative = Path(os.path.relpath(entry.path, root))
+        return {
+            'path': entry.path,
+            'filename': relative.name,
+            'uploader': relative.parts[0] if len(relative.parts) > 1 else Path(root).name,
+            'job_id': entry.job_id,
+            'create_time': create_time,
+            'file_size': entry.size,
+            'is_old': reason == 'expired',
+            'reason': reason,
+            'file_age_days': (datetime.now() - create_time).days
+        }
+
     def cleanup_empty_directories(self, video_dir: str, dry_run: bool = False) -> List[str]:
         """
         Remove empty uploader directories.
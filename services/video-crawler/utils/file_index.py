@@ -0,0 +1,214 @@
+"""
+Persistent index of downloaded video files.
+
+Records the path, size, modification time and owning job of every file
+written under the video directories, so cleanup can walk files oldest-first
+and track the total size on disk without listing and stat-ing every file.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from common_py.logging_config import configure_logging
+
+logger = configure_logging("video-crawler:file_index")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    job_id TEXT
+);
+CREATE INDEX IF NOT EXISTS files_by_mtime ON files (mtime, path);
+CREATE TABLE IF NOT EXISTS scanned_roots (
+    root TEXT PRIMARY KEY,
+    scanned_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class IndexedFile:
+    """One file as recorded in the index."""
+
+    path: str
+    size: int
+    mtime: float
+    job_id: Optional[str] = None
+
+
+def _prefix_range(root: str) -> Tuple[str, str]:
+    """Bounds selecting every path below ``root`` with a range scan."""
+    prefix = os.path.join(os.path.abspath(root), "")
+    return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+
+class FileIndex:
+    """SQLite-backed index of files under the video directories.
+
+    The database is opened on first use. All methods are blocking and
+    thread-safe; async callers run them with ``asyncio.to_thread``.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def record(
+        self,
+        path: str,
+        job_id: Optional[str] = None,
+        size: Optional[int] = None,
+        mtime: Optional[float] = None,
+    ) -> bool:
+        """Add or refresh ``path``; the owning job is kept when ``job_id`` is None.
+
+        Returns False when the file does not exist.
+        """
+        path = os.path.abspath(path)
+        if size is None or mtime is None:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                return False
+            size, mtime = stat.st_size, stat.st_mtime
+
+        with self._lock:
+            self._connection().execute(
+                """
+                INSERT INTO files (path, size, mtime, job_id) VALUES (?, ?, ?, ?)
+                ON CONFLICT (path) DO UPDATE SET
+                    size = excluded.size,
+                    mtime = excluded.mtime,
+                    job_id = COALESCE(excluded.job_id, files.job_id)
+                """,
+                (path, size, mtime, job_id),
+            )
+        return True
+
+    def forget(self, paths: Iterable[str]) -> None:
+        rows = [(os.path.abspath(path),) for path in paths]
+        if not rows:
+            return
+        with self._lock:
+            self._connection().executemany("DELETE FROM files WHERE path = ?", rows)
+
+    def oldest(
+        self,
+        root: str,
+        limit: int = 500,
+        after: Optional[Tuple[float, str]] = None,
+    ) -> List[IndexedFile]:
+        """Files below ``root`` in ascending mtime order, continuing past ``after``."""
+        low, high = _prefix_range(root)
+        last_mtime, last_path = after if after else (float("-inf"), "")
+        with self._lock:
+            rows = self._connection().execute(
+                """
+                SELECT path, size, mtime, job_id FROM files
+                WHERE (mtime, path) > (?, ?) AND path >= ? AND path < ?
+                ORDER BY mtime, path
+                LIMIT ?
+                """,
+                (last_mtime, last_path, low, high, limit),
+            ).fetchall()
+        return [IndexedFile(*row) for row in rows]
+
+    def total_size(self, root: str) -> int:
+        low, high = _prefix_range(root)
+        with self._lock:
+            (total,) = self._connection().execute(
+                "SELECT COALESCE(SUM(size), 0) FROM files WHERE path >= ? AND path < ?",
+                (low, high),
+            ).fetchone()
+        return total
+
+    def count(self, root: str) -> int:
+        low, high = _prefix_range(root)
+        with self._lock:
+            (count,) = self._connection().execute(
+                "SELECT COUNT(*) FROM files WHERE path >= ? AND path < ?",
+                (low, high),
+            ).fetchone()
+        return count
+
+    def needs_scan(self, root: str, max_age_s: float) -> bool:
+        """True when ``root`` was never scanned, or not within ``max_age_s`` seconds."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT scanned_at FROM scanned_roots WHERE root = ?",
+                (os.path.abspath(root),),
+            ).fetchone()
+        return row is None or (max_age_s > 0 and time.time() - row[0] > max_age_s)
+
+    def scan(self, root: str) -> int:
+        """Rebuild the entries below ``root`` from disk and return the file count.
+
+        Picks up files written without going through ``record`` and drops
+        entries for files removed behind the index's back. Owning jobs of
+        files that are still present are kept.
+        """
+        root = os.path.abspath(root)
+        found = []
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                found.append((path, stat.st_size, stat.st_mtime))
+
+        low, high = _prefix_range(root)
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS scan_paths (path TEXT PRIMARY KEY)")
+                conn.execute("DELETE FROM scan_paths")
+                conn.executemany("INSERT OR IGNORE INTO scan_paths (path) VALUES (?)", [(p,) for p, _, _ in found])
+                conn.execute(
+                    "DELETE FROM files WHERE path >= ? AND path < ? AND path NOT IN (SELECT path FROM scan_paths)",
+                    (low, high),
+                )
+                conn.executemany(
+                    """
+                    INSERT INTO files (path, size, mtime) VALUES (?, ?, ?)
+                    ON CONFLICT (path) DO UPDATE SET size = excluded.size, mtime = excluded.mtime
+                    """,
+                    found,
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO scanned_roots (root, scanned_at) VALUES (?, ?)",
+                    (root, time.time()),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        logger.info(f"[FILE-INDEX] Indexed {len(found)} files under {root}")
+        return len(found)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,81 @@
+"""Benchmark CLIP embedding throughput (images/sec) against batch size.
+
+Run from the service directory::
+
+    python benchmarks/batch_throughput.py --batch-sizes 1 4 8 16 32 --images 128
+
+Synthetic images are written to a temporary directory, so the numbers cover
+image decoding plus the RGB and grayscale forward passes, i.e. the work done
+per micro-batch by ``VisionEmbeddingService``.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+from PIL import Image
+
+SERVICE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SERVICE_DIR))
+
+
+def _write_images(directory: Path, count: int, size: int) -> List[str]:
+    rng = np.random.default_rng(0)
+    paths = []
+    for index in range(count):
+        pixels = rng.integers(0, 256, (size, size, 3), dtype=np.uint8)
+        path = directory / f"bench_{index:04d}.jpg"
+        Image.fromarray(pixels).save(path, quality=90)
+        paths.append(str(path))
+    return paths
+
+
+async def _run(args: argparse.Namespace) -> None:
+    os.environ["DEVICE"] = args.device
+
+    from embedding import EmbeddingExtractor
+
+    extractor = EmbeddingExtractor(args.model)
+    await extractor.initialize()
+    if not extractor.initialized:
+        print("CLIP model failed to load; results would measure mock embeddings")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_images(Path(tmp), args.images, args.image_size)
+
+        # Warm-up pass so lazy initialisation does not skew the first size
+        await extractor.extract_embeddings_batch(paths[: max(args.batch_sizes)])
+
+        print(f"device={extractor.device} model={args.model} images={args.images}")
+        print(f"{'batch_size':>10} {'seconds':>10} {'images/sec':>12}")
+        for batch_size in args.batch_sizes:
+            start = time.perf_counter()
+            for offset in range(0, len(paths), batch_size):
+                await extractor.extract_embeddings_batch(
+                    paths[offset:offset + batch_size]
+                )
+            elapsed = time.perf_counter() - start
+            print(f"{batch_size:>10} {elapsed:>10.2f} {len(paths) / elapsed:>12.1f}")
+
+    await extractor.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    parser.add_argument("--images", type=int, default=128)
+    parser.add_argument("--image-size", type=int, default=512)
+    parser.add_argument("--device", default="cpu", choices=["cpu", "cuda"])
+    parser.add_argument("--model", default="clip-vit-b32")
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
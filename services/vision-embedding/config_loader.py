@@ -49,6 +49,17 @@ class VisionEmbeddingConfig:
     # Device configuration
     DEVICE: str = os.getenv("DEVICE", "cuda")
 
+    # Micro-batching: concurrent requests are embedded together, up to
+    # EMBED_BATCH_SIZE images or EMBED_BATCH_MAX_WAIT_MS of waiting
+    EMBED_BATCH_SIZE: int = int(os.getenv("EMBED_BATCH_SIZE", "16"))
+    EMBED_BATCH_MAX_WAIT_MS: float = float(
+        os.getenv("EMBED_BATCH_MAX_WAIT_MS", "20")
+    )
+
+    # Threads running CLIP forward passes and image decoding off the event
+    # loop; 0 runs them inline
+    INFERENCE_WORKERS: int = int(os.getenv("INFERENCE_WORKERS", "2"))
+
     # Logging (from global config)
     LOG_LEVEL: str = global_config.LOG_LEVEL
 
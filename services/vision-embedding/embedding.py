@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple
+import os
+from typing import List, Optional, Sequence, Tuple
 
 import numpy as np
 import torch
@@ -8,6 +9,7 @@ from PIL import Image
 from transformers import CLIPModel, CLIPProcessor
 
 from common_py.logging_config import configure_logging
+from vision_common import InferenceExecutor
 
 from config_loader import config
 from embedding_components.clip_processor import (
@@ -18,12 +20,23 @@ from embedding_components.mock_generator import MockEmbeddingGenerator
 
 logger = configure_logging("vision-embedding:embedding")
 
+EmbeddingPair = Tuple[Optional[np.ndarray], Optional[np.ndarray]]
+
+
+def _load_rgb_image(image_path: str) -> Image.Image:
+    return Image.open(image_path).convert("RGB")
+
 
 class EmbeddingExtractor:
     """Extract visual embeddings using the configured CLIP model."""
 
-    def __init__(self, model_name: str = "clip-vit-b32") -> None:
+    def __init__(
+        self,
+        model_name: str = "clip-vit-b32",
+        executor: Optional[InferenceExecutor] = None,
+    ) -> None:
         self.model_name = model_name
+        self.executor = executor or InferenceExecutor("clip_inference", max_workers=0)
         self.device = None
         self.model = None
         self.processor = None
@@ -58,6 +71,19 @@ class EmbeddingExtractor:
                     device=str(self.device),
                 )
 
+            if self.device.type == "cpu" and self.executor.max_workers > 1:
+                # Split cores between concurrent forward passes instead of
+                # letting every worker spin up a full intra-op thread pool
+                torch_threads = max(
+                    1, (os.cpu_count() or 1) // self.executor.max_workers
+                )
+                torch.set_num_threads(torch_threads)
+                logger.info(
+                    "Configured torch threads per inference worker",
+                    torch_threads=torch_threads,
+                    inference_workers=self.executor.max_workers,
+                )
+
             # Load model and processor
             if self.model_name == "clip-vit-b32":
                 model_id = "openai/clip-vit-base-patch32"
@@ -75,6 +101,7 @@ class EmbeddingExtractor:
                 self.model,
                 self.processor,
                 self.device,
+                executor=self.executor,
             )
 
             self.initialized = True
@@ -91,7 +118,7 @@ class EmbeddingExtractor:
         """Extract RGB and grayscale embeddings from an image."""
         try:
             # Load and preprocess image
-            image = Image.open(image_path).convert("RGB")
+            image = await self.executor.run(_load_rgb_image, image_path)
 
             if self.initialized:
                 # Real CLIP embeddings
@@ -108,6 +135,87 @@ class EmbeddingExtractor:
             )
             return None, None
 
+    async def extract_embeddings_batch(
+        self,
+        image_paths: Sequence[str],
+        mask_paths: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[EmbeddingPair]:
+        """Extract RGB and grayscale embeddings for several images at once.
+
+        ``mask_paths`` optionally pairs each image with a mask (or ``None``).
+        All images that load successfully are embedded in a single forward
+        pass. Returns one ``(emb_rgb, emb_gray)`` pair per input, with
+        ``(None, None)`` for images that failed.
+        """
+        if mask_paths is None:
+            mask_paths = [None] * len(image_paths)
+
+        results: List[EmbeddingPair] = [(None, None)] * len(image_paths)
+        images, positions = await self.executor.run(
+            self._load_images, image_paths, mask_paths
+        )
+
+        if not images:
+            return results
+
+        try:
+            if self.initialized:
+                processor = self.clip_processor_instance
+                embeddings = await processor.extract_clip_embeddings_batch(
+                    images
+                )
+            else:
+                # Mock embeddings for MVP
+                embeddings = [
+                    await self.mock_generator.extract_mock_embeddings(image)
+                    for image in images
+                ]
+        except Exception as e:
+            logger.error(
+                "Failed to extract batch embeddings",
+                batch_size=len(images),
+                error=str(e),
+            )
+            return results
+
+        for position, embedding_pair in zip(positions, embeddings):
+            results[position] = embedding_pair
+        return results
+
+    def _load_images(
+        self,
+        image_paths: Sequence[str],
+        mask_paths: Sequence[Optional[str]],
+    ) -> Tuple[List[Image.Image], List[int]]:
+        """Decode a batch of images, skipping (and logging) unreadable ones."""
+        images: List[Image.Image] = []
+        positions: List[int] = []
+
+        for position, (image_path, mask_path) in enumerate(
+            zip(image_paths, mask_paths)
+        ):
+            try:
+                if mask_path and self.initialized:
+                    image = self.clip_processor_instance.load_masked_image(
+                        image_path,
+                        mask_path,
+                        config.IMG_SIZE,
+                    )
+                else:
+                    image = _load_rgb_image(image_path)
+            except Exception as e:
+                logger.error(
+                    "Failed to load image for embedding",
+                    image_path=image_path,
+                    mask_path=mask_path,
+                    error=str(e),
+                )
+                continue
+            images.append(image)
+            positions.append(position)
+
+        return images, positions
+
     async def cleanup(self) -> None:
         """Clean up resources."""
         if self.model is not None:
@@ -132,5 +240,5 @@ class EmbeddingExtractor:
                 config.IMG_SIZE,
             )
         # Mock embeddings for MVP with mask
-        image = Image.open(image_path).convert("RGB")
+        image = await self.executor.run(_load_rgb_image, image_path)
         return await self.mock_generator.extract_mock_embeddings(image)
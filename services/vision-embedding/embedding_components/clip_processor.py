@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple
+import time
+from typing import List, Optional, Sequence, Tuple
 
 import numpy as np
 import torch
@@ -9,6 +10,7 @@ from PIL import Image
 from transformers import CLIPModel, CLIPProcessor as CLIPProcessorTransformers
 
 from common_py.logging_config import configure_logging
+from vision_common import InferenceExecutor
 
 logger = configure_logging("vision-embedding:clip_processor")
 
@@ -19,60 +21,94 @@ class CLIPProcessor:
         model: CLIPModel,
         processor: CLIPProcessorTransformers,
         device: torch.device,
+        executor: Optional[InferenceExecutor] = None,
     ) -> None:
         self.model = model
         self.processor = processor
         self.device = device
+        # Forward passes run off the event loop; torch releases the GIL
+        self.executor = executor or InferenceExecutor("clip_inference", max_workers=0)
+
+    def embed_images(
+        self, images: Sequence[Image.Image]
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Embed the RGB and grayscale variants of images in one forward pass.
+
+        Returns one ``(rgb_embedding, gray_embedding)`` pair per image.
+        """
+        count = len(images)
+        if count == 0:
+            return []
+
+        # Grayscale variants are converted back to RGB for the CLIP processor
+        variants = list(images) + [
+            image.convert("L").convert("RGB") for image in images
+        ]
+
+        with torch.no_grad():
+            inputs = self.processor(images=variants, return_tensors="pt")
+            inputs = {
+                key: value.to(self.device)
+                for key, value in inputs.items()
+            }
+            features = self.model.get_image_features(**inputs)
+            embeddings = F.normalize(features, p=2, dim=1).cpu().numpy()
+
+        return [
+            (embeddings[index], embeddings[count + index])
+            for index in range(count)
+        ]
+
+    async def extract_clip_embeddings_batch(
+        self, images: Sequence[Image.Image]
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Extract real CLIP embeddings for a batch of images."""
+        start_time = time.time()
+
+        embeddings = await self.executor.run(self.embed_images, images)
+
+        total_time = time.time() - start_time
+        logger.info(
+            "CLIP embedding extraction",
+            batch_size=len(images),
+            time_ms=round(total_time * 1000, 2),
+            device=str(self.device),
+        )
+
+        return embeddings
 
     async def extract_clip_embeddings(
         self, image: Image.Image
     ) -> Tuple[np.ndarray, np.ndarray]:
         """Extract real CLIP embeddings."""
-        import time
-        start_time = time.time()
-        
-        with torch.no_grad():
-            # RGB embedding
-            rgb_inputs = self.processor(images=image, return_tensors="pt")
-            rgb_inputs = {
-                key: value.to(self.device)
-                for key, value in rgb_inputs.items()
-            }
-            rgb_features = self.model.get_image_features(**rgb_inputs)
-            rgb_embedding = F.normalize(
-                rgb_features,
-                p=2,
-                dim=1,
-            ).cpu().numpy()[0]
-
-            # Grayscale embedding
-            gray_image = image.convert("L").convert(
-                "RGB"
-            )  # Convert to grayscale then back to RGB
-            gray_inputs = self.processor(
-                images=gray_image,
-                return_tensors="pt",
-            )
-            gray_inputs = {
-                key: value.to(self.device)
-                for key, value in gray_inputs.items()
-            }
-            gray_features = self.model.get_image_features(**gray_inputs)
-            gray_embedding = F.normalize(
-                gray_features,
-                p=2,
-                dim=1,
-            ).cpu().numpy()[0]
-            
-            total_time = time.time() - start_time
-            
-            logger.info(
-                "CLIP embedding extraction",
-                time_ms=round(total_time * 1000, 2),
-                device=str(self.device),
-            )
+        embeddings = await self.extract_clip_embeddings_batch([image])
+        return embeddings[0]
+
+    def load_masked_image(
+        self,
+        image_path: str,
+        mask_path: str,
+        img_size: Tuple[int, int],
+    ) -> Image.Image:
+        """Load an image, resize it to img_size and apply its mask."""
+        image = Image.open(image_path).convert("RGB")
 
-            return rgb_embedding, gray_embedding
+        # Resize image to img_size
+        if image.size != img_size:
+            image = image.resize(
+                img_size,
+                Image.LANCZOS,
+            )  # Using LANCZOS for better quality resizing
+
+        # Load mask
+        mask = Image.open(mask_path).convert("L")
+
+        # Resize mask to match image size if needed
+        if mask.size != img_size:
+            mask = mask.resize(img_size, Image.NEAREST)
+
+        # Apply mask to image
+        return self._apply_mask_to_image(image, mask)
 
     async def extract_embeddings_with_mask(
         self,
@@ -82,25 +118,12 @@ class CLIPProcessor:
     ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
         """Extract RGB and grayscale embeddings from an image with a mask."""
         try:
-            # Load and preprocess image
-            image = Image.open(image_path).convert("RGB")
-
-            # Resize image to img_size
-            if image.size != img_size:
-                image = image.resize(
-                    img_size,
-                    Image.LANCZOS,
-                )  # Using LANCZOS for better quality resizing
-
-            # Load mask
-            mask = Image.open(mask_path).convert("L")
-
-            # Resize mask to match image size if needed
-            if mask.size != img_size:
-                mask = mask.resize(img_size, Image.NEAREST)
-
-            # Apply mask to image
-            masked_image = self._apply_mask_to_image(image, mask)
+            masked_image = await self.executor.run(
+                self.load_masked_image,
+                image_path,
+                mask_path,
+                img_size,
+            )
 
             return await self.extract_clip_embeddings(masked_image)
 
@@ -13,6 +13,9 @@ class VisionEmbeddingHandler:
             self.db,
             self.broker,
             config.EMBED_MODEL,
+            batch_size=config.EMBED_BATCH_SIZE,
+            batch_max_wait_ms=config.EMBED_BATCH_MAX_WAIT_MS,
+            inference_workers=config.INFERENCE_WORKERS,
         )
         self.initialized = False
 
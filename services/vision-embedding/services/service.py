@@ -1,15 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from common_py.crud import ProductImageCRUD, VideoFrameCRUD
 from common_py.database import DatabaseManager
 from common_py.logging_config import configure_logging
 from common_py.messaging import MessageBroker
 
-from embedding import EmbeddingExtractor
-from vision_common import JobProgressManager
+from embedding import EmbeddingExtractor, EmbeddingPair
+from vision_common import InferenceExecutor, JobProgressManager, MicroBatcher
 
 
 logger = configure_logging("vision-embedding:service")
@@ -23,6 +24,9 @@ class VisionEmbeddingService:
         db: DatabaseManager,
         broker: MessageBroker,
         embed_model: str,
+        batch_size: int = 16,
+        batch_max_wait_ms: float = 20.0,
+        inference_workers: int = 2,
     ) -> None:
         self.db = db
         self.broker = broker
@@ -32,8 +36,24 @@ class VisionEmbeddingService:
             "Initializing vision embedding service",
             model_name=embed_model,
         )
-        self.extractor = EmbeddingExtractor(embed_model)
+        self.executor = InferenceExecutor(
+            "clip_inference",
+            max_workers=inference_workers,
+            kind="thread",
+        )
+        self.extractor = EmbeddingExtractor(embed_model, executor=self.executor)
         self.progress_manager = JobProgressManager(broker)
+        # Concurrent per-asset requests share CLIP forward passes, and each
+        # inference worker can run one batch at a time
+        self.batcher: MicroBatcher[Tuple[str, Optional[str]], EmbeddingPair] = (
+            MicroBatcher(
+                self._extract_batch,
+                max_batch_size=batch_size,
+                max_wait_ms=batch_max_wait_ms,
+                name="embedding_batcher",
+                max_concurrent_batches=max(1, inference_workers),
+            )
+        )
 
     async def initialize(self) -> None:
         """Initialize the embedding extractor."""
@@ -41,9 +61,33 @@ class VisionEmbeddingService:
 
     async def cleanup(self) -> None:
         """Clean up resources."""
+        await self.batcher.stop()
         await self.extractor.cleanup()
+        self.executor.shutdown(wait=False)
         await self.progress_manager.cleanup_all()
 
+    async def _extract_batch(
+        self,
+        items: Sequence[Tuple[str, Optional[str]]],
+    ) -> List[EmbeddingPair]:
+        """Embed a micro-batch of ``(local_path, mask_path)`` requests."""
+        return await self.extractor.extract_embeddings_batch(
+            [local_path for local_path, _ in items],
+            [mask_path for _, mask_path in items],
+        )
+
+    async def extract_embeddings(self, local_path: str) -> EmbeddingPair:
+        """Extract embeddings for one image through the micro-batcher."""
+        return await self.batcher.submit((local_path, None))
+
+    async def extract_embeddings_with_mask(
+        self,
+        local_path: str,
+        mask_path: str,
+    ) -> EmbeddingPair:
+        """Extract masked embeddings for one image through the micro-batcher."""
+        return await self.batcher.submit((local_path, mask_path))
+
     async def _publish_embedding_ready_event(
         self,
         asset_type: str,
@@ -162,11 +206,8 @@ class VisionEmbeddingService:
             emb_rgb, emb_gray = await extract_func(local_path)
 
         if emb_rgb is not None and emb_gray is not None:
-            await crud.update_embeddings(
-                asset_id,
-                emb_rgb.tolist(),
-                emb_gray.tolist(),
-            )
+            # Arrays are sent as binary pgvector values by DatabaseManager
+            await crud.update_embeddings(asset_id, emb_rgb, emb_gray)
 
             await self._publish_embedding_ready_event(
                 asset_type,
@@ -367,7 +408,7 @@ class VisionEmbeddingService:
                 "image",
                 local_path,
                 self.image_crud,
-                self.extractor.extract_embeddings,
+                self.extract_embeddings,
             )
 
             # Always update progress, whether success or failure
@@ -396,19 +437,22 @@ class VisionEmbeddingService:
             frames = event_data["frames"]
             job_id = event_data["job_id"]
 
-            for frame_data in frames:
-                frame_id = frame_data["frame_id"]
-                local_path = frame_data["local_path"]
-
-                success = await self._handle_single_asset_processing(
-                    job_id,
-                    frame_id,
-                    "video",
-                    local_path,
-                    self.frame_crud,
-                    self.extractor.extract_embeddings,
+            # Frames are submitted together so they share forward passes
+            results = await asyncio.gather(
+                *(
+                    self._handle_single_asset_processing(
+                        job_id,
+                        frame_data["frame_id"],
+                        "video",
+                        frame_data["local_path"],
+                        self.frame_crud,
+                        self.extract_embeddings,
+                    )
+                    for frame_data in frames
                 )
+            )
 
+            for success in results:
                 if success:
                     await self._update_and_check_completion_per_asset_first(
                         job_id,
@@ -454,7 +498,7 @@ class VisionEmbeddingService:
                 "image",
                 local_path,
                 self.image_crud,
-                self.extractor.extract_embeddings_with_mask,
+                self.extract_embeddings_with_mask,
                 is_masked=True,
                 mask_path=mask_path,
             )
@@ -485,6 +529,7 @@ class VisionEmbeddingService:
             job_id = event_data["job_id"]
             frames = event_data["frames"]
 
+            pending = []
             for frame_data in frames:
                 frame_id = frame_data["frame_id"]
                 mask_path = frame_data["mask_path"]
@@ -500,19 +545,23 @@ class VisionEmbeddingService:
                     )
                     continue
 
-                local_path = frame_record.local_path
-
-                success = await self._handle_single_asset_processing(
-                    job_id,
-                    frame_id,
-                    "video",
-                    local_path,
-                    self.frame_crud,
-                    self.extractor.extract_embeddings_with_mask,
-                    is_masked=True,
-                    mask_path=mask_path,
+                pending.append(
+                    self._handle_single_asset_processing(
+                        job_id,
+                        frame_id,
+                        "video",
+                        frame_record.local_path,
+                        self.frame_crud,
+                        self.extract_embeddings_with_mask,
+                        is_masked=True,
+                        mask_path=mask_path,
+                    )
                 )
 
+            # Frames are submitted together so they share forward passes
+            results = await asyncio.gather(*pending)
+
+            for success in results:
                 if success:
                     await self._update_and_check_completion_per_asset_first(
                         job_id,
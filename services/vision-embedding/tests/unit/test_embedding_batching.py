@@ -0,0 +1,116 @@
+"""Tests for batched CLIP inference and the service micro-batcher."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+import torch
+from PIL import Image
+
+
+pytestmark = pytest.mark.unit
+
+
+def _write_image(path, color):
+    Image.new("RGB", (32, 32), color).save(path)
+    return str(path)
+
+
+class TestCLIPBatchInference:
+    """Test that a batch is embedded with one forward pass."""
+
+    def test_embed_images_splits_rgb_and_gray_variants(self):
+        from embedding_components.clip_processor import CLIPProcessor
+
+        processor = Mock(
+            side_effect=lambda images, return_tensors: {
+                "pixel_values": torch.zeros(len(images), 3, 4, 4)
+            }
+        )
+        model = Mock()
+        model.get_image_features = Mock(
+            side_effect=lambda pixel_values: torch.arange(
+                pixel_values.shape[0] * 2,
+                dtype=torch.float32,
+            ).reshape(-1, 2) + 1.0
+        )
+        clip = CLIPProcessor(model, processor, torch.device("cpu"))
+        images = [Image.new("RGB", (8, 8), "red") for _ in range(3)]
+
+        embeddings = clip.embed_images(images)
+
+        assert processor.call_count == 1
+        assert len(processor.call_args.kwargs["images"]) == 6
+        assert model.get_image_features.call_count == 1
+        assert len(embeddings) == 3
+        for rgb, gray in embeddings:
+            assert np.linalg.norm(rgb) == pytest.approx(1.0)
+            assert np.linalg.norm(gray) == pytest.approx(1.0)
+        # Row i pairs with its grayscale variant at row 3 + i
+        expected_gray = np.array([7.0, 8.0]) / np.linalg.norm([7.0, 8.0])
+        np.testing.assert_allclose(embeddings[0][1], expected_gray, rtol=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_extract_embeddings_batch_skips_unreadable_images(self, tmp_path):
+        from embedding import EmbeddingExtractor
+
+        extractor = EmbeddingExtractor()
+        extractor.initialized = True
+        extractor.clip_processor_instance = Mock()
+        extractor.clip_processor_instance.extract_clip_embeddings_batch = AsyncMock(
+            side_effect=lambda images: [
+                (np.full(4, i, dtype=np.float32), np.full(4, -i, dtype=np.float32))
+                for i in range(len(images))
+            ]
+        )
+        paths = [
+            _write_image(tmp_path / "a.jpg", "red"),
+            str(tmp_path / "missing.jpg"),
+            _write_image(tmp_path / "b.jpg", "blue"),
+        ]
+
+        results = await extractor.extract_embeddings_batch(paths)
+
+        batch_call = extractor.clip_processor_instance.extract_clip_embeddings_batch
+        batch_call.assert_awaited_once()
+        assert len(batch_call.call_args.args[0]) == 2
+        assert results[1] == (None, None)
+        assert results[0][0][0] == 0.0
+        assert results[2][0][0] == 1.0
+
+
+class TestServiceMicroBatching:
+    """Test that concurrent asset requests share one extractor call."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_batched(self):
+        from services.service import VisionEmbeddingService
+
+        service = VisionEmbeddingService(
+            Mock(),
+            Mock(),
+            "clip-vit-b32",
+            batch_size=8,
+            batch_max_wait_ms=50,
+        )
+        service.extractor.extract_embeddings_batch = AsyncMock(
+            side_effect=lambda paths, masks: [
+                (np.ones(4), np.zeros(4)) if mask is None else (np.zeros(4), np.ones(4))
+                for mask in masks
+            ]
+        )
+
+        results = await asyncio.gather(
+            service.extract_embeddings("/data/a.jpg"),
+            service.extract_embeddings_with_mask("/data/b.jpg", "/data/b_mask.png"),
+            service.extract_embeddings("/data/c.jpg"),
+        )
+        await service.batcher.stop()
+
+        service.extractor.extract_embeddings_batch.assert_awaited_once_with(
+            ["/data/a.jpg", "/data/b.jpg", "/data/c.jpg"],
+            [None, "/data/b_mask.png", None],
+        )
+        assert results[0][0][0] == 1.0
+        assert results[1][0][0] == 0.0
@@ -8,6 +8,7 @@ import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -47,6 +48,12 @@ class VisionKeypointConfig:
     # Keypoint directory
     KEYPOINT_DIR: str = os.getenv("KEYPOINT_DIR", "./keypoints")
 
+    # Worker processes for AKAZE/SIFT extraction (empty uses every CPU,
+    # 0 runs extraction inline on the event loop)
+    KEYPOINT_WORKERS: Optional[int] = (
+        int(os.environ["KEYPOINT_WORKERS"]) if os.getenv("KEYPOINT_WORKERS") else None
+    )
+
     # Logging (from global config)
     LOG_LEVEL: str = global_config.LOG_LEVEL
 
@@ -10,7 +10,12 @@ class VisionKeypointHandler:
     def __init__(self):
         self.db = DatabaseManager(config.POSTGRES_DSN)
         self.broker = MessageBroker(config.BUS_BROKER)
-        self.service = VisionKeypointService(self.db, self.broker, config.DATA_ROOT)
+        self.service = VisionKeypointService(
+            self.db,
+            self.broker,
+            config.DATA_ROOT,
+            feature_workers=config.KEYPOINT_WORKERS,
+        )
         self.initialized = False
 
     async def initialize(self):
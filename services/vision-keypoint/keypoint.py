@@ -1,43 +1,169 @@
+import asyncio
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 import cv2
 import numpy as np
 
+from common_py.keypoint_blob import (
+    KEYPOINT_DTYPE,
+    blob_path,
+    keypoints_to_array,
+    read_keypoint_blob,
+    write_keypoint_blob,
+)
 from common_py.logging_config import configure_logging
+from vision_common import InferenceExecutor
 
 from config_loader import config
+from keypoint_worker import MIN_KEYPOINTS, SharedArray, extract_shared
 
 logger = configure_logging("vision-keypoint:keypoint")
 
+# Shared memory segments allowed per pool worker: one being extracted and
+# one decoded ahead so the worker does not wait on image decoding
+SHARED_SEGMENTS_PER_WORKER = 2
+
 
 class KeypointExtractor:
     """Extracts keypoint descriptors using AKAZE and SIFT"""
 
-    def __init__(self, data_root: str):
+    def __init__(self, data_root: str, executor: Optional[InferenceExecutor] = None):
         self.data_root = Path(data_root)
         self.kp_dir = self.data_root / Path(config.KEYPOINT_DIR)
         self.kp_dir.mkdir(parents=True, exist_ok=True)
 
+        # With a process pool, images are handed to workers (which own their
+        # detectors) through shared memory; otherwise the in-process
+        # detectors below run inline
+        self.executor = executor or InferenceExecutor("keypoint_features", max_workers=0)
+        # Every pooled extraction holds a segment in /dev/shm from decoding
+        # until its worker returns, so the number alive at once is bounded
+        self._shared_slots = asyncio.Semaphore(
+            max(1, self.executor.max_workers) * SHARED_SEGMENTS_PER_WORKER
+        )
+
         # Initialize detectors
         self.akaze = cv2.AKAZE_create()
         self.sift = cv2.SIFT_create()
 
+    @property
+    def pooled(self) -> bool:
+        return self.executor.kind == "process" and not self.executor.inline
+
+    async def _detect(
+        self, algorithm: str, image: np.ndarray, mask: Optional[np.ndarray]
+    ) -> Tuple[Any, Optional[np.ndarray]]:
+        """Run ``detectAndCompute`` for one algorithm through the executor"""
+        detector = self.akaze if algorithm == "akaze" else self.sift
+        return await self.executor.run(detector.detectAndCompute, image, mask)
+
+    @staticmethod
+    def _load_shared(
+        image_path: str, mask_path: Optional[str]
+    ) -> Optional[SharedArray]:
+        """Decode an image (and mask) and resize them into one shared segment"""
+        image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            logger.error("Failed to load image", image_path=image_path)
+            return None
+
+        mask = None
+        if mask_path:
+            mask = cv2.imread(mask_path, cv2.IMREAD_GRAYSCALE)
+            if mask is None:
+                logger.error("Failed to load mask", mask_path=mask_path)
+                return None
+
+        width, height = config.IMG_SIZE
+        shared = SharedArray((1 if mask is None else 2, height, width))
+        # Resize straight into the segment; plane 0 is the image, plane 1 the mask
+        cv2.resize(image, config.IMG_SIZE, dst=shared.array[0], interpolation=cv2.INTER_LINEAR)
+        if mask is not None:
+            cv2.resize(mask, config.IMG_SIZE, dst=shared.array[1], interpolation=cv2.INTER_NEAREST)
+        return shared
+
+    async def _extract_pooled(
+        self, image_path: str, mask_path: Optional[str], entity_id: str
+    ) -> Optional[str]:
+        """Extract keypoints in a pool worker, handing the image over in shared memory"""
+        start_time = time.time()
+
+        try:
+            async with self._shared_slots:
+                shared = await asyncio.to_thread(self._load_shared, image_path, mask_path)
+                if shared is None:
+                    return None
+
+                try:
+                    algorithm_used, keypoints, descriptors = await self.executor.run(
+                        extract_shared, shared.ref
+                    )
+                finally:
+                    shared.release()
+
+            if descriptors is None or len(keypoints) < MIN_KEYPOINTS:
+                logger.warning(
+                    "Insufficient keypoints found",
+                    entity_id=entity_id,
+                    final_count=len(keypoints),
+                    masked=mask_path is not None,
+                )
+                # Create mock keypoints for MVP
+                return await self._create_mock_keypoints(entity_id)
+
+            kp_blob_path = await self._save_keypoints(entity_id, keypoints, descriptors)
+
+            logger.info(
+                "Keypoint extraction",
+                entity_id=entity_id,
+                algorithm=algorithm_used,
+                keypoint_count=len(keypoints),
+                masked=mask_path is not None,
+                time_ms=round((time.time() - start_time) * 1000, 2),
+            )
+
+            return kp_blob_path
+
+        except Exception as e:
+            logger.error(
+                "Failed to extract keypoints",
+                image_path=image_path,
+                mask_path=mask_path,
+                entity_id=entity_id,
+                error=str(e),
+            )
+            return None
+
+    @staticmethod
+    async def _load_resized(
+        path: str, interpolation: int
+    ) -> Optional[np.ndarray]:
+        """Decode a grayscale image and resize it to IMG_SIZE off the event loop"""
+
+        def load() -> Optional[np.ndarray]:
+            image = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+            if image is None:
+                return None
+            return cv2.resize(image, config.IMG_SIZE, interpolation=interpolation)
+
+        return await asyncio.to_thread(load)
+
     async def extract_keypoints(self, image_path: str, entity_id: str) -> Optional[str]:
         """Extract keypoints and descriptors from an image"""
-        import time
+        if self.pooled:
+            return await self._extract_pooled(image_path, None, entity_id)
+
         start_time = time.time()
         
         try:
-            # Load image
-            image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+            # Load image and resize it to IMG_SIZE
+            image = await self._load_resized(image_path, cv2.INTER_LINEAR)
             if image is None:
                 logger.error("Failed to load image", image_path=image_path)
                 return None
 
-            # Resize image to IMG_SIZE
-            image = cv2.resize(image, config.IMG_SIZE, interpolation=cv2.INTER_LINEAR)
-
             # Try AKAZE first (faster and more robust)
             keypoints, descriptors = await self._extract_akaze_keypoints(image)
             
@@ -48,7 +174,7 @@ class KeypointExtractor:
                 logger.info(
                     "AKAZE found insufficient keypoints, trying SIFT",
                     entity_id=entity_id,
-                    akaze_count=len(keypoints) if keypoints else 0,
+                    akaze_count=len(keypoints),
                 )
                 keypoints, descriptors = await self._extract_sift_keypoints(image)
                 algorithm_used = "SIFT"
@@ -57,7 +183,7 @@ class KeypointExtractor:
                 logger.warning(
                     "Insufficient keypoints found",
                     entity_id=entity_id,
-                    final_count=len(keypoints) if keypoints else 0,
+                    final_count=len(keypoints),
                 )
                 # Create mock keypoints for MVP
                 return await self._create_mock_keypoints(entity_id)
@@ -91,8 +217,7 @@ class KeypointExtractor:
     ) -> Tuple[list, Optional[np.ndarray]]:
         """Extract AKAZE keypoints and descriptors"""
         try:
-            keypoints, descriptors = self.akaze.detectAndCompute(image, None)
-            return keypoints, descriptors
+            return await self._detect("akaze", image, None)
         except Exception as e:
             logger.error("AKAZE extraction failed", error=str(e))
             return [], None
@@ -102,8 +227,7 @@ class KeypointExtractor:
     ) -> Tuple[list, Optional[np.ndarray]]:
         """Extract SIFT keypoints and descriptors"""
         try:
-            keypoints, descriptors = self.sift.detectAndCompute(image, None)
-            return keypoints, descriptors
+            return await self._detect("sift", image, None)
         except Exception as e:
             logger.error("SIFT extraction failed", error=str(e))
             return [], None
@@ -111,32 +235,15 @@ class KeypointExtractor:
     async def _save_keypoints(
         self, entity_id: str, keypoints: list, descriptors: np.ndarray
     ) -> str:
-        """Save keypoints and descriptors to compressed numpy file"""
-        kp_blob_path = self.kp_dir / f"{entity_id}.npz"
-
-        # Convert keypoints to serializable format
-        kp_data = []
-        for kp in keypoints:
-            kp_data.append(
-                {
-                    "pt": kp.pt,
-                    "angle": kp.angle,
-                    "response": kp.response,
-                    "octave": kp.octave,
-                    "size": kp.size,
-                }
-            )
-
-        # Save to compressed numpy file
-        np.savez_compressed(
-            kp_blob_path,
-            keypoints=kp_data,
-            descriptors=descriptors,
-            count=len(keypoints),
+        """Save keypoints and descriptors as a memory-mappable blob"""
+        if not isinstance(keypoints, np.ndarray):
+            keypoints = keypoints_to_array(keypoints)
+        return write_keypoint_blob(
+            blob_path(self.kp_dir, entity_id),
+            keypoints,
+            descriptors,
         )
 
-        return str(kp_blob_path)
-
     async def _create_mock_keypoints(self, entity_id: str) -> str:
         """Create mock keypoints for MVP testing"""
         try:
@@ -144,33 +251,30 @@ class KeypointExtractor:
             num_keypoints = np.random.randint(20, 100)
 
             # Mock keypoint data
-            kp_data = []
-            for i in range(num_keypoints):
-                kp_data.append(
-                    {
-                        "pt": (
-                            np.random.uniform(50, 450),
-                            np.random.uniform(50, 350),
-                        ),
-                        "angle": np.random.uniform(0, 360),
-                        "response": np.random.uniform(0.1, 1.0),
-                        "octave": np.random.randint(0, 4),
-                        "size": np.random.uniform(5, 20),
-                    }
-                )
+            kp_data = np.array(
+                [
+                    (
+                        np.random.uniform(50, 450),  # x
+                        np.random.uniform(50, 350),  # y
+                        np.random.uniform(5, 20),  # size
+                        np.random.uniform(0, 360),  # angle
+                        np.random.uniform(0.1, 1.0),  # response
+                        np.random.randint(0, 4),  # octave
+                    )
+                    for _ in range(num_keypoints)
+                ],
+                dtype=KEYPOINT_DTYPE,
+            )
 
             # Mock descriptors (64-dimensional for AKAZE, 128 for SIFT)
             # Use 64 for consistency
             descriptors = np.random.randint(0, 256, (num_keypoints, 64), dtype=np.uint8)
 
             # Save mock data
-            kp_blob_path = self.kp_dir / f"{entity_id}.npz"
-            np.savez_compressed(
-                kp_blob_path,
-                keypoints=kp_data,
-                descriptors=descriptors,
-                count=num_keypoints,
-                mock=True,
+            kp_blob_path = write_keypoint_blob(
+                blob_path(self.kp_dir, entity_id),
+                kp_data,
+                descriptors,
             )
 
             logger.info(
@@ -179,7 +283,7 @@ class KeypointExtractor:
                 count=num_keypoints,
             )
 
-            return str(kp_blob_path)
+            return kp_blob_path
 
         except Exception as e:
             logger.error(
@@ -190,26 +294,24 @@ class KeypointExtractor:
             return None
 
     def load_keypoints(self, kp_blob_path: str) -> Tuple[list, np.ndarray]:
-        """Load keypoints and descriptors from file"""
+        """Load keypoints and descriptors from a blob of any format version"""
         try:
-            data = np.load(kp_blob_path)
+            blob = read_keypoint_blob(kp_blob_path, mmap=False)
 
             # Reconstruct keypoints
-            keypoints = []
-            for kp_data in data["keypoints"]:
-                kp = cv2.KeyPoint(
-                    x=float(kp_data["pt"][0]),
-                    y=float(kp_data["pt"][1]),
-                    size=float(kp_data["size"]),
-                    angle=float(kp_data["angle"]),
-                    response=float(kp_data["response"]),
-                    octave=int(kp_data["octave"]),
+            keypoints = [
+                cv2.KeyPoint(
+                    x=float(x),
+                    y=float(y),
+                    size=float(size),
+                    angle=float(angle),
+                    response=float(response),
+                    octave=int(octave),
                 )
-                keypoints.append(kp)
+                for x, y, size, angle, response, octave in blob.keypoints.tolist()
+            ]
 
-            descriptors = data["descriptors"]
-
-            return keypoints, descriptors
+            return keypoints, np.ascontiguousarray(blob.descriptors)
 
         except Exception as e:
             logger.error(
@@ -223,28 +325,24 @@ class KeypointExtractor:
         self, image_path: str, mask_path: str, entity_id: str
     ) -> Optional[str]:
         """Extract keypoints and descriptors from an image with mask applied"""
-        import time
+        if self.pooled:
+            return await self._extract_pooled(image_path, mask_path, entity_id)
+
         start_time = time.time()
         
         try:
-            # Load image
-            image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+            # Load image and resize it to IMG_SIZE
+            image = await self._load_resized(image_path, cv2.INTER_LINEAR)
             if image is None:
                 logger.error("Failed to load image", image_path=image_path)
                 return None
 
-            # Resize image to IMG_SIZE
-            image = cv2.resize(image, config.IMG_SIZE, interpolation=cv2.INTER_LINEAR)
-
-            # Load mask
-            mask = cv2.imread(mask_path, cv2.IMREAD_GRAYSCALE)
+            # Load mask and resize it to IMG_SIZE
+            mask = await self._load_resized(mask_path, cv2.INTER_NEAREST)
             if mask is None:
                 logger.error("Failed to load mask", mask_path=mask_path)
                 return None
 
-            # Resize mask to IMG_SIZE
-            mask = cv2.resize(mask, config.IMG_SIZE, interpolation=cv2.INTER_NEAREST)
-
             # Apply mask to image (set background to black)
             masked_image = cv2.bitwise_and(image, mask)
 
@@ -260,7 +358,7 @@ class KeypointExtractor:
                 logger.info(
                     "AKAZE found insufficient keypoints with mask, trying SIFT",
                     entity_id=entity_id,
-                    akaze_count=len(keypoints) if keypoints else 0,
+                    akaze_count=len(keypoints),
                 )
                 keypoints, descriptors = await self._extract_sift_keypoints_with_mask(
                     masked_image, mask
@@ -271,7 +369,7 @@ class KeypointExtractor:
                 logger.warning(
                     "Insufficient keypoints found with mask",
                     entity_id=entity_id,
-                    final_count=len(keypoints) if keypoints else 0,
+                    final_count=len(keypoints),
                 )
                 # Create mock keypoints for MVP
                 return await self._create_mock_keypoints(entity_id)
@@ -306,8 +404,7 @@ class KeypointExtractor:
     ) -> Tuple[list, Optional[np.ndarray]]:
         """Extract AKAZE keypoints and descriptors with mask"""
         try:
-            keypoints, descriptors = self.akaze.detectAndCompute(image, mask)
-            return keypoints, descriptors
+            return await self._detect("akaze", image, mask)
         except Exception as e:
             logger.error("AKAZE extraction with mask failed", error=str(e))
             return [], None
@@ -317,8 +414,7 @@ class KeypointExtractor:
     ) -> Tuple[list, Optional[np.ndarray]]:
         """Extract SIFT keypoints and descriptors with mask"""
         try:
-            keypoints, descriptors = self.sift.detectAndCompute(image, mask)
-            return keypoints, descriptors
+            return await self._detect("sift", image, mask)
         except Exception as e:
             logger.error("SIFT extraction with mask failed", error=str(e))
             return [], None
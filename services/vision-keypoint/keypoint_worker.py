@@ -0,0 +1,111 @@
+"""Worker-process side of pooled keypoint extraction.
+
+Decoded images reach the workers through ``multiprocessing.shared_memory``
+instead of being pickled: the service resizes each image (and its mask)
+straight into a shared segment and only sends the segment's name, shape and
+dtype. Each worker process keeps its own AKAZE and SIFT detectors.
+"""
+
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from common_py.keypoint_blob import keypoints_to_array
+
+# AKAZE results below this count fall back to SIFT
+AKAZE_MIN_KEYPOINTS = 10
+# Results below this count are treated as a failed extraction
+MIN_KEYPOINTS = 5
+
+DETECTOR_FACTORIES = {
+    "akaze": cv2.AKAZE_create,
+    "sift": cv2.SIFT_create,
+}
+
+# Detectors owned by this worker process, created on first use
+_worker_detectors: Dict[str, Any] = {}
+
+
+@dataclass(frozen=True)
+class SharedArrayRef:
+    """Picklable handle to an array living in a shared memory segment"""
+
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+class SharedArray:
+    """Numpy array backed by a shared memory segment owned by this process.
+
+    The segment is unlinked by :meth:`release`; workers only attach to it.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], dtype: Any = np.uint8):
+        dtype = np.dtype(dtype)
+        size = max(1, int(np.prod(shape)) * dtype.itemsize)
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf)
+        self.ref = SharedArrayRef(self._shm.name, tuple(shape), dtype.str)
+
+    def release(self) -> None:
+        # The array view must go before the segment can be closed
+        self.array = None
+        self._shm.close()
+        self._shm.unlink()
+
+
+def _get_detector(algorithm: str) -> Any:
+    detector = _worker_detectors.get(algorithm)
+    if detector is None:
+        detector = DETECTOR_FACTORIES[algorithm]()
+        _worker_detectors[algorithm] = detector
+    return detector
+
+
+def extract_features(
+    image: np.ndarray, mask: Optional[np.ndarray] = None
+) -> Tuple[str, np.ndarray, Optional[np.ndarray]]:
+    """Run AKAZE, falling back to SIFT when it finds too few keypoints.
+
+    ``cv2.KeyPoint`` objects cannot be pickled, so keypoints are returned as
+    a ``KEYPOINT_DTYPE`` array, ready to be written to a blob.
+    """
+    if mask is not None:
+        # Set the background to black before detection
+        image = cv2.bitwise_and(image, mask)
+
+    keypoints, descriptors = _get_detector("akaze").detectAndCompute(image, mask)
+    algorithm = "AKAZE"
+
+    if descriptors is None or len(keypoints) < AKAZE_MIN_KEYPOINTS:
+        keypoints, descriptors = _get_detector("sift").detectAndCompute(image, mask)
+        algorithm = "SIFT"
+
+    return algorithm, keypoints_to_array(keypoints), descriptors
+
+
+def _extract_from_buffer(buffer: memoryview, ref: SharedArrayRef):
+    planes = np.ndarray(ref.shape, dtype=np.dtype(ref.dtype), buffer=buffer)
+    mask = planes[1] if ref.shape[0] > 1 else None
+    return extract_features(planes[0], mask)
+
+
+def extract_shared(ref: SharedArrayRef) -> Tuple[str, np.ndarray, Optional[np.ndarray]]:
+    """Extract features from an image (plane 0) and optional mask (plane 1)
+    held in a shared memory segment"""
+    shm = shared_memory.SharedMemory(name=ref.name)
+    error = None
+    try:
+        # Views into the segment are dropped when the helper returns, so the
+        # segment can be closed; the results are fresh arrays
+        return _extract_from_buffer(shm.buf, ref)
+    except Exception as e:
+        # Keep only the message: the traceback would pin views into the segment
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        shm.close()
+    raise RuntimeError(error)
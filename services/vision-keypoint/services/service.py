@@ -1,26 +1,46 @@
-from typing import Any, Dict
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from common_py.database import DatabaseManager
 from common_py.logging_config import configure_logging
 from common_py.messaging import MessageBroker
 
 from keypoint import KeypointExtractor
-from vision_common import JobProgressManager
+from vision_common import InferenceExecutor, JobProgressManager
 
 from .keypoint_asset_processor import KeypointAssetProcessor
 
 logger = configure_logging("vision-keypoint:service")
 
+# Frames processed at once per feature worker, across all events
+FRAMES_PER_FEATURE_WORKER = 2
+
 
 class VisionKeypointService:
     """Main service class for vision keypoint extraction with progress tracking"""
 
     def __init__(
-        self, db: DatabaseManager, broker: MessageBroker, data_root: str
+        self,
+        db: DatabaseManager,
+        broker: MessageBroker,
+        data_root: str,
+        feature_workers: Optional[int] = None,
     ):
         self.db = db
         self.broker = broker
-        self.extractor = KeypointExtractor(data_root)
+        # OpenCV feature extraction runs in worker processes so concurrent
+        # messages are processed in parallel instead of on the event loop
+        self.executor = InferenceExecutor(
+            "keypoint_features",
+            max_workers=feature_workers,
+            kind="process",
+        )
+        self.extractor = KeypointExtractor(data_root, executor=self.executor)
+        # Bounds how many frames (with their DB and progress calls) are in
+        # flight, however many frames an event carries
+        self._frame_slots = asyncio.Semaphore(
+            max(1, self.executor.max_workers) * FRAMES_PER_FEATURE_WORKER
+        )
         self.progress_manager = JobProgressManager(broker)
         self.asset_processor = KeypointAssetProcessor(
             db, broker, self.extractor, self.progress_manager
@@ -28,6 +48,7 @@ class VisionKeypointService:
 
     async def cleanup(self):
         """Clean up resources"""
+        await asyncio.to_thread(self.executor.shutdown)
         await self.progress_manager.cleanup_all()
 
     async def handle_products_image_ready(self, event_data: Dict[str, Any]):
@@ -68,23 +89,16 @@ class VisionKeypointService:
             job_id = event_data["job_id"]
             frames = event_data["frames"]
 
-            update_progress = (
-                self.asset_processor.update_and_check_completion_per_asset_first
-            )
-
-            for frame_data in frames:
-                frame_id = frame_data["frame_id"]
-                local_path = frame_data["local_path"]
-
-                success = await self.asset_processor.process_single_asset(
+            await self._process_frames(
+                job_id,
+                frames,
+                lambda frame_data: self.asset_processor.process_single_asset(
                     job_id,
-                    frame_id,
+                    frame_data["frame_id"],
                     "video",
-                    local_path,
-                )
-
-                if success:
-                    await update_progress(job_id, "video")
+                    frame_data["local_path"],
+                ),
+            )
 
         except Exception as e:
             logger.error(
@@ -96,6 +110,25 @@ class VisionKeypointService:
             )
             raise
 
+    async def _process_frames(
+        self,
+        job_id: str,
+        frames: List[Dict[str, Any]],
+        process_frame: Callable[[Dict[str, Any]], Awaitable[bool]],
+    ):
+        """Process an event's frames concurrently, bounded by ``_frame_slots``"""
+        update_progress = (
+            self.asset_processor.update_and_check_completion_per_asset_first
+        )
+
+        async def process(frame_data: Dict[str, Any]):
+            async with self._frame_slots:
+                if await process_frame(frame_data):
+                    await update_progress(job_id, "video")
+
+        # Frames are extracted concurrently across the feature workers
+        await asyncio.gather(*(process(frame_data) for frame_data in frames))
+
     async def handle_products_image_masked(self, event_data: Dict[str, Any]):
         """Handle product image masked event"""
         try:
@@ -136,25 +169,18 @@ class VisionKeypointService:
             job_id = event_data["job_id"]
             frames = event_data["frames"]
 
-            update_progress = (
-                self.asset_processor.update_and_check_completion_per_asset_first
-            )
-
-            for frame_data in frames:
-                frame_id = frame_data["frame_id"]
-                mask_path = frame_data["mask_path"]
-
-                success = await self.asset_processor.process_single_asset(
+            await self._process_frames(
+                job_id,
+                frames,
+                lambda frame_data: self.asset_processor.process_single_asset(
                     job_id,
-                    frame_id,
+                    frame_data["frame_id"],
                     "video",
                     None,
                     is_masked=True,
-                    mask_path=mask_path,
-                )
-
-                if success:
-                    await update_progress(job_id, "video")
+                    mask_path=frame_data["mask_path"],
+                ),
+            )
 
         except Exception as e:
             logger.error(
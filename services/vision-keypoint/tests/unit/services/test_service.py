@@ -127,6 +127,51 @@ class TestVisionKeypointService:
         # Assert that update_progress was called twice
         assert self.mock_asset_processor.update_and_check_completion_per_asset_first.call_count == 2
 
+    @pytest.mark.unit
+    async def test_handle_videos_keyframes_ready_bounds_concurrent_frames(self):
+        """Test that frames of an event are processed at most _frame_slots at a time"""
+        import asyncio
+
+        from services.service import FRAMES_PER_FEATURE_WORKER
+
+        running = 0
+        peak = 0
+
+        async def process_single_asset(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return True
+
+        self.mock_asset_processor.process_single_asset.side_effect = process_single_asset
+        limit = 2 * FRAMES_PER_FEATURE_WORKER
+        self.service._frame_slots = asyncio.Semaphore(limit)
+        event_data = {
+            "job_id": "job_789",
+            "frames": [
+                {"frame_id": f"frame_{i:03d}", "local_path": f"/path/to/frame{i}.jpg"}
+                for i in range(20)
+            ]
+        }
+
+        await self.service.handle_videos_keyframes_ready(event_data)
+
+        assert peak == limit
+        assert self.mock_asset_processor.update_and_check_completion_per_asset_first.call_count == 20
+
+    @pytest.mark.unit
+    async def test_frame_slots_are_sized_from_feature_workers(self):
+        """Test that the frame bound follows the configured feature workers"""
+        from services.service import FRAMES_PER_FEATURE_WORKER
+
+        service = VisionKeypointService(
+            self.mock_db, self.mock_broker, self.mock_data_root, feature_workers=3
+        )
+
+        assert service._frame_slots._value == 3 * FRAMES_PER_FEATURE_WORKER
+
     @pytest.mark.unit
     async def test_handle_products_image_masked_success(self):
         """Test successful handling of products image masked event"""
@@ -1,10 +1,11 @@
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
 import numpy as np
 import pytest
 
+from config_loader import config
 from keypoint import KeypointExtractor
 
 
@@ -25,7 +26,7 @@ class TestKeypointExtractor:
     @pytest.mark.unit
     @patch('keypoint.cv2.imread')
     @patch('keypoint.cv2.resize')
-    @patch('keypoint.np.savez_compressed')
+    @patch('keypoint.write_keypoint_blob')
     @patch('keypoint.np.random.randint')
     @patch('keypoint.np.random.uniform')
     @patch('pathlib.Path.mkdir')
@@ -61,7 +62,7 @@ class TestKeypointExtractor:
     @pytest.mark.unit
     @patch('keypoint.cv2.imread')
     @patch('keypoint.cv2.resize')
-    @patch('keypoint.np.savez_compressed')
+    @patch('keypoint.write_keypoint_blob')
     @patch('keypoint.np.random.randint')
     @patch('keypoint.np.random.uniform')
     async def test_extract_keypoints_fallback_to_sift(self, mock_uniform, mock_randint,
@@ -100,55 +101,53 @@ class TestKeypointExtractor:
         mock_sift_instance.detectAndCompute.assert_called_once()
 
     @pytest.mark.unit
-    @patch('keypoint.cv2.imread')
-    @patch('keypoint.cv2.resize')
-    @patch('keypoint.np.savez_compressed')
-    @patch('keypoint.np.random.randint')
-    @patch('keypoint.np.random.uniform')
-    def test_load_keypoints_success(self, mock_uniform, mock_randint,
-                                    mock_savez, mock_resize, mock_imread):
-        """Test successful loading of keypoints from file"""
-        import numpy as np
-
-        # Create a realistic mock for np.load result that has the expected structure
-        mock_loaded_data = MagicMock()
-
-        # Mock the keypoints data
-        mock_keypoints_data = np.array([{
-            "pt": (10, 20),
-            "angle": 45.0,
-            "response": 0.8,
-            "octave": 1,
-            "size": 5.0,
-        }])
-
-        # Mock the descriptors with the correct shape
-        mock_descriptors = MagicMock()
-        mock_descriptors.shape = (1, 64)
-        mock_descriptors.__len__ = lambda: 1
-
-        # Configure the mock to return the expected values when indexed
-        mock_loaded_data.__getitem__.side_effect = lambda key: {
-            "keypoints": mock_keypoints_data,
-            "descriptors": mock_descriptors
-        }[key]
-
-        with patch('keypoint.np.load', return_value=mock_loaded_data):
-            # Create a temporary file path
-            fake_path = str(Path(self.test_dir) / "fake_keypoints.npz")
-
-            # Test the method
-            keypoints, descriptors = self.extractor.load_keypoints(fake_path)
-
-            # Assertions
-            assert len(keypoints) == 1
-            assert descriptors.shape == (1, 64)
+    async def test_save_and_load_keypoints_round_trip(self):
+        """Test that saved keypoints load back from the versioned blob"""
+        keypoint = Mock()
+        keypoint.pt = (10.0, 20.0)
+        keypoint.angle = 45.0
+        keypoint.response = 0.8
+        keypoint.octave = 1
+        keypoint.size = 5.0
+        descriptors = np.random.randint(0, 255, (1, 61), dtype=np.uint8)
+
+        kp_blob_path = await self.extractor._save_keypoints("entity_1", [keypoint], descriptors)
+        keypoints, loaded = self.extractor.load_keypoints(kp_blob_path)
+
+        assert kp_blob_path.endswith(".kpv2.npy")
+        assert len(keypoints) == 1
+        assert keypoints[0].pt == (10.0, 20.0)
+        assert keypoints[0].octave == 1
+        assert np.array_equal(loaded, descriptors)
+
+    @pytest.mark.unit
+    def test_load_keypoints_legacy_npz(self):
+        """Test loading of keypoints from a legacy compressed blob"""
+        fake_path = str(Path(self.test_dir) / "fake_keypoints.npz")
+        np.savez_compressed(
+            fake_path,
+            keypoints=[{
+                "pt": (10, 20),
+                "angle": 45.0,
+                "response": 0.8,
+                "octave": 1,
+                "size": 5.0,
+            }],
+            descriptors=np.zeros((1, 64), dtype=np.uint8),
+            count=1,
+        )
+
+        keypoints, descriptors = self.extractor.load_keypoints(fake_path)
+
+        assert len(keypoints) == 1
+        assert keypoints[0].size == 5.0
+        assert descriptors.shape == (1, 64)
 
     @pytest.mark.unit
     @patch('keypoint.cv2.imread')
     @patch('keypoint.cv2.resize')
     @patch('keypoint.cv2.bitwise_and')
-    @patch('keypoint.np.savez_compressed')
+    @patch('keypoint.write_keypoint_blob')
     @patch('keypoint.cv2.KeyPoint')
     @patch('keypoint.np.random.randint')
     @patch('keypoint.np.random.uniform')
@@ -393,7 +392,7 @@ class TestKeypointExtractor:
     @pytest.mark.unit
     @patch('keypoint.np.random.randint')
     @patch('keypoint.np.random.uniform')
-    @patch('keypoint.np.savez_compressed')
+    @patch('keypoint.write_keypoint_blob')
     async def test_create_mock_keypoints_failure(self, mock_savez, mock_uniform, mock_randint):
         """Test _create_mock_keypoints failure handling"""
         # Setup mocks to avoid recursion
@@ -413,7 +412,7 @@ class TestKeypointExtractor:
     @pytest.mark.unit
     @patch('keypoint.np.random.randint')
     @patch('keypoint.np.random.uniform')
-    @patch('keypoint.np.savez_compressed')
+    @patch('keypoint.write_keypoint_blob')
     @patch('pathlib.Path.mkdir')
     async def test_extract_akaze_keypoints_with_mask(self, mock_mkdir, mock_savez, mock_uniform, mock_randint):
         """Test _extract_akaze_keypoints_with_mask method"""
@@ -449,7 +448,7 @@ class TestKeypointExtractor:
     @pytest.mark.unit
     @patch('keypoint.np.random.randint')
     @patch('keypoint.np.random.uniform')
-    @patch('keypoint.np.savez_compressed')
+    @patch('keypoint.write_keypoint_blob')
     @patch('pathlib.Path.mkdir')
     async def test_extract_sift_keypoints_with_mask(self, mock_mkdir, mock_savez, mock_uniform, mock_randint):
         """Test _extract_sift_keypoints_with_mask method"""
@@ -559,3 +558,101 @@ class TestKeypointExtractor:
         # Assertions - should return empty results due to exception handler
         assert keypoints == []
         assert descriptors is None
+
+    @pytest.mark.unit
+    async def test_process_executor_extracts_in_worker(self):
+        """Test extraction through a process-pool executor end to end"""
+        import cv2
+        from vision_common import InferenceExecutor
+
+        executor = InferenceExecutor("keypoint_test", max_workers=1, kind="process")
+        extractor = KeypointExtractor(self.test_dir, executor=executor)
+
+        # Checkerboard gives AKAZE plenty of corners to find
+        image = np.kron((np.indices((8, 8)).sum(axis=0) % 2) * 255, np.ones((64, 64))).astype(np.uint8)
+        image_path = str(Path(self.test_dir) / "checkerboard.png")
+        cv2.imwrite(image_path, image)
+
+        try:
+            kp_blob_path = await extractor.extract_keypoints(image_path, "entity_proc")
+        finally:
+            executor.shutdown()
+
+        keypoints, descriptors = extractor.load_keypoints(kp_blob_path)
+        assert kp_blob_path.endswith(".kpv2.npy")
+        assert len(keypoints) >= 5
+        # 61-byte AKAZE descriptors, not the 64-wide mock fallback
+        assert descriptors.shape == (len(keypoints), 61)
+
+    @pytest.mark.unit
+    async def test_process_executor_extracts_with_mask_in_worker(self):
+        """Test masked extraction through a process-pool executor end to end"""
+        import cv2
+        from vision_common import InferenceExecutor
+
+        executor = InferenceExecutor("keypoint_test", max_workers=1, kind="process")
+        extractor = KeypointExtractor(self.test_dir, executor=executor)
+
+        image = np.kron((np.indices((8, 8)).sum(axis=0) % 2) * 255, np.ones((64, 64))).astype(np.uint8)
+        mask = np.zeros_like(image)
+        mask[:, :256] = 255
+        image_path = str(Path(self.test_dir) / "checkerboard.png")
+        mask_path = str(Path(self.test_dir) / "checkerboard_mask.png")
+        cv2.imwrite(image_path, image)
+        cv2.imwrite(mask_path, mask)
+
+        try:
+            kp_blob_path = await extractor.extract_keypoints_with_mask(image_path, mask_path, "entity_mask")
+            missing = await extractor.extract_keypoints_with_mask(image_path, "/nonexistent.png", "entity_x")
+        finally:
+            executor.shutdown()
+
+        keypoints, descriptors = extractor.load_keypoints(kp_blob_path)
+        assert missing is None
+        assert descriptors.shape == (len(keypoints), 61)
+        # Keypoints only come from the unmasked half (image is resized to IMG_SIZE)
+        assert max(kp.pt[0] for kp in keypoints) < config.IMG_SIZE[0] / 2
+
+    @pytest.mark.unit
+    async def test_pooled_extraction_bounds_live_shared_segments(self):
+        """Test that concurrent pooled extractions hold a bounded number of segments"""
+        import asyncio
+
+        import cv2
+        import keypoint
+        from keypoint_worker import SharedArray
+
+        live = 0
+        peak = 0
+
+        class CountingSharedArray(SharedArray):
+            def __init__(self, *args, **kwargs):
+                nonlocal live, peak
+                super().__init__(*args, **kwargs)
+                live += 1
+                peak = max(peak, live)
+
+            def release(self):
+                nonlocal live
+                live -= 1
+                super().release()
+
+        async def slow_run(func, *args):
+            await asyncio.sleep(0.01)
+            return "AKAZE", np.zeros(0, dtype=keypoint.KEYPOINT_DTYPE), None
+
+        executor = Mock(kind="process", inline=False, max_workers=2)
+        executor.run = slow_run
+        extractor = KeypointExtractor(self.test_dir, executor=executor)
+
+        image_path = str(Path(self.test_dir) / "frame.png")
+        cv2.imwrite(image_path, np.full((64, 64), 128, dtype=np.uint8))
+
+        with patch.object(keypoint, "SharedArray", CountingSharedArray):
+            results = await asyncio.gather(
+                *(extractor.extract_keypoints(image_path, f"frame_{i}") for i in range(12))
+            )
+
+        assert all(results)
+        assert live == 0
+        assert peak == 2 * keypoint.SHARED_SEGMENTS_PER_WORKER
@@ -0,0 +1,64 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from keypoint_worker import SharedArray, extract_features, extract_shared
+
+
+def _checkerboard(size: int = 384, squares: int = 8) -> np.ndarray:
+    cells = (np.indices((squares, squares)).sum(axis=0) % 2) * 255
+    return np.kron(cells, np.ones((size // squares, size // squares))).astype(np.uint8)
+
+
+class TestKeypointWorker:
+    """Unit tests for the worker-process side of keypoint extraction"""
+
+    @pytest.mark.unit
+    def test_extract_features_uses_akaze(self):
+        """Test that AKAZE is used when it finds enough keypoints"""
+        algorithm, keypoints, descriptors = extract_features(_checkerboard())
+
+        assert algorithm == "AKAZE"
+        assert len(keypoints) >= 10
+        assert descriptors.shape == (len(keypoints), 61)
+
+    @pytest.mark.unit
+    def test_extract_features_falls_back_to_sift(self):
+        """Test the SIFT fallback on an image without AKAZE features"""
+        blank = np.zeros((128, 128), dtype=np.uint8)
+
+        algorithm, keypoints, _ = extract_features(blank)
+
+        assert algorithm == "SIFT"
+        assert len(keypoints) == 0
+
+    @pytest.mark.unit
+    def test_extract_shared_applies_mask_plane(self):
+        """Test extraction from a shared segment holding an image and mask"""
+        image = _checkerboard()
+        mask = np.zeros_like(image)
+        mask[:, : image.shape[1] // 2] = 255
+
+        shared = SharedArray((2,) + image.shape)
+        try:
+            shared.array[0] = image
+            shared.array[1] = mask
+            _, keypoints, _ = extract_shared(shared.ref)
+            _, unmasked, _ = extract_features(image)
+        finally:
+            shared.release()
+
+        assert 0 < len(keypoints) < len(unmasked)
+        assert keypoints["x"].max() < image.shape[1] / 2
+
+    @pytest.mark.unit
+    def test_release_unlinks_segment(self):
+        """Test that releasing a shared array removes its segment"""
+        shared = SharedArray((1, 8, 8))
+        name = shared.ref.name
+
+        shared.release()
+
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
@@ -0,0 +1,68 @@
+"""Unit tests for the vision inference executor."""
+
+import asyncio
+import math
+import threading
+
+import pytest
+
+from common_py.metrics import metrics
+from vision_common import InferenceExecutor
+
+
+class TestInferenceExecutor:
+    """Pool routing, saturation gauges and shutdown behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_inline_executor_runs_on_calling_thread(self):
+        executor = InferenceExecutor("inline_test", max_workers=0)
+
+        thread_id = await executor.run(threading.get_ident)
+
+        assert executor.inline
+        assert thread_id == threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_thread_executor_runs_off_the_event_loop(self):
+        executor = InferenceExecutor("thread_test", max_workers=2)
+
+        thread_id = await executor.run(threading.get_ident)
+        executor.shutdown()
+
+        assert thread_id != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_gauges_track_busy_workers_and_queue_depth(self):
+        executor = InferenceExecutor("gauge_test", max_workers=2)
+        release = threading.Event()
+
+        def gauge(name):
+            return metrics.get_metrics()["gauges"][f"inference_executor.{name}[executor=gauge_test]"]
+
+        tasks = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+
+        assert executor.stats()["busy_workers"] == 2
+        assert executor.stats()["queue_depth"] == 1
+        assert gauge("busy_workers") == 2
+        assert gauge("queue_depth") == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        executor.shutdown()
+
+        assert gauge("busy_workers") == 0
+        assert gauge("queue_depth") == 0
+
+    @pytest.mark.asyncio
+    async def test_process_executor_returns_results(self):
+        executor = InferenceExecutor("process_test", max_workers=1, kind="process")
+
+        try:
+            assert await executor.run(math.factorial, 10) == 3628800
+        finally:
+            executor.shutdown()
+
+    def test_rejects_unknown_kind(self):
+        with pytest.raises(ValueError):
+            InferenceExecutor("bad", kind="gpu")
@@ -0,0 +1,98 @@
+"""Unit tests for the versioned keypoint blob format."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from common_py.keypoint_blob import (
+    KEYPOINT_DTYPE,
+    blob_path,
+    blob_version,
+    keypoints_to_array,
+    migrate_keypoint_blob,
+    read_keypoint_blob,
+    write_keypoint_blob,
+)
+
+
+def _keypoints(count):
+    return [
+        SimpleNamespace(
+            pt=(float(i), float(2 * i)),
+            size=5.0 + i,
+            angle=10.0 * i,
+            response=0.1 * i,
+            octave=i % 4,
+        )
+        for i in range(count)
+    ]
+
+
+class TestKeypointBlob:
+    """Round-trip, memory-mapping and legacy migration checks."""
+
+    @pytest.mark.parametrize("dtype, width", [(np.uint8, 61), (np.float32, 128)])
+    def test_round_trip_is_memory_mapped(self, tmp_path, dtype, width):
+        descriptors = (np.arange(3 * width) % 200).astype(dtype).reshape(3, width)
+        path = write_keypoint_blob(
+            blob_path(tmp_path, "img_1"),
+            keypoints_to_array(_keypoints(3)),
+            descriptors,
+        )
+
+        blob = read_keypoint_blob(path)
+
+        assert path.endswith("img_1.kpv2.npy")
+        assert len(blob) == 3
+        assert blob.descriptors.dtype == dtype
+        assert not blob.descriptors.flags.writeable
+        np.testing.assert_array_equal(blob.descriptors, descriptors)
+        np.testing.assert_array_equal(blob.points, [[0, 0], [1, 2], [2, 4]])
+        assert blob.keypoints["octave"].tolist() == [0.0, 1.0, 2.0]
+
+    def test_blob_loads_without_pickle(self, tmp_path):
+        path = write_keypoint_blob(
+            blob_path(tmp_path, "img_1"),
+            keypoints_to_array(_keypoints(2)),
+            np.zeros((2, 61), dtype=np.uint8),
+        )
+
+        records = np.load(path, allow_pickle=False)
+
+        assert records.dtype.names[: len(KEYPOINT_DTYPE.names)] == KEYPOINT_DTYPE.names
+
+    def test_legacy_blob_is_read_and_migrated(self, tmp_path):
+        legacy_path = tmp_path / "frame_1.npz"
+        np.savez_compressed(
+            legacy_path,
+            keypoints=[
+                {"pt": kp.pt, "angle": kp.angle, "response": kp.response,
+                 "octave": kp.octave, "size": kp.size}
+                for kp in _keypoints(4)
+            ],
+            descriptors=np.ones((4, 64), dtype=np.uint8),
+            count=4,
+        )
+
+        legacy = read_keypoint_blob(legacy_path)
+        migrated_path = migrate_keypoint_blob(legacy_path)
+        migrated = read_keypoint_blob(migrated_path)
+
+        assert blob_version(legacy_path) == 1
+        assert blob_version(migrated_path) == 2
+        assert migrate_keypoint_blob(migrated_path) == migrated_path
+        np.testing.assert_array_equal(migrated.keypoints, legacy.keypoints)
+        np.testing.assert_array_equal(migrated.descriptors, legacy.descriptors)
+
+    def test_rejects_unknown_versions_and_mismatched_shapes(self, tmp_path):
+        with pytest.raises(ValueError):
+            read_keypoint_blob(tmp_path / "img_1.kpv9.npy")
+        with pytest.raises(ValueError):
+            blob_version(tmp_path / "img_1.pkl")
+        with pytest.raises(ValueError):
+            write_keypoint_blob(
+                blob_path(tmp_path, "img_1"),
+                keypoints_to_array(_keypoints(2)),
+                np.zeros((3, 61), dtype=np.uint8),
+            )
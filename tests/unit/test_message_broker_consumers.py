@@ -0,0 +1,203 @@
+"""Unit tests for per-subscription consumer channels, QoS and worker pools."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from common_py.messaging import ConsumerStats, MessageBroker
+
+
+def _channel():
+    channel = MagicMock()
+    channel.set_qos = AsyncMock()
+    queue = MagicMock()
+    queue.bind = AsyncMock()
+    queue.consume = AsyncMock()
+    channel.declare_queue = AsyncMock(return_value=queue)
+    channel.queue = queue
+    return channel
+
+
+def _broker():
+    broker = MessageBroker("amqp://test", local_retries=True)
+    broker.exchange = MagicMock()
+    broker.exchange.name = "product_video_matching"
+    broker.exchange.publish = AsyncMock()
+    broker.connection = MagicMock()
+    broker.connection.channel = AsyncMock(side_effect=lambda: _channel())
+    broker.connection.close = AsyncMock()
+    return broker
+
+
+def _incoming(index):
+    message = MagicMock()
+    message.body = json.dumps({"index": index}).encode()
+    message.correlation_id = f"corr-{index}"
+    message.headers = {}
+    message.ack = AsyncMock()
+    return message
+
+
+def _consumer_callback(broker, queue_name):
+    return broker.consumer_channels[queue_name].queue.consume.await_args.args[0]
+
+
+async def _wait_until(condition, timeout=1.0):
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+class TestConsumerChannels:
+    """Every subscription consumes on its own channel with its own QoS."""
+
+    @pytest.mark.asyncio
+    async def test_each_subscription_opens_its_own_channel(self):
+        broker = _broker()
+
+        await broker.subscribe_to_topic("image.embed.request", AsyncMock(), prefetch_count=4)
+        await broker.subscribe_to_topic("video.keyframes.ready", AsyncMock(), prefetch_count=16)
+
+        assert broker.connection.channel.await_count == 2
+        image_channel = broker.consumer_channels["queue.image.embed.request"]
+        video_channel = broker.consumer_channels["queue.video.keyframes.ready"]
+        assert image_channel is not video_channel
+        assert broker.channel is None
+
+    @pytest.mark.asyncio
+    async def test_prefetch_count_is_applied_per_subscription(self):
+        broker = _broker()
+
+        await broker.subscribe_to_topic("image.embed.request", AsyncMock(), prefetch_count=4)
+        await broker.subscribe_to_topic("video.keyframes.ready", AsyncMock(), prefetch_count=16)
+
+        image_channel = broker.consumer_channels["queue.image.embed.request"]
+        video_channel = broker.consumer_channels["queue.video.keyframes.ready"]
+        image_channel.set_qos.assert_awaited_once_with(prefetch_count=4)
+        video_channel.set_qos.assert_awaited_once_with(prefetch_count=16)
+        # The queues are declared on the subscription's channel
+        image_channel.declare_queue.assert_any_await("queue.image.embed.request", durable=True)
+
+
+class TestConsumerWorkers:
+    """Dispatch of deliveries to handlers with and without a worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_max_workers_bounds_concurrent_handlers(self):
+        broker = _broker()
+        release = asyncio.Event()
+        running = 0
+        peak = 0
+
+        async def handler(event_data, correlation_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+        await broker.subscribe_to_topic("image.embed.request", handler, prefetch_count=10, max_workers=2)
+        stats = broker.consumer_stats["queue.image.embed.request"]
+        deliver = _consumer_callback(broker, "queue.image.embed.request")
+        messages = [_incoming(i) for i in range(5)]
+
+        # The consumer callback only queues the delivery and returns at once
+        for message in messages:
+            await deliver(message)
+
+        await _wait_until(lambda: running == 2)
+        await asyncio.sleep(0.01)
+        assert running == 2
+        assert stats.in_flight == 2
+
+        release.set()
+        await _wait_until(lambda: stats.processed == 5)
+
+        assert peak == 2
+        assert stats.in_flight == 0
+        for message in messages:
+            message.ack.assert_awaited_once()
+
+        await broker.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_without_max_workers_the_callback_runs_the_handler(self):
+        broker = _broker()
+        handler = AsyncMock()
+
+        await broker.subscribe_to_topic("image.embed.request", handler)
+        deliver = _consumer_callback(broker, "queue.image.embed.request")
+        message = _incoming(0)
+
+        await deliver(message)
+
+        handler.assert_awaited_once_with({"index": 0}, "corr-0")
+        message.ack.assert_awaited_once()
+        assert broker._worker_tasks == []
+        assert broker.consumer_stats["queue.image.embed.request"].processed == 1
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_worker_tasks(self):
+        broker = _broker()
+
+        await broker.subscribe_to_topic("image.embed.request", AsyncMock(), max_workers=3)
+        workers = list(broker._worker_tasks)
+        assert len(workers) == 3
+
+        await broker.disconnect()
+
+        assert all(task.cancelled() for task in workers)
+        assert broker._worker_tasks == []
+        assert broker.consumer_channels == {}
+        broker.connection.close.assert_awaited_once()
+
+
+class TestConsumerStats:
+    """In-flight, processed and latency reporting per queue."""
+
+    def test_snapshot_reports_counts_and_latency(self):
+        stats = ConsumerStats("queue.image.embed.request", prefetch_count=8, max_workers=2)
+
+        first = stats.started()
+        second = stats.started()
+        assert stats.in_flight == 2
+        stats.finished(first)
+
+        snapshot = stats.snapshot()
+
+        assert snapshot["queue"] == "queue.image.embed.request"
+        assert snapshot["prefetch_count"] == 8
+        assert snapshot["max_workers"] == 2
+        assert snapshot["in_flight"] == 1
+        assert snapshot["processed"] == 1
+        assert snapshot["latency_avg_seconds"] >= 0.0
+        assert snapshot["latency_p95_seconds"] == snapshot["latency_avg_seconds"]
+
+        stats.finished(second)
+        assert stats.snapshot()["in_flight"] == 0
+
+    def test_empty_snapshot_has_zero_latency(self):
+        snapshot = ConsumerStats("queue.idle", prefetch_count=1, max_workers=None).snapshot()
+
+        assert snapshot["processed"] == 0
+        assert snapshot["latency_avg_seconds"] == 0.0
+        assert snapshot["latency_p95_seconds"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_broker_reports_stats_for_every_subscription(self):
+        broker = _broker()
+
+        await broker.subscribe_to_topic("image.embed.request", AsyncMock(), prefetch_count=4)
+        await broker.subscribe_to_topic("video.keyframes.ready", AsyncMock(), prefetch_count=16, max_workers=2)
+
+        consumer_stats = broker.get_consumer_stats()
+
+        assert set(consumer_stats) == {"queue.image.embed.request", "queue.video.keyframes.ready"}
+        assert consumer_stats["queue.image.embed.request"]["max_workers"] is None
+        assert consumer_stats["queue.video.keyframes.ready"]["prefetch_count"] == 16
+
+        await broker.disconnect()
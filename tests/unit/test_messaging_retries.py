@@ -0,0 +1,220 @@
+"""Unit tests for delayed retries and dead-lettering of failed messages."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from common_py import messaging_handler
+from common_py.error_codes import ErrorCode, RetryableError
+from common_py.messaging import MessageBroker
+from common_py.messaging_handler import (
+    MessageHandler,
+    retry_queue_arguments,
+    retry_queue_name,
+)
+
+TOPIC = "image.embed.request"
+DLQ_NAME = "queue.image.embed.request.dlq"
+EXCHANGE_NAME = "product_video_matching"
+
+
+def _exchange():
+    exchange = MagicMock()
+    exchange.name = EXCHANGE_NAME
+    exchange.publish = AsyncMock()
+    return exchange
+
+
+def _incoming(retry_count=None):
+    message = MagicMock()
+    message.body = json.dumps({"job_id": "job-1"}).encode()
+    message.correlation_id = "corr-1"
+    message.headers = {} if retry_count is None else {"x-retry-count": retry_count}
+    message.ack = AsyncMock()
+    return message
+
+
+def _failing_handler(error):
+    return AsyncMock(side_effect=error)
+
+
+def _published(exchange):
+    """Return (message, routing_key) of the single publish on ``exchange``."""
+
+    exchange.publish.assert_awaited_once()
+    call = exchange.publish.await_args
+    return call.args[0], call.kwargs["routing_key"]
+
+
+class TestRetryQueues:
+    """Naming and arguments of the per-topic TTL retry queues."""
+
+    def test_retry_queue_dead_letters_back_to_topic_after_delay(self):
+        arguments = retry_queue_arguments(EXCHANGE_NAME, TOPIC, 2)
+
+        assert arguments == {
+            "x-message-ttl": 2000,
+            "x-dead-letter-exchange": EXCHANGE_NAME,
+            "x-dead-letter-routing-key": TOPIC,
+        }
+        assert retry_queue_name(TOPIC, 2) == f"retry.{TOPIC}.2s"
+
+    @pytest.mark.asyncio
+    async def test_subscribe_declares_and_binds_a_retry_queue_per_delay(self):
+        exchange = _exchange()
+        queues = {}
+
+        async def declare_queue(name, durable=True, arguments=None):
+            queue = MagicMock()
+            queue.arguments = arguments
+            queue.bind = AsyncMock()
+            queue.consume = AsyncMock()
+            queues[name] = queue
+            return queue
+
+        channel = MagicMock()
+        channel.set_qos = AsyncMock()
+        channel.declare_queue = AsyncMock(side_effect=declare_queue)
+
+        broker = MessageBroker("amqp://test")
+        broker.exchange = exchange
+        broker.connection = MagicMock()
+        broker.connection.channel = AsyncMock(return_value=channel)
+
+        await broker.subscribe_to_topic(TOPIC, AsyncMock())
+
+        for delay in messaging_handler.RETRY_DELAYS_SECONDS:
+            retry_queue = queues[retry_queue_name(TOPIC, delay)]
+            assert retry_queue.arguments == retry_queue_arguments(EXCHANGE_NAME, TOPIC, delay)
+            retry_queue.bind.assert_awaited_once_with(
+                exchange,
+                routing_key=retry_queue_name(TOPIC, delay),
+            )
+
+    @pytest.mark.asyncio
+    async def test_local_retries_skip_retry_queue_declaration(self):
+        channel = MagicMock()
+        channel.set_qos = AsyncMock()
+        channel.declare_queue = AsyncMock(return_value=MagicMock(bind=AsyncMock(), consume=AsyncMock()))
+
+        broker = MessageBroker("amqp://test", local_retries=True)
+        broker.exchange = _exchange()
+        broker.connection = MagicMock()
+        broker.connection.channel = AsyncMock(return_value=channel)
+
+        await broker.subscribe_to_topic(TOPIC, AsyncMock())
+
+        declared = [call.args[0] for call in channel.declare_queue.await_args_list]
+        assert declared == [f"queue.{TOPIC}", DLQ_NAME]
+
+
+class TestMessageHandlerRetries:
+    """Routing of failed deliveries to retry queues or the DLQ."""
+
+    @pytest.mark.asyncio
+    async def test_successful_message_is_acked_without_publishing(self):
+        exchange = _exchange()
+        message = _incoming()
+        handler = AsyncMock()
+
+        await MessageHandler(exchange, DLQ_NAME).handle_message(message, handler, TOPIC)
+
+        handler.assert_awaited_once_with({"job_id": "job-1"}, "corr-1")
+        message.ack.assert_awaited_once()
+        exchange.publish.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_retryable_failure_goes_to_first_retry_queue(self):
+        exchange = _exchange()
+        message = _incoming()
+
+        await MessageHandler(exchange, DLQ_NAME).handle_message(
+            message,
+            _failing_handler(ConnectionError("broker away")),
+            TOPIC,
+        )
+
+        retry_message, routing_key = _published(exchange)
+        first_delay = messaging_handler.RETRY_DELAYS_SECONDS[0]
+        assert routing_key == retry_queue_name(TOPIC, first_delay)
+        assert retry_message.body == message.body
+        assert retry_message.correlation_id == "corr-1"
+        assert retry_message.headers["x-retry-count"] == 1
+        assert retry_message.headers["x-error-type"] == "ConnectionError"
+        # Acked at once so the waiting retry does not hold a prefetch slot
+        message.ack.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_each_attempt_uses_the_next_delay_tier(self):
+        exchange = _exchange()
+        message = _incoming(retry_count=2)
+
+        await MessageHandler(exchange, DLQ_NAME).handle_message(
+            message,
+            _failing_handler(
+                RetryableError(ErrorCode.DATABASE_CONNECTION, "still failing")
+            ),
+            TOPIC,
+        )
+
+        retry_message, routing_key = _published(exchange)
+        assert routing_key == retry_queue_name(TOPIC, messaging_handler.RETRY_DELAYS_SECONDS[2])
+        assert retry_message.headers["x-retry-count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_message_is_dead_lettered_once_retries_are_used_up(self):
+        exchange = _exchange()
+        retry_limit = len(messaging_handler.RETRY_DELAYS_SECONDS)
+        message = _incoming(retry_count=retry_limit)
+
+        await MessageHandler(exchange, DLQ_NAME).handle_message(
+            message,
+            _failing_handler(ConnectionError("broker away")),
+            TOPIC,
+        )
+
+        dlq_message, routing_key = _published(exchange)
+        assert routing_key == DLQ_NAME
+        assert dlq_message.headers["x-original-topic"] == TOPIC
+        assert dlq_message.headers["x-retry-count"] == retry_limit
+        assert dlq_message.headers["x-is-retryable"] == "True"
+        message.ack.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_fatal_error_skips_retries(self):
+        exchange = _exchange()
+        message = _incoming()
+
+        await MessageHandler(exchange, DLQ_NAME).handle_message(
+            message,
+            _failing_handler(RuntimeError("bad payload")),
+            TOPIC,
+        )
+
+        dlq_message, routing_key = _published(exchange)
+        assert routing_key == DLQ_NAME
+        assert dlq_message.headers["x-retry-count"] == 0
+        assert dlq_message.headers["x-is-retryable"] == "False"
+
+    @pytest.mark.asyncio
+    async def test_local_retry_is_republished_to_topic_after_delay(self, monkeypatch):
+        monkeypatch.setattr(messaging_handler, "RETRY_DELAYS_SECONDS", (0.01, 0.01, 0.01))
+        exchange = _exchange()
+        message = _incoming()
+        handler = MessageHandler(exchange, DLQ_NAME, local_retries=True)
+
+        await handler.handle_message(
+            message,
+            _failing_handler(ConnectionError("broker away")),
+            TOPIC,
+        )
+
+        message.ack.assert_awaited_once()
+        exchange.publish.assert_not_awaited()
+
+        await handler.wait_for_retries()
+
+        retry_message, routing_key = _published(exchange)
+        assert routing_key == TOPIC
+        assert retry_message.headers["x-retry-count"] == 1
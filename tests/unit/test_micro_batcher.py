@@ -0,0 +1,111 @@
+"""Unit tests for the asyncio micro-batcher."""
+
+import asyncio
+
+import pytest
+
+from vision_common import MicroBatcher
+
+
+class TestMicroBatcher:
+    """Batch formation, result routing and shutdown behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_a_batch(self):
+        batches = []
+
+        async def double(items):
+            batches.append(list(items))
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(double, max_batch_size=8, max_wait_ms=50)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        await batcher.stop()
+
+        assert results == [0, 2, 4, 6, 8]
+        assert batches == [[0, 1, 2, 3, 4]]
+        assert batcher.batches_processed == 1
+        assert batcher.items_processed == 5
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped_at_max_size(self):
+        sizes = []
+
+        async def identity(items):
+            sizes.append(len(items))
+            return list(items)
+
+        batcher = MicroBatcher(identity, max_batch_size=3, max_wait_ms=50)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(7)))
+        await batcher.stop()
+
+        assert results == list(range(7))
+        assert sizes == [3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_max_wait_flushes_partial_batch(self):
+        async def identity(items):
+            return list(items)
+
+        batcher = MicroBatcher(identity, max_batch_size=100, max_wait_ms=5)
+
+        result = await asyncio.wait_for(batcher.submit("only"), timeout=1.0)
+        await batcher.stop()
+
+        assert result == "only"
+
+    @pytest.mark.asyncio
+    async def test_batch_errors_reach_every_caller(self):
+        async def fail(items):
+            raise ValueError("model exploded")
+
+        batcher = MicroBatcher(fail, max_batch_size=4, max_wait_ms=20)
+        results = await asyncio.gather(
+            batcher.submit(1),
+            batcher.submit(2),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+        # The worker keeps serving later requests
+        batcher.batch_fn = lambda items: asyncio.sleep(0, result=list(items))
+        assert await batcher.submit(3) == 3
+        await batcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_fails_in_flight_requests(self):
+        release = asyncio.Event()
+
+        async def slow(items):
+            await release.wait()
+            return list(items)
+
+        batcher = MicroBatcher(slow, max_batch_size=2, max_wait_ms=0)
+        pending = asyncio.ensure_future(batcher.submit(1))
+        await asyncio.sleep(0.01)
+
+        await batcher.stop()
+
+        with pytest.raises(RuntimeError):
+            await pending
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_overlap(self):
+        running = 0
+        peak = 0
+
+        async def slow(items):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return list(items)
+
+        batcher = MicroBatcher(slow, max_batch_size=2, max_wait_ms=0, max_concurrent_batches=3)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(6)))
+        await batcher.stop()
+
+        assert results == list(range(6))
+        assert peak == 3
@@ -0,0 +1,53 @@
+"""Unit tests for the binary pgvector codec."""
+
+import struct
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from common_py.vector_codec import decode_vector, encode_vector, register_vector_codec
+
+
+class TestVectorCodec:
+    """Round-trip and registration checks for the vector codec."""
+
+    def test_round_trip_preserves_float32_values(self):
+        embedding = np.random.default_rng(0).normal(size=512).astype(np.float32)
+
+        decoded = decode_vector(encode_vector(embedding))
+
+        assert decoded.dtype == np.float32
+        np.testing.assert_array_equal(decoded, embedding)
+
+    def test_encode_matches_pgvector_wire_format(self):
+        data = encode_vector([1.0, -2.5])
+
+        assert data[:4] == struct.pack(">HH", 2, 0)
+        assert struct.unpack(">ff", data[4:]) == (1.0, -2.5)
+
+    def test_encode_accepts_legacy_text_values(self):
+        assert encode_vector("[1,-2.5]") == encode_vector([1.0, -2.5])
+
+    def test_encode_rejects_matrices(self):
+        with pytest.raises(ValueError):
+            encode_vector(np.zeros((2, 2)))
+
+    @pytest.mark.asyncio
+    async def test_register_sets_binary_codec(self):
+        conn = AsyncMock()
+
+        assert await register_vector_codec(conn) is True
+
+        conn.set_type_codec.assert_awaited_once()
+        _, kwargs = conn.set_type_codec.call_args
+        assert kwargs["format"] == "binary"
+        assert kwargs["encoder"] is encode_vector
+        assert kwargs["decoder"] is decode_vector
+
+    @pytest.mark.asyncio
+    async def test_register_without_extension_is_noop(self):
+        conn = AsyncMock()
+        conn.set_type_codec.side_effect = ValueError("unknown type: public.vector")
+
+        assert await register_vector_codec(conn) is False